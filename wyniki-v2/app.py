@@ -9,7 +9,7 @@ from __future__ import annotations
 from gevent import monkey
 monkey.patch_all()
 
-from flask import Flask, request
+from flask import Flask, g, request
 from prometheus_client import CollectorRegistry
 from prometheus_flask_exporter import PrometheusMetrics
 from sqlalchemy import event
@@ -22,7 +22,14 @@ from wyniki.api.admin_global_players import blueprint as global_players_blueprin
 from wyniki.api.umpire_api import blueprint as umpire_api_blueprint
 from wyniki.api.overlay_api import blueprint as overlay_api_blueprint
 from wyniki.api.brackets import bracket_public_bp, bracket_admin_bp
+from wyniki.database import tournament_registry
 from wyniki.services.api_auth import require_admin_access
+from wyniki.services.cache_metrics import CacheStatsCollector
+from wyniki.services.compute_pool import compute_stats
+from wyniki.services.duration_estimator import duration_cache
+from wyniki.services.priority_lanes import LANE_FAST, begin_request_lane, end_request_lane, lane_stats
+from wyniki.services.query_budget import finish_request_queries, instrument_sqlalchemy, query_budget_stats
+from wyniki.services.sse_registry import SSERegistryCollector, sse_registry
 from wyniki.init_state import initialize_state
 
 
@@ -52,11 +59,21 @@ def create_app() -> Flask:
     # Create tables
     with app.app_context():
         event.listen(db.engine, "connect", _enable_sqlite_foreign_keys)
+        instrument_sqlalchemy()
         db.create_all()
         initialize_state()
     
     # Initialize Prometheus metrics
-    metrics = PrometheusMetrics(app, registry=CollectorRegistry())
+    metrics_registry = CollectorRegistry()
+    metrics_registry.register(SSERegistryCollector(sse_registry))
+    metrics_registry.register(lane_stats)
+    metrics_registry.register(compute_stats)
+    metrics_registry.register(query_budget_stats)
+    metrics_registry.register(CacheStatsCollector({
+        "tournament_registry": tournament_registry,
+        "duration_estimates": duration_cache,
+    }))
+    metrics = PrometheusMetrics(app, registry=metrics_registry)
     metrics.info('wyniki_live_v2', 'Tennis Live Scores v2', version='2.0.0')
 
     @app.before_request
@@ -69,6 +86,22 @@ def create_app() -> Flask:
         if request.path.startswith("/api/overlay/") and request.method in {"POST", "PUT", "PATCH", "DELETE"}:
             return require_admin_access()
         return None
+
+    @app.before_request
+    def track_request_lane():
+        """Classify the request; in-flight umpire writes reserve SSE headroom."""
+        begin_request_lane()
+        if g.request_lane == LANE_FAST:
+            sse_registry.priority_started()
+
+    @app.teardown_request
+    def finish_request_lane(_exc):
+        if end_request_lane() == LANE_FAST:
+            sse_registry.priority_finished()
+
+    @app.teardown_request
+    def finish_query_budget(_exc):
+        finish_request_queries()
     
     # Register blueprints
     app.register_blueprint(web.blueprint)
@@ -0,0 +1,55 @@
+"""Shared pytest fixtures."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture()
+def query_counter():
+    """Count SQL statements (raw ``db_conn`` and SQLAlchemy) issued inside a block.
+
+    ``with query_counter() as queries: client.get(...)`` then assert on
+    ``queries.statements`` or ``queries.count("FROM tournament_schedule")``.
+    """
+    from wyniki.services.query_budget import capture_queries, instrument_sqlalchemy
+
+    instrument_sqlalchemy()
+    return capture_queries
+
+
+@pytest.fixture()
+def temp_db(tmp_path, monkeypatch):
+    """A freshly initialized SQLite database under ``tmp_path``; yields ``wyniki.database``."""
+    db_path = tmp_path / "wyniki.sqlite3"
+    monkeypatch.setenv("DATABASE_PATH", str(db_path))
+
+    from wyniki.config import settings
+
+    # Assigned, not monkeypatched, like the older fixtures in this suite: a few
+    # DB-less tests still resolve db_conn() through the last database set here.
+    settings.database_path = str(db_path)
+
+    from wyniki import database
+
+    database.init_db()
+    return database
+
+
+@pytest.fixture()
+def blueprint_app(temp_db):
+    """Build a bare Flask app on ``temp_db`` with the ORM bound: ``blueprint_app(bp, ...)``."""
+    from flask import Flask
+    from wyniki.config import settings
+    from wyniki.db_models import db
+
+    def build(*blueprints):
+        app = Flask(__name__)
+        app.config["TESTING"] = True
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{settings.database_path}"
+        app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        db.init_app(app)
+        for blueprint in blueprints:
+            app.register_blueprint(blueprint)
+        return app
+
+    return build
@@ -822,6 +822,19 @@ export function createTournamentsAdmin() {
         }
       },
 
+      mergePlanningSchedule(changedEntries) {
+        if (!Array.isArray(changedEntries) || !changedEntries.length) return;
+        const byId = new Map(this.planningSchedule.map(entry => [entry.id, entry]));
+        changedEntries.forEach(entry => (entry.removed ? byId.delete(entry.id) : byId.set(entry.id, entry)));
+        this.planningSchedule = [...byId.values()].sort((a, b) => (
+     String(a.day_date || '').localeCompare(String(b.day_date || ''))
+     || String(a.scheduled_time || '99:99').localeCompare(String(b.scheduled_time || '99:99'))
+     || (a.court_display_order ?? 9999) - (b.court_display_order ?? 9999)
+     || (a.sort_order || 0) - (b.sort_order || 0)
+     || (a.id || 0) - (b.id || 0)
+        ));
+      },
+
       async addPlanningScheduleEntry() {
         if (!this.planningTournamentId) return;
         if (!this.planningNewSchedule.player1_name || !this.planningNewSchedule.player2_name || this.planningNewSchedule.player1_name === this.planningNewSchedule.player2_name) {
@@ -832,11 +845,11 @@ export function createTournamentsAdmin() {
      const response = await fetch(`/admin/api/tournaments/${this.planningTournamentId}/schedule`, {
        method: 'POST',
        headers: { 'Content-Type': 'application/json' },
-       body: JSON.stringify(this.planningNewSchedule),
+       body: JSON.stringify({ ...this.planningNewSchedule, changed_only: true }),
      });
      const payload = await response.json().catch(() => ({}));
      if (!response.ok) throw new Error(payload.error || 'Failed to add schedule entry');
-     this.planningSchedule = Array.isArray(payload.schedule) ? payload.schedule : this.planningSchedule;
+     this.mergePlanningSchedule(payload.changed);
      const dayDate = this.planningNewSchedule.day_date;
      const courtId = this.planningNewSchedule.court_id;
      const category = this.planningNewSchedule.category_name;
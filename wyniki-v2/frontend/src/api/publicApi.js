@@ -14,6 +14,14 @@ async function fetchJson(path, existingQuery = '', { errorMessage = '' } = {}) {
   return response.json();
 }
 
+// Lets the browser revalidate with If-None-Match; a 304 resolves to the cached body.
+async function fetchRevalidatedJson(path, existingQuery = '') {
+  const query = String(existingQuery || '').replace(/^\?/, '');
+  const response = await fetch(query ? `${path}?${query}` : path, { cache: 'no-cache' });
+  if (!response.ok) return null;
+  return response.json();
+}
+
 export const publicApi = {
   getSnapshot() {
     return fetchJson('/api/snapshot', '', { errorMessage: 'Failed to fetch courts' });
@@ -36,7 +44,7 @@ export const publicApi = {
   },
 
   getTournamentSchedule(tournamentId, accessQuery = '') {
-    return fetchJson(`/api/tournament/${encodeURIComponent(tournamentId)}/schedule`, accessQuery);
+    return fetchRevalidatedJson(`/api/tournament/${encodeURIComponent(tournamentId)}/schedule`, accessQuery);
   },
 
   getActiveBracket() {
@@ -44,7 +52,7 @@ export const publicApi = {
   },
 
   getActiveSchedule() {
-    return fetchJson('/api/tournament/schedule');
+    return fetchRevalidatedJson('/api/tournament/schedule');
   },
 
   getActiveQuickInfo() {
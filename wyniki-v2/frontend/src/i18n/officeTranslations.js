@@ -114,6 +114,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'Korty B1 (specjalne)',
         courtPrefix: 'Kort {name}',
         generateProposal: 'Generuj propozycję',
+        optimize: 'Optymalizuj plan',
+        optimizeHint: 'Poprawia propozycję lokalnym przeszukiwaniem: krótszy dzień, mniej kolizji i przestojów zawodników. Trwa kilka sekund.',
+        multiDay: 'Wszystkie dni turnieju',
+        multiDayHint: 'Planuje cały turniej naraz w godzinach kortów z konfiguracji; mecze pucharowe po swoich grupach, nadmiar przechodzi na kolejny dzień.',
+        durationSource: 'Długość slotu',
+        durationSourceHint: 'Stała z konfiguracji albo wyliczona z czasów rozegranych meczów (mediana lub 80. percentyl) plus czas na zmianę na korcie.',
+        durationFixed: 'Stała (konfiguracja)',
+        durationP50: 'Z historii – mediana',
+        durationP80: 'Z historii – 80. percentyl',
         previewMode: 'Tryb podglądu propozycji',
         approveSchedule: 'Zatwierdź terminarz',
         discardProposal: 'Odrzuć propozycję',
@@ -125,6 +134,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Oznacz lub odznacz jako kort specjalny B1',
         slotMinutes: 'slot {minutes} min',
         dropMatchHere: 'Upuść mecz tutaj',
+        conflictsTitle: 'Konflikty zawodników w harmonogramie: {count}',
+        dropConflicts: 'Ten termin koliduje z innymi meczami tych zawodników',
+        conflictOverlap: '{players}: mecze {first} i {second} nakładają się',
+        conflictRest: '{players}: za krótka przerwa między {first} a {second}',
         unassignedTitle: 'Nieprzypisane mecze turnieju ({count})',
         unassignedHint: 'Mecze z całego turnieju bez kortu lub godziny. Wybierz dzień powyżej i przeciągnij mecz na kort. Mecze już przypisane do kortu są widoczne tylko na tablicy dnia.',
         unassignedPhaseGroup: 'Faza grupowa',
@@ -311,6 +324,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'Brak meczów {scope} do rozmieszczenia. {hint}',
         proposalReady: 'Propozycja {scope}: {placed} meczów{extra}. Sprawdź i zatwierdź.',
         withPlaceholders: ' (w tym {count} z placeholderem)',
+        optimizedSummary: '; optymalizacja: koniec {finishBefore} → {finishAfter}, kolizje {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; dni: {days}',
+        multiDayEntry: '{date}: {matches} meczów ({percent}%)',
         publishedCount: 'Opublikowano {count} wpisów.',
         noDraftEntries: 'Brak roboczych wpisów do opublikowania.',
         hintKnockout: 'Zapisz grupy w Kroku 1, potem użyj „Generuj mecze” lub ponów propozycję.',
@@ -478,6 +494,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'Plätze B1 (speziell)',
         courtPrefix: 'Platz {name}',
         generateProposal: 'Vorschlag generieren',
+        optimize: 'Plan optimieren',
+        optimizeHint: 'Verbessert den Vorschlag per lokaler Suche: kürzerer Tag, weniger Konflikte und Wartezeiten. Dauert einige Sekunden.',
+        multiDay: 'Alle Turniertage',
+        multiDayHint: 'Plant das ganze Turnier in einem Durchgang innerhalb der Platzzeiten; K.-o.-Spiele nach ihren Gruppen, Überhang rutscht auf den nächsten Tag.',
+        durationSource: 'Slotlänge',
+        durationSourceHint: 'Fest aus der Konfiguration oder aus den Dauern gespielter Matches (Median oder 80. Perzentil) plus Wechselzeit auf dem Platz.',
+        durationFixed: 'Fest (Konfiguration)',
+        durationP50: 'Aus Historie – Median',
+        durationP80: 'Aus Historie – 80. Perzentil',
         previewMode: 'Vorschau-Modus',
         approveSchedule: 'Zeitplan bestätigen',
         discardProposal: 'Vorschlag verwerfen',
@@ -489,6 +514,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Als B1-Sonderplatz markieren oder abwählen',
         slotMinutes: 'Slot {minutes} Min.',
         dropMatchHere: 'Spiel hier ablegen',
+        conflictsTitle: 'Spielerkonflikte im Zeitplan: {count}',
+        dropConflicts: 'Dieser Termin kollidiert mit anderen Spielen dieser Spieler',
+        conflictOverlap: '{players}: Spiele {first} und {second} überschneiden sich',
+        conflictRest: '{players}: zu kurze Pause zwischen {first} und {second}',
         unassignedTitle: 'Nicht zugewiesene Turnierspiele ({count})',
         unassignedHint: 'Spiele des gesamten Turniers ohne Platz oder Uhrzeit. Wählen Sie oben einen Tag und ziehen Sie das Spiel auf einen Platz. Bereits zugewiesene Spiele stehen nur auf der Tagesübersicht.',
         unassignedPhaseGroup: 'Gruppenphase',
@@ -660,6 +689,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'Keine Spiele {scope} zum Verteilen. {hint}',
         proposalReady: 'Vorschlag {scope}: {placed} Spiele{extra}. Prüfen und bestätigen.',
         withPlaceholders: ' (davon {count} mit Platzhalter)',
+        optimizedSummary: '; Optimierung: Ende {finishBefore} → {finishAfter}, Konflikte {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; Tage: {days}',
+        multiDayEntry: '{date}: {matches} Spiele ({percent}%)',
         publishedCount: '{count} Einträge veröffentlicht.',
         noDraftEntries: 'Keine Entwurfseinträge zum Veröffentlichen.',
         hintKnockout: 'Speichern Sie die Gruppen in Schritt 1, dann „Spiele generieren“ oder erneut vorschlagen.',
@@ -824,6 +856,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'B1 courts (special)',
         courtPrefix: 'Court {name}',
         generateProposal: 'Generate proposal',
+        optimize: 'Optimize plan',
+        optimizeHint: 'Improves the proposal with local search: shorter day, fewer player clashes and less idle time. Takes a few seconds.',
+        multiDay: 'All tournament days',
+        multiDayHint: 'Plans the whole tournament in one pass within the configured court hours; knockout matches after their groups, overflow moves to the next day.',
+        durationSource: 'Slot length',
+        durationSourceHint: 'Fixed from the config, or learned from finished match durations (median or 80th percentile) plus court turnover.',
+        durationFixed: 'Fixed (config)',
+        durationP50: 'From history – median',
+        durationP80: 'From history – 80th percentile',
         previewMode: 'Proposal preview mode',
         approveSchedule: 'Approve schedule',
         discardProposal: 'Discard proposal',
@@ -835,6 +876,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Mark or unmark as special B1 court',
         slotMinutes: 'slot {minutes} min',
         dropMatchHere: 'Drop match here',
+        conflictsTitle: 'Player conflicts in the schedule: {count}',
+        dropConflicts: 'This slot clashes with other matches of these players',
+        conflictOverlap: '{players}: matches {first} and {second} overlap',
+        conflictRest: '{players}: too little rest between {first} and {second}',
         unassignedTitle: 'Unassigned tournament matches ({count})',
         unassignedHint: 'Matches from the whole tournament without a court or time. Pick a day above and drag a match onto a court.',
         unassignedPhaseGroup: 'Group phase',
@@ -1006,6 +1051,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'No {scope} matches to place. {hint}',
         proposalReady: '{scope} proposal: {placed} matches{extra}. Review and approve.',
         withPlaceholders: ' (including {count} placeholders)',
+        optimizedSummary: '; optimized: finish {finishBefore} → {finishAfter}, clashes {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; days: {days}',
+        multiDayEntry: '{date}: {matches} matches ({percent}%)',
         publishedCount: 'Published {count} entries.',
         noDraftEntries: 'No draft entries to publish.',
         hintKnockout: 'Save groups in Step 1, then use “Generate matches” or retry the proposal.',
@@ -1170,6 +1218,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'Campi B1 (speciali)',
         courtPrefix: 'Campo {name}',
         generateProposal: 'Genera proposta',
+        optimize: 'Ottimizza il piano',
+        optimizeHint: 'Migliora la proposta con una ricerca locale: giornata più corta, meno conflitti e attese dei giocatori. Richiede qualche secondo.',
+        multiDay: 'Tutti i giorni del torneo',
+        multiDayHint: 'Pianifica l’intero torneo in un solo passaggio negli orari dei campi; le partite a eliminazione dopo i loro gironi, l’eccedenza passa al giorno successivo.',
+        durationSource: 'Durata dello slot',
+        durationSourceHint: 'Fissa dalla configurazione o ricavata dalla durata delle partite giocate (mediana o 80° percentile) più il cambio campo.',
+        durationFixed: 'Fissa (configurazione)',
+        durationP50: 'Dallo storico – mediana',
+        durationP80: 'Dallo storico – 80° percentile',
         previewMode: 'Modalità anteprima proposta',
         approveSchedule: 'Conferma programma',
         discardProposal: 'Scarta proposta',
@@ -1181,6 +1238,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Segna o deseleziona come campo B1 speciale',
         slotMinutes: 'slot {minutes} min',
         dropMatchHere: 'Rilascia partita qui',
+        conflictsTitle: 'Conflitti dei giocatori nel programma: {count}',
+        dropConflicts: 'Questo orario è in conflitto con altre partite di questi giocatori',
+        conflictOverlap: '{players}: le partite {first} e {second} si sovrappongono',
+        conflictRest: '{players}: riposo troppo breve tra {first} e {second}',
         unassignedTitle: 'Partite del torneo non assegnate ({count})',
         unassignedHint: 'Partite di tutto il torneo senza campo o orario. Scegli il giorno sopra e trascina la partita su un campo.',
         unassignedPhaseGroup: 'Fase a gironi',
@@ -1352,6 +1413,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'Nessuna partita {scope} da posizionare. {hint}',
         proposalReady: 'Proposta {scope}: {placed} partite{extra}. Controlla e conferma.',
         withPlaceholders: ' (di cui {count} con placeholder)',
+        optimizedSummary: '; ottimizzazione: fine {finishBefore} → {finishAfter}, conflitti {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; giorni: {days}',
+        multiDayEntry: '{date}: {matches} partite ({percent}%)',
         publishedCount: 'Pubblicate {count} voci.',
         noDraftEntries: 'Nessuna bozza da pubblicare.',
         hintKnockout: 'Salva i gironi al Passo 1, poi «Genera partite» o rigenera la proposta.',
@@ -1516,6 +1580,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'Pistas B1 (especiales)',
         courtPrefix: 'Pista {name}',
         generateProposal: 'Generar propuesta',
+        optimize: 'Optimizar plan',
+        optimizeHint: 'Mejora la propuesta con búsqueda local: jornada más corta, menos conflictos y esperas de los jugadores. Tarda unos segundos.',
+        multiDay: 'Todos los días del torneo',
+        multiDayHint: 'Planifica todo el torneo de una vez dentro del horario de pistas; los partidos eliminatorios tras sus grupos, el exceso pasa al día siguiente.',
+        durationSource: 'Duración del turno',
+        durationSourceHint: 'Fija según la configuración o calculada a partir de la duración de los partidos jugados (mediana o percentil 80) más el cambio de pista.',
+        durationFixed: 'Fija (configuración)',
+        durationP50: 'Del historial – mediana',
+        durationP80: 'Del historial – percentil 80',
         previewMode: 'Modo vista previa de propuesta',
         approveSchedule: 'Confirmar calendario',
         discardProposal: 'Descartar propuesta',
@@ -1527,6 +1600,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Marcar o desmarcar como pista B1 especial',
         slotMinutes: 'slot {minutes} min',
         dropMatchHere: 'Suelta el partido aquí',
+        conflictsTitle: 'Conflictos de jugadores en el horario: {count}',
+        dropConflicts: 'Este horario choca con otros partidos de estos jugadores',
+        conflictOverlap: '{players}: los partidos {first} y {second} se solapan',
+        conflictRest: '{players}: descanso demasiado corto entre {first} y {second}',
         unassignedTitle: 'Partidos del torneo sin asignar ({count})',
         unassignedHint: 'Partidos de todo el torneo sin pista u hora. Elige el día arriba y arrastra el partido a una pista.',
         unassignedPhaseGroup: 'Fase de grupos',
@@ -1698,6 +1775,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'No hay partidos de {scope} para colocar. {hint}',
         proposalReady: 'Propuesta {scope}: {placed} partidos{extra}. Revisa y confirma.',
         withPlaceholders: ' (incluidos {count} placeholders)',
+        optimizedSummary: '; optimización: fin {finishBefore} → {finishAfter}, conflictos {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; días: {days}',
+        multiDayEntry: '{date}: {matches} partidos ({percent}%)',
         publishedCount: 'Publicadas {count} entradas.',
         noDraftEntries: 'No hay borradores para publicar.',
         hintKnockout: 'Guarda los grupos en el Paso 1, luego «Generar partidos» o vuelve a generar la propuesta.',
@@ -1862,6 +1942,15 @@ export const OFFICE_TRANSLATION_PATCHES = {
         b1Court: 'Courts B1 (spéciaux)',
         courtPrefix: 'Court {name}',
         generateProposal: 'Générer une proposition',
+        optimize: 'Optimiser le plan',
+        optimizeHint: 'Améliore la proposition par recherche locale : journée plus courte, moins de conflits et d’attente des joueurs. Prend quelques secondes.',
+        multiDay: 'Tous les jours du tournoi',
+        multiDayHint: 'Planifie tout le tournoi en une passe dans les horaires des courts ; les matchs à élimination après leurs poules, le surplus passe au jour suivant.',
+        durationSource: 'Durée du créneau',
+        durationSourceHint: 'Fixe selon la configuration ou déduite de la durée des matchs joués (médiane ou 80e centile) plus le changement de court.',
+        durationFixed: 'Fixe (configuration)',
+        durationP50: 'Historique – médiane',
+        durationP80: 'Historique – 80e centile',
         previewMode: 'Mode aperçu de proposition',
         approveSchedule: 'Valider le planning',
         discardProposal: 'Rejeter la proposition',
@@ -1873,6 +1962,10 @@ export const OFFICE_TRANSLATION_PATCHES = {
         toggleB1Court: 'Marquer ou retirer comme court B1 spécial',
         slotMinutes: 'créneau {minutes} min',
         dropMatchHere: 'Déposer le match ici',
+        conflictsTitle: 'Conflits de joueurs dans le programme : {count}',
+        dropConflicts: 'Ce créneau entre en conflit avec d\'autres matchs de ces joueurs',
+        conflictOverlap: '{players} : les matchs {first} et {second} se chevauchent',
+        conflictRest: '{players} : repos trop court entre {first} et {second}',
         unassignedTitle: 'Matchs du tournoi non assignés ({count})',
         unassignedHint: 'Matchs de tout le tournoi sans court ni heure. Choisissez le jour ci-dessus et faites glisser le match vers un court.',
         unassignedPhaseGroup: 'Phase de poules',
@@ -2044,6 +2137,9 @@ export const OFFICE_TRANSLATION_PATCHES = {
         noMatchesScope: 'Aucun match {scope} à placer. {hint}',
         proposalReady: 'Proposition {scope} : {placed} matchs{extra}. Vérifiez et validez.',
         withPlaceholders: ' (dont {count} avec placeholder)',
+        optimizedSummary: '; optimisation : fin {finishBefore} → {finishAfter}, conflits {clashesBefore} → {clashesAfter}',
+        multiDaySummary: '; jours : {days}',
+        multiDayEntry: '{date} : {matches} matchs ({percent} %)',
         publishedCount: '{count} entrées publiées.',
         noDraftEntries: 'Aucun brouillon à publier.',
         hintKnockout: 'Enregistrez les poules à l\'étape 1, puis « Générer les matchs » ou relancez la proposition.',
@@ -466,7 +466,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Filtr płci' },
     playerProfile: { ageLabel: '{years} lat', noMatches: 'Brak meczów', notFound: 'Nie znaleziono zawodnika' },
     liveSub: { navLabel: 'Sekcje na żywo', scores: 'Mecze na żywo', schedule: 'Plan turnieju', history: 'Wyniki' },
-    schedule: { title: 'Plan turnieju', emptyTitle: 'Plan turnieju nie jest jeszcze opublikowany', loading: 'Ładowanie planu turnieju...', updated: 'Plan turnieju zaktualizowany' },
+    schedule: { title: 'Plan turnieju', emptyTitle: 'Plan turnieju nie jest jeszcze opublikowany', loading: 'Ładowanie planu turnieju...', updated: 'Plan turnieju zaktualizowany', eta: 'prognoza {time}' },
     bracket: { categoryTabsLabel: 'Kategorie turniejowe', podiumLabel: 'Podium', groupTableLabel: 'Tabela grupy {group}', treeLabel: 'Drabinka {category}', placeMatch: 'Mecz o {number}. miejsce' },
     tournamentHistory: { navLabel: 'Sekcje turnieju', matchHistory: 'Wyniki', schedule: 'Plan turnieju' },
     accessibility: { scoreJoiner: 'do', winner: 'Zwycięzca', result: 'Wynik meczu', court: 'Kort', phase: 'Etap', duration: 'Czas', unknownPlayer: 'zawodnik nieustalony', unknownCourt: 'kort nieustalony', scorePending: 'wynik nie jest jeszcze dostępny', stageMatch: '{phase}, mecz {number}', groupMatch: '{group}, mecz {number}', tournamentQuickInfoLabel: 'Komunikat turniejowy' },
@@ -479,7 +479,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Geschlechtsfilter' },
     playerProfile: { ageLabel: '{years} Jahre', noMatches: 'Keine Spiele', notFound: 'Spieler nicht gefunden' },
     liveSub: { navLabel: 'Live-Bereiche', scores: 'Live-Spiele', schedule: 'Turnierplan', history: 'Ergebnisse' },
-    schedule: { title: 'Turnierplan', emptyTitle: 'Der Turnierplan ist noch nicht veröffentlicht', emptyText: 'Das Turnierbüro ergänzt ungefähre Zeiten und Plätze.', loading: 'Turnierplan wird geladen...', refresh: 'Aktualisieren', time: 'Uhrzeit', court: 'Platz', category: 'Kategorie', phase: 'Phase', match: 'Spiel', status: 'Status', notes: 'Hinweise', searchLabel: 'Nach Nachnamen suchen', searchPlaceholder: 'Nachnamen suchen...', sortLabel: 'Sortierung', sortCourt: 'Nach Platz', sortCategory: 'Nach Kategorie', tabsLabelCourt: 'Platz auswählen', tabsLabelCategory: 'Kategorie auswählen', noResultsTitle: 'Keine passenden Spiele', noResultsText: 'Ändere den Suchbegriff oder die Sortierung.', timeTbd: 'Uhrzeit wird bestätigt', courtTbd: 'Platz wird bestätigt', categoryTbd: 'Kategorie wird bestätigt', statusDraft: 'Entwurf', statusPlanned: 'Geplant', statusInProgress: 'Läuft', statusCompleted: 'Beendet', updated: 'Turnierplan aktualisiert' },
+    schedule: { title: 'Turnierplan', emptyTitle: 'Der Turnierplan ist noch nicht veröffentlicht', emptyText: 'Das Turnierbüro ergänzt ungefähre Zeiten und Plätze.', loading: 'Turnierplan wird geladen...', refresh: 'Aktualisieren', time: 'Uhrzeit', court: 'Platz', category: 'Kategorie', phase: 'Phase', match: 'Spiel', status: 'Status', notes: 'Hinweise', searchLabel: 'Nach Nachnamen suchen', searchPlaceholder: 'Nachnamen suchen...', sortLabel: 'Sortierung', sortCourt: 'Nach Platz', sortCategory: 'Nach Kategorie', tabsLabelCourt: 'Platz auswählen', tabsLabelCategory: 'Kategorie auswählen', noResultsTitle: 'Keine passenden Spiele', noResultsText: 'Ändere den Suchbegriff oder die Sortierung.', timeTbd: 'Uhrzeit wird bestätigt', courtTbd: 'Platz wird bestätigt', categoryTbd: 'Kategorie wird bestätigt', statusDraft: 'Entwurf', statusPlanned: 'Geplant', statusInProgress: 'Läuft', statusCompleted: 'Beendet', updated: 'Turnierplan aktualisiert', eta: 'voraussichtlich {time}' },
     bracket: { categoryTabsLabel: 'Turnierkategorien', podiumLabel: 'Podium', groupTableLabel: 'Tabelle der Gruppe {group}', treeLabel: 'Turnierbaum {category}', placeMatch: 'Spiel um Platz {number}' },
     tournamentHistory: { navLabel: 'Turnierbereiche', matchHistory: 'Ergebnisse', schedule: 'Turnierplan' },
     accessibility: { scoreJoiner: 'zu', winner: 'Sieger', result: 'Spielstand', court: 'Platz', phase: 'Phase', duration: 'Dauer', unknownPlayer: 'Spieler steht noch nicht fest', unknownCourt: 'Platz steht noch nicht fest', scorePending: 'Ergebnis ist noch nicht verfügbar', stageMatch: '{phase}, Spiel {number}', groupMatch: '{group}, Spiel {number}', tournamentQuickInfoLabel: 'Turnierinfo' },
@@ -492,7 +492,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Gender filter' },
     playerProfile: { ageLabel: '{years} years', noMatches: 'No matches', notFound: 'Player not found' },
     liveSub: { navLabel: 'Live sections', scores: 'Live matches', schedule: 'Tournament schedule', history: 'Results' },
-    schedule: { title: 'Tournament schedule', updated: 'Tournament schedule updated' },
+    schedule: { title: 'Tournament schedule', updated: 'Tournament schedule updated', eta: 'expected {time}' },
     bracket: { categoryTabsLabel: 'Tournament categories', podiumLabel: 'Podium', groupTableLabel: 'Standings for group {group}', treeLabel: 'Bracket {category}', placeMatch: 'Match for place {number}' },
     tournamentHistory: { navLabel: 'Tournament sections', matchHistory: 'Results', schedule: 'Tournament schedule' },
     accessibility: { scoreJoiner: 'to', winner: 'Winner', result: 'Match score', court: 'Court', phase: 'Stage', duration: 'Duration', unknownPlayer: 'player to be confirmed', unknownCourt: 'court to be confirmed', scorePending: 'score is not available yet', stageMatch: '{phase}, match {number}', groupMatch: '{group}, match {number}', tournamentQuickInfoLabel: 'Tournament announcement' },
@@ -505,7 +505,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Filtro genere' },
     playerProfile: { ageLabel: '{years} anni', noMatches: 'Nessuna partita', notFound: 'Giocatore non trovato' },
     liveSub: { navLabel: 'Sezioni live', scores: 'Partite live', schedule: 'Programma del torneo', history: 'Risultati' },
-    schedule: { title: 'Programma del torneo', emptyTitle: 'Il programma del torneo non è ancora pubblicato', emptyText: 'L\'ufficio del torneo aggiungerà orari e campi indicativi.', loading: 'Caricamento del programma del torneo...', refresh: 'Aggiorna', time: 'Ora', court: 'Campo', category: 'Categoria', phase: 'Fase', match: 'Partita', status: 'Stato', notes: 'Note', searchLabel: 'Cerca per cognome', searchPlaceholder: 'Cerca cognome...', sortLabel: 'Ordinamento', sortCourt: 'Per campo', sortCategory: 'Per categoria', tabsLabelCourt: 'Scegli campo', tabsLabelCategory: 'Scegli categoria', noResultsTitle: 'Nessuna partita corrispondente', noResultsText: 'Modifica la ricerca o cambia ordinamento.', timeTbd: 'orario da confermare', courtTbd: 'campo da confermare', categoryTbd: 'categoria da confermare', statusDraft: 'Bozza', statusPlanned: 'Programmato', statusInProgress: 'In corso', statusCompleted: 'Concluso', updated: 'Programma del torneo aggiornato' },
+    schedule: { title: 'Programma del torneo', emptyTitle: 'Il programma del torneo non è ancora pubblicato', emptyText: 'L\'ufficio del torneo aggiungerà orari e campi indicativi.', loading: 'Caricamento del programma del torneo...', refresh: 'Aggiorna', time: 'Ora', court: 'Campo', category: 'Categoria', phase: 'Fase', match: 'Partita', status: 'Stato', notes: 'Note', searchLabel: 'Cerca per cognome', searchPlaceholder: 'Cerca cognome...', sortLabel: 'Ordinamento', sortCourt: 'Per campo', sortCategory: 'Per categoria', tabsLabelCourt: 'Scegli campo', tabsLabelCategory: 'Scegli categoria', noResultsTitle: 'Nessuna partita corrispondente', noResultsText: 'Modifica la ricerca o cambia ordinamento.', timeTbd: 'orario da confermare', courtTbd: 'campo da confermare', categoryTbd: 'categoria da confermare', statusDraft: 'Bozza', statusPlanned: 'Programmato', statusInProgress: 'In corso', statusCompleted: 'Concluso', updated: 'Programma del torneo aggiornato', eta: 'previsto {time}' },
     bracket: { categoryTabsLabel: 'Categorie del torneo', podiumLabel: 'Podio', groupTableLabel: 'Classifica del girone {group}', treeLabel: 'Tabellone {category}', placeMatch: 'Partita per il {number}° posto' },
     tournamentHistory: { navLabel: 'Sezioni del torneo', matchHistory: 'Risultati', schedule: 'Programma del torneo' },
     accessibility: { scoreJoiner: 'a', winner: 'Vincitore', result: 'Punteggio del match', court: 'Campo', phase: 'Fase', duration: 'Durata', unknownPlayer: 'giocatore da definire', unknownCourt: 'campo da definire', scorePending: 'risultato non ancora disponibile', stageMatch: '{phase}, partita {number}', groupMatch: '{group}, partita {number}', tournamentQuickInfoLabel: 'Annuncio del torneo' },
@@ -518,7 +518,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Filtro de género' },
     playerProfile: { ageLabel: '{years} años', noMatches: 'Sin partidos', notFound: 'Jugador no encontrado' },
     liveSub: { navLabel: 'Secciones en vivo', scores: 'Partidos en vivo', schedule: 'Calendario del torneo', history: 'Resultados' },
-    schedule: { title: 'Calendario del torneo', emptyTitle: 'El calendario del torneo aún no está publicado', emptyText: 'La oficina del torneo añadirá horarios y canchas orientativos.', loading: 'Cargando calendario del torneo...', refresh: 'Actualizar', time: 'Hora', court: 'Cancha', category: 'Categoría', phase: 'Fase', match: 'Partido', status: 'Estado', notes: 'Notas', searchLabel: 'Buscar por apellido', searchPlaceholder: 'Buscar apellido...', sortLabel: 'Ordenación', sortCourt: 'Por cancha', sortCategory: 'Por categoría', tabsLabelCourt: 'Elegir cancha', tabsLabelCategory: 'Elegir categoría', noResultsTitle: 'No hay partidos coincidentes', noResultsText: 'Cambia la búsqueda o el modo de ordenación.', timeTbd: 'hora por confirmar', courtTbd: 'cancha por confirmar', categoryTbd: 'categoría por confirmar', statusDraft: 'Borrador', statusPlanned: 'Planificado', statusInProgress: 'En curso', statusCompleted: 'Finalizado', updated: 'Calendario del torneo actualizado' },
+    schedule: { title: 'Calendario del torneo', emptyTitle: 'El calendario del torneo aún no está publicado', emptyText: 'La oficina del torneo añadirá horarios y canchas orientativos.', loading: 'Cargando calendario del torneo...', refresh: 'Actualizar', time: 'Hora', court: 'Cancha', category: 'Categoría', phase: 'Fase', match: 'Partido', status: 'Estado', notes: 'Notas', searchLabel: 'Buscar por apellido', searchPlaceholder: 'Buscar apellido...', sortLabel: 'Ordenación', sortCourt: 'Por cancha', sortCategory: 'Por categoría', tabsLabelCourt: 'Elegir cancha', tabsLabelCategory: 'Elegir categoría', noResultsTitle: 'No hay partidos coincidentes', noResultsText: 'Cambia la búsqueda o el modo de ordenación.', timeTbd: 'hora por confirmar', courtTbd: 'cancha por confirmar', categoryTbd: 'categoría por confirmar', statusDraft: 'Borrador', statusPlanned: 'Planificado', statusInProgress: 'En curso', statusCompleted: 'Finalizado', updated: 'Calendario del torneo actualizado', eta: 'previsto {time}' },
     bracket: { categoryTabsLabel: 'Categorías del torneo', podiumLabel: 'Podio', groupTableLabel: 'Tabla del grupo {group}', treeLabel: 'Cuadro {category}', placeMatch: 'Partido por el {number}.º puesto' },
     tournamentHistory: { navLabel: 'Secciones del torneo', matchHistory: 'Resultados', schedule: 'Calendario del torneo' },
     accessibility: { scoreJoiner: 'a', winner: 'Ganador', result: 'Marcador del partido', court: 'Cancha', phase: 'Fase', duration: 'Duración', unknownPlayer: 'jugador por confirmar', unknownCourt: 'cancha por confirmar', scorePending: 'el resultado aún no está disponible', stageMatch: '{phase}, partido {number}', groupMatch: '{group}, partido {number}', tournamentQuickInfoLabel: 'Anuncio del torneo' },
@@ -531,7 +531,7 @@ export const TRANSLATION_PATCHES = {
     playerSection: { genderFilter: 'Filtre par genre' },
     playerProfile: { ageLabel: '{years} ans', noMatches: 'Aucun match', notFound: 'Joueur introuvable' },
     liveSub: { navLabel: 'Sections en direct', scores: 'Matchs en direct', schedule: 'Programme du tournoi', history: 'Résultats' },
-    schedule: { title: 'Programme du tournoi', emptyTitle: 'Le programme du tournoi n\'est pas encore publié', emptyText: 'Le bureau du tournoi ajoutera les horaires et courts indicatifs.', loading: 'Chargement du programme du tournoi...', refresh: 'Actualiser', time: 'Heure', court: 'Court', category: 'Catégorie', phase: 'Phase', match: 'Match', status: 'Statut', notes: 'Notes', searchLabel: 'Rechercher par nom', searchPlaceholder: 'Rechercher un nom...', sortLabel: 'Tri', sortCourt: 'Par court', sortCategory: 'Par catégorie', tabsLabelCourt: 'Choisir un court', tabsLabelCategory: 'Choisir une catégorie', noResultsTitle: 'Aucun match correspondant', noResultsText: 'Modifiez la recherche ou le mode de tri.', timeTbd: 'heure à confirmer', courtTbd: 'court à confirmer', categoryTbd: 'catégorie à confirmer', statusDraft: 'Brouillon', statusPlanned: 'Planifié', statusInProgress: 'En cours', statusCompleted: 'Terminé', updated: 'Programme du tournoi mis à jour' },
+    schedule: { title: 'Programme du tournoi', emptyTitle: 'Le programme du tournoi n\'est pas encore publié', emptyText: 'Le bureau du tournoi ajoutera les horaires et courts indicatifs.', loading: 'Chargement du programme du tournoi...', refresh: 'Actualiser', time: 'Heure', court: 'Court', category: 'Catégorie', phase: 'Phase', match: 'Match', status: 'Statut', notes: 'Notes', searchLabel: 'Rechercher par nom', searchPlaceholder: 'Rechercher un nom...', sortLabel: 'Tri', sortCourt: 'Par court', sortCategory: 'Par catégorie', tabsLabelCourt: 'Choisir un court', tabsLabelCategory: 'Choisir une catégorie', noResultsTitle: 'Aucun match correspondant', noResultsText: 'Modifiez la recherche ou le mode de tri.', timeTbd: 'heure à confirmer', courtTbd: 'court à confirmer', categoryTbd: 'catégorie à confirmer', statusDraft: 'Brouillon', statusPlanned: 'Planifié', statusInProgress: 'En cours', statusCompleted: 'Terminé', updated: 'Programme du tournoi mis à jour', eta: 'prévu {time}' },
     bracket: { categoryTabsLabel: 'Catégories du tournoi', podiumLabel: 'Podium', groupTableLabel: 'Classement du groupe {group}', treeLabel: 'Tableau {category}', placeMatch: 'Match pour la {number}e place' },
     tournamentHistory: { navLabel: 'Sections du tournoi', matchHistory: 'Résultats', schedule: 'Programme du tournoi' },
     accessibility: { scoreJoiner: 'à', winner: 'Vainqueur', result: 'Score du match', court: 'Court', phase: 'Phase', duration: 'Durée', unknownPlayer: 'joueur à confirmer', unknownCourt: 'court à confirmer', scorePending: 'le score n’est pas encore disponible', stageMatch: '{phase}, match {number}', groupMatch: '{group}, match {number}', tournamentQuickInfoLabel: 'Annonce du tournoi' },
@@ -124,6 +124,12 @@ export function createLiveRuntimeView() {
         } catch { /* ignore parse errors */ }
       });
 
+      eventSource.addEventListener('schedule_eta', (e) => {
+        try {
+          this.applyScheduleEta(JSON.parse(e.data));
+        } catch { /* ignore parse errors */ }
+      });
+
       eventSource.onopen = () => {
         this._sseFailures = 0;
         this.error = null;
@@ -19,6 +19,7 @@ export function createOfficeAutoScheduleView() {
         this.autoCourts = Array.isArray(payload.courts) ? payload.courts : [];
         this.autoBands = Array.isArray(payload.bands) ? payload.bands : [];
         this.autoStartTime = this.autoConfig?.start_time || '09:30';
+        this.autoDurationSource = this.autoConfig?.duration_source || 'fixed';
         const savedB1Courts = Array.isArray(this.autoConfig?.b1_court_ids)
           ? this.autoConfig.b1_court_ids.map(String).filter(Boolean)
           : [];
@@ -66,6 +67,8 @@ export function createOfficeAutoScheduleView() {
           b1_court_ids: b1Courts,
           b1_court_id: b1Courts[0] || '',
           day_date: selectedDay,
+          optimize: Boolean(this.autoOptimize),
+          multi_day: Boolean(this.autoMultiDay),
         };
         if (this.autoPhaseScope && this.autoPhaseScope !== 'all') {
           body.phases = [this.autoPhaseScope];
@@ -80,6 +83,7 @@ export function createOfficeAutoScheduleView() {
         this.autoConfig = payload.config || this.autoConfig;
         this.autoCourts = Array.isArray(payload.courts) ? payload.courts : this.autoCourts;
         this.autoProposal = Array.isArray(payload.placements) ? payload.placements : [];
+        this.autoProposalDays = Array.isArray(payload.days) ? payload.days : null;
         this.autoDayDate = selectedDay || this.autoDayDate;
         const placed = this.autoProposal.filter(p => p.court_id && p.scheduled_time).length;
         if (!placed) {
@@ -89,9 +93,28 @@ export function createOfficeAutoScheduleView() {
           this.showToast(this.ot('toast.noMatchesScope', { scope: this.autoScopeLabel(), hint }), 'warning');
         } else {
           const placeholders = this.autoProposal.filter(p => p.scheduled_time && this.autoIsPlaceholder(p)).length;
-          const extra = placeholders
+          let extra = placeholders
             ? this.ot('toast.withPlaceholders', { count: placeholders })
             : '';
+          if (this.autoProposalDays) {
+            const spread = this.autoProposalDays
+              .filter(day => day.matches)
+              .map(day => this.ot('toast.multiDayEntry', {
+                date: day.day_date,
+                matches: day.matches,
+                percent: Math.round((day.utilization || 0) * 100),
+              }));
+            extra += this.ot('toast.multiDaySummary', { days: spread.join(', ') });
+          }
+          if (payload.optimization) {
+            const { before, after } = payload.optimization;
+            extra += this.ot('toast.optimizedSummary', {
+              finishBefore: before.finish_time,
+              finishAfter: after.finish_time,
+              clashesBefore: before.player_clashes,
+              clashesAfter: after.player_clashes,
+            });
+          }
           this.showToast(this.ot('toast.proposalReady', {
             scope: this.autoScopeLabel(),
             placed,
@@ -147,6 +170,7 @@ export function createOfficeAutoScheduleView() {
         if (Array.isArray(payload.schedule)) this.planningSchedule = payload.schedule;
         if (payload.dashboard) this.applyDashboard(payload.dashboard, { notify: false });
         this.autoProposal = null;
+        this.autoProposalDays = null;
         this.showToast(this.ot('toast.scheduleApproved'), 'success');
       } catch (error) {
         console.error('Auto-apply failed:', error);
@@ -158,6 +182,7 @@ export function createOfficeAutoScheduleView() {
 
     autoDiscardProposal() {
       this.autoProposal = null;
+      this.autoProposalDays = null;
     },
 
     autoIsPreview() {
@@ -209,6 +234,27 @@ export function createOfficeAutoScheduleView() {
       }
     },
 
+    async autoSaveDurationSource() {
+      if (!this.token) return;
+      try {
+        const response = await fetch(`/api/office/${this.slot}/autoschedule/config`, {
+          method: 'PUT',
+          headers: this.officeHeaders(),
+          body: JSON.stringify({ duration_source: this.autoDurationSource || 'fixed' }),
+        });
+        const payload = await response.json().catch(() => ({}));
+        if (response.status === 401) {
+          this.logout(this.ot('errors.sessionExpired'));
+          return;
+        }
+        if (!response.ok) throw new Error(payload.error || this.ot('errors.configFailed'));
+        this.autoConfig = payload.config || this.autoConfig;
+      } catch (error) {
+        console.error('Failed to save duration source:', error);
+        this.showToast(error.message || this.ot('toast.configError'), 'error');
+      }
+    },
+
     autoBandForCourt(courtId) {
       if (this.autoIsB1Court(courtId)) return 'B1';
       const map = this.autoConfig?.category_courts || {};
@@ -232,11 +278,22 @@ export function createOfficeAutoScheduleView() {
       return match ? `B${match[1]}` : '';
     },
 
-    autoSlotMinutes(band, courtId = '') {
-      if (courtId && this.autoIsB1Court(courtId)) return 75;
+    autoPhaseKind(phase) {
+      const text = String(phase || '').toLowerCase();
+      return !text || text.includes('grup') ? 'group' : 'knockout';
+    },
+
+    autoSlotMinutes(band, courtId = '', phase = '') {
+      if (courtId && this.autoIsB1Court(courtId)) band = 'B1';
       const slots = this.autoConfig?.slot_minutes || {};
+      const estimated = this.autoConfig?.estimated_minutes || {};
+      const kind = this.autoPhaseKind(phase);
+      if (band && estimated[`${band}:${kind}`] != null) return Number(estimated[`${band}:${kind}`]);
+      if (band && estimated[band] != null) return Number(estimated[band]);
       if (band && slots[band] != null) return Number(slots[band]);
       if (band === 'B1') return 75;
+      if (estimated[`default:${kind}`] != null) return Number(estimated[`default:${kind}`]);
+      if (estimated.default != null) return Number(estimated.default);
       return Number(slots.default || 60);
     },
 
@@ -342,11 +399,79 @@ export function createOfficeAutoScheduleView() {
       const entries = this.autoBoardEntries(courtId);
       if (!entries.length) return this.autoStartTime;
       const last = entries[entries.length - 1];
-      return this.autoAddMinutes(last.scheduled_time, this.autoSlotMinutes(this.autoBandForCourt(courtId)));
+      return this.autoAddMinutes(last.scheduled_time, this.autoSlotMinutes(this.autoBandForCourt(courtId), courtId, last.phase));
+    },
+
+    async loadScheduleConflicts() {
+      if (!this.token) return;
+      try {
+        const response = await fetch(`/api/office/${this.slot}/schedule/conflicts`, { headers: this.officeHeaders() });
+        if (!response.ok) return;
+        const payload = await response.json().catch(() => ({}));
+        this.scheduleConflicts = Array.isArray(payload.conflicts) ? payload.conflicts : [];
+      } catch (error) {
+        console.error('Schedule conflicts load failed:', error);
+      }
+    },
+
+    autoEntryConflicts(entry) {
+      const id = Number(this.autoEntryId(entry));
+      return (this.scheduleConflicts || []).filter(conflict => (conflict.entry_ids || []).includes(id));
+    },
+
+    autoConflictLabel(conflict) {
+      const key = conflict.kind === 'overlap' ? 'planning.conflictOverlap' : 'planning.conflictRest';
+      const [first, second] = conflict.entries || [];
+      return this.ot(key, {
+        players: (conflict.players || []).join(', '),
+        first: first ? `${first.scheduled_time} ${this.autoCourtLabel(first.court_id)}` : '',
+        second: second ? `${second.scheduled_time} ${this.autoCourtLabel(second.court_id)}` : '',
+      });
+    },
+
+    onAutoDragOver(courtId, targetEntry) {
+      if (!this.autoDragId || this.autoIsPreview()) return;
+      const dropTime = targetEntry && targetEntry.scheduled_time
+        ? targetEntry.scheduled_time
+        : this.autoNextTimeForCourt(courtId);
+      const key = [this.autoDragId, courtId, this.autoDayDate, dropTime].join('|');
+      if (key === this.autoDropCheckKey) return;
+      this.autoDropCheckKey = key;
+      window.clearTimeout(this.autoDropCheckTimer);
+      this.autoDropCheckTimer = window.setTimeout(async () => {
+        try {
+          const response = await fetch(`/api/office/${this.slot}/schedule/conflicts/check`, {
+            method: 'POST',
+            headers: this.officeHeaders(),
+            body: JSON.stringify({
+              schedule_id: this.autoDragId,
+              court_id: courtId,
+              scheduled_time: dropTime,
+              day_date: this.autoDayDate,
+            }),
+          });
+          const payload = await response.json().catch(() => ({}));
+          if (this.autoDropCheckKey === key) this.autoDropConflicts = response.ok ? payload.conflicts || [] : [];
+        } catch (error) {
+          console.error('Schedule conflict check failed:', error);
+        }
+      }, 120);
+    },
+
+    onAutoDragEnd() {
+      this.autoDragId = null;
+      this.clearAutoDropCheck();
+    },
+
+    clearAutoDropCheck() {
+      window.clearTimeout(this.autoDropCheckTimer);
+      this.autoDropCheckKey = '';
+      this.autoDropConflicts = [];
     },
 
     onAutoDragStart(entry, event) {
       this.autoDragId = this.autoEntryId(entry);
+      this.clearAutoDropCheck();
       if (event?.dataTransfer) {
         event.dataTransfer.effectAllowed = 'move';
         try { event.dataTransfer.setData('text/plain', String(this.autoDragId)); } catch (e) { /* noop */ }
@@ -365,7 +490,7 @@ export function createOfficeAutoScheduleView() {
         if (index < 0) continue;
         const band = this.autoMatchBand(entry);
         proposal[index] = { ...proposal[index], scheduled_time: cursor, court_id: String(courtId), day_date: day };
-        cursor = this.autoAddMinutes(cursor, this.autoSlotMinutes(band, courtId));
+        cursor = this.autoAddMinutes(cursor, this.autoSlotMinutes(band, courtId, entry.phase));
       }
       return proposal;
     },
@@ -389,7 +514,7 @@ export function createOfficeAutoScheduleView() {
           court_id: String(courtId),
           day_date: day,
         };
-        cursor = this.autoAddMinutes(cursor, this.autoSlotMinutes(band, courtId));
+        cursor = this.autoAddMinutes(cursor, this.autoSlotMinutes(band, courtId, entry.phase));
       }
       return proposal;
     },
@@ -418,6 +543,7 @@ export function createOfficeAutoScheduleView() {
     async onAutoDrop(courtId, targetEntry) {
       const scheduleId = this.autoDragId;
       this.autoDragId = null;
+      this.clearAutoDropCheck();
       if (!scheduleId) return;
       const dropTime = targetEntry && targetEntry.scheduled_time
         ? targetEntry.scheduled_time
@@ -453,6 +579,7 @@ export function createOfficeAutoScheduleView() {
     async onAutoDropToUnassigned() {
       const scheduleId = this.autoDragId;
       this.autoDragId = null;
+      this.clearAutoDropCheck();
       if (!scheduleId) return;
       if (this.autoIsPreview()) {
         const proposal = this.autoProposal.map(entry => ({ ...entry }));
@@ -101,6 +101,7 @@ export function createOfficeCoreView() {
     planningAddPlayerOpen: false,
 
     autoConfig: null,
+    autoDurationSource: 'fixed',
 
     autoCourts: [],
 
@@ -114,12 +115,24 @@ export function createOfficeCoreView() {
 
     autoPhaseScope: 'group',
 
+    autoOptimize: false,
+
+    autoMultiDay: false,
+
     autoProposal: null,
 
+    autoProposalDays: null,
+
     autoLoading: false,
 
     autoDragId: null,
 
+    scheduleConflicts: [],
+
+    autoDropConflicts: [],
+
+    autoDropCheckKey: '',
+
     toast: {
       show: false,
       message: '',
@@ -262,6 +275,7 @@ export function createOfficeCoreView() {
 
       this.dashboard = nextDashboard;
       this.tournamentMeta = nextDashboard?.tournament || this.tournamentMeta;
+      this.scheduleConflicts = nextDashboard?.schedule_conflicts || [];
       if (nextDashboard?.quick_info && !this.quickInfoDirty && !this.quickInfoSaving) {
         this.applyQuickInfo(nextDashboard.quick_info);
       }
@@ -13,6 +13,19 @@ export function createOfficeScheduleView() {
     },
 
 
+    mergePlanningSchedule(changedEntries) {
+      if (!Array.isArray(changedEntries) || !changedEntries.length) return;
+      const byId = new Map(this.planningSchedule.map(entry => [entry.id, entry]));
+      changedEntries.forEach(entry => (entry.removed ? byId.delete(entry.id) : byId.set(entry.id, entry)));
+      this.planningSchedule = [...byId.values()].sort((a, b) => (
+        String(a.day_date || '').localeCompare(String(b.day_date || ''))
+        || String(a.scheduled_time || '99:99').localeCompare(String(b.scheduled_time || '99:99'))
+        || (a.court_display_order ?? 9999) - (b.court_display_order ?? 9999)
+        || (a.sort_order || 0) - (b.sort_order || 0)
+        || (a.id || 0) - (b.id || 0)
+      ));
+    },
+
     addDaysToIsoDate(isoDate, offsetDays = 1) {
       const parts = String(isoDate || '').split('-').map(Number);
       if (parts.length !== 3 || parts.some(Number.isNaN)) return String(isoDate || '');
@@ -68,7 +81,8 @@ export function createOfficeScheduleView() {
     selectPlanningDay(day) {
       this.autoDayDate = day;
       this.planningOpenCardId = null;
-      if (this.autoIsPreview()) this.autoDiscardProposal();
+      // A multi-day proposal spans every tab; a single-day one belongs to its day.
+      if (this.autoIsPreview() && !this.autoProposalDays) this.autoDiscardProposal();
     },
 
     togglePlanningCard(entry) {
@@ -178,6 +192,7 @@ export function createOfficeScheduleView() {
           body: JSON.stringify({
             ...this.planningNewSchedule,
             court_label: selectedCourt?.name || '',
+            changed_only: true,
           }),
         });
         const payload = await response.json().catch(() => ({}));
@@ -186,7 +201,7 @@ export function createOfficeScheduleView() {
           return;
         }
         if (!response.ok) throw new Error(payload.error || this.ot('errors.scheduleAddFailed'));
-        this.planningSchedule = Array.isArray(payload.schedule) ? payload.schedule : this.planningSchedule;
+        this.mergePlanningSchedule(payload.changed);
         if (payload.dashboard) this.applyDashboard(payload.dashboard, { notify: false });
         const dayDate = this.planningNewSchedule.day_date;
         const courtId = this.planningNewSchedule.court_id;
@@ -12,7 +12,13 @@ export function createOfficeSseView() {
         this.officeSseState = 'live';
         this.stopOfficeFallbackPoll();
       });
-      source.addEventListener('office_invalidate', () => this.queueOfficeSSERefresh());
+      source.addEventListener('office_invalidate', (event) => {
+        let scopes = [];
+        try { scopes = JSON.parse(event.data || '{}').scopes || []; } catch (e) { /* noop */ }
+        // Conflicts refresh on their own so they stay current while edits hold back the dashboard.
+        if (scopes.includes('conflicts')) this.loadScheduleConflicts();
+        this.queueOfficeSSERefresh();
+      });
       source.onerror = () => {
         if (this.officeEventSource !== source) return;
         source.close();
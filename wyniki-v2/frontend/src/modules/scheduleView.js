@@ -1,5 +1,6 @@
 import { publicApi } from '../api/publicApi.js';
 import { TRANSLATIONS } from '../i18n/translations.js';
+import { formatTemplate } from '../shared/text.js';
 import {
   buildScheduleGroups,
   compareScheduleMatches as compareScheduleMatchesData,
@@ -32,6 +33,7 @@ export function createScheduleView() {
     scheduleSearch: '',
     scheduleSortMode: 'court',
     scheduleSelectedGroups: {},
+    scheduleEtas: {},
 
     async fetchSchedule() {
       this.scheduleLoading = true;
@@ -221,6 +223,22 @@ export function createScheduleView() {
       return this.scheduleText().courtTbd;
     },
 
+    applyScheduleEta(projection) {
+      if (!projection?.tournament_id) return;
+      this.scheduleEtas = { ...this.scheduleEtas, [String(projection.tournament_id)]: projection };
+    },
+
+    scheduleEta(match) {
+      const projection = this.scheduleEtas[String(this.scheduleData?.tournament?.id || '')];
+      if (!projection || projection.day_date !== match?.day_date) return '';
+      return projection.entries?.[String(match.id)] || '';
+    },
+
+    scheduleEtaLabel(match) {
+      const eta = this.scheduleEta(match);
+      return eta ? formatTemplate(this.scheduleText().eta || '~{time}', { time: eta }) : '';
+    },
+
     scheduleStatusLabel(status) {
       return getScheduleStatusLabel(status, this.scheduleText());
     },
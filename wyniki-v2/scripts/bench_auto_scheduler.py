@@ -0,0 +1,224 @@
+"""Benchmark the auto-scheduler engine against the previous full-scan placement.
+
+Usage:
+    python scripts/bench_auto_scheduler.py [--courts 40] [--matches 600] [--moves 50]
+
+Builds a synthetic event day (round-robin groups of five across B1..B4 with
+short 45-minute slots, the B1 groups pinned to six special courts) and measures:
+  * placement: the old loop, which scanned every scheduled match for each
+    candidate court, vs ``place_matches`` on the indexed engine (results are
+    checked to be identical),
+  * drag-and-drop moves: re-timing both affected courts from scratch vs
+    ``ScheduleEngine.move``, which only touches entries after the drop point.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from itertools import combinations
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from wyniki.services import auto_scheduler as sched  # noqa: E402
+
+# Roughly one B1 group per dozen, like the recorded events.
+BANDS = ["B2", "B3", "B4"] * 4
+BANDS[-1] = "B1"
+
+
+def _matches(total: int) -> list[dict]:
+    matches: list[dict] = []
+    group = 0
+    while len(matches) < total:
+        band = BANDS[group % len(BANDS)]
+        players = [f"{band}-G{group}-P{idx}" for idx in range(5)]
+        for first, second in combinations(players, 2):
+            if len(matches) >= total:
+                break
+            matches.append({
+                "id": len(matches) + 1,
+                "category_name": f"{band} Mężczyźni",
+                "group_name": f"{band} Grupa {group}",
+                "phase": "Grupowa",
+                "player1_name": first,
+                "player2_name": second,
+                "sort_order": len(matches),
+            })
+        group += 1
+    return matches
+
+
+def _config(courts: int) -> dict:
+    court_ids = [f"court{idx}" for idx in range(1, courts + 1)]
+    config = sched.build_default_config([{"kort_id": cid, "display_order": idx} for idx, cid in enumerate(court_ids)])
+    config["category_courts"] = {f"K{idx}": cid for idx, cid in enumerate(court_ids)}
+    config["category_courts"]["B1"] = court_ids[-1]
+    config["start_time"] = "08:00"
+    config["slot_minutes"] = {"B1": 75, "default": 45}
+    return sched.apply_b1_courts(config, court_ids[-6:])
+
+
+def _legacy_slot_minutes(court_id, config, band=""):
+    return sched.slot_minutes_for("B1" if sched.is_b1_court(court_id, config) else band, config)
+
+
+def _legacy_window(placement, config):
+    start = sched.time_to_minutes(str(placement.get("scheduled_time") or sched.DEFAULT_START_TIME))
+    match = placement.get("match", {})
+    band = sched.normalize_band(match.get("category_name") or match.get("group_name"))
+    return start, start + _legacy_slot_minutes(str(placement.get("court_id") or ""), config, band)
+
+
+def _legacy_slot_available(match, court_id, start_time, config, scheduled, rest_slots):
+    """Full scan: compare the candidate slot with every scheduled placement."""
+    start, end = _legacy_window({"scheduled_time": start_time, "court_id": court_id, "match": match}, config)
+    rest_gap = sched._rest_gap_minutes(config, rest_slots)
+    players = sched._players(match)
+    for placement in scheduled:
+        if not players & sched._players(placement["match"]):
+            continue
+        other_start, other_end = _legacy_window(placement, config)
+        if start < other_end and end > other_start:
+            return False
+        if other_end <= start and (start - other_end) < rest_gap:
+            return False
+        if end <= other_start and (other_start - end) < rest_gap:
+            return False
+    return True
+
+
+def _legacy_place_load_balanced(matches, flex_courts, config, day_date, start_time, rest_slots):
+    """The pre-engine loop: every availability check scans all scheduled placements."""
+    ordered = sched._order_matches_for_scheduling(matches, rest_slots)
+    court_next_time = {court_id: start_time for court_id in flex_courts}
+    scheduled: list[dict] = []
+    placements: list[dict] = []
+    for match in ordered:
+        band = sched.normalize_band(match.get("category_name") or match.get("group_name"))
+        candidates = sorted(flex_courts, key=lambda court_id: sched.time_to_minutes(court_next_time[court_id]))
+        chosen_court = None
+        for court_id in candidates:
+            if _legacy_slot_available(match, court_id, court_next_time[court_id], config, scheduled, rest_slots):
+                chosen_court = court_id
+                break
+        chosen_court = chosen_court or candidates[0]
+        chosen_start = court_next_time[chosen_court]
+        placement = {"match": match, "court_id": chosen_court, "day_date": day_date,
+                     "scheduled_time": chosen_start, "band": band}
+        placements.append(placement)
+        scheduled.append(placement)
+        court_next_time[chosen_court] = sched.add_minutes(
+            chosen_start, _legacy_slot_minutes(chosen_court, config, band)
+        )
+    return placements
+
+
+def _legacy_place(matches, config, day_date):
+    start_time = str(config.get("start_time") or sched.DEFAULT_START_TIME)
+    rest_slots = int(config.get("rest_slots") or 1)
+    b1_courts = sched.normalize_b1_court_ids(config)
+    b1 = [m for m in matches if sched.normalize_band(m.get("category_name")) == "B1"]
+    flex = [m for m in matches if m not in b1]
+    placements: list[dict] = []
+    by_court: dict[str, list[dict]] = {}
+    for idx, match in enumerate(b1):
+        by_court.setdefault(b1_courts[idx % len(b1_courts)], []).append(match)
+    for court_id, court_matches in by_court.items():
+        placements.extend(sched._place_on_court(court_matches, court_id, config, day_date, start_time, rest_slots))
+    placements.extend(_legacy_place_load_balanced(
+        flex, sched._ordered_flex_court_ids(config), config, day_date, start_time, rest_slots,
+    ))
+    return placements
+
+
+def _timed(func, repeat: int = 3):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - started)
+    return min(samples), result
+
+
+def _court_entries(entries, court_id, day_date):
+    items = [e for e in entries if e["court_id"] == court_id and e["day_date"] == day_date]
+    items.sort(key=lambda e: (str(e.get("scheduled_time") or "99:99"), int(e.get("sort_order") or 0), int(e["id"])))
+    return items
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courts", type=int, default=40)
+    parser.add_argument("--matches", type=int, default=600)
+    parser.add_argument("--moves", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = _config(args.courts)
+    matches = _matches(args.matches)
+    day = "2026-05-23"
+
+    legacy_seconds, legacy = _timed(lambda: _legacy_place(matches, config, day))
+    engine_seconds, placements = _timed(lambda: sched.place_matches(matches, config, day))
+    as_key = lambda items: sorted((p["match"]["id"], p["court_id"], p["scheduled_time"]) for p in items)  # noqa: E731
+    identical = as_key(legacy) == as_key(placements)
+    makespan = max(sched.time_to_minutes(p["scheduled_time"]) for p in placements)
+    print(f"placement  {args.matches} matches on {args.courts} courts (identical result: {identical}, last start {sched.minutes_to_time(makespan)})")
+    print(f"  full scan  {legacy_seconds * 1e3:8.1f} ms")
+    print(f"  engine     {engine_seconds * 1e3:8.1f} ms  ({legacy_seconds / engine_seconds:.1f}x)")
+
+    rng = random.Random(args.seed)
+    entries = [
+        dict(p["match"], court_id=p["court_id"], day_date=day, scheduled_time=p["scheduled_time"])
+        for p in placements
+    ]
+    court_ids = sorted({e["court_id"] for e in entries})
+    moves = [(rng.choice(entries)["id"], rng.choice(court_ids)) for _ in range(args.moves)]
+
+    legacy_rows: list[int] = []
+    started = time.perf_counter()
+    for entry_id, court_id in moves:
+        moved = next(e for e in entries if e["id"] == entry_id)
+        source = moved["court_id"]
+        moved["court_id"] = court_id
+        target_entries = _court_entries(entries, court_id, day)
+        rows = sched.recompute_court_times(target_entries, config)
+        if source != court_id:
+            rows += sched.recompute_court_times(_court_entries(entries, source, day), config)
+        by_id = {row["id"]: row for row in rows}
+        for entry in entries:
+            if entry["id"] in by_id:
+                entry["scheduled_time"] = by_id[entry["id"]]["scheduled_time"]
+        legacy_rows.append(len(rows))
+    legacy_move_seconds = time.perf_counter() - started
+
+    entries = [
+        dict(p["match"], court_id=p["court_id"], day_date=day, scheduled_time=p["scheduled_time"])
+        for p in placements
+    ]
+    engine = sched.ScheduleEngine(config)
+    started = time.perf_counter()
+    engine.load(entries)
+    load_seconds = time.perf_counter() - started
+    engine_rows: list[int] = []
+    started = time.perf_counter()
+    for entry_id, court_id in moves:
+        engine_rows.append(len(engine.move(entry_id, court_id)))
+    engine_move_seconds = time.perf_counter() - started
+
+    print(f"moves      {args.moves} drag-and-drop moves")
+    print(f"  recompute  {legacy_move_seconds / args.moves * 1e6:8.0f} us/move  rows written p50 {statistics.median(legacy_rows):.0f}")
+    print(
+        f"  engine     {engine_move_seconds / args.moves * 1e6:8.0f} us/move  rows written p50 {statistics.median(engine_rows):.0f}"
+        f"  (one-off load {load_seconds * 1e3:.1f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
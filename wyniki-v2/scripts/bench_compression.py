@@ -0,0 +1,149 @@
+"""Benchmark response compression: bytes on the wire and CPU per request.
+
+Usage:
+    python scripts/bench_compression.py [--courts 12] [--events 500] [--requests 200]
+
+Measures three paths with synthetic but realistically shaped payloads:
+  * SSE court_update frames: raw vs one-shot gzip per frame vs per-connection
+    deflate context flushed with Z_SYNC_FLUSH per event,
+  * large JSON (snapshot / players list): raw vs compressing on every request
+    vs the pre-compressed cache (compressed once per body version).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+import zlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from wyniki.services.compression import (  # noqa: E402
+    PrecompressedCache,
+    StreamCompressor,
+    compress_bytes,
+)
+
+SURNAMES = ["Kowalski", "Nowak", "Wiśniewski", "Wójcik", "Kamiński", "Lewandowski", "Zieliński", "Szymański"]
+
+
+def _court_state(rng: random.Random, kort_id: str) -> dict:
+    def player() -> dict:
+        return {
+            "surname": rng.choice(SURNAMES),
+            "full_name": None,
+            "points": rng.choice(["0", "15", "30", "40", "ADV"]),
+            "set1": rng.randint(0, 6),
+            "set2": rng.randint(0, 6),
+            "set3": 0,
+            "current_games": rng.randint(0, 6),
+            "flag_url": "https://flagcdn.com/w40/pl.png",
+            "flag_code": "pl",
+        }
+
+    return {
+        "court_id": kort_id,
+        "court_name": f"Kort {kort_id}",
+        "A": player(),
+        "B": player(),
+        "current_set": rng.randint(1, 3),
+        "serve": rng.choice(["A", "B"]),
+        "tie": {"A": 0, "B": 0, "visible": False, "locked": False},
+        "match_time": {"seconds": rng.randint(0, 5400), "running": True},
+        "match_status": {"active": True, "last_completed": None},
+        "history_meta": {"phase": "Grupowa", "category": "B1"},
+    }
+
+
+def _players(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "id": idx,
+            "global_player_id": idx,
+            "name": f"Gracz{idx} {rng.choice(SURNAMES)}",
+            "first_name": f"Gracz{idx}",
+            "last_name": rng.choice(SURNAMES),
+            "gender": rng.choice(["M", "F"]),
+            "category": rng.choice(["B1", "B2", "B3"]),
+            "country": "PL",
+            "tournament_id": rng.randint(1, 20),
+            "tournament_name": "Mistrzostwa Polski",
+            "matches_played": rng.randint(0, 40),
+            "wins": rng.randint(0, 20),
+            "losses": rng.randint(0, 20),
+        }
+        for idx in range(count)
+    ]
+
+
+def _cpu_us(fn, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - start) / repeat * 1e6
+
+
+def bench_sse(courts: int, events: int) -> None:
+    rng = random.Random(1)
+    frames = [
+        f"event: court_update\ndata: {json.dumps(_court_state(rng, str(rng.randint(1, courts))))}\n\n".encode()
+        for _ in range(events)
+    ]
+    raw = sum(len(frame) for frame in frames)
+
+    start = time.process_time()
+    oneshot = sum(len(compress_bytes(frame, "gzip")) for frame in frames)
+    oneshot_cpu = (time.process_time() - start) / events * 1e6
+
+    start = time.process_time()
+    stream = StreamCompressor("gzip")
+    streamed = sum(len(stream.compress_event(frame)) for frame in frames)
+    streamed_cpu = (time.process_time() - start) / events * 1e6
+
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    stream = StreamCompressor("gzip")
+    assert b"".join(decoder.decompress(stream.compress_event(f)) for f in frames) == b"".join(frames)
+
+    print(f"SSE ({events} court_update frames, {courts} courts)")
+    print(f"  raw                    {raw / events:8.1f} B/event")
+    print(f"  gzip per frame         {oneshot / events:8.1f} B/event  {oneshot_cpu:7.1f} us/event")
+    print(f"  per-connection + sync  {streamed / events:8.1f} B/event  {streamed_cpu:7.1f} us/event")
+
+
+def bench_json(label: str, payload: object, requests: int) -> None:
+    body = (json.dumps(payload) + "\n").encode()
+    cache = PrecompressedCache()
+    per_request_cpu = _cpu_us(lambda: compress_bytes(body, "gzip"), requests)
+    cached_cpu = _cpu_us(lambda: cache.get(label, body, "gzip"), requests)
+    compressed = len(compress_bytes(body, "gzip"))
+    print(f"{label} JSON ({len(body)} B raw)")
+    print(f"  gzip                   {compressed:8d} B  ratio {compressed / len(body):.3f}")
+    print(f"  compress every request {per_request_cpu:10.1f} us/request")
+    print(f"  pre-compressed cache   {cached_cpu:10.1f} us/request (hits={cache.hits}, misses={cache.misses})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courts", type=int, default=12)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--players", type=int, default=1500)
+    args = parser.parse_args()
+
+    rng = random.Random(2)
+    bench_sse(args.courts, args.events)
+    snapshot = {
+        "courts": {str(idx): _court_state(rng, str(idx)) for idx in range(1, args.courts + 1)},
+        "tournament_name": "Mistrzostwa Polski",
+        "tournament_names": ["Mistrzostwa Polski"],
+    }
+    bench_json("snapshot", snapshot, args.requests)
+    bench_json("players-all", _players(rng, args.players), args.requests)
+
+
+if __name__ == "__main__":
+    main()
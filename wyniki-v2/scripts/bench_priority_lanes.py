@@ -0,0 +1,151 @@
+"""Latency-SLO benchmark: p99 of umpire match-events while /api/players/all is loaded.
+
+Usage:
+    python scripts/bench_priority_lanes.py [--players 100] [--readers 3] [--events 40]
+
+Runs the full app against a throw-away SQLite database inside one gevent
+process, the same way production runs one worker. Reader greenlets hammer
+``/api/players/all`` while one greenlet posts ``/api/match-events`` and records
+its latency. The run is repeated with the CPU lane disabled (inline) and
+enabled, so the effect of offloading is visible side by side.
+"""
+from __future__ import annotations
+
+from gevent import monkey
+
+monkey.patch_all()
+
+import argparse  # noqa: E402
+import os  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import gevent  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+_TMP = tempfile.mkdtemp(prefix="wyniki-bench-lanes-")
+os.environ["DATABASE_PATH"] = str(Path(_TMP) / "bench.sqlite3")
+
+from wyniki import database  # noqa: E402
+from wyniki.config import settings  # noqa: E402
+from wyniki.services import priority_lanes  # noqa: E402
+from wyniki.services.api_auth import issue_court_token  # noqa: E402
+
+
+def _seed(players: int) -> str:
+    database.init_db()
+    tournament_id = database.insert_tournament(
+        "Bench Cup", "2026-05-01", "2026-05-03", active=True, is_public=True, stats_enabled=True,
+    )
+    kort_id = database.create_tournament_courts(tournament_id, 1)[0]
+    for idx in range(players):
+        database.insert_player(
+            tournament_id, f"Gracz{idx} Nazwisko{idx}", "B1", "PL",
+            first_name=f"Gracz{idx}", last_name=f"Nazwisko{idx}",
+        )
+        database.insert_match_history({
+            "kort_id": kort_id,
+            "ended_ts": "2026-05-01T10:00:00Z",
+            "duration_seconds": 1800,
+            "player_a": f"Gracz{idx} Nazwisko{idx}",
+            "player_b": f"Gracz{(idx + 1) % players} Nazwisko{(idx + 1) % players}",
+            "score_a": [6, 6],
+            "score_b": [3, 4],
+            "category": "B1",
+            "phase": "Grupowa",
+            "tournament_id": tournament_id,
+        })
+    return kort_id
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _run(app, kort_id: str, readers: int, events: int, workers: int) -> None:
+    settings.cpu_lane_workers = workers
+    priority_lanes._pool = None
+    stop = False
+    read_latencies: list[float] = []
+
+    def reader():
+        client = app.test_client()
+        while not stop:
+            started = time.perf_counter()
+            client.get("/api/players/all")
+            read_latencies.append(time.perf_counter() - started)
+            # Real clients yield on socket I/O between requests.
+            gevent.sleep(0)
+
+    greenlets = [gevent.spawn(reader) for _ in range(readers)]
+    gevent.sleep(0.2)
+
+    client = app.test_client()
+    headers = {"Authorization": f"Bearer {issue_court_token(kort_id)}"}
+    event_latencies: list[float] = []
+    # Open-loop schedule: latency is measured from when the umpire app *wanted*
+    # to send the event, so time spent waiting for the event loop is included.
+    interval = 0.05
+    first_send = time.perf_counter()
+    for idx in range(events):
+        intended = first_send + idx * interval
+        delay = intended - time.perf_counter()
+        if delay > 0:
+            gevent.sleep(delay)
+        payload = {
+            "event_type": "point",
+            "court_id": kort_id,
+            "score": {"player1_points": idx % 4, "player2_points": 0, "player1_games": 0, "player2_games": 0},
+            "player1": {"name": "Gracz0 Nazwisko0"},
+            "player2": {"name": "Gracz1 Nazwisko1"},
+        }
+        client.post("/api/match-events", json=payload, headers=headers)
+        event_latencies.append(time.perf_counter() - intended)
+
+    stop = True
+    gevent.joinall(greenlets, timeout=30)
+
+    label = "inline" if workers <= 0 else f"cpu lane x{workers}"
+    print(f"{label}")
+    print(
+        "  match-events  p50 {:7.1f} ms  p99 {:7.1f} ms  max {:7.1f} ms".format(
+            statistics.median(event_latencies) * 1e3,
+            _percentile(event_latencies, 99) * 1e3,
+            max(event_latencies) * 1e3,
+        )
+    )
+    if read_latencies:
+        print(
+            "  players/all   p50 {:7.1f} ms  p99 {:7.1f} ms  ({} requests)".format(
+                statistics.median(read_latencies) * 1e3,
+                _percentile(read_latencies, 99) * 1e3,
+                len(read_latencies),
+            )
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=100)
+    parser.add_argument("--readers", type=int, default=3)
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    kort_id = _seed(args.players)
+    from app import create_app
+
+    app = create_app()
+    _run(app, kort_id, args.readers, args.events, workers=0)
+    _run(app, kort_id, args.readers, args.events, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Compare greedy auto-scheduling with the optimizing mode on recorded and synthetic days.
+
+Usage:
+    python scripts/bench_schedule_optimizer.py [--seed 0] [--budget 2.0] [--iterations 20000]
+        [--database /data/wyniki.sqlite3] [--courts 40] [--matches 600]
+
+Days benchmarked:
+  * the group stage of the recorded MP simulation roster (scripts/create_mp_simulation.py)
+    and of the Dürener Handicap 2026 roster (scripts/setup_duener_handicap_2026.py),
+    on the court counts those events used,
+  * optionally every (tournament, day) in a real database's ``tournament_schedule``,
+    with the default court-based config,
+  * the synthetic large day from ``bench_auto_scheduler.py``.
+
+For each day the greedy ``place_matches`` result is scored and then improved with
+``schedule_optimizer.optimize_placements``; finish time, player clashes, phase
+violations, B1 idle minutes and player idle minutes are printed side by side.
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import sys
+from itertools import combinations
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import bench_auto_scheduler  # noqa: E402
+import create_mp_simulation  # noqa: E402
+import setup_duener_handicap_2026  # noqa: E402
+from wyniki.services import auto_scheduler as sched  # noqa: E402
+from wyniki.services import schedule_optimizer  # noqa: E402
+
+
+def _round_robin(category: str, group_name: str, players: list[str], start_id: int) -> list[dict]:
+    return [
+        {
+            "id": start_id + idx,
+            "category_name": category,
+            "group_name": group_name,
+            "phase": "Grupowa",
+            "player1_name": first,
+            "player2_name": second,
+            "sort_order": start_id + idx,
+        }
+        for idx, (first, second) in enumerate(combinations(players, 2))
+    ]
+
+
+def _court_config(courts: int, b1_courts: int = 1) -> dict:
+    """Every court in play, B1 pinned to the last ones (as the office sets it up)."""
+    court_ids = [f"court{idx}" for idx in range(1, courts + 1)]
+    config = sched.build_default_config([{"kort_id": cid, "display_order": idx} for idx, cid in enumerate(court_ids)])
+    config["category_courts"] = {f"K{idx}": cid for idx, cid in enumerate(court_ids)}
+    return sched.apply_b1_courts(config, court_ids[-b1_courts:])
+
+
+def _mp_simulation_day() -> tuple[list[dict], dict]:
+    matches: list[dict] = []
+    for division in create_mp_simulation.DIVISIONS:
+        for group_key, players in division["groups"].items():
+            group_name = create_mp_simulation._group_name(division["label"], group_key)
+            names = [f"{first} {last}" for first, last in players]
+            matches.extend(_round_robin(division["label"], group_name, names, len(matches) + 1))
+    return matches, _court_config(8, b1_courts=2)
+
+
+def _duener_day() -> tuple[list[dict], dict]:
+    matches: list[dict] = []
+    for division in setup_duener_handicap_2026.DIVISIONS:
+        names = [f"{player['first_name']} {player['last_name']}" for player in division["players"]]
+        matches.extend(_round_robin(division["group_name"], division["group_name"], names, len(matches) + 1))
+    return matches, _court_config(4)
+
+
+def _database_days(path: str) -> list[tuple[str, list[dict], dict]]:
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    try:
+        courts: dict[int, list[dict]] = {}
+        for row in conn.execute(
+            "SELECT kort_id, tournament_id, display_order FROM courts WHERE tournament_id IS NOT NULL"
+        ):
+            courts.setdefault(int(row["tournament_id"]), []).append(dict(row))
+        days: dict[tuple[int, str], list[dict]] = {}
+        for row in conn.execute(
+            """
+            SELECT id, tournament_id, day_date, category_name, group_name, phase,
+                   player1_name, player2_name, sort_order
+            FROM tournament_schedule
+            ORDER BY tournament_id, day_date, sort_order, id
+            """
+        ):
+            days.setdefault((int(row["tournament_id"]), str(row["day_date"])), []).append(dict(row))
+    finally:
+        conn.close()
+    return [
+        (f"db t{tournament_id} {day}", matches, sched.build_default_config(courts[tournament_id]))
+        for (tournament_id, day), matches in sorted(days.items())
+        if courts.get(tournament_id)
+    ]
+
+
+def _row(label: str, metrics: dict, extra: str = "") -> str:
+    return (
+        f"  {label:<9} finish {metrics['finish_time']}  clashes {metrics['player_clashes']:4d}"
+        f"  phase {metrics['phase_violations']:3d}  b1 idle {metrics['b1_idle_minutes']:5d}"
+        f"  player idle {metrics['player_idle_minutes']:6d}{extra}"
+    )
+
+
+def _bench(label: str, matches: list[dict], config: dict, args: argparse.Namespace) -> None:
+    placements = sched.place_matches(matches, config, "2026-05-23")
+    result = schedule_optimizer.optimize_placements(
+        placements, config, seed=args.seed, time_budget_seconds=args.budget, max_iterations=args.iterations,
+    )
+    stats = result["stats"]
+    courts = len(sched.normalize_b1_court_ids(config)) + len(sched._ordered_flex_court_ids(config))
+    print(f"{label}: {len(matches)} matches on {courts} courts")
+    print(_row("greedy", stats["before"]))
+    print(_row(
+        "optimized",
+        stats["after"],
+        f"  ({stats['iterations']} iterations, {stats['elapsed_ms']:.0f} ms)",
+    ))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=2.0, help="wall-clock cap per day, seconds")
+    parser.add_argument("--iterations", type=int, default=schedule_optimizer.DEFAULT_MAX_ITERATIONS)
+    parser.add_argument("--database", help="also benchmark every day stored in this SQLite database")
+    parser.add_argument("--courts", type=int, default=40)
+    parser.add_argument("--matches", type=int, default=600)
+    args = parser.parse_args()
+
+    _bench("MP simulation (groups)", *_mp_simulation_day(), args)
+    _bench("Dürener Handicap 2026 (groups)", *_duener_day(), args)
+    if args.database:
+        for label, matches, config in _database_days(args.database):
+            _bench(label, matches, config, args)
+    synthetic_config = bench_auto_scheduler._config(args.courts)
+    _bench("synthetic day", bench_auto_scheduler._matches(args.matches), synthetic_config, args)
+
+
+if __name__ == "__main__":
+    main()
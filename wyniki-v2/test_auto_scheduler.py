@@ -170,3 +170,143 @@ def test_recompute_court_times_with_explicit_start():
     ]
     result = sched.recompute_court_times(entries, config, start_time="09:00")
     assert [e["scheduled_time"] for e in result] == ["09:00", "10:00"]  # +60
+
+
+def _full_scan_available(match, court_id, start, config, scheduled, rest_slots):
+    """Reference check: compare the slot with every booked placement, as the pre-engine loop did."""
+
+    def window(court, begin, booked_match):
+        band = sched.normalize_band(booked_match.get("category_name") or booked_match.get("group_name"))
+        minutes = sched.slot_minutes_for("B1" if sched.is_b1_court(court, config) else band, config)
+        return sched.time_to_minutes(begin), sched.time_to_minutes(begin) + minutes
+
+    gap = rest_slots * sched.slot_minutes_for("", config)
+    begin, end = window(court_id, start, match)
+    players = {match["player1_name"], match["player2_name"]}
+    for placement in scheduled:
+        other = placement["match"]
+        if not players & {other["player1_name"], other["player2_name"]}:
+            continue
+        other_begin, other_end = window(placement["court_id"], placement["scheduled_time"], other)
+        if begin < other_end + gap and other_begin < end + gap:
+            return False
+    return True
+
+
+def test_schedule_engine_availability_matches_full_scan():
+    config = sched.build_default_config(_courts())
+    engine = sched.ScheduleEngine(config)
+    scheduled = []
+    booked = [
+        ("c1", "09:30", {"id": 1, "category_name": "B2", "player1_name": "X", "player2_name": "A"}),
+        ("c4", "11:00", {"id": 2, "category_name": "B1", "player1_name": "Y", "player2_name": "X"}),
+    ]
+    for court_id, start, match in booked:
+        engine.book(match, court_id, sched.time_to_minutes(start))
+        scheduled.append({"match": match, "court_id": court_id, "scheduled_time": start})
+
+    for court_id in ("c1", "c2", "c4"):
+        for minutes in range(8 * 60, 15 * 60, 15):
+            start = sched.minutes_to_time(minutes)
+            for players in (("X", "B"), ("Y", "C"), ("D", "E")):
+                match = {"category_name": "B2", "player1_name": players[0], "player2_name": players[1]}
+                expected = _full_scan_available(match, court_id, start, config, scheduled, 1)
+                assert engine.is_available(match, court_id, minutes) is expected
+
+
+def test_schedule_engine_move_returns_only_shifted_entries():
+    config = sched.build_default_config(_courts())
+    entries = [
+        {"id": i, "category_name": "B2", "court_id": court, "day_date": "2026-05-23",
+         "scheduled_time": time, "player1_name": f"P{i}", "player2_name": f"Q{i}"}
+        for i, court, time in [
+            (1, "c1", "09:30"), (2, "c1", "10:30"), (3, "c1", "11:30"),
+            (4, "c2", "09:30"), (5, "c2", "10:30"), (6, "c2", "11:30"),
+        ]
+    ]
+    engine = sched.ScheduleEngine(config)
+    engine.load(entries)
+
+    changed = engine.move(2, "c2", scheduled_time="10:30")
+
+    assert sorted(entry["id"] for entry in changed) == [2, 3, 5, 6]
+    times = {entry["id"]: (entry["court_id"], entry["scheduled_time"]) for entry in entries}
+    assert times[1] == ("c1", "09:30")
+    assert times[3] == ("c1", "10:30")
+    assert times[4] == ("c2", "09:30")
+    assert times[2] == ("c2", "10:30")
+    assert times[5] == ("c2", "11:30")
+    assert times[6] == ("c2", "12:30")
+
+
+def _group_matches(category, players, start_id=1):
+    matches = []
+    for index, first in enumerate(players):
+        for second in players[index + 1:]:
+            matches.append({"id": start_id + len(matches), "category_name": category, "phase": "Grupowa",
+                            "player1_name": first, "player2_name": second})
+    return matches
+
+
+def test_plan_tournament_days_spills_overflow_to_next_day_within_windows():
+    config = sched.build_default_config(_courts())
+    config["day_windows"] = {"2026-05-23": {"start_time": "09:00", "end_time": "12:00"}}
+    # With a rest slot between matches nobody plays more than twice in a 3-hour day.
+    matches = _group_matches("B2", ["A", "B", "C", "D", "E"])
+
+    plan = sched.plan_tournament_days(matches, config, ["2026-05-23", "2026-05-24"])
+
+    placed = [p for p in plan["placements"] if p["court_id"]]
+    assert len(placed) == 10
+    for placement in placed:
+        start = sched.time_to_minutes(placement["scheduled_time"])
+        window_start, window_end = sched.day_window(config, placement["day_date"])
+        assert window_start <= start and start + 60 <= window_end
+    first, second = plan["days"]
+    assert (first["start_time"], first["end_time"], second["start_time"]) == ("09:00", "12:00", "09:30")
+    assert first["matches"] <= 5
+    assert first["matches"] + second["matches"] == 10
+    assert first["capacity_minutes"] == 4 * 180
+    assert first["booked_minutes"] == first["matches"] * 60
+
+
+def test_plan_tournament_days_knockout_waits_for_its_groups():
+    config = sched.build_default_config(_courts())
+    config["end_time"] = "12:30"
+    matches = _group_matches("B2 Kobiety", ["A", "B", "C", "D"])
+    matches += _group_matches("B3 Kobiety", ["E", "F", "G"], start_id=50)
+    matches += [
+        {"id": 90, "category_name": "B2 Kobiety", "phase": "B2 Kobiety — Finał",
+         "player1_name": "1A", "player2_name": "2A"},
+        {"id": 91, "category_name": "B3 Kobiety", "phase": "B3 Kobiety — Finał",
+         "player1_name": "1B", "player2_name": "2B"},
+    ]
+
+    plan = sched.plan_tournament_days(matches, config, ["2026-05-23", "2026-05-24"])
+
+    def slot(placement):
+        return placement["day_date"], sched.time_to_minutes(placement["scheduled_time"])
+
+    by_id = {p["match"]["id"]: p for p in plan["placements"]}
+    for final_id, category in ((90, "B2 Kobiety"), (91, "B3 Kobiety")):
+        group_ends = [
+            (p["day_date"], sched.time_to_minutes(p["scheduled_time"]) + 60)
+            for p in plan["placements"]
+            if p["match"]["category_name"] == category and p["match"]["phase"] == "Grupowa"
+        ]
+        assert slot(by_id[final_id]) >= max(group_ends)
+    assert not [p for p in plan["placements"] if not p["court_id"]]
+
+
+def test_plan_tournament_days_reports_unplaced_when_window_runs_out():
+    config = sched.build_default_config(_courts())
+    config["end_time"] = "10:30"
+    matches = _group_matches("B2", ["A", "B", "C"])
+    matches.append({"id": 9, "category_name": "B2", "phase": "B2 — Finał", "player1_name": "1A", "player2_name": "2A"})
+
+    plan = sched.plan_tournament_days(matches, config, ["2026-05-23"])
+
+    reasons = {p["match"]["id"]: p.get("reason") for p in plan["placements"] if not p["court_id"]}
+    # A and B, C cannot all play in a single one-hour window; the final then has no feeding groups.
+    assert 9 in reasons and reasons[9] == "dependency"
+    assert "capacity" in reasons.values()
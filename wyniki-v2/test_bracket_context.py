@@ -0,0 +1,122 @@
+"""Match classification from the in-memory bracket context index."""
+from __future__ import annotations
+
+
+def _seed(database):
+    tid = database.insert_tournament(
+        name="Context Open", start_date="2026-05-01", end_date="2026-05-02",
+        active=True, city="Test", country="PL", is_public=True,
+    )
+    ids = {
+        name: database.insert_player(tid, name)
+        for name in ("Anna Nowak", "Basia Kowalska", "Celina Lis", "Dorota Lis", "Ewa Mak")
+    }
+    database.save_bracket_groups(tid, [
+        {"name": "A", "players": [ids["Anna Nowak"], ids["Basia Kowalska"], ids["Celina Lis"]]},
+        {"name": "B", "players": [ids["Dorota Lis"], ids["Ewa Mak"]]},
+    ])
+    database.save_bracket_knockout(tid, [
+        {"phase": "B2 — Finał", "position": 1, "player1_name": "Anna Nowak", "player2_name": "Basia Kowalska"},
+    ])
+    return tid
+
+
+def test_classification_covers_phases_groups_and_fallbacks(temp_db):
+    database = temp_db
+    tid = _seed(database)
+    group_a, group_b = (group["id"] for group in database.fetch_bracket_groups(tid))
+
+    detect = database.detect_bracket_context
+    # explicit knockout slot beats the shared group, in either order and by surname
+    assert detect("Basia Kowalska", "Anna Nowak", tid)["phase"] == "B2 — Finał"
+    assert detect("B. kowalska", "A. nowak", tid)["phase"] == "B2 — Finał"
+    assert detect("Anna Nowak", "Celina Lis", tid) == {"group_id": group_a, "phase": "Grupowa", "warning": None}
+    assert detect("Anna Nowak", "Ewa Mak", tid) == {
+        "group_id": None, "phase": "Pucharowa", "warning": "different_groups",
+    }
+    # "Lis" alone matches both groups by surname; the shared one decides
+    assert detect("X Lis", "Ewa Mak", tid)["group_id"] == group_b
+    assert detect("Dorota Lis", "Ewa Mak", tid)["group_id"] == group_b
+    assert detect("Nobody Here", "Ewa Mak", tid)["warning"] == "no_bracket"
+
+
+def test_index_is_reused_until_the_bracket_changes(temp_db, query_counter):
+    database = temp_db
+    tid = _seed(database)
+    database.detect_bracket_context("Anna Nowak", "Ewa Mak", tid)
+
+    with query_counter() as queries:
+        assert database.detect_bracket_context("Anna Nowak", "Ewa Mak", tid)["phase"] == "Pucharowa"
+    assert queries.count("FROM tournament_schedule_versions") == 1
+    assert queries.count("bracket_group_players") == 0
+
+    database.upsert_tournament_schedule_entries(tid, [
+        {"day_date": "2026-05-02", "scheduled_time": "10:00", "court_id": "c1", "category_name": "B2",
+         "phase": "B2 — o 3. miejsce", "player1_name": "Anna Nowak", "player2_name": "Ewa Mak", "status": "planned"},
+    ])
+    assert database.detect_bracket_context("Anna Nowak", "Ewa Mak", tid)["phase"] == "B2 — o 3. miejsce"
+
+    with database.db_conn() as conn:
+        group_b = conn.execute("SELECT id FROM bracket_groups WHERE name = 'B'").fetchone()[0]
+        conn.execute(
+            "INSERT INTO bracket_group_players (group_id, player_name) VALUES (?, 'Celina Lis')", (group_b,)
+        )
+        conn.commit()
+    assert database.detect_bracket_context("Celina Lis", "Ewa Mak", tid)["group_id"] == group_b
+
+
+def test_groups_load_with_one_query_and_are_memoized_per_request(temp_db, query_counter):
+    from flask import Flask
+
+    database = temp_db
+    tid = _seed(database)
+    expected = database.fetch_bracket_groups(tid)
+    assert [(group["name"], len(group["players"])) for group in expected] == [("A", 3), ("B", 2)]
+
+    with query_counter() as queries:
+        database.fetch_bracket_groups(tid)
+    assert queries.count("bracket_group_players") == 1
+
+    with Flask(__name__).test_request_context("/"):
+        first = database.fetch_bracket_groups(tid)
+        first[0]["players"].clear()
+        with query_counter() as queries:
+            assert database.fetch_bracket_groups(tid) == expected
+        assert queries.count("bracket_group_players") == 0
+
+        with database.db_conn() as conn:
+            conn.execute("DELETE FROM bracket_group_players WHERE player_name = 'Ewa Mak'")
+            conn.commit()
+        assert [len(group["players"]) for group in database.fetch_bracket_groups(tid)] == [3, 1]
+
+    with query_counter() as queries:
+        bracket = database.get_full_bracket(tid)
+    assert [group["name"] for group in bracket["groups"]] == ["A", "B"]
+    assert queries.count("bracket_group_players") == 1
+
+
+def test_unchanged_rewrites_keep_the_bracket_version(temp_db):
+    from wyniki.database.connection import bracket_version
+
+    database = temp_db
+    tid = _seed(database)
+
+    def version():
+        with database.db_conn() as conn:
+            return bracket_version(conn.cursor(), tid)
+
+    database.ensure_knockout_schedule_entries(tid)
+    before = version()
+    with database.db_conn() as conn:
+        conn.execute("UPDATE bracket_knockout SET phase = phase, player1_name = player1_name, score_summary = '6:4'")
+        conn.execute("UPDATE tournament_schedule SET phase = phase, player2_name = player2_name, updated_at = 'now'")
+        conn.execute("UPDATE bracket_groups SET name = name, order_num = order_num")
+        conn.execute("UPDATE bracket_group_players SET player_name = player_name")
+        conn.commit()
+    database.ensure_knockout_schedule_entries(tid)
+    assert version() == before
+
+    with database.db_conn() as conn:
+        conn.execute("UPDATE bracket_knockout SET player2_name = 'Ewa Mak'")
+        conn.commit()
+    assert version() > before
@@ -0,0 +1,96 @@
+"""Bulk tournament player import: set-based global-player resolution and per-row report."""
+from __future__ import annotations
+
+
+def _tournament(database, name="Import Open", **extra):
+    return database.insert_tournament(name, "2026-05-01", "2026-05-02", active=True, **extra)
+
+
+def test_statement_count_does_not_grow_with_rows(temp_db, query_counter):
+    database = temp_db
+    counts = []
+    for size in (5, 80):
+        tid = _tournament(database, f"Open {size}")
+        rows = [{"name": f"Player{size}x{index} Surname{index}", "category": "B1"} for index in range(size)]
+        with query_counter() as queries:
+            result = database.bulk_import_tournament_players(tid, rows)
+        assert result["inserted"] == size and result["created_global"] == size
+        counts.append(queries.statements)
+    assert counts[0] == counts[1]
+
+
+def test_matches_fill_blanks_and_report_each_row(temp_db):
+    database = temp_db
+    first = _tournament(database, "First Open")
+    database.bulk_import_tournament_players(first, [{"first_name": "Ada", "last_name": "Nowak", "gender": ""}])
+    second = _tournament(database, "Second Open")
+
+    result = database.bulk_import_tournament_players(second, [
+        {"first_name": " ada ", "last_name": "NOWAK", "country": "PL"},
+        {"name": "Jan Kowalski", "category": "B2"},
+        {"name": "Jan Kowalski", "gender": "M"},
+        {"first_name": "Ada", "last_name": "Nowak", "country": "DE", "gender": "K"},
+    ])
+
+    assert [(row["status"], row["global"]) for row in result["rows"]] == [
+        ("added", "matched"), ("added", "created"), ("added", "matched"), ("added", "matched"),
+    ]
+    assert result["rows"][0]["global_player_id"] == result["rows"][3]["global_player_id"]
+    with database.db_conn() as conn:
+        globals_ = {
+            row["last_name"]: dict(row)
+            for row in conn.execute("SELECT last_name, gender, country, category FROM global_players")
+        }
+    assert len(globals_) == 2
+    assert (globals_["Nowak"]["country"], globals_["Nowak"]["gender"]) == ("PL", "K")
+    assert (globals_["Kowalski"]["category"], globals_["Kowalski"]["gender"]) == ("B2", "M")
+
+
+def test_skip_existing_and_simulation_tournaments(temp_db):
+    database = temp_db
+    tid = _tournament(database)
+    database.bulk_import_tournament_players(tid, [{"name": "Ada Nowak", "category": "B1", "country": "PL"}])
+
+    result = database.bulk_import_tournament_players(
+        tid,
+        [{"name": "Ada Nowak"}, {"name": "Ewa Lis", "category": ""}, {"name": "Ewa Lis"}],
+        skip_existing=True,
+        fill_from_global=True,
+    )
+    assert [row["status"] for row in result["rows"]] == ["skipped", "added", "skipped"]
+    assert result["matched_global"] == 2 and result["created_global"] == 1
+
+    simulation = _tournament(database, "Simulation Open", is_simulation=True)
+    result = database.bulk_import_tournament_players(
+        simulation, [{"name": "Ada Nowak"}, {"name": "ada nowak"}], skip_existing=True,
+    )
+    assert [(row["status"], row["global_player_id"]) for row in result["rows"]] == [("added", None), ("skipped", None)]
+
+
+def test_import_file_route_uses_the_bulk_engine(temp_db):
+    from flask import Flask
+    from wyniki.api.admin_global_players import blueprint
+    from wyniki.config import settings
+    from wyniki.db_models import db
+
+    database = temp_db
+    tid = _tournament(database)
+    database.bulk_import_tournament_players(_tournament(database, "Earlier Open"), [
+        {"name": "Ada Nowak", "category": "B1", "country": "PL", "gender": "K"},
+    ])
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{settings.database_path}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    db.init_app(app)
+    app.register_blueprint(blueprint)
+
+    response = app.test_client().post(
+        f"/admin/api/global-players/tournaments/{tid}/import-file",
+        json={"text": "Ada Nowak B1 PL\nJan Kowalski B2 DE\nJan Kowalski B2 DE\n"},
+    )
+
+    payload = response.get_json()
+    assert (payload["added"], payload["matched_global"], payload["created_global"]) == (2, 2, 1)
+    players = {player["last_name"]: player for player in database.fetch_players(tid)}
+    assert (players["Nowak"]["category"], players["Nowak"]["gender"], players["Nowak"]["country"]) == ("B1", "K", "PL")
+    assert players["Kowalski"]["country"] == "DE"
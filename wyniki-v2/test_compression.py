@@ -0,0 +1,63 @@
+import gzip
+import zlib
+
+from flask import Flask
+
+from wyniki.services import compression
+
+
+def test_negotiate_encoding_respects_quality_values():
+    assert compression.negotiate_encoding("gzip, deflate, br") == "gzip"
+    assert compression.negotiate_encoding("deflate;q=1, gzip;q=0.5") == "deflate"
+    assert compression.negotiate_encoding("gzip;q=0, deflate;q=0") is None
+    assert compression.negotiate_encoding("*") == "gzip"
+    assert compression.negotiate_encoding("br") is None
+    assert compression.negotiate_encoding(None) is None
+
+
+def test_stream_compressor_flushes_every_event_independently():
+    compressor = compression.StreamCompressor("gzip")
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    frames = [f"event: court_update\ndata: {{\"court_id\": \"{idx}\"}}\n\n" for idx in range(5)]
+
+    for frame in frames:
+        # Each chunk must decode completely without waiting for later ones.
+        assert decoder.decompress(compressor.compress_event(frame)).decode() == frame
+
+
+def test_precompressed_cache_compresses_once_per_body_version():
+    cache = compression.PrecompressedCache()
+    body = b'{"players": []}' * 200
+
+    first = cache.get("players-all", body, "gzip")
+    second = cache.get("players-all", body, "gzip")
+    assert first is second
+    assert gzip.decompress(first) == body
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    changed = cache.get("players-all", body + b" ", "gzip")
+    assert gzip.decompress(changed) == body + b" "
+    assert cache.misses == 2
+
+
+def test_compressed_json_and_sse_responses_follow_accept_encoding():
+    app = Flask(__name__)
+    payload = {"courts": {str(idx): {"surname": "Kowalski"} for idx in range(100)}}
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = compression.compressed_json_no_cache(payload, "test")
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(response.get_data()) == (app.json.dumps(payload) + "\n").encode()
+
+    with app.test_request_context():
+        response = compression.compressed_json_no_cache(payload, "test")
+        assert "Content-Encoding" not in response.headers
+
+    with app.test_request_context(headers={"Accept-Encoding": "deflate"}):
+        response = compression.sse_response(lambda: iter(["event: connected\ndata: {}\n\n"]))
+        assert response.headers["Content-Encoding"] == "deflate"
+        assert response.headers["X-Accel-Buffering"] == "no"
+        decoder = zlib.decompressobj()
+        assert decoder.decompress(b"".join(response.response)) == b"event: connected\ndata: {}\n\n"
+        response.close()
@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from wyniki.config import settings
+from wyniki.database.brackets import _compute_groups_standings, _compute_knockout_slots_from_bracket
+from wyniki.services import compute_pool
+
+
+@pytest.fixture()
+def pool(monkeypatch):
+    monkeypatch.setattr(settings, "compute_pool_workers", 1)
+    monkeypatch.setattr(settings, "compute_pool_timeout_seconds", 30.0)
+    yield compute_pool
+    compute_pool.shutdown_compute_pool(wait=True)
+
+
+def _group_inputs():
+    return [{
+        "name": "Grupa A",
+        "player_names": ["Nowak", "Kowalski", "Wiśniewski"],
+        "matches": [
+            {"id": 1, "player1_name": "Nowak", "player2_name": "Kowalski", "player1_sets": 2, "player2_sets": 0,
+             "sets_history": '[{"player1_games": 4, "player2_games": 1}, {"player1_games": 4, "player2_games": 2}]',
+             "winner_name": None, "finish_reason": "normal", "result_note": None},
+            {"id": 2, "player1_name": "Kowalski", "player2_name": "Wiśniewski", "player1_sets": 2, "player2_sets": 1,
+             "sets_history": None, "winner_name": None, "finish_reason": "normal", "result_note": None},
+        ],
+    }]
+
+
+def test_offloaded_standings_match_inline_result(pool):
+    inline = _compute_groups_standings(_group_inputs())
+    offloaded = pool.run_cpu_bound(_compute_groups_standings, _group_inputs())
+    assert offloaded == inline
+    assert [row["name"] for row in offloaded[0]["standings"]] == ["Nowak", "Kowalski", "Wiśniewski"]
+    assert "_compute_groups_standings" in pool.compute_stats.offloaded()
+
+    knockout = pool.run_cpu_bound(_compute_knockout_slots_from_bracket, offloaded)
+    assert knockout == _compute_knockout_slots_from_bracket(offloaded)
+
+
+def test_timeout_falls_back_to_inline(pool):
+    started = time.perf_counter()
+    assert pool.run_cpu_bound(time.sleep, 0.3, timeout=0.01) is None
+    assert time.perf_counter() - started >= 0.3
+    assert pool.compute_stats.fallbacks()[("sleep", "timeout")] >= 1
+
+
+def test_disabled_pool_runs_inline(monkeypatch):
+    monkeypatch.setattr(settings, "compute_pool_workers", 0)
+    assert compute_pool.run_cpu_bound(sum, [1, 2, 3]) == 6
+    assert compute_pool.compute_stats.fallbacks()[("sum", "disabled")] >= 1
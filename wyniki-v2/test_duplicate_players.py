@@ -0,0 +1,86 @@
+"""Blocked fuzzy duplicate detection of global players: scoring, clusters, the admin route."""
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from wyniki.services.duplicate_players import find_duplicate_clusters, phonetic_key
+
+
+def _player(pid, first, last, birth_date=None, gender=None):
+    return {"id": pid, "first_name": first, "last_name": last, "birth_date": birth_date, "gender": gender}
+
+
+def test_spelling_variants_cluster_and_conflicts_do_not():
+    players = [
+        _player(1, "Jan", "Kowalski", "1980-02-01", "M"),
+        _player(2, "Jan", "Kowalsky", "1980-06-01"),
+        _player(3, "", "Kowalski"),
+        _player(4, "Jan", "Kowalski", "1995-07-07"),
+        _player(5, "Piotr", "Kowalski", "1980-02-01"),
+        _player(6, "Zofia", "Szymańska"),
+        _player(7, "Zofia", "Szymanska"),
+        _player(8, "Ewa", "Nowak"),
+        _player(9, "Jana", "Kowalska", "1980-02-01", "K"),
+    ]
+
+    assert phonetic_key("Kowalski") == phonetic_key("Kowalsky")
+    clusters = find_duplicate_clusters(players, tournament_counts={2: 5})
+
+    assert [cluster["player_ids"] for cluster in clusters] == [[6, 7], [1, 2, 3]]
+    polish, kowalski = clusters
+    assert polish["score"] == 1.0
+    # Player 3 has no first name; it must not chain Jan (1) to Piotr (5) or the 1995 Jan (4).
+    assert kowalski["suggested_merge"] == {"target_id": 2, "source_ids": [1, 3]}
+    assert 0.9 <= kowalski["score"] < 1.0
+
+
+def test_ten_thousand_players_well_under_a_second():
+    rng = random.Random(46)
+    stems = ["Kowal", "Nowak", "Wiśniew", "Wójcik", "Kamiń", "Lewandow", "Zieliń", "Szymań", "Woźniak", "Dąbrow"]
+    syllables = ["ra", "to", "mi", "ke", "lu", "sa", "no", "pe", "di", "ga"]
+    firsts = ["Jan", "Anna", "Piotr", "Ewa", "Marek", "Zofia", "Adam", "Ola", "Igor", "Lena"]
+    players = [
+        _player(
+            pid,
+            rng.choice(firsts),
+            rng.choice(stems) + "".join(rng.choice(syllables) for _ in range(3)),
+            f"{rng.randint(1950, 2010)}-01-01" if rng.random() < 0.7 else None,
+        )
+        for pid in range(1, 10001)
+    ]
+
+    started = time.perf_counter()
+    find_duplicate_clusters(players)
+    assert time.perf_counter() - started < 1.0
+
+
+@pytest.fixture()
+def duplicates_app(blueprint_app, temp_db):
+    from wyniki.api.admin_global_players import blueprint
+
+    return blueprint_app(blueprint), temp_db
+
+
+def test_route_reports_groups_with_counts_from_one_grouped_query(duplicates_app, query_counter):
+    app, database = duplicates_app
+    for index in range(3):
+        tid = database.insert_tournament(f"Open {index}", "2026-05-01", "2026-05-02", active=True)
+        database.bulk_import_tournament_players(tid, [{"name": "Jan Kowalsky"}])
+    database.bulk_import_tournament_players(tid, [{"name": "Jan Kowalski"}, {"name": "Ewa Nowak"}])
+
+    with query_counter() as stats:
+        response = app.test_client().get("/admin/api/global-players/duplicates")
+
+    groups = response.get_json()
+    assert len(groups) == 1
+    group = groups[0]
+    assert sorted(player["last_name"] for player in group["players"]) == ["Kowalski", "Kowalsky"]
+    counts = {player["last_name"]: player["tournaments_count"] for player in group["players"]}
+    assert counts == {"Kowalski": 1, "Kowalsky": 3}
+    target = next(player for player in group["players"] if player["last_name"] == "Kowalsky")
+    assert group["suggested_merge"]["target_id"] == target["id"]
+    assert group["last_name"] == "Kowalsky" and group["count"] == 2 and group["score"] >= 0.9
+    assert stats.statements <= 4
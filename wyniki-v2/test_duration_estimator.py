@@ -0,0 +1,104 @@
+"""Slot-length estimates learned from match history, and how the scheduler uses them."""
+from __future__ import annotations
+
+import pytest
+
+from wyniki.services import auto_scheduler as sched
+from wyniki.services import duration_estimator as estimator
+
+
+def _samples(category, phase, minutes):
+    return [(category, phase, value * 60) for value in minutes]
+
+
+def test_build_estimates_percentiles_and_outlier_filter():
+    samples = _samples("B2", "Grupowa", [40, 45, 50, 55, 60]) + [
+        ("B2", "Grupowa", 30),  # walkover-length noise
+        ("B2", "Grupowa", 6 * 3600),  # forgotten "end match"
+    ]
+
+    estimates = estimator.build_estimates(samples)
+
+    assert estimates["B2:group"] == {"samples": 5, "p50": 50 * 60, "p80": 56 * 60}
+    assert estimates["B2"]["samples"] == 5
+    assert estimates[""]["samples"] == 5
+    assert "B2:knockout" not in estimates
+
+
+def test_estimated_slot_minutes_adds_turnover_and_skips_thin_keys():
+    samples = _samples("B2", "Grupowa", [40, 45, 50, 55, 60]) + _samples("B3", "Półfinał", [70, 80])
+    estimates = estimator.build_estimates(samples)
+
+    slots = estimator.estimated_slot_minutes(estimates, which="p80", turnover_minutes=5)
+
+    # p80 = 56 min + 5 min turnover, rounded up to 5 minutes.
+    assert slots["B2:group"] == 65
+    assert slots["B2"] == 65
+    assert slots["default:group"] == 65
+    assert "B3" not in slots and "B3:knockout" not in slots
+    assert estimator.estimated_slot_minutes(estimates, which="p50", turnover_minutes=0)["B2"] == 50
+    with pytest.raises(ValueError):
+        estimator.estimated_slot_minutes(estimates, which="p95")
+
+
+def test_scheduler_prefers_estimates_but_keeps_b1_pinned():
+    config = sched.build_default_config([{"kort_id": "c1", "display_order": 1}, {"kort_id": "c2", "display_order": 2}])
+    config = sched.apply_b1_courts(config, ["c2"])
+    config["estimated_minutes"] = {"B2:knockout": 85, "B3": 50, "default": 55}
+    compiled = sched.compile_config(config)
+
+    assert compiled.duration("c1", "B2:knockout") == 85
+    assert compiled.duration("c1", "B3:group") == 50
+    assert compiled.duration("c1", ":group") == 55
+    # B1 keeps its configured slot and is not stretched by other bands' history.
+    assert compiled.duration("c2", "B2:group") == sched.slot_minutes_for("B1", config)
+
+
+def test_cache_rebuilds_only_when_fingerprint_changes():
+    cache = estimator.DurationEstimateCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return {"": {"samples": len(builds), "p50": 0, "p80": 0}}
+
+    cache.get(1, (3, 10), build)
+    cache.get(1, (3, 10), build)
+    refreshed = cache.get(1, (4, 11), build)
+
+    assert len(builds) == 2
+    assert refreshed[""]["samples"] == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.fixture()
+def history_db(temp_db):
+    estimator.duration_cache.invalidate()
+    return temp_db
+
+
+def test_autoscheduler_config_picks_up_newly_finished_matches(history_db):
+    tid = history_db.insert_tournament(
+        name="Durations", start_date="2026-05-01", end_date="2026-05-02",
+        active=True, city="Test", country="PL", is_public=False,
+    )
+    history_db.save_autoscheduler_config(tid, {"duration_source": "p50", "turnover_minutes": 0})
+
+    def finish(minutes):
+        history_db.insert_match_history({
+            "kort_id": "1", "ended_ts": f"2026-05-01T10:{minutes:02d}:00", "duration_seconds": minutes * 60,
+            "player_a": "A", "player_b": "B", "category": "B3", "phase": "Grupowa", "tournament_id": tid,
+        })
+
+    for minutes in (40, 40, 40, 40):
+        finish(minutes)
+    assert "estimated_minutes" not in history_db.get_autoscheduler_config(tid)
+
+    finish(40)
+    config = history_db.get_autoscheduler_config(tid)
+    assert config["estimated_minutes"]["B3:group"] == 40
+    assert config["duration_source"] == "p50"
+
+    for _ in range(6):
+        finish(50)
+    assert history_db.get_autoscheduler_config(tid)["estimated_minutes"]["B3:group"] == 50
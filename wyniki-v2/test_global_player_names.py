@@ -0,0 +1,62 @@
+"""Folded name keys of global players: normalizer, indexed lookups, ORM upkeep."""
+from __future__ import annotations
+
+import pytest
+
+from wyniki.services.name_keys import fold_name
+
+
+def test_fold_name_drops_diacritics_case_and_extra_spaces():
+    assert fold_name("  Łukasz  Żółć ") == fold_name("LUKASZ zolc") == "lukasz zolc"
+    assert fold_name("Søren Große") == "soren grosse"
+    assert fold_name("Müller-Lüdenscheidt") == "muller-ludenscheidt"
+    assert fold_name(None) == ""
+
+
+@pytest.fixture()
+def names_app(blueprint_app, temp_db):
+    return blueprint_app(), temp_db
+
+
+def test_raw_and_orm_paths_share_the_folded_keys(names_app):
+    app, database = names_app
+    from wyniki.db_models import GlobalPlayer, db
+    from wyniki.services.player_registry import find_or_create_global_player
+
+    tid = database.insert_tournament("Names Open", "2026-05-01", "2026-05-02", active=True)
+    database.insert_player(tid, "Łukasz Żółć", first_name="Łukasz", last_name="Żółć")
+
+    with app.app_context():
+        found = find_or_create_global_player(db.session, "LUKASZ", "zolc")
+        assert found.first_name == "Łukasz" and found.first_name_key == "lukasz"
+        created = find_or_create_global_player(db.session, "Søren", "Große")
+        db.session.commit()
+        assert (created.first_name_key, created.last_name_key) == ("soren", "grosse")
+        created.last_name = "Grosz"
+        db.session.commit()
+        assert db.session.get(GlobalPlayer, created.id).last_name_key == "grosz"
+
+    result = database.bulk_import_tournament_players(tid, [{"name": "Soren Grosz"}, {"name": "lukasz ZOLC"}])
+    assert [row["global"] for row in result["rows"]] == ["matched", "matched"]
+
+    with database.db_conn() as conn:
+        plan = " ".join(
+            row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM global_players WHERE last_name_key = ? AND first_name_key = ?",
+                ("zolc", "lukasz"),
+            )
+        )
+    assert "idx_global_players_name_keys" in plan
+
+
+def test_init_db_backfills_keys_of_existing_rows(names_app):
+    _app, database = names_app
+    with database.db_conn() as conn:
+        conn.execute("INSERT INTO global_players (first_name, last_name) VALUES ('Ángel', 'Núñez')")
+        conn.commit()
+
+    database.init_db()
+
+    with database.db_conn() as conn:
+        row = conn.execute("SELECT first_name_key, last_name_key FROM global_players").fetchone()
+    assert tuple(row) == ("angel", "nunez")
@@ -0,0 +1,129 @@
+"""AI-assisted import preview against a local stub model: disk cache, chunking, concurrency cap, PL default."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _StubModel:
+    """Answers generateContent calls with PL (or ``countries[last_name]``), counting calls and overlap."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.countries = {}
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def answer(self, body: dict) -> dict:
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+            prompt = body["contents"][0]["parts"][0]["text"]
+            candidates = json.loads(prompt.rsplit("Candidates:\n", 1)[1])
+            players = [
+                {"line_number": item["line_number"], "country": self.countries.get(item["last_name"], "PL"), "notes": "stub"}
+                for item in candidates
+            ]
+            return {"candidates": [{"content": {"parts": [{"text": json.dumps({"players": players})}]}}]}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture()
+def stub_model():
+    model = _StubModel()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            payload = json.dumps(model.answer(body)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    model.base_url = f"http://127.0.0.1:{server.server_address[1]}/v1beta"
+    yield model
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def ai_app(blueprint_app, temp_db, tmp_path, monkeypatch, stub_model):
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+
+    from wyniki.api.admin_tournaments import blueprint
+    from wyniki.config import settings
+
+    monkeypatch.setattr(settings, "import_players_ai_api_key", "stub-key")
+    monkeypatch.setattr(settings, "import_players_ai_base_url", stub_model.base_url)
+    monkeypatch.setattr(settings, "import_players_ai_cache_dir", "")
+    tid = temp_db.insert_tournament("AI Open", "2026-05-01", "2026-05-02", active=True)
+    return blueprint_app(blueprint).test_client(), tid, tmp_path
+
+
+def _preview(client, tid, text):
+    response = client.post(f"/admin/api/tournaments/{tid}/players/parse-import", json={"text": text})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_same_list_is_answered_from_the_disk_cache(ai_app, stub_model):
+    client, tid, data_dir = ai_app
+    text = "Jan Kowalski B1M\nAnna Nowak B1K"
+
+    first = _preview(client, tid, text)
+    second = _preview(client, tid, text)
+
+    assert stub_model.calls == 1
+    assert [player["country"] for player in second["players"]] == ["PL", "PL"]
+    assert second["players"] == first["players"]
+    assert len(list((data_dir / "ai-import-cache").glob("*.json"))) == 1
+
+
+def test_chunks_run_in_parallel_within_the_tournament_cap(ai_app, stub_model, monkeypatch):
+    from wyniki.config import settings
+
+    client, tid, _data_dir = ai_app
+    monkeypatch.setattr(settings, "import_players_ai_chunk_size", 2)
+    monkeypatch.setattr(settings, "import_players_ai_concurrency", 2)
+    stub_model.delay = 0.2
+    text = "\n".join(f"Gracz{index} Testowy{index} B2M" for index in range(7))
+
+    started = time.perf_counter()
+    payload = _preview(client, tid, text)
+    elapsed = time.perf_counter() - started
+
+    assert stub_model.calls == 4
+    assert stub_model.max_active == 2
+    assert elapsed < 4 * stub_model.delay
+    assert {player["country"] for player in payload["players"]} == {"PL"}
+
+
+def test_polish_default_only_fills_countries_the_model_left_blank(ai_app, stub_model):
+    client, tid, _data_dir = ai_app
+    stub_model.countries = {"Novák": "CZ", "Nowak": ""}
+
+    payload = _preview(client, tid, "B1 Kobiety\nAnna Nowak\nJana Novák\nŁucja Wrona PL")
+
+    assert stub_model.calls == 1
+    assert {player["last_name"]: player["country"] for player in payload["players"]} == {
+        "Nowak": "PL", "Novák": "CZ", "Wrona": "PL",
+    }
@@ -1,3 +1,5 @@
+import json
+
 from wyniki.database import (
     _compute_knockout_slots_from_bracket,
     _compute_provisional_knockout_slots_from_bracket,
@@ -116,3 +118,71 @@ def test_two_groups_per_category_create_semifinals():
     assert phases.count("B1 Mężczyźni — Półfinał") == 2
     assert "B1 Mężczyźni — Finał" in phases
     assert "B1 Mężczyźni — o 3. miejsce" in phases
+
+
+def _finished_match(conn, tid, player1, player2, phase, created_at, sets=(2, 0), **extra):
+    sets_history = json.dumps([
+        {"player1_games": 6, "player2_games": 3 + index} for index in range(sets[0] + sets[1])
+    ])
+    columns = {
+        "court_id": "c1", "player1_name": player1, "player2_name": player2, "status": "finished",
+        "tournament_id": tid, "phase": phase, "created_at": created_at, "sets_history": sets_history,
+        "player1_sets": sets[0], "player2_sets": sets[1], **extra,
+    }
+    conn.execute(
+        f"INSERT INTO matches ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        tuple(columns.values()),
+    )
+
+
+def test_full_bracket_resolves_knockout_slots_like_per_slot_lookups(temp_db, query_counter):
+    database = temp_db
+    tid = database.insert_tournament(
+        name="Knockout Open", start_date="2026-05-01", end_date="2026-05-02",
+        active=True, city="Test", country="PL", is_public=True,
+    )
+    semi, final, third = "B2 — Półfinał", "B2 — Finał", "B2 — o 3. miejsce"
+    database.save_bracket_knockout(tid, [
+        {"phase": semi, "position": 1, "player1_name": "Anna Nowak", "player2_name": "Basia Kowalska"},
+        {"phase": semi, "position": 2, "player1_name": "Celina Wiśniewska", "player2_name": "Dorota Zając"},
+        {"phase": final, "position": 1, "player1_name": "Anna Nowak", "player2_name": "Dorota Zając"},
+        {"phase": third, "position": 1, "player1_name": "Basia Kowalska", "player2_name": "Celina Wiśniewska",
+         "winner_name": "Basia Kowalska", "score_summary": "walkover"},
+        {"phase": "B3 — Finał", "position": 1, "player1_name": "Ewa Lis", "player2_name": "Fryda Lis"},
+        {"phase": "B3 — Finał", "position": 2, "player1_name": "Gosia Mak", "player2_name": None},
+    ])
+    with database.db_conn() as conn:
+        # exact pair, newest of two wins; an older rematch and a test match are ignored
+        _finished_match(conn, tid, "Basia Kowalska", "Anna Nowak", semi, "2026-05-01T10:00:00", sets=(0, 2))
+        _finished_match(conn, tid, "Anna Nowak", "Basia Kowalska", semi, "2026-05-01T12:00:00", sets=(2, 1))
+        _finished_match(conn, tid, "Anna Nowak", "Basia Kowalska", semi, "2026-05-01T13:00:00",
+                        finish_reason="test")
+        # surname fallback (LIKE '%surname', ASCII case-insensitive)
+        _finished_match(conn, tid, "c. wiśniewska", "D. zając", semi, "2026-05-01T11:00:00",
+                        winner_name="D. zając")
+        # recorded under the generic knockout phase
+        _finished_match(conn, tid, "Dorota Zając", "Anna Nowak", "Pucharowa", "2026-05-02T15:00:00")
+        _finished_match(conn, tid, "Basia Kowalska", "Celina Wiśniewska", third, "2026-05-02T09:00:00")
+        # outside the tournament dates
+        _finished_match(conn, tid, "Ewa Lis", "Fryda Lis", "B3 — Finał", "2026-05-03T09:00:00")
+        conn.commit()
+
+    with query_counter() as queries:
+        bracket = database.get_full_bracket(tid)
+    assert queries.count("FROM matches") == 1
+
+    with database.db_conn() as conn:
+        cursor = conn.cursor()
+        for phase, slots in bracket["knockout"].items():
+            for slot in slots:
+                result = database._detect_knockout_result(
+                    cursor, slot["player1"], slot["player2"], "2026-05-01", "2026-05-02", tid, phase
+                )
+                assert slot["sets"] == (result or {}).get("sets")
+
+    semis = bracket["knockout"][semi]
+    assert semis[0]["winner"] == "Anna Nowak" and semis[0]["score"].count("6") == 3
+    assert semis[1]["winner"] == "Dorota Zając"
+    assert bracket["knockout"][final][0]["winner"] == "Dorota Zając"
+    assert bracket["knockout"][third][0]["score"] == "walkover"
+    assert bracket["knockout"]["B3 — Finał"][0]["sets"] is None
@@ -0,0 +1,86 @@
+"""Overlay settings: logo stored as a content-addressed asset, versioned settings with ETag/304."""
+from __future__ import annotations
+
+import base64
+import json
+
+import pytest
+
+_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+)
+_DATA_URL = "data:image/png;base64," + base64.b64encode(_PNG).decode("ascii")
+
+
+@pytest.fixture()
+def overlay_app(blueprint_app, temp_db, tmp_path, monkeypatch):
+    from wyniki.api.overlay_api import blueprint
+    from wyniki.services import overlay_settings
+
+    monkeypatch.setattr(overlay_settings, "_overlay_settings", {})
+    monkeypatch.setattr(overlay_settings, "_loaded_from_db", False)
+    return blueprint_app(blueprint).test_client(), temp_db, tmp_path
+
+
+def test_logo_upload_is_stored_once_and_served_immutable(overlay_app):
+    client, _database, data_dir = overlay_app
+
+    first = client.post("/api/overlay/logo", json={"logo": _DATA_URL}).get_json()
+    again = client.post("/api/overlay/logo", json={"logo": _DATA_URL}).get_json()
+
+    url = first["tournament_logo"]
+    assert url.startswith("/api/overlay/assets/") and url.endswith(".png") and again["tournament_logo"] == url
+    assert [path.name for path in (data_dir / "overlay-assets").iterdir()] == [url.rsplit("/", 1)[1]]
+
+    asset = client.get(url)
+    assert asset.data == _PNG
+    assert "immutable" in asset.headers["Cache-Control"] and "max-age=31536000" in asset.headers["Cache-Control"]
+
+    settings = client.get("/api/overlay/settings")
+    assert settings.get_json()["tournament_logo"] == url
+    assert "data:" not in settings.get_data(as_text=True)
+
+    assert client.post("/api/overlay/logo", json={"logo": "data:text/plain;base64,aGk="}).status_code == 400
+
+
+def test_svg_logo_is_served_sandboxed(overlay_app):
+    client, _database, _data_dir = overlay_app
+    svg = b'<svg xmlns="http://www.w3.org/2000/svg"><script>alert(document.cookie)</script></svg>'
+    data_url = "data:image/svg+xml;base64," + base64.b64encode(svg).decode("ascii")
+
+    url = client.post("/api/overlay/logo", json={"logo": data_url}).get_json()["tournament_logo"]
+    asset = client.get(url)
+
+    assert asset.mimetype == "image/svg+xml"
+    assert "sandbox" in asset.headers["Content-Security-Policy"]
+    assert "default-src 'none'" in asset.headers["Content-Security-Policy"]
+    assert asset.headers["X-Content-Type-Options"] == "nosniff"
+
+
+def test_settings_answer_304_until_a_writer_bumps_the_version(overlay_app):
+    client, _database, _data_dir = overlay_app
+
+    first = client.get("/api/overlay/settings")
+    etag = first.headers["ETag"]
+    version = first.get_json()["version"]
+    assert client.get("/api/overlay/settings", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/api/overlay/stats/on")
+    changed = client.get("/api/overlay/settings", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.get_json()["version"] == version + 1
+    assert changed.headers["ETag"] != etag
+
+
+def test_inline_logo_from_older_installs_moves_to_an_asset(overlay_app):
+    client, database, data_dir = overlay_app
+    database.upsert_app_settings({
+        "overlay_settings": json.dumps({"tournament_logo": _DATA_URL, "tournament_name": "Open", "overlays": {}}),
+    })
+
+    payload = client.get("/api/overlay/settings").get_json()
+
+    assert payload["tournament_logo"].startswith("/api/overlay/assets/")
+    assert len(list((data_dir / "overlay-assets").iterdir())) == 1
+    stored = json.loads(database.fetch_app_settings(["overlay_settings"])["overlay_settings"])
+    assert stored["tournament_logo"] == payload["tournament_logo"]
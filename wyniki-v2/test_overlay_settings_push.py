@@ -0,0 +1,68 @@
+"""Overlay settings writers publish versioned overlay_settings events on the public SSE stream."""
+from __future__ import annotations
+
+import json
+import queue
+
+import pytest
+
+
+@pytest.fixture()
+def overlay_stream_app(blueprint_app, monkeypatch):
+    from wyniki.api.overlay_api import blueprint as overlay_blueprint
+    from wyniki.api.stream import blueprint as stream_blueprint
+    from wyniki.services import overlay_settings
+    from wyniki.services.event_broker import event_broker
+
+    monkeypatch.setattr(overlay_settings, "_overlay_settings", {})
+    monkeypatch.setattr(overlay_settings, "_loaded_from_db", False)
+    listener = event_broker.listen()
+    yield blueprint_app(overlay_blueprint, stream_blueprint).test_client(), listener
+    event_broker.discard(listener)
+
+
+def _overlay_events(listener):
+    events = []
+    while True:
+        try:
+            event = listener.get_nowait()
+        except queue.Empty:
+            return events
+        if event.get("type") == "overlay_settings":
+            events.append(event)
+
+
+def test_writers_publish_the_new_version_and_changed_overlays(overlay_stream_app):
+    client, listener = overlay_stream_app
+    version = client.get("/api/overlay/settings").get_json()["version"]
+
+    client.post("/api/overlay/stats/on?mode=advanced")
+    client.put("/api/overlay/settings", json={"tournament_name": "Open", "overlays": {"5": {"name": "Extra"}}})
+    client.delete("/api/overlay/overlays/5")
+
+    toggle, update, delete = _overlay_events(listener)
+    assert [event["version"] for event in (toggle, update, delete)] == [version + 1, version + 2, version + 3]
+    assert sorted(toggle["overlays"]) == ["1", "2", "3", "4"]
+    stats = [element for element in toggle["overlays"]["1"]["elements"] if element["type"] == "stats"]
+    assert stats and all(element["visible"] and element["stats_mode"] == "advanced" for element in stats)
+    assert list(update["overlays"]) == ["5"] and update["tournament_name"] == "Open"
+    assert delete["overlays"] == {} and delete["removed"] == ["5"]
+    assert delete["etag"] == client.get("/api/overlay/settings").headers["ETag"].strip('W/"')
+
+
+def test_stream_opens_with_the_current_settings_version(overlay_stream_app):
+    client, _listener = overlay_stream_app
+    version = client.get("/api/overlay/settings").get_json()["version"]
+
+    response = client.get("/api/stream", buffered=False)
+    chunks = response.response
+    hint = None
+    for chunk in chunks:
+        text = chunk.decode() if isinstance(chunk, bytes) else chunk
+        if text.startswith("event: overlay_settings"):
+            hint = json.loads(text.split("data: ", 1)[1])
+            break
+    response.close()
+
+    assert hint == {"type": "overlay_settings", "version": version, "etag": hint["etag"]}
+    assert "overlays" not in hint
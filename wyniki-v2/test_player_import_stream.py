@@ -0,0 +1,102 @@
+"""Streamed player uploads: lazy CSV/text rows, chunked bulk writes, progress events, result file."""
+from __future__ import annotations
+
+import csv
+import io
+import queue
+
+import pytest
+
+
+@pytest.fixture()
+def import_app(blueprint_app, temp_db, tmp_path, monkeypatch):
+    from wyniki.api.admin_global_players import blueprint as global_players_blueprint
+    from wyniki.api.admin_tournaments import blueprint as tournaments_blueprint
+    from wyniki.config import settings
+
+    monkeypatch.setattr(settings, "player_import_dir", str(tmp_path / "imports"))
+    monkeypatch.setattr(settings, "player_import_chunk_size", 2)
+    return blueprint_app(global_players_blueprint, tournaments_blueprint), temp_db
+
+
+def _finish(client, payload):
+    from wyniki.services.player_import import player_import_jobs
+
+    job = payload["job"]
+    assert player_import_jobs.get(job["tournament_id"], job["id"]).wait(10)
+    return client.get(payload["status_url"]).get_json()["job"]
+
+
+def test_csv_upload_is_imported_in_chunks_with_progress_and_a_result_file(import_app):
+    app, database = import_app
+    from wyniki.services.office_event_broker import office_event_broker
+
+    tid = database.insert_tournament("Stream Open", "2026-05-01", "2026-05-02", active=True)
+    listener = office_event_broker.listen(tid)
+    body = (
+        "Imię;Nazwisko;Kategoria;Kraj\n"
+        "Łukasz;Żółć;B1;PL\n"
+        "Ada;Nowak;B2;PL\n"
+        ";;B3;PL\n"
+        "Jan;Kowalski;B2;DE\n"
+        "Ada;Nowak;B2;PL\n"
+    ).encode("cp1250")
+    client = app.test_client()
+
+    response = client.post(
+        f"/admin/api/global-players/tournaments/{tid}/import-file",
+        data={"file": (io.BytesIO(body), "federation.csv")},
+        content_type="multipart/form-data",
+    )
+    assert response.status_code == 202
+    job = _finish(client, response.get_json())
+
+    assert (job["status"], job["inserted"], job["skipped"], job["invalid"]) == ("done", 3, 1, 1)
+    players = {player["last_name"]: player for player in database.fetch_players(tid)}
+    assert players["Żółć"]["first_name"] == "Łukasz" and players["Kowalski"]["country"] == "DE"
+
+    result = client.get(response.get_json()["result_url"])
+    assert result.headers["Content-Type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(result.get_data(as_text=True))))
+    assert [(row["line"], row["status"]) for row in rows] == [
+        ("2", "added"), ("3", "added"), ("4", "invalid"), ("5", "added"), ("6", "skipped"),
+    ]
+
+    events = []
+    while True:
+        try:
+            events.append(listener.get_nowait())
+        except queue.Empty:
+            break
+    office_event_broker.discard(tid, listener)
+    progress = [event["job"]["processed"] for event in events if event.get("event") == "player_import"]
+    assert progress[0] < progress[-1] == 5
+    assert "players" in events[-1]["scopes"]
+
+
+def test_parse_import_stays_a_read_only_preview(import_app):
+    app, database = import_app
+    tid = database.insert_tournament("Preview Open", "2026-05-01", "2026-05-02", active=True)
+    client = app.test_client()
+
+    upload = client.post(
+        f"/admin/api/tournaments/{tid}/players/parse-import",
+        data={"file": (io.BytesIO("B1 Kobiety\nAnna Lis PL\n".encode("utf-8")), "lista.txt")},
+        content_type="multipart/form-data",
+    )
+    preview = client.post(f"/admin/api/tournaments/{tid}/players/parse-import", json={"text": "B1 Kobiety\nAnna Lis PL"})
+
+    assert upload.status_code == 400
+    assert [player["name"] for player in preview.get_json()["players"]] == ["Anna Lis"]
+    assert database.fetch_players(tid) == []
+
+
+def test_rows_are_read_lazily_with_positional_columns(tmp_path):
+    from wyniki.services.player_import import iter_upload_rows
+
+    path = tmp_path / "plain.csv"
+    path.write_text("Ada Nowak,B1,PL,K\n" * 50_000, encoding="utf-8")
+
+    rows = iter_upload_rows(path, "plain.csv")
+    assert next(rows) == {"line_number": 1, "name": "Ada Nowak", "category": "B1", "country": "PL", "gender": "K"}
+    assert not isinstance(rows, list)
@@ -0,0 +1,44 @@
+import threading
+
+from flask import Flask, jsonify, request
+
+from wyniki.config import settings
+from wyniki.services import priority_lanes
+
+
+def _app():
+    app = Flask(__name__)
+
+    @app.route("/api/players/all")
+    @priority_lanes.cpu_lane
+    def heavy():
+        return jsonify({"thread": threading.get_ident(), "arg": request.args.get("q")})
+
+    @app.route("/api/match-events", methods=["POST"])
+    def umpire():
+        return jsonify({"lane": priority_lanes.request_lane()})
+
+    return app
+
+
+def test_classify_request_separates_umpire_writes_and_cpu_reads():
+    app = _app()
+    assert priority_lanes.classify_request("/api/match-events") == priority_lanes.LANE_FAST
+    assert priority_lanes.classify_request("/api/matches/3/finish") == priority_lanes.LANE_FAST
+    assert priority_lanes.classify_request("/api/players/all", app.view_functions["heavy"]) == priority_lanes.LANE_CPU
+    assert priority_lanes.classify_request("/api/snapshot") == priority_lanes.LANE_DEFAULT
+    assert app.test_client().post("/api/match-events").get_json() == {"lane": "fast"}
+
+
+def test_cpu_lane_runs_view_off_the_calling_thread_with_request_context(monkeypatch):
+    monkeypatch.setattr(settings, "cpu_lane_workers", 2)
+    response = _app().test_client().get("/api/players/all?q=nowak")
+    assert response.status_code == 200
+    assert response.get_json()["arg"] == "nowak"
+    assert response.get_json()["thread"] != threading.get_ident()
+
+
+def test_cpu_lane_runs_inline_when_disabled(monkeypatch):
+    monkeypatch.setattr(settings, "cpu_lane_workers", 0)
+    response = _app().test_client().get("/api/players/all")
+    assert response.get_json()["thread"] == threading.get_ident()
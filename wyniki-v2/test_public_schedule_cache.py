@@ -0,0 +1,155 @@
+"""Versioned public schedule documents: per-day payloads, ETags and invalidation."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture()
+def schedule_app(blueprint_app, temp_db):
+    from wyniki.api.brackets import bracket_public_bp
+
+    return blueprint_app(bracket_public_bp), temp_db
+
+
+def _seed(database):
+    tid = database.insert_tournament(
+        name="Cache Open", start_date="2026-05-01", end_date="2026-05-02",
+        active=True, city="Test", country="PL", is_public=True,
+    )
+    database.upsert_tournament_schedule_entries(tid, [
+        {"day_date": "2026-05-01", "scheduled_time": "10:00", "court_id": "c1", "category_name": "B2",
+         "player1_name": "Anna", "player2_name": "Basia", "status": "planned"},
+        {"day_date": "2026-05-02", "scheduled_time": "11:00", "court_id": "c1", "category_name": "B2",
+         "player1_name": "Celina", "player2_name": "Dorota", "status": "planned"},
+    ])
+    return tid
+
+
+def test_documents_are_cached_per_day_until_a_version_moves(schedule_app):
+    _app, database = schedule_app
+    tid = _seed(database)
+
+    etag, full = database.fetch_public_schedule_document(tid)
+    day_etag, day = database.fetch_public_schedule_document(tid, "2026-05-02")
+
+    assert full["day_dates"] == ["2026-05-01", "2026-05-02"]
+    assert [item["date"] for item in day["days"]] == ["2026-05-02"]
+    assert database.fetch_public_schedule_document(tid)[1] is full
+    assert database.fetch_public_schedule_document(tid, "2026-06-01")[1]["days"] == []
+
+    first_day_entry = full["days"][0]["categories"][0]["matches"][0]
+    database.update_tournament_schedule_entry(tid, first_day_entry["id"], {"scheduled_time": "09:30"})
+
+    new_etag, refreshed = database.fetch_public_schedule_document(tid)
+    assert new_etag != etag
+    assert refreshed["days"][0]["categories"][0]["matches"][0]["scheduled_time"] == "09:30"
+    # The other day's document is unchanged, and so is its ETag.
+    assert database.fetch_public_schedule_document(tid, "2026-05-02")[0] == day_etag
+
+
+def test_match_result_writes_refresh_the_schedule(schedule_app):
+    _app, database = schedule_app
+    tid = _seed(database)
+    entry = database.fetch_tournament_schedule(tid)[0]
+    with database.db_conn() as conn:
+        cursor = conn.execute(
+            "INSERT INTO matches (court_id, player1_name, player2_name, status, tournament_id) "
+            "VALUES ('c1', 'Anna', 'Basia', 'in_progress', ?)",
+            (tid,),
+        )
+        conn.execute("UPDATE tournament_schedule SET match_id = ? WHERE id = ?", (cursor.lastrowid, entry["id"]))
+        conn.commit()
+        match_id = cursor.lastrowid
+
+    etag, _payload = database.fetch_public_schedule_document(tid)
+    with database.db_conn() as conn:
+        conn.execute("UPDATE matches SET player1_games = 3 WHERE id = ?", (match_id,))
+        conn.commit()
+    assert database.fetch_public_schedule_document(tid)[0] == etag
+
+    with database.db_conn() as conn:
+        conn.execute(
+            "UPDATE matches SET status = 'finished', winner_name = 'Anna', player1_sets = 2 WHERE id = ?",
+            (match_id,),
+        )
+        conn.commit()
+    assert database.fetch_public_schedule_document(tid)[0] != etag
+
+
+def test_schedule_endpoint_answers_304_for_a_current_etag(schedule_app):
+    app, database = schedule_app
+    tid = _seed(database)
+    client = app.test_client()
+
+    first = client.get(f"/api/tournament/{tid}/schedule")
+    etag = first.headers["ETag"]
+    repeat = client.get(f"/api/tournament/{tid}/schedule", headers={"If-None-Match": etag})
+    day = client.get(f"/api/tournament/{tid}/schedule?day=2026-05-01")
+
+    assert first.status_code == 200 and "no-store" not in first.headers["Cache-Control"]
+    assert repeat.status_code == 304 and repeat.data == b""
+    assert [item["date"] for item in day.get_json()["days"]] == ["2026-05-01"]
+    assert day.headers["ETag"] != etag
+
+    from wyniki.services.office_event_broker import emit_office_invalidation
+
+    with database.db_conn() as conn:
+        conn.execute("UPDATE tournaments SET name = 'Renamed Open' WHERE id = ?", (tid,))
+        conn.commit()
+    emit_office_invalidation(tid, ["dashboard"])
+    renamed = client.get(f"/api/tournament/{tid}/schedule", headers={"If-None-Match": etag})
+    assert renamed.status_code == 200
+    assert renamed.get_json()["tournament"]["name"] == "Renamed Open"
+
+
+def test_knockout_tournament_schedule_reads_do_not_move_the_version(schedule_app):
+    app, database = schedule_app
+    tid = _seed(database)
+    with database.db_conn() as conn:
+        conn.execute(
+            "INSERT INTO bracket_knockout (tournament_id, phase, position, player1_name, player2_name) "
+            "VALUES (?, 'B2 Półfinał', 1, 'Anna', 'Celina')",
+            (tid,),
+        )
+        conn.commit()
+    client = app.test_client()
+    from wyniki.database.connection import schedule_versions
+
+    def versions():
+        with database.db_conn() as conn:
+            return schedule_versions(conn.cursor(), tid)
+
+    etag = client.get(f"/api/tournament/{tid}/schedule").headers["ETag"]
+    version = versions()
+    document = database.fetch_public_schedule_document(tid)[1]
+    repeats = [client.get(f"/api/tournament/{tid}/schedule", headers={"If-None-Match": etag}) for _ in range(3)]
+
+    assert [response.status_code for response in repeats] == [304, 304, 304]
+    assert versions() == version
+    assert database.fetch_public_schedule_document(tid)[1] is document
+    assert [entry["phase"] for entry in database.fetch_tournament_schedule(tid) if entry["source_type"] == "knockout"] == [
+        "B2 Półfinał"
+    ]
+
+
+def test_warm_reads_skip_the_schedule_sync_until_the_bracket_moves(schedule_app, query_counter):
+    app, database = schedule_app
+    tid = _seed(database)
+    client = app.test_client()
+    client.get(f"/api/tournament/{tid}/schedule")
+
+    with query_counter() as queries:
+        assert client.get(f"/api/tournament/{tid}/schedule").status_code == 200
+    assert queries.count("bracket_knockout") == 0 and queries.count("bracket_groups") == 0
+
+    with database.db_conn() as conn:
+        conn.execute(
+            "INSERT INTO bracket_knockout (tournament_id, phase, position, player1_name, player2_name) "
+            "VALUES (?, 'B2 Finał', 1, 'Anna', 'Dorota')",
+            (tid,),
+        )
+        conn.commit()
+    client.get(f"/api/tournament/{tid}/schedule")
+    assert [entry["phase"] for entry in database.fetch_tournament_schedule(tid) if entry["source_type"] == "knockout"] == [
+        "B2 Finał"
+    ]
@@ -0,0 +1,128 @@
+"""Per-request SQL counting: constant query counts for key endpoints, budget logging, metrics."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+
+@pytest.fixture()
+def budget_app(blueprint_app, temp_db):
+    from wyniki.api.brackets import bracket_public_bp
+    from wyniki.services.query_budget import finish_request_queries
+
+    app = blueprint_app(bracket_public_bp)
+    app.teardown_request(lambda _exc: finish_request_queries())
+    return app, temp_db
+
+
+def _seed(database, name, entries):
+    tid = database.insert_tournament(
+        name=name, start_date="2026-05-01", end_date="2026-05-01",
+        active=True, city="Test", country="PL", is_public=True,
+    )
+    database.upsert_tournament_schedule_entries(tid, [
+        {"day_date": "2026-05-01", "scheduled_time": f"{9 + index // 4:02d}:{(index % 4) * 15:02d}",
+         "court_id": f"c{index % 4 + 1}", "category_name": "B2",
+         "player1_name": f"Player {index}A", "player2_name": f"Player {index}B", "status": "planned"}
+        for index in range(entries)
+    ])
+    return tid
+
+
+def test_public_schedule_query_count_does_not_grow_with_entries(budget_app, query_counter):
+    app, database = budget_app
+    small = _seed(database, "Small Open", 2)
+    large = _seed(database, "Large Open", 40)
+    client = app.test_client()
+    database.fetch_tournaments()  # both tournaments in the process-wide registry
+
+    cold, warm = [], []
+    for tid in (small, large):
+        with query_counter() as queries:
+            assert client.get(f"/api/tournament/{tid}/schedule").status_code == 200
+        cold.append(queries.statements)
+        with query_counter() as queries:
+            assert client.get(f"/api/tournament/{tid}/schedule").status_code == 200
+        warm.append(queries.statements)
+
+    assert cold[0] == cold[1]
+    assert warm[0] == warm[1] <= cold[0]
+
+
+def test_budget_overrun_is_logged_and_observed(budget_app, monkeypatch):
+    app, database = budget_app
+    tid = _seed(database, "Budget Open", 3)
+
+    from wyniki.config import settings
+    from wyniki.services import query_budget
+
+    events = []
+
+    class _Recorder:
+        def warning(self, event, **fields):
+            events.append((event, fields))
+
+    monkeypatch.setattr(query_budget, "logger", _Recorder())
+    monkeypatch.setattr(settings, "query_budget_statements", 1)
+    app.test_client().get(f"/api/tournament/{tid}/schedule")
+
+    assert [event for event, _fields in events] == ["query_budget_exceeded"]
+    fields = events[0][1]
+    assert fields["statements"] > 1 and fields["budget_statements"] == 1
+    assert fields["endpoint"].startswith("bracket_public")
+
+    families = {family.name: family for family in query_budget.query_budget_stats.collect()}
+    samples = [
+        sample for sample in families["wyniki_request_sql_statements"].samples
+        if sample.labels.get("endpoint") == fields["endpoint"] and sample.name.endswith("_count")
+    ]
+    assert samples and samples[0].value >= 1
+
+
+def test_repeated_statements_are_flagged_within_budget(monkeypatch):
+    from flask import Flask
+    from wyniki.config import settings
+    from wyniki.services import query_budget
+
+    events = []
+
+    class _Recorder:
+        def warning(self, event, **fields):
+            events.append((event, fields))
+
+    monkeypatch.setattr(query_budget, "logger", _Recorder())
+    monkeypatch.setattr(settings, "query_budget_statements", 0)
+    monkeypatch.setattr(settings, "query_budget_seconds", 0)
+    monkeypatch.setattr(settings, "query_repeat_threshold", 5)
+
+    app = Flask(__name__)
+    with app.test_request_context("/loop"):
+        for _ in range(6):
+            query_budget.record_query("SELECT * FROM players WHERE id = ?", 0.0001)
+        query_budget.record_query("SELECT 1", 0.0001)
+        stats = query_budget.finish_request_queries()
+
+    assert stats.statements == 7
+    assert events[0][0] == "query_repeat_suspected"
+    assert events[0][1]["repeated"] == 6
+    assert events[0][1]["repeated_sql"] == "SELECT * FROM players WHERE id = ?"
+
+
+def test_failed_sqlalchemy_statement_does_not_skew_later_timings():
+    from sqlalchemy import create_engine, text
+    from wyniki.services.query_budget import capture_queries, instrument_sqlalchemy
+
+    instrument_sqlalchemy()
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with capture_queries() as queries:
+            with pytest.raises(Exception):
+                conn.execute(text("SELECT * FROM missing_table"))
+            conn.execute(text("SELECT 1"))
+        assert queries.statements == 2 and queries.count("missing_table") == 1
+        time.sleep(0.2)
+        with capture_queries() as queries:
+            conn.execute(text("SELECT 2"))
+        assert queries.statements == 1
+        assert queries.seconds < 0.1
@@ -0,0 +1,131 @@
+"""Player overlap / rest-gap conflicts kept incrementally over the saved schedule."""
+from __future__ import annotations
+
+import pytest
+
+from wyniki.services import auto_scheduler as sched
+from wyniki.services import schedule_conflicts as conflicts_module
+
+# 60 minute slots everywhere; one rest slot keeps players off court for an hour.
+CONFIG = {"slot_minutes": {"default": 60}, "rest_slots": 1}
+
+
+def _entry(entry_id, court_id, time, player1, player2, **extra):
+    return {
+        "id": entry_id,
+        "day_date": "2026-05-01",
+        "scheduled_time": time,
+        "court_id": court_id,
+        "category_name": "B2",
+        "phase": "Grupowa",
+        "status": "planned",
+        "player1_name": player1,
+        "player2_name": player2,
+        **extra,
+    }
+
+
+def _index(*entries):
+    index = conflicts_module.ScheduleConflictIndex(CONFIG)
+    index.apply(list(entries))
+    return index
+
+
+def test_overlap_and_rest_conflicts_are_detected():
+    index = _index(
+        _entry(1, "c1", "10:00", "Anna", "Basia"),
+        _entry(2, "c2", "10:30", "anna", "Celina"),
+        _entry(3, "c1", "11:30", "Celina", "Dorota"),
+        _entry(4, "c2", "13:30", "Dorota", "Ewa"),
+        {**_entry(5, "c1", "10:00", "Basia", "Ewa"), "day_date": "2026-05-02"},
+    )
+
+    found = index.conflicts()
+
+    assert [(item["kind"], item["entry_ids"], item["players"]) for item in found] == [
+        ("overlap", [1, 2], ["Anna"]),
+        ("rest", [2, 3], ["Celina"]),
+    ]
+    assert found[0]["entries"][1]["end_time"] == "11:30"
+
+
+def test_moves_and_removals_update_only_affected_pairs():
+    index = _index(
+        _entry(1, "c1", "10:00", "Anna", "Basia"),
+        _entry(2, "c2", "10:00", "Anna", "Celina"),
+    )
+    assert index.signature() == {(frozenset({1, 2}), "overlap")}
+
+    index.upsert(_entry(2, "c2", "11:30", "Anna", "Celina"))
+    assert index.signature() == {(frozenset({1, 2}), "rest")}
+
+    index.upsert(_entry(2, "c2", "12:00", "Anna", "Celina"))
+    assert index.conflicts() == []
+
+    index.upsert(_entry(3, "c1", "11:00", "Basia", "Celina"))
+    assert {pair for pair, _kind in index.signature()} == {frozenset({1, 3}), frozenset({2, 3})}
+    index.remove(3)
+    assert index.signature() == frozenset()
+
+
+def test_check_reports_without_changing_the_index():
+    index = _index(
+        _entry(1, "c1", "10:00", "Anna", "Basia"),
+        _entry(2, "c2", "12:00", "Anna", "Celina"),
+    )
+
+    clash = index.check(2, court_id="c2", scheduled_time="10:30")
+
+    assert [(item["kind"], item["entry_ids"]) for item in clash] == [("overlap", [1, 2])]
+    assert index.check(2, scheduled_time="14:00") == []
+    assert index.conflicts() == []
+    with pytest.raises(KeyError):
+        index.check(99, scheduled_time="10:00")
+
+
+def test_placeholders_completed_and_unplaced_entries_are_ignored():
+    index = conflicts_module.ScheduleConflictIndex(CONFIG, lambda name: name.startswith("Zwycięzca"))
+    index.apply([
+        _entry(1, "c1", "10:00", "Zwycięzca PF1", "Anna"),
+        _entry(2, "c2", "10:00", "Zwycięzca PF1", "Basia"),
+        _entry(3, "c1", "11:00", "Anna", "Celina", status="completed"),
+        _entry(4, "", "10:00", "Basia", "Dorota"),
+    ])
+
+    assert index.conflicts() == []
+    assert index.check(4, court_id="c3")[0]["players"] == ["Basia"]
+
+
+def test_interval_lookup_walks_only_nearby_bookings():
+    index = sched.PlayerIntervalIndex()
+    for token in range(500):
+        index.add([("d", "anna")], token * 90, token * 90 + 60, token)
+
+    assert index.conflicts([("d", "anna")], 250 * 90 + 30, 250 * 90 + 90, rest_gap=0) == [250]
+
+
+def test_registry_follows_schedule_writes(temp_db):
+    tid = temp_db.insert_tournament(
+        name="Conflicts", start_date="2026-05-01", end_date="2026-05-01",
+        active=True, city="Test", country="PL", is_public=False,
+    )
+    temp_db.upsert_tournament_schedule_entries(tid, [
+        {"day_date": "2026-05-01", "scheduled_time": "10:00", "court_id": "c1", "category_name": "B2",
+         "player1_name": "Anna", "player2_name": "Basia", "status": "planned"},
+        {"day_date": "2026-05-01", "scheduled_time": "13:00", "court_id": "c2", "category_name": "B2",
+         "player1_name": "Anna", "player2_name": "Celina", "status": "planned"},
+    ])
+    registry = conflicts_module.ScheduleConflictRegistry()
+    first, second = (entry["id"] for entry in temp_db.fetch_tournament_schedule(tid))
+
+    assert registry.conflicts(tid) == []
+    assert registry.refresh(tid) is False
+
+    with temp_db.db_conn() as conn:
+        conn.execute("UPDATE tournament_schedule SET scheduled_time = '10:30' WHERE id = ?", (second,))
+        conn.commit()
+
+    assert registry.refresh(tid) is True
+    assert registry.refresh(tid) is False
+    assert [item["entry_ids"] for item in registry.conflicts(tid)] == [[first, second]]
+    assert registry.check(tid, second, scheduled_time="15:00") == []
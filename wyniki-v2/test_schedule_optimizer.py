@@ -0,0 +1,102 @@
+"""Unit tests for the local-search schedule optimizer (no DB, no Flask)."""
+from itertools import combinations
+
+from wyniki.services import auto_scheduler as sched
+from wyniki.services import schedule_optimizer as optimizer
+
+
+def _config():
+    courts = [{"kort_id": f"c{idx}", "display_order": idx} for idx in range(1, 5)]
+    return sched.build_default_config(courts)
+
+
+def _matches():
+    matches = []
+    for category, players in (
+        ("B2", ["Anna", "Basia", "Celina", "Dorota"]),
+        ("B3", ["Ewa", "Filip", "Gosia", "Henryk"]),
+        ("B4", ["Igor", "Jan", "Kasia", "Lena"]),
+        ("B1", ["Marek", "Nina", "Ola", "Piotr"]),
+    ):
+        for first, second in combinations(players, 2):
+            matches.append({
+                "id": len(matches) + 1,
+                "category_name": category,
+                "phase": "Grupowa",
+                "player1_name": first,
+                "player2_name": second,
+            })
+    return matches
+
+
+def _optimize(seed):
+    config = _config()
+    placements = sched.place_matches(_matches(), config, "2026-05-01")
+    return config, placements, optimizer.optimize_placements(
+        placements, config, seed=seed, time_budget_seconds=60, max_iterations=3000,
+    )
+
+
+def test_optimizer_is_deterministic_per_seed():
+    _config_a, _placements_a, first = _optimize(7)
+    _config_b, _placements_b, second = _optimize(7)
+
+    def layout(result):
+        return [(p["match"]["id"], p["court_id"], p["scheduled_time"]) for p in result["placements"]]
+
+    assert layout(first) == layout(second)
+    assert first["stats"]["iterations"] == 3000
+    assert first["stats"]["stopped_by"] == "iterations"
+
+
+def test_iteration_budget_is_sized_from_the_day_and_clock_stops_are_reported():
+    config = _config()
+    placements = sched.place_matches(_matches(), config, "2026-05-01")
+
+    sized = optimizer.optimize_placements(placements, config, seed=2, time_budget_seconds=60, max_iterations=10**9)
+    stopped = optimizer.optimize_placements(placements, config, seed=2, time_budget_seconds=0)
+
+    # 24 matches on 4 courts: six per court.
+    assert sized["stats"]["max_iterations"] == sized["stats"]["iterations"] == optimizer._ITERATION_WORK // 6
+    assert (stopped["stats"]["stopped_by"], stopped["stats"]["iterations"]) == ("time", 0)
+    assert stopped["stats"]["after"] == stopped["stats"]["before"]
+
+
+def test_optimizer_never_worse_than_greedy_and_keeps_b1_pinned():
+    config, placements, result = _optimize(1)
+    stats = result["stats"]
+
+    assert stats["after"]["cost"] <= stats["before"]["cost"]
+    assert stats["before"] == optimizer.placement_metrics(placements, config)
+    assert stats["after"] == optimizer.placement_metrics(result["placements"], config)
+    assert len(result["placements"]) == len(placements)
+    for original, optimized in zip(placements, result["placements"]):
+        assert optimized["match"] is original["match"]
+        assert optimized["scheduled_time"]
+        assert (optimized["court_id"] == "c4") == (optimized["band"] == "B1")
+
+
+def test_optimizer_resolves_greedy_player_clash():
+    config = {
+        "category_courts": {"B2": "c1", "B3": "c2"},
+        "slot_minutes": {"default": 60},
+        "start_time": "09:00",
+    }
+    # Greedy keeps input order per court, so both of Anna's matches start at 09:00.
+    placements = [
+        {"match": {"id": 1, "category_name": "B2", "player1_name": "Anna", "player2_name": "Basia"},
+         "court_id": "c1", "day_date": "d", "scheduled_time": "09:00", "band": "B2"},
+        {"match": {"id": 2, "category_name": "B2", "player1_name": "Celina", "player2_name": "Dorota"},
+         "court_id": "c1", "day_date": "d", "scheduled_time": "10:00", "band": "B2"},
+        {"match": {"id": 3, "category_name": "B3", "player1_name": "Anna", "player2_name": "Ewa"},
+         "court_id": "c2", "day_date": "d", "scheduled_time": "09:00", "band": "B3"},
+        {"match": {"id": 4, "category_name": "B3", "player1_name": "Filip", "player2_name": "Gosia"},
+         "court_id": "c2", "day_date": "d", "scheduled_time": "10:00", "band": "B3"},
+    ]
+
+    result = optimizer.optimize_placements(placements, config, seed=3, time_budget_seconds=60, max_iterations=500)
+
+    assert result["stats"]["before"]["player_clashes"] == 1
+    assert result["stats"]["after"]["player_clashes"] == 0
+    # One free slot of rest between Anna's matches is the shortest clash-free day.
+    assert result["stats"]["after"]["finish_time"] == "12:00"
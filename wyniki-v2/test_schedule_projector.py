@@ -0,0 +1,87 @@
+"""Live schedule ETA projection (pure projection plus one DB-backed publish)."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from wyniki.services import schedule_projector as projector
+
+NOW = datetime(2026, 5, 1, 11, 0)
+CONFIG = {"category_courts": {"B2": "c1", "B3": "c2"}, "slot_minutes": {"default": 60}, "start_time": "09:00"}
+
+
+def _entry(entry_id, court_id, time, **extra):
+    return {
+        "id": entry_id,
+        "day_date": "2026-05-01",
+        "scheduled_time": time,
+        "court_id": court_id,
+        "category_name": "B2",
+        "phase": "Grupowa",
+        "status": "planned",
+        **extra,
+    }
+
+
+def _started(local_time):
+    return NOW.replace(hour=local_time[0], minute=local_time[1]).astimezone(timezone.utc).isoformat()
+
+
+def test_overrunning_court_pushes_remaining_entries():
+    entries = [
+        _entry(1, "c1", "10:00", status="in_progress", match_id=7),
+        _entry(2, "c1", "11:00"),
+        _entry(3, "c1", "12:00"),
+        _entry(4, "c1", "14:00"),
+    ]
+    live = {"c1": {"active": True, "started_ts": _started((10, 15)), "category": "B2", "phase": "Grupowa"}}
+
+    result = projector.project_tournament_etas(entries, live, CONFIG, NOW, overrun_minutes=10)
+
+    # Started 10:15 with a 60 min slot: free at 11:15, so everything after slips by fifteen
+    # minutes until the gap before 14:00 absorbs it.
+    assert result["courts"]["c1"] == {"free_at": "11:15", "delay_minutes": 15}
+    assert result["entries"] == {"2": "11:15", "3": "12:15"}
+
+
+def test_match_past_its_slot_keeps_minimum_remaining_time():
+    entries = [_entry(2, "c1", "11:00")]
+    live = {"c1": {"active": True, "started_ts": _started((9, 30)), "category": "B2", "phase": "Grupowa"}}
+
+    result = projector.project_tournament_etas(entries, live, CONFIG, NOW, overrun_minutes=10)
+
+    assert result["entries"] == {"2": "11:10"}
+
+
+def test_idle_court_and_other_days_are_left_alone():
+    entries = [
+        _entry(1, "c2", "12:00", category_name="B3"),
+        _entry(2, "c2", "10:30", category_name="B3", status="completed"),
+        {**_entry(3, "c1", "09:00"), "day_date": "2026-05-02"},
+    ]
+
+    result = projector.project_tournament_etas(entries, {}, CONFIG, NOW)
+
+    assert result["entries"] == {}
+    assert result["courts"] == {"c2": {"free_at": "11:00", "delay_minutes": 0}}
+
+
+def test_run_once_publishes_only_changed_projections(temp_db):
+    tid = temp_db.insert_tournament(
+        name="ETA", start_date="2026-05-01", end_date="2026-05-01",
+        active=True, city="Test", country="PL", is_public=True,
+    )
+    temp_db.upsert_tournament_schedule_entries(tid, [
+        {"day_date": "2026-05-01", "scheduled_time": "11:00", "court_id": "c1", "category_name": "B2",
+         "player1_name": "Anna", "player2_name": "Basia", "status": "planned"},
+    ])
+    live = {"c1": {"tournament_id": tid, "active": True, "started_ts": _started((10, 30)),
+                   "category": "B2", "phase": "Grupowa"}}
+    runner = projector.ScheduleProjector()
+
+    first = runner.run_once(live, now=NOW)
+    again = runner.run_once(live, now=NOW)
+
+    assert len(first) == 1 and again == []
+    assert first[0]["type"] == "schedule_eta"
+    assert list(first[0]["entries"].values()) == ["11:30"]
+    assert runner.latest() == first
@@ -0,0 +1,97 @@
+from flask import Flask
+
+from wyniki.config import settings
+from wyniki.services import compression
+from wyniki.services.sse_registry import SSEConnectionRegistry, SSERegistryCollector, is_priority_path
+
+
+def _limits(monkeypatch, total=10, per_ip=2, reserve=3):
+    monkeypatch.setattr(settings, "sse_max_connections", total)
+    monkeypatch.setattr(settings, "sse_max_connections_per_ip", per_ip)
+    monkeypatch.setattr(settings, "sse_priority_reserve", reserve)
+
+
+def test_per_ip_cap_rejects_and_release_frees_slot(monkeypatch):
+    _limits(monkeypatch)
+    registry = SSEConnectionRegistry()
+
+    first, _ = registry.try_acquire("stream.event_stream", "10.0.0.1")
+    second, _ = registry.try_acquire("stream.event_stream", "10.0.0.1")
+    rejected, reason = registry.try_acquire("stream.event_stream", "10.0.0.1")
+    assert first and second and rejected is None
+    assert reason == "per_ip"
+    assert registry.try_acquire("stream.event_stream", "10.0.0.2")[0] is not None
+
+    first.release()
+    first.release()
+    assert registry.open_streams() == {"stream.event_stream": 2}
+    assert registry.try_acquire("stream.event_stream", "10.0.0.1")[0] is not None
+
+
+def test_global_cap_keeps_headroom_for_priority_requests(monkeypatch):
+    _limits(monkeypatch, total=5, per_ip=10, reserve=2)
+    registry = SSEConnectionRegistry()
+
+    leases = [registry.try_acquire("stream.event_stream", "10.0.0.1")[0] for _ in range(3)]
+    assert all(leases)
+    assert registry.try_acquire("stream.event_stream", "10.0.0.1") == (None, "capacity")
+
+    leases[0].release()
+    for _ in range(3):
+        registry.priority_started()
+    # More umpire requests in flight than the static reserve shrink SSE capacity further.
+    assert registry.try_acquire("stream.event_stream", "10.0.0.1") == (None, "capacity")
+    for _ in range(3):
+        registry.priority_finished()
+    assert registry.try_acquire("stream.event_stream", "10.0.0.1")[0] is not None
+
+    metrics = {family.name: family for family in SSERegistryCollector(registry).collect()}
+    assert metrics["wyniki_sse_open_streams"].samples[0].value == 3
+    assert {sample.labels["reason"] for sample in metrics["wyniki_sse_rejected"].samples} == {"capacity"}
+
+
+def test_priority_paths_cover_umpire_writes():
+    assert is_priority_path("/api/matches")
+    assert is_priority_path("/api/matches/12/finish")
+    assert is_priority_path("/api/match-events")
+    assert not is_priority_path("/api/stream")
+
+
+def test_rejected_stream_gets_retry_hint(monkeypatch):
+    _limits(monkeypatch, total=1, per_ip=1, reserve=0)
+    monkeypatch.setattr(settings, "sse_retry_ms", 2000)
+    app = Flask(__name__)
+
+    with app.test_request_context("/api/stream"):
+        admitted = compression.sse_response(lambda: iter([": heartbeat\n\n"]))
+        rejected = compression.sse_response(lambda: iter([": heartbeat\n\n"]))
+        body = rejected.get_data(as_text=True)
+        assert rejected.status_code == 200
+        assert body.startswith("retry: ")
+        assert 2000 <= int(body.split("\n", 1)[0].split(": ")[1]) <= 3000
+        assert "event: busy" in body
+        assert rejected.headers["Retry-After"] == "2"
+        admitted.close()
+        again = compression.sse_response(lambda: iter([": heartbeat\n\n"]))
+        assert "Retry-After" not in again.headers
+        again.close()
+
+
+def test_client_ip_is_named_by_the_trusted_proxy_chain():
+    from wyniki.services.client_ip import request_client_ip
+
+    app = Flask(__name__)
+    app.add_url_rule("/ip", "ip", request_client_ip)
+    client = app.test_client()
+
+    def key(peer, **headers):
+        return client.get("/ip", headers=headers, environ_base={"REMOTE_ADDR": peer}).get_data(as_text=True)
+
+    # cloudflared -> Traefik on the docker network: Cloudflare's edge names the visitor.
+    tunnel = "172.18.0.2"
+    assert key(tunnel, **{"CF-Connecting-IP": "203.0.113.7", "X-Forwarded-For": "198.51.100.1, 10.0.0.5"}) == "203.0.113.7"
+    # Without it, the nearest X-Forwarded-For entry that is not one of our proxies.
+    assert key(tunnel, **{"X-Forwarded-For": "198.51.100.1, 203.0.113.9, 10.0.0.5"}) == "203.0.113.9"
+    assert key(tunnel) == tunnel
+    # A peer outside the proxy networks is the client; its headers are ignored.
+    assert key("203.0.113.50", **{"CF-Connecting-IP": "198.51.100.2", "X-Forwarded-For": "198.51.100.3"}) == "203.0.113.50"
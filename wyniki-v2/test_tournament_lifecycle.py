@@ -452,6 +452,48 @@ def test_mobile_suggested_match_uses_selected_court_and_nearest_time(umpire_app_
     assert suggestion["player2"]["full_name"] == "Nearest Two"
 
 
+def test_suggested_match_index_follows_schedule_writes(umpire_app_with_temp_db):
+    from wyniki import database
+
+    tournament_id = database.insert_tournament("Suggestion Index Cup", "2026-05-29", "2026-05-29", active=True)
+    court_id = f"t{tournament_id}-1"
+    database.insert_court(court_id, pin="1111", tournament_id=tournament_id, name="Kort 1", display_order=1)
+    entries = database.upsert_tournament_schedule_entries(tournament_id, [
+        {"day_date": "2026-05-29", "scheduled_time": "09:00", "court_id": court_id,
+         "player1_name": "A One", "player2_name": "A Two", "status": "planned", "sort_order": 1},
+        {"day_date": "2026-05-29", "scheduled_time": "10:00", "court_id": court_id,
+         "player1_name": "B One", "player2_name": "B Two", "status": "planned", "sort_order": 3},
+        {"day_date": "2026-05-29", "scheduled_time": "10:00", "court_id": court_id,
+         "player1_name": "C One", "player2_name": "C Two", "status": "planned", "sort_order": 2},
+    ])
+    ids = {entry["player1_name"]: entry["id"] for entry in entries}
+
+    def suggested(at):
+        entry = database.find_suggested_schedule_match(tournament_id, court_id, reference_time=at)
+        return entry and entry["player1_name"]
+
+    # Equidistant: the upcoming entry wins, and within one start time the lower sort order.
+    assert suggested("2026-05-29T09:30:00") == "C One"
+    assert suggested("2026-05-29T09:10:00") == "A One"
+    assert suggested("2026-05-29T12:00:00") == "C One"
+
+    # Raw SQL writes (as the ORM linking path does) refresh the cached index.
+    with database.db_conn() as conn:
+        conn.execute("UPDATE tournament_schedule SET match_id = 99 WHERE id = ?", (ids["C One"],))
+        conn.commit()
+    assert suggested("2026-05-29T09:30:00") == "B One"
+
+    database.update_tournament_schedule_entry(tournament_id, ids["A One"], {"scheduled_time": "09:50"})
+    assert suggested("2026-05-29T09:30:00") == "A One"
+
+    with database.db_conn() as conn:
+        conn.execute("UPDATE courts SET display_order = 5 WHERE kort_id = ?", (court_id,))
+        conn.commit()
+    assert database.find_suggested_schedule_match(
+        tournament_id, court_id, reference_time="2026-05-29T09:30:00"
+    )["court_display_order"] == 5
+
+
 def test_mobile_create_match_links_explicit_schedule_id(umpire_app_with_temp_db):
     from wyniki import database
 
@@ -1075,6 +1117,15 @@ def test_office_planning_configures_groups_and_schedule(full_app_with_temp_db):
     manual_entry = next(entry for entry in manual_response.get_json()["schedule"] if entry["source_type"] == "manual")
     assert manual_entry["scheduled_time"] == "18:00"
 
+    moved_response = client.post(
+        "/api/office/1/schedule",
+        headers=headers,
+        json={**manual_entry, "scheduled_time": "18:30", "changed_only": True},
+    )
+    assert moved_response.status_code == 200
+    assert list(moved_response.get_json()) == ["changed"]
+    assert [entry["scheduled_time"] for entry in moved_response.get_json()["changed"]] == ["18:30"]
+
     delete_response = client.delete(f"/api/office/1/schedule/{manual_entry['id']}", headers=headers)
     assert delete_response.status_code == 200
     assert all(entry["id"] != manual_entry["id"] for entry in delete_response.get_json()["schedule"])
@@ -2769,6 +2820,58 @@ def test_office_group_rematch_after_first_leg(full_app_with_temp_db):
         assert phases == ["Grupowa", database.GROUP_REMATCH_PHASE]
 
 
+def test_bulk_schedule_upsert_returns_only_changed_rows(app_with_temp_db):
+    from wyniki import database
+
+    tournament_id = database.insert_tournament("Bulk Schedule Cup", "2026-07-18", "2026-07-18", active=True)
+    entries = [
+        {
+            "day_date": "2026-07-18",
+            "scheduled_time": f"{9 + index}:00",
+            "court_id": f"t{tournament_id}-1",
+            "phase": "Grupowa",
+            "player1_name": f"Bulk {index}A",
+            "player2_name": f"Bulk {index}B",
+            "status": "planned",
+            "sort_order": index,
+        }
+        for index in range(4)
+    ]
+
+    created = database.upsert_tournament_schedule_entries(tournament_id, entries, changed_only=True)
+    assert len(created) == 4
+    assert database.upsert_tournament_schedule_entries(tournament_id, entries, changed_only=True) == []
+
+    # Same pair in the other order hits the existing row instead of adding one.
+    swapped = dict(entries[2], player1_name="Bulk 2B", player2_name="Bulk 2A", scheduled_time="15:00")
+    by_id = dict(entries[0], id=created[0]["id"], scheduled_time="16:00")
+    changed = database.upsert_tournament_schedule_entries(tournament_id, [swapped, by_id], changed_only=True)
+
+    assert sorted((row["player1_name"], row["scheduled_time"]) for row in changed) == [
+        ("Bulk 0A", "16:00"),
+        ("Bulk 2B", "15:00"),
+    ]
+    assert len(database.fetch_tournament_schedule(tournament_id)) == 4
+
+
+def test_bulk_schedule_upsert_prunes_duplicates_the_pair_key_misses(app_with_temp_db):
+    from wyniki import database
+
+    tournament_id = database.insert_tournament("Case Schedule Cup", "2026-07-18", "2026-07-18", active=True)
+    placed = database.upsert_tournament_schedule_entries(tournament_id, [{
+        "day_date": "2026-07-18", "scheduled_time": "10:00", "court_id": f"t{tournament_id}-1",
+        "phase": "Finał", "player1_name": "Case A", "player2_name": "Case B", "status": "planned",
+    }], changed_only=True)
+
+    changed = database.upsert_tournament_schedule_entries(tournament_id, [{
+        "day_date": "2026-07-18", "phase": "finał", "player1_name": "Case B", "player2_name": "Case A",
+    }], changed_only=True)
+
+    schedule = database.fetch_tournament_schedule(tournament_id)
+    assert [(row["id"], row["scheduled_time"]) for row in schedule] == [(placed[0]["id"], "10:00")]
+    assert changed and all(row.get("removed") for row in changed)
+
+
 def test_office_manual_knockout_result_from_schedule(full_app_with_temp_db):
     from wyniki import database
 
@@ -0,0 +1,59 @@
+"""In-process tournament read model: cache hits, version-counter invalidation, lookups."""
+from __future__ import annotations
+
+
+def _insert(database, name, start_date, **extra):
+    return database.insert_tournament(
+        name=name, start_date=start_date, end_date=start_date, city="Test", country="PL", **extra,
+    )
+
+
+def test_reads_are_served_from_memory_until_a_write(temp_db):
+    database = temp_db
+    registry = database.tournament_registry
+    older = _insert(database, "Spring Open", "2026-04-01", active=True)
+    newer = _insert(database, "Summer Open", "2026-06-01", active=True, is_public=False)
+
+    before = registry.stats()
+    assert [t["id"] for t in database.fetch_tournaments()] == [newer, older]
+    assert [t["id"] for t in database.fetch_tournaments(public_only=True)] == [older]
+    assert database.get_active_tournament_id() == older
+    assert database.get_active_tournament_name(public_only=True) == "Spring Open"
+    assert database.fetch_tournament_by_name("Summer Open")["id"] == newer
+    assert database.fetch_tournament(999) is None
+    after = registry.stats()
+
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 5
+
+    database.set_tournament_active_state(older, False)
+    assert database.get_active_tournament_id() == newer
+    assert registry.stats()["misses"] - after["misses"] == 1
+
+
+def test_writes_outside_the_helpers_bump_the_version(temp_db):
+    database = temp_db
+    tid = _insert(database, "Autumn Open", "2026-09-01")
+    assert database.fetch_tournament(tid)["court_count"] == 0
+
+    with database.db_conn() as conn:
+        conn.execute("UPDATE tournaments SET name = 'Autumn Cup' WHERE id = ?", (tid,))
+        conn.execute("INSERT INTO courts (kort_id, name, tournament_id) VALUES ('k9', 'Court 9', ?)", (tid,))
+        conn.commit()
+
+    tournament = database.fetch_tournament(tid)
+    assert tournament["name"] == "Autumn Cup"
+    assert tournament["court_count"] == 1
+    assert database.fetch_tournament_by_name("Autumn Open") is None
+
+
+def test_callers_get_copies(temp_db):
+    database = temp_db
+    tid = _insert(database, "Winter Open", "2026-12-01", access_key="secret")
+
+    database.fetch_tournaments()[0].pop("access_key")
+    database.fetch_tournament(tid)["name"] = "changed"
+
+    tournament = database.fetch_tournament(tid)
+    assert tournament["access_key"] == "secret"
+    assert tournament["name"] == "Winter Open"
@@ -5,8 +5,11 @@ from sqlalchemy import or_, func
 
 from ..db_models import db, GlobalPlayer, Player, MatchHistory, Tournament
 from ..config import logger
-from ..services.player_registry import create_tournament_player, find_or_create_global_player, split_player_name
+from ..database import bulk_import_tournament_players
+from ..services.player_registry import create_tournament_player, split_player_name
+from ..services.duplicate_players import DEFAULT_THRESHOLD, find_duplicate_clusters
 from ..services.office_event_broker import emit_office_invalidation
+from ..services.player_import import player_import_job_payload, player_import_jobs, save_upload
 
 blueprint = Blueprint('admin_global_players', __name__, url_prefix='/admin/api/global-players')
 
@@ -345,10 +348,61 @@ def add_global_to_tournament(tid: int):
     return jsonify(p.to_dict()), 201
 
 
+def _parse_import_file_line(line: str):
+    """One "First Last Category Country" line as an import row (None for blank or test lines)."""
+    line = line.strip()
+    if not line:
+        return None
+
+    parts = line.rsplit(' ', 2)
+    if len(parts) == 3:
+        name, category, country = parts
+    elif len(parts) == 2:
+        name, category = parts
+        country = ''
+    else:
+        name = line
+        category = ''
+        country = ''
+
+    return _import_file_row(name=name, category=category, country=country)
+
+
+def _import_file_row(name='', first_name='', last_name='', category='', country='', gender=''):
+    name, fn, ln = split_player_name(name=name.strip(), first_name=first_name, last_name=last_name)
+
+    # Skip test entry
+    if f"{fn} {ln}".strip().lower() == 'dawid suchodolski':
+        return None
+
+    return {
+        'name': name,
+        'first_name': fn,
+        'last_name': ln,
+        'category': category.strip(),
+        'country': country.strip(),
+        'gender': gender.strip(),
+    }
+
+
+def _normalize_uploaded_import_row(row):
+    """Normalizer for streamed import-file uploads (text lines or CSV/XLSX fields)."""
+    if 'raw_line' in row:
+        return _parse_import_file_line(row['raw_line'])
+    player = _import_file_row(
+        **{field: row.get(field, '') for field in ('name', 'first_name', 'last_name', 'category', 'country', 'gender')}
+    )
+    if player is not None and not player['name']:
+        raise ValueError('Missing player name')
+    return player
+
+
 @blueprint.route('/tournaments/<int:tid>/import-file', methods=['POST'])
 def import_file_to_tournament(tid: int):
     """Import players from text — auto-match to global_players or create new.
-    Body: { text: "First Last Category Country\\n..." }
+    Body: { text: "First Last Category Country\\n..." }, or a multipart ``file``
+    (CSV, XLSX or text), which is imported by a background job: the response is
+    202 with the job and its status/result URLs.
     """
     from ..db_models import Tournament
     tournament = db.session.get(Tournament, tid)
@@ -357,121 +411,81 @@ def import_file_to_tournament(tid: int):
     if int(tournament.active or 0) != 1:
         return jsonify({'error': 'Tournament is inactive'}), 409
 
+    upload = request.files.get('file')
+    if upload is not None and upload.filename:
+        source_path = save_upload(upload.stream, upload.filename)
+        job = player_import_jobs.start(
+            tid,
+            source_path,
+            upload.filename,
+            _normalize_uploaded_import_row,
+            lambda chunk: bulk_import_tournament_players(tid, chunk, skip_existing=True, fill_from_global=True),
+        )
+        return jsonify(player_import_job_payload(job)), 202
+
     data = request.get_json(silent=True) or {}
     text = data.get('text', '')
     if not text.strip():
         return jsonify({'error': 'No text provided'}), 400
 
-    lines = text.strip().split('\n')
-    created_global = 0
-    matched_global = 0
-    added_tournament = 0
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        parts = line.rsplit(' ', 2)
-        if len(parts) == 3:
-            name, category, country = parts
-        elif len(parts) == 2:
-            name, category = parts
-            country = ''
-        else:
-            name = line
-            category = ''
-            country = ''
-
-        name, fn, ln = split_player_name(name=name.strip())
-
-        # Skip test entry
-        if f"{fn} {ln}".strip().lower() == 'dawid suchodolski':
-            continue
+    rows = [row for row in map(_parse_import_file_line, text.strip().split('\n')) if row]
 
-        gp = None
-        if int(tournament.is_simulation or 0) != 1:
-            gp_exists = GlobalPlayer.query.filter(
-                func.lower(func.trim(GlobalPlayer.first_name)) == fn.lower(),
-                func.lower(func.trim(GlobalPlayer.last_name)) == ln.lower(),
-            ).first()
-            gp = find_or_create_global_player(db.session, fn, ln, category, country)
-            if not gp:
-                continue
-            if gp_exists:
-                matched_global += 1
-            else:
-                created_global += 1
-
-            existing = Player.query.filter_by(tournament_id=tid, global_player_id=gp.id).first()
-            if existing:
-                continue
-        else:
-            existing = Player.query.filter(
-                Player.tournament_id == tid,
-                func.lower(func.trim(Player.first_name)) == fn.lower(),
-                func.lower(func.trim(Player.last_name)) == ln.lower(),
-            ).first()
-            if existing:
-                continue
-
-        create_tournament_player(
-            db.session,
-            tournament_id=tid,
-            name=name,
-            first_name=fn,
-            last_name=ln,
-            gender=(gp.gender if gp else ''),
-            category=category.strip() or ((gp.category or '') if gp else ''),
-            country=country.strip() or ((gp.country or '') if gp else ''),
-            global_player=gp,
-        )
-        added_tournament += 1
+    try:
+        result = bulk_import_tournament_players(tid, rows, skip_existing=True, fill_from_global=True)
+    except Exception as e:
+        logger.error("import_file_to_tournament_error", error=str(e), tournament_id=tid)
+        return jsonify({'error': 'Import failed'}), 500
 
-    db.session.commit()
+    added_tournament = result['inserted']
+    matched_global = result['matched_global']
+    created_global = result['created_global']
     return jsonify({
         'message': f'Imported {added_tournament} players ({matched_global} matched, {created_global} new)',
         'added': added_tournament,
         'matched_global': matched_global,
         'created_global': created_global,
+        'rows': result['rows'],
     })
 
 
 @blueprint.route('/duplicates', methods=['GET'])
 def find_duplicates():
-    """Find duplicate global players (same last_name or same first+last)."""
-    from sqlalchemy import func as sqf
-
-    # Find by same last_name
-    dupes_by_lastname = (
-        db.session.query(sqf.lower(sqf.trim(GlobalPlayer.last_name)).label('ln'),
-                         sqf.count(GlobalPlayer.id).label('cnt'))
-        .filter(GlobalPlayer.last_name.isnot(None), sqf.trim(GlobalPlayer.last_name) != '')
-        .group_by(sqf.lower(sqf.trim(GlobalPlayer.last_name)))
-        .having(sqf.count(GlobalPlayer.id) > 1)
+    """Find likely duplicate global players, scored, with a merge suggestion per group."""
+    threshold = request.args.get('threshold', default=DEFAULT_THRESHOLD, type=float)
+    candidates = [
+        {'id': pid, 'first_name_key': first, 'last_name_key': last, 'gender': gender, 'birth_date': birth_date}
+        for pid, first, last, gender, birth_date in db.session.query(
+            GlobalPlayer.id, GlobalPlayer.first_name_key, GlobalPlayer.last_name_key,
+            GlobalPlayer.gender, GlobalPlayer.birth_date,
+        )
+    ]
+    tournament_counts = dict(
+        db.session.query(Player.global_player_id, func.count(Player.id))
+        .join(Tournament, Player.tournament_id == Tournament.id)
+        .filter(Player.global_player_id.isnot(None), Tournament.stats_enabled == 1)
+        .group_by(Player.global_player_id)
         .all()
     )
+    clusters = find_duplicate_clusters(candidates, tournament_counts, threshold=threshold)
+
+    member_ids = [pid for cluster in clusters for pid in cluster['player_ids']]
+    players_by_id = {
+        gp.id: gp for gp in GlobalPlayer.query.filter(GlobalPlayer.id.in_(member_ids)).all()
+    } if member_ids else {}
 
     result = []
-    for ln, cnt in dupes_by_lastname:
-        players = GlobalPlayer.query.filter(
-            sqf.lower(sqf.trim(GlobalPlayer.last_name)) == ln
-        ).all()
-        entries = []
-        for gp in players:
-            tournament_count = (
-                Player.query.join(Tournament, Player.tournament_id == Tournament.id)
-                .filter(Player.global_player_id == gp.id, Tournament.stats_enabled == 1)
-                .count()
-            )
-            entries.append({
-                **gp.to_dict(),
-                'tournaments_count': tournament_count,
-            })
+    for cluster in clusters:
+        target = players_by_id[cluster['suggested_merge']['target_id']]
         result.append({
-            'last_name': ln,
-            'count': cnt,
-            'players': entries,
+            'last_name': target.last_name,
+            'count': len(cluster['player_ids']),
+            'score': cluster['score'],
+            'pairs': cluster['pairs'],
+            'suggested_merge': cluster['suggested_merge'],
+            'players': [
+                {**players_by_id[pid].to_dict(), 'tournaments_count': tournament_counts.get(pid, 0)}
+                for pid in cluster['player_ids']
+            ],
         })
 
     return jsonify(result)
@@ -3,7 +3,7 @@ import json
 import queue
 import re
 
-from flask import Blueprint, Response, jsonify, request, stream_with_context
+from flask import Blueprint, jsonify, request, send_file
 from pathlib import Path
 from typing import Dict, Any
 from uuid import uuid4
@@ -46,6 +46,7 @@ from ..database import (
     insert_player,
     update_player,
     delete_player,
+    bulk_import_tournament_players,
     bulk_insert_players,
     maybe_generate_knockout_from_completed_groups,
     advance_knockout,
@@ -58,7 +59,11 @@ from ..database import (
     link_schedule_to_match,
 )
 from ..config import logger, settings
+from ..services.compression import compressed_json_no_cache, sse_response
 from ..services.office_event_broker import emit_office_invalidation, office_event_broker
+from ..services.import_ai_cache import cache_get, cache_put, content_key, map_limited
+from ..services.player_import import player_import_job_payload, player_import_jobs
+from ..services.priority_lanes import cpu_lane
 from ..services.office_workflow import (
     OfficeWorkflowError,
     _build_office_dashboard,
@@ -388,30 +393,29 @@ def _apply_import_ai_suggestions(
     return enriched
 
 
-def _fetch_import_ai_suggestions(text: str, players: list[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
-    api_key = str(settings.import_players_ai_api_key or '').strip()
-    model = str(settings.import_players_ai_model or 'gemini-2.5-flash').strip()
-    if not api_key or not players:
-        return {}
+_POLISH_LIST_MARKERS = ('kobiety', 'kobiet', 'mezczyzni', 'mężczyźni', 'mężczyzn', 'lista startowa', 'kategoria')
 
-    candidates = [
-        {
-            'line_number': int(player.get('line_number') or 0),
-            'raw_line': player.get('raw_line') or '',
-            'first_name': player.get('first_name') or '',
-            'last_name': player.get('last_name') or '',
-            'category': player.get('category') or '',
-            'gender': player.get('gender') or '',
-            'country': player.get('country') or '',
-            'warnings': player.get('warnings') or [],
-        }
-        for player in players
-        if _needs_import_ai_help(player)
-    ]
-    if not candidates:
-        return {}
 
-    prompt = (
+def _looks_like_polish_list(text: str) -> bool:
+    lowered = str(text or '').lower()
+    return any(char in lowered for char in 'ąćęłńóśźż') or any(marker in lowered for marker in _POLISH_LIST_MARKERS)
+
+
+def _defaults_to_polish(players: list[Dict[str, Any]], text: str) -> bool:
+    """A Polish start list with no foreign country entered: blank countries default to PL."""
+    explicit = {player.get('country') for player in players if player.get('country')}
+    return not explicit - {'PL'} and _looks_like_polish_list(text)
+
+
+def _fill_blank_import_countries(players: list[Dict[str, Any]], country: str) -> list[Dict[str, Any]]:
+    for player in players:
+        if not player.get('country'):
+            player['country'] = country
+    return players
+
+
+def _import_ai_prompt(text: str, candidates: list[Dict[str, Any]]) -> str:
+    return (
         'You are correcting a tournament player import for blind tennis. '
         'Return only JSON matching this schema: '
         '{"players":[{"line_number":1,"first_name":"","last_name":"","category":"B1","gender":"K","country":"PL","notes":""}]}. '
@@ -422,6 +426,12 @@ def _fetch_import_ai_suggestions(text: str, players: list[Dict[str, Any]]) -> Di
         f'Source text:\n{text}\n\nCandidates:\n{json.dumps(candidates, ensure_ascii=False)}'
     )
 
+
+def _request_import_ai(prompt: str, candidate_count: int) -> Dict[str, Any] | None:
+    """One model call; the parsed JSON answer, or None when it failed."""
+    api_key = str(settings.import_players_ai_api_key or '').strip()
+    model = str(settings.import_players_ai_model or 'gemini-2.5-flash').strip()
+    base_url = str(settings.import_players_ai_base_url or '').rstrip('/')
     request_payload = {
         'contents': [{'parts': [{'text': prompt}]}],
         'generationConfig': {
@@ -429,7 +439,7 @@ def _fetch_import_ai_suggestions(text: str, players: list[Dict[str, Any]]) -> Di
             'responseMimeType': 'application/json',
         },
     }
-    endpoint = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}'
+    endpoint = f'{base_url}/models/{model}:generateContent?key={api_key}'
 
     try:
         response = requests.post(
@@ -441,34 +451,103 @@ def _fetch_import_ai_suggestions(text: str, players: list[Dict[str, Any]]) -> Di
         response_payload = response.json()
         json_text = _extract_gemini_json_text(response_payload)
         if not json_text:
-            return {}
-        parsed = json.loads(json_text)
+            return None
+        return json.loads(json_text)
     except Exception as exc:
-        logger.warning('import_players_ai_failed', error=str(exc), candidates=len(candidates))
+        logger.warning('import_players_ai_failed', error=str(exc), candidates=candidate_count)
+        return None
+
+
+def _cached_import_ai(prompt: str, candidate_count: int) -> Dict[str, Any]:
+    key = content_key(str(settings.import_players_ai_model or ''), prompt)
+    cached = cache_get(key)
+    if cached is not None:
+        return cached
+    parsed = _request_import_ai(prompt, candidate_count)
+    if parsed is None:
+        # Failures are not cached, so the next preview retries.
         return {}
+    cache_put(key, parsed)
+    return parsed
 
-    suggestions: Dict[int, Dict[str, Any]] = {}
-    for item in parsed.get('players', []):
-        line_number = _normalize_int(item.get('line_number'), 0)
-        if not line_number:
-            continue
-        suggestions[line_number] = {
-            'first_name': str(item.get('first_name') or '').strip(),
-            'last_name': str(item.get('last_name') or '').strip(),
-            'category': _normalize_import_category(item.get('category') or ''),
-            'gender': _normalize_import_gender(item.get('gender') or ''),
-            'country': _normalize_import_country(item.get('country') or ''),
-            'notes': str(item.get('notes') or '').strip(),
+
+def _fetch_import_ai_suggestions(
+    text: str,
+    players: list[Dict[str, Any]],
+    tournament_id: int | None = None,
+) -> Dict[int, Dict[str, Any]]:
+    api_key = str(settings.import_players_ai_api_key or '').strip()
+    if not api_key or not players:
+        return {}
+
+    candidates = [
+        {
+            'line_number': int(player.get('line_number') or 0),
+            'raw_line': player.get('raw_line') or '',
+            'first_name': player.get('first_name') or '',
+            'last_name': player.get('last_name') or '',
+            'category': player.get('category') or '',
+            'gender': player.get('gender') or '',
+            'country': player.get('country') or '',
+            'warnings': player.get('warnings') or [],
         }
+        for player in players
+        if _needs_import_ai_help(player)
+    ]
+    if not candidates:
+        return {}
+
+    # Long lists are asked in chunks, in parallel; each chunk sees its own stretch of the source.
+    chunk_size = max(1, int(settings.import_players_ai_chunk_size))
+    chunks = [candidates[index:index + chunk_size] for index in range(0, len(candidates), chunk_size)]
+    if len(chunks) == 1:
+        prompts = [_import_ai_prompt(text, candidates)]
+    else:
+        source_lines = str(text or '').splitlines()
+        prompts = [
+            _import_ai_prompt(
+                '\n'.join(source_lines[chunk[0]['line_number'] - 1:chunk[-1]['line_number']]),
+                chunk,
+            )
+            for chunk in chunks
+        ]
+    answers = map_limited(
+        tournament_id,
+        lambda item: _cached_import_ai(item[0], len(item[1])),
+        list(zip(prompts, chunks)),
+    )
+
+    suggestions: Dict[int, Dict[str, Any]] = {}
+    for parsed in answers:
+        for item in parsed.get('players', []):
+            line_number = _normalize_int(item.get('line_number'), 0)
+            if not line_number:
+                continue
+            suggestions[line_number] = {
+                'first_name': str(item.get('first_name') or '').strip(),
+                'last_name': str(item.get('last_name') or '').strip(),
+                'category': _normalize_import_category(item.get('category') or ''),
+                'gender': _normalize_import_gender(item.get('gender') or ''),
+                'country': _normalize_import_country(item.get('country') or ''),
+                'notes': str(item.get('notes') or '').strip(),
+            }
     return suggestions
 
 
-def _parse_import_players_with_ai(text: str, mixed_categories: list[str] | None = None) -> list[Dict[str, Any]]:
+def _parse_import_players_with_ai(
+    text: str,
+    mixed_categories: list[str] | None = None,
+    tournament_id: int | None = None,
+) -> list[Dict[str, Any]]:
     players = _parse_import_players_text(text, mixed_categories)
-    suggestions = _fetch_import_ai_suggestions(text, players)
-    if not suggestions:
-        return players
-    return _apply_import_ai_suggestions(players, suggestions, mixed_categories)
+    # The prompt's "prefer PL" rule, applied after the model so its inferred countries win.
+    polish_default = bool(str(settings.import_players_ai_api_key or '').strip()) and _defaults_to_polish(players, text)
+    suggestions = _fetch_import_ai_suggestions(text, players, tournament_id)
+    if suggestions:
+        players = _apply_import_ai_suggestions(players, suggestions, mixed_categories)
+    if polish_default:
+        players = _fill_blank_import_countries(players, 'PL')
+    return players
 
 
 def _parse_import_player_line(
@@ -614,11 +693,12 @@ def save_tournament_schedule(tournament_id: int):
         return error
     data = request.get_json(silent=True) or {}
     raw_entries = data.get('entries') if isinstance(data.get('entries'), list) else [data]
+    changed_only = bool(data.get('changed_only'))
     try:
-        schedule = upsert_tournament_schedule_entries(tournament_id, raw_entries)
+        schedule = upsert_tournament_schedule_entries(tournament_id, raw_entries, changed_only=changed_only)
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
-    return _json_no_cache({"schedule": schedule})
+    return _json_no_cache({("changed" if changed_only else "schedule"): schedule})
 
 
 @blueprint.route('/<int:tournament_id>/schedule/generate', methods=['POST'])
@@ -965,7 +1045,7 @@ def get_tournament_office_dashboard(tournament_id: int):
     _, error = _require_tournament(tournament_id)
     if error:
         return error
-    return _json_no_cache(_build_office_dashboard(tournament_id))
+    return compressed_json_no_cache(_build_office_dashboard(tournament_id), f"office-dashboard:{tournament_id}")
 
 
 @blueprint.route('/<int:tournament_id>/office/stream', methods=['GET'])
@@ -983,15 +1063,15 @@ def admin_tournament_office_stream(tournament_id: int):
             while True:
                 try:
                     event = listener.get(timeout=30)
-                    yield f"event: office_invalidate\ndata: {json.dumps(event)}\n\n"
+                    name = event.get("event", "office_invalidate")
+                    yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
                 except queue.Empty:
                     yield ": heartbeat\n\n"
         finally:
             office_event_broker.discard(tournament_id, listener)
 
-    return Response(
-        stream_with_context(generate()),
-        mimetype="text/event-stream",
+    return sse_response(
+        generate,
         headers={
             "Cache-Control": "no-store, no-cache, must-revalidate",
             "X-Accel-Buffering": "no",
@@ -1281,7 +1361,7 @@ def parse_import_players(tournament_id: int):
         return jsonify({"error": "No text provided"}), 400
 
     mixed_bands = get_planning_mixed_bands(tournament_id)
-    players_data = _parse_import_players_with_ai(text, mixed_bands)
+    players_data = _parse_import_players_with_ai(text, mixed_bands, tournament_id)
     if not players_data:
         return jsonify({"error": "No valid players found"}), 400
 
@@ -1338,14 +1418,46 @@ def bulk_import_players(tournament_id: int):
     if not players_data:
         return jsonify({"error": "No valid players found"}), 400
     
-    count = bulk_insert_players(tournament_id, players_data)
+    try:
+        result = bulk_import_tournament_players(tournament_id, players_data)
+    except Exception as e:
+        logger.error("bulk_import_tournament_players_error", error=str(e), tournament_id=tournament_id)
+        return jsonify({"error": "Import failed"}), 500
+    count = result["inserted"]
     
     return jsonify({
         "message": f"Imported {count} players",
-        "count": count
+        "count": count,
+        "rows": result["rows"],
     })
 
 
+@blueprint.route('/<int:tournament_id>/players/import-jobs/<job_id>', methods=['GET'])
+def get_player_import_job(tournament_id: int, job_id: str):
+    """Progress of a streamed player import."""
+    job = player_import_jobs.get(tournament_id, job_id)
+    if job is None:
+        return jsonify({"error": "Import job not found"}), 404
+    return _json_no_cache(player_import_job_payload(job))
+
+
+@blueprint.route('/<int:tournament_id>/players/import-jobs/<job_id>/result', methods=['GET'])
+def download_player_import_result(tournament_id: int, job_id: str):
+    """Per-row outcome of a finished streamed import, as CSV."""
+    job = player_import_jobs.get(tournament_id, job_id)
+    if job is None or not job.result_path.exists():
+        return jsonify({"error": "Import job not found"}), 404
+    if not job.finished:
+        return jsonify({"error": "Import still running", "job": job.to_dict()}), 409
+    return send_file(
+        job.result_path,
+        mimetype='text/csv',
+        as_attachment=True,
+        download_name=f"import-{tournament_id}-{job.id[:8]}.csv",
+        max_age=0,
+    )
+
+
 # ==================== PUBLIC API ====================
 
 players_public_bp = Blueprint('players_public', __name__, url_prefix='/api/players')
@@ -1389,6 +1501,7 @@ def get_active_players():
 
 
 @players_public_bp.route('/all', methods=['GET'])
+@cpu_lane
 def get_all_players():
     """Get all players across all tournaments with match stats.
     Deduplicates by global_player_id (or name), preferring the latest tournament entry.
@@ -1396,7 +1509,8 @@ def get_all_players():
     import json
     from wyniki.db_models import Player, GlobalPlayer, Tournament, MatchHistory
     from wyniki.services.categories import normalize_player_classification
-    from sqlalchemy import func, or_
+    from wyniki.services.name_keys import fold_name
+    from sqlalchemy import or_
 
     players = (
         Player.query.join(Tournament)
@@ -1408,18 +1522,22 @@ def get_all_players():
         .all()
     )
 
+    global_ids_by_name: dict[tuple[str, str], int] | None = None
+
     def _dedup_key(player: Player) -> str:
+        nonlocal global_ids_by_name
         if player.global_player_id:
             return f"g:{player.global_player_id}"
-        gp = (
-            GlobalPlayer.query.filter(
-                func.lower(func.trim(GlobalPlayer.first_name)) == (player.first_name or '').strip().lower(),
-                func.lower(func.trim(GlobalPlayer.last_name)) == (player.last_name or '').strip().lower(),
-            )
-            .first()
-        )
-        if gp:
-            return f"g:{gp.id}"
+        if global_ids_by_name is None:
+            global_ids_by_name = {}
+            for gp_id, first_key, last_key in (
+                db.session.query(GlobalPlayer.id, GlobalPlayer.first_name_key, GlobalPlayer.last_name_key)
+                .order_by(GlobalPlayer.id)
+            ):
+                global_ids_by_name.setdefault((first_key, last_key), gp_id)
+        gp_id = global_ids_by_name.get((fold_name(player.first_name), fold_name(player.last_name)))
+        if gp_id:
+            return f"g:{gp_id}"
         return f"n:{player.full_name.strip().lower()}"
 
     def _resolve_category(player: Player, global_player: GlobalPlayer | None) -> str:
@@ -1496,10 +1614,11 @@ def get_all_players():
         })
 
     result.sort(key=lambda row: (row.get('last_name', ''), row.get('first_name', '')))
-    return _json_no_cache(result)
+    return compressed_json_no_cache(result, "players-all")
 
 
 @players_public_bp.route('/<int:player_id>/profile', methods=['GET'])
+@cpu_lane
 def get_player_profile(player_id: int):
     """Get full player profile: info, tournament history, matches, medals.
     Accepts either a Player id (tournament entry) or a GlobalPlayer id via ?global=1
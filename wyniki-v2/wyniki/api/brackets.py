@@ -1,12 +1,15 @@
 """Bracket API: group management, standings, knockout bracket."""
 from flask import Blueprint, jsonify, request
+from wyniki.services.compression import compressed_json_revalidated
 from wyniki.services.office_event_broker import emit_office_invalidation
+from wyniki.services.priority_lanes import cpu_lane
 
 from wyniki.database import (
     get_active_tournament_id,
     fetch_active_tournaments,
     fetch_tournaments,
     fetch_tournament,
+    fetch_tournament_by_name,
     fetch_bracket_groups,
     save_bracket_groups,
     get_full_bracket,
@@ -15,8 +18,7 @@ from wyniki.database import (
     fetch_bracket_knockout,
     fetch_match_history,
     fetch_players,
-    build_public_schedule_payload,
-    ensure_group_schedule_entries,
+    fetch_public_schedule_document,
     ensure_knockout_schedule_entries,
     get_public_tournament_quick_info,
 )
@@ -46,6 +48,13 @@ def _json_no_cache(payload, status: int = 200):
     return response
 
 
+def _public_schedule_response(tid: int):
+    """Cached public schedule (whole or ``?day=YYYY-MM-DD``) with ETag revalidation."""
+    day = (request.args.get('day') or '').strip() or None
+    etag, payload = fetch_public_schedule_document(tid, day, sync_entries=True)
+    return compressed_json_revalidated(payload, f"public_schedule:{tid}:{day or ''}", etag)
+
+
 def _public_tournament_or_404(tid: int):
     tournament = fetch_tournament(tid)
     if not tournament:
@@ -89,15 +98,16 @@ def _resolve_requested_stage(tournament: dict):
 
     base_name = _simulation_base_name(str(tournament.get("name") or ""))
     expected_name = f"{base_name} — etap {stage}"
-    for candidate in fetch_tournaments():
-        if candidate.get("name") == expected_name:
-            return candidate, None
+    candidate = fetch_tournament_by_name(expected_name)
+    if candidate:
+        return candidate, None
     return None, (jsonify({"error": "Tournament stage not found"}), 404)
 
 
 # ==================== PUBLIC ====================
 
 @bracket_public_bp.route('/bracket')
+@cpu_lane
 def public_bracket():
     """Full bracket for a requested tournament or the first active one."""
     requested_tid = request.args.get('tournament_id', type=int)
@@ -130,9 +140,7 @@ def public_schedule():
         if error:
             return error
         tid = tournament["id"]
-    ensure_group_schedule_entries(tid)
-    ensure_knockout_schedule_entries(tid)
-    return _json_no_cache(build_public_schedule_payload(tid))
+    return _public_schedule_response(tid)
 
 
 @bracket_public_bp.route('/info')
@@ -184,6 +192,7 @@ def public_tournament_list():
 
 
 @bracket_public_bp.route('/<int:tid>/bracket')
+@cpu_lane
 def public_tournament_bracket(tid: int):
     """Full bracket for a specific tournament."""
     tournament, error = _public_tournament_or_404(tid)
@@ -224,9 +233,7 @@ def public_tournament_schedule(tid: int):
     tournament, error = _resolve_requested_stage(tournament)
     if error:
         return error
-    ensure_group_schedule_entries(tournament["id"])
-    ensure_knockout_schedule_entries(tournament["id"])
-    return _json_no_cache(build_public_schedule_payload(tournament["id"]))
+    return _public_schedule_response(tournament["id"])
 
 
 # ==================== ADMIN ====================
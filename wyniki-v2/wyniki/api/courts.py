@@ -1,6 +1,7 @@
 """Courts API endpoints."""
 from flask import Blueprint, jsonify, request
 
+from ..services.compression import compressed_json_no_cache
 from ..services.court_manager import serialize_public_snapshot
 from ..services.history_manager import get_history
 from ..db_models import db, Match, MatchStatistics, Player, Tournament
@@ -40,11 +41,11 @@ def snapshot():
             court.get("tournament_name") for court in configured_courts if court.get("tournament_name")
         })
         tournament_name = tournament_names[0] if len(tournament_names) == 1 else get_active_tournament_name(public_only=True)
-        return _json_no_cache({
+        return compressed_json_no_cache({
             "courts": courts_data,
             "tournament_name": tournament_name,
             "tournament_names": tournament_names,
-        })
+        }, "snapshot")
     except Exception as e:
         logger.error(f"Failed to get snapshot: {e}")
         return _json_no_cache({"error": str(e)}, 500)
@@ -4,7 +4,7 @@ from __future__ import annotations
 import json
 import queue
 
-from flask import Blueprint, Response, jsonify, request, stream_with_context
+from flask import Blueprint, jsonify, request
 from werkzeug.security import check_password_hash
 
 from ..services.api_auth import (
@@ -12,7 +12,9 @@ from ..services.api_auth import (
     office_stream_cookie_name,
     require_office_access,
 )
+from ..services.compression import compressed_json_no_cache, sse_response
 from ..services.office_event_broker import emit_office_invalidation, office_event_broker
+from ..services.schedule_conflicts import schedule_conflicts
 from ..database import (
     advance_knockout,
     apply_autoschedule_placements,
@@ -70,6 +72,7 @@ _MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 _NON_MUTATING_ENDPOINTS = {
     "office_auth",
     "office_autoschedule_generate",
+    "office_schedule_conflicts_check",
 }
 
 
@@ -145,7 +148,10 @@ def _emit_office_mutation_invalidation(response):
         return response
     tournament, error = _resolve_office_tournament_slot(int(slot))
     if not error and tournament:
-        emit_office_invalidation(int(tournament["id"]), ["dashboard"])
+        scopes = ["dashboard"]
+        if schedule_conflicts.refresh(int(tournament["id"])):
+            scopes.append("conflicts")
+        emit_office_invalidation(int(tournament["id"]), scopes)
     return response
 
 
@@ -203,15 +209,15 @@ def office_stream(slot: int):
             while True:
                 try:
                     event = listener.get(timeout=30)
-                    yield f"event: office_invalidate\ndata: {json.dumps(event)}\n\n"
+                    name = event.get("event", "office_invalidate")
+                    yield f"event: {name}\ndata: {json.dumps(event)}\n\n"
                 except queue.Empty:
                     yield ": heartbeat\n\n"
         finally:
             office_event_broker.discard(tournament_id, listener)
 
-    return Response(
-        stream_with_context(generate()),
-        mimetype="text/event-stream",
+    return sse_response(
+        generate,
         headers={
             "Cache-Control": "no-store, no-cache, must-revalidate",
             "X-Accel-Buffering": "no",
@@ -227,7 +233,10 @@ def office_dashboard(slot: int):
     if error:
         return error
     return _set_office_stream_cookie(
-        _json_no_cache(_build_office_dashboard(int(tournament["id"]))),
+        compressed_json_no_cache(
+            _build_office_dashboard(int(tournament["id"])),
+            f"office-dashboard:{int(tournament['id'])}",
+        ),
         slot,
         int(tournament["id"]),
     )
@@ -393,14 +402,15 @@ def office_schedule_save(slot: int):
     tournament_id = int(tournament['id'])
     data = request.get_json(silent=True) or {}
     raw_entries = data.get('entries') if isinstance(data.get('entries'), list) else [data]
+    changed_only = bool(data.get('changed_only'))
     try:
-        schedule = upsert_tournament_schedule_entries(tournament_id, raw_entries)
+        schedule = upsert_tournament_schedule_entries(tournament_id, raw_entries, changed_only=changed_only)
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
-    return _json_no_cache({
-        "schedule": schedule,
-        "dashboard": _build_office_dashboard(tournament_id),
-    })
+    if changed_only:
+        # The client patches its copy; the dashboard follows the office_invalidate this write emits.
+        return _json_no_cache({"changed": schedule})
+    return _json_no_cache({"schedule": schedule, "dashboard": _build_office_dashboard(tournament_id)})
 
 
 @blueprint.route('/<int:slot>/schedule/generate', methods=['POST'])
@@ -614,6 +624,10 @@ def office_autoschedule_generate(slot: int):
         b1_court_ids=b1_court_ids,
         day_date=(data.get('day_date') or None),
         phases=data.get('phases') if isinstance(data.get('phases'), list) else None,
+        optimize=_normalize_bool(data.get('optimize', False)),
+        optimize_seed=_normalize_int(data.get('seed'), 0),
+        optimize_budget_ms=(_normalize_int(data.get('time_budget_ms'), 0) if data.get('time_budget_ms') is not None else None),
+        multi_day=_normalize_bool(data.get('multi_day', False)),
     )
     return _json_no_cache(proposal)
 
@@ -660,6 +674,38 @@ def office_autoschedule_move(slot: int):
     })
 
 
+@blueprint.route('/<int:slot>/schedule/conflicts', methods=['GET'])
+def office_schedule_conflicts(slot: int):
+    """Return player overlap and rest-gap conflicts in the saved schedule."""
+    tournament, error = _require_office_access(slot)
+    if error:
+        return error
+    return _json_no_cache({"conflicts": schedule_conflicts.conflicts(int(tournament['id']))})
+
+
+@blueprint.route('/<int:slot>/schedule/conflicts/check', methods=['POST'])
+def office_schedule_conflicts_check(slot: int):
+    """Validate a drag target: conflicts one entry would have at a court/day/time."""
+    tournament, error = _require_office_access(slot)
+    if error:
+        return error
+    data = request.get_json(silent=True) or {}
+    schedule_id = _normalize_int(data.get('schedule_id'), 0)
+    if not schedule_id:
+        return jsonify({"error": "schedule_id is required"}), 400
+    try:
+        conflicts = schedule_conflicts.check(
+            int(tournament['id']),
+            schedule_id,
+            court_id=(str(data['court_id']) if data.get('court_id') is not None else None),
+            day_date=(data.get('day_date') or None),
+            scheduled_time=(data.get('scheduled_time') or None),
+        )
+    except KeyError:
+        return jsonify({"error": "Schedule entry not found"}), 404
+    return _json_no_cache({"conflicts": conflicts})
+
+
 @blueprint.route('/<int:slot>/autoschedule/unassign', methods=['POST'])
 def office_autoschedule_unassign(slot: int):
     """Return a match to the unassigned pool (clear court and time)."""
@@ -1,23 +1,25 @@
 """Overlay settings API endpoints."""
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, send_from_directory
 
 from ..services.overlay_settings import (
-    get_overlay_settings,
+    asset_dir,
+    get_overlay_settings_document,
     update_overlay_settings,
     delete_overlay,
     set_overlay_stats_visibility,
 )
 from ..config import logger
+from ..services.compression import compressed_json_revalidated
 
 blueprint = Blueprint('overlay_api', __name__, url_prefix='/api/overlay')
 
 
 @blueprint.route('/settings', methods=['GET'])
 def get_settings():
-    """Get current overlay settings."""
+    """Get current overlay settings (ETag-validated; 304 when unchanged)."""
     try:
-        settings = get_overlay_settings()
-        return jsonify(settings)
+        etag, settings = get_overlay_settings_document()
+        return compressed_json_revalidated(settings, "overlay_settings", etag)
     except Exception as e:
         logger.error(f"Failed to get overlay settings: {e}")
         return jsonify({"error": str(e)}), 500
@@ -33,6 +35,8 @@ def put_settings():
 
         updated = update_overlay_settings(data)
         return jsonify(updated)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Failed to update overlay settings: {e}")
         return jsonify({"error": str(e)}), 500
@@ -52,7 +56,10 @@ def remove_overlay(overlay_id):
 
 @blueprint.route('/logo', methods=['POST'])
 def upload_logo():
-    """Upload tournament logo as base64 data-URL (JSON body: {logo: "data:..."})."""
+    """Upload tournament logo as base64 data-URL (JSON body: {logo: "data:..."}).
+
+    The image is stored as a content-addressed asset; settings keep its URL.
+    """
     try:
         data = request.get_json(force=True)
         logo = data.get("logo")
@@ -60,11 +67,29 @@ def upload_logo():
             return jsonify({"error": "Missing 'logo' field (base64 data-URL)"}), 400
         updated = update_overlay_settings({"tournament_logo": logo})
         return jsonify({"ok": True, "tournament_logo": updated.get("tournament_logo")})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         logger.error(f"Failed to upload logo: {e}")
         return jsonify({"error": str(e)}), 500
 
 
+@blueprint.route('/assets/<path:filename>', methods=['GET'])
+def get_asset(filename):
+    """Serve a content-addressed overlay asset; its name changes with its content.
+
+    Uploaded SVGs can carry script, and these URLs share the app's origin (and
+    its admin token), so an asset opened directly renders sandboxed and is
+    never sniffed into something executable.
+    """
+    response = send_from_directory(asset_dir(), filename, max_age=31536000)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    response.headers["Content-Security-Policy"] = "default-src 'none'; style-src 'unsafe-inline'; sandbox"
+    response.headers["X-Content-Type-Options"] = "nosniff"
+    return response
+
+
 @blueprint.route('/logo', methods=['DELETE'])
 def delete_logo():
     """Remove tournament logo."""
@@ -1,9 +1,12 @@
 """SSE Stream endpoints."""
-from flask import Blueprint, Response, stream_with_context
+from flask import Blueprint
 import json
 
 from ..services.event_broker import event_broker
+from ..services.compression import sse_response
 from ..services.court_manager import serialize_public_snapshot
+from ..services.overlay_settings import overlay_settings_version_event
+from ..services.schedule_projector import schedule_projector
 from ..config import logger
 
 blueprint = Blueprint('stream', __name__, url_prefix='/api')
@@ -20,11 +23,19 @@ def event_stream():
             for kort_id, state in snapshot.items():
                 payload = json.dumps({"court_id": kort_id, **state})
                 yield f"event: court_update\ndata: {payload}\n\n"
+            for projection in schedule_projector.latest():
+                yield f"event: schedule_eta\ndata: {json.dumps(projection)}\n\n"
+            # Overlays compare this with the version they hold (changes missed while disconnected).
+            yield f"event: overlay_settings\ndata: {json.dumps(overlay_settings_version_event())}\n\n"
+            schedule_projector.ensure_started()
             
             # Stream updates
             while True:
                 try:
                     event = listener.get(timeout=30)  # 30s timeout for heartbeat
+                    if event.get("type") in ("schedule_eta", "overlay_settings"):
+                        yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+                        continue
                     kort_id = event.get("kort_id", "")
                     state = event.get("data", {})
                     payload = json.dumps({"court_id": kort_id, **state})
@@ -37,9 +48,8 @@ def event_stream():
         finally:
             event_broker.discard(listener)
     
-    return Response(
-        stream_with_context(generate()),
-        mimetype='text/event-stream',
+    return sse_response(
+        generate,
         headers={
             'Cache-Control': 'no-cache',
             'X-Accel-Buffering': 'no'
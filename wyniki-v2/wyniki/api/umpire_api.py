@@ -12,6 +12,7 @@ from ..services.office_event_broker import emit_office_invalidation
 from ..services.history_manager import add_match_to_history
 from ..services.player_registry import create_tournament_player, player_payload
 from ..services.api_auth import court_session_expires_at, issue_court_token, require_court_access
+from ..services.client_ip import request_client_ip
 from ..config import logger
 
 blueprint = Blueprint('umpire_api', __name__, url_prefix='/api')
@@ -62,29 +63,7 @@ def _normalize_country(value: Any) -> str | None:
 
 
 def _request_client_ip() -> str | None:
-    direct_headers = ("CF-Connecting-IP", "X-Real-IP")
-    for header in direct_headers:
-        value = _clean_client_text(request.headers.get(header), 100)
-        if value:
-            return value
-
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        first_ip = _clean_client_text(forwarded_for.split(",", 1)[0], 100)
-        if first_ip:
-            return first_ip
-
-    forwarded = request.headers.get("Forwarded")
-    if forwarded:
-        for part in forwarded.split(","):
-            for item in part.split(";"):
-                key, _, value = item.strip().partition("=")
-                if key.lower() == "for":
-                    cleaned = _clean_client_text(value.strip('"[]'), 100)
-                    if cleaned:
-                        return cleaned
-
-    return _clean_client_text(request.remote_addr, 100)
+    return _clean_client_text(request_client_ip(), 100)
 
 
 def _request_client_meta(data: dict | None) -> dict:
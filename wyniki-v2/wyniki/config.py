@@ -37,7 +37,48 @@ class Settings(BaseSettings):
     import_players_ai_api_key: Optional[str] = None
     import_players_ai_model: str = "gemini-2.5-flash"
     import_players_ai_timeout_seconds: int = 20
+    import_players_ai_base_url: str = "https://generativelanguage.googleapis.com/v1beta"
+    # Candidate lines per model request; parallel requests per tournament
+    import_players_ai_chunk_size: int = 60
+    import_players_ai_concurrency: int = 2
+    # Parsed answers cached by content hash ("" = ai-import-cache next to the database)
+    import_players_ai_cache_dir: str = ""
+    import_players_ai_cache_ttl_days: int = 30
     
+    # Peers (cloudflared, Traefik) whose CF-Connecting-IP / X-Forwarded-For headers name the client; comma-separated CIDRs
+    trusted_proxy_networks: str = "127.0.0.0/8,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,::1/128,fc00::/7"
+
+    # SSE admission control
+    sse_max_connections: int = 2000
+    sse_max_connections_per_ip: int = 16
+    sse_priority_reserve: int = 64
+    sse_retry_ms: int = 15000
+
+    # Bounded threadpool for CPU-heavy read endpoints (0 = run inline)
+    cpu_lane_workers: int = 4
+
+    # Process pool for bracket/standings computation (0 = run inline)
+    compute_pool_workers: int = 0
+    compute_pool_timeout_seconds: float = 5.0
+
+    # Auto-scheduler "optimize" mode: wall-clock cap and upper bound on the size-based iteration budget
+    autoschedule_optimize_seconds: float = 2.0
+    autoschedule_optimize_iterations: int = 20000
+
+    # Live schedule ETAs on the public stream (0 = off); minimum time left for a running match
+    schedule_eta_interval_seconds: float = 30.0
+    schedule_eta_overrun_minutes: int = 10
+
+    # Per-request SQL budget (0 = no limit); repeats of one statement that suggest an N+1 loop
+    query_budget_statements: int = 100
+    query_budget_seconds: float = 0.5
+    query_repeat_threshold: int = 25
+
+    # Streaming player import: valid rows per bulk write, where uploads and per-row results live, result lifetime
+    player_import_chunk_size: int = 500
+    player_import_dir: str = ""
+    player_import_result_ttl_seconds: int = 3600
+
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"  # "json" or "console"
@@ -31,6 +31,8 @@ from .tournaments import (
     fetch_active_tournaments,
     fetch_tournaments,
     fetch_tournament,
+    fetch_tournament_by_name,
+    tournament_registry,
     insert_tournament,
     update_tournament,
     mark_tournament_summary_sent,
@@ -55,6 +57,7 @@ from .players import (
     _sync_player_name_across_tournament,
     update_player,
     delete_player,
+    bulk_import_tournament_players,
     bulk_insert_players,
 )
 
@@ -82,6 +85,8 @@ from .schedule import (
     _parse_schedule_reference_datetime,
     find_suggested_schedule_match,
     build_public_schedule_payload,
+    fetch_public_schedule_document,
+    invalidate_public_schedule_cache,
     _coerce_schedule_entry,
     upsert_tournament_schedule_entries,
     update_tournament_schedule_entry,
@@ -180,6 +185,8 @@ from .history import (
     insert_match_history,
     delete_latest_history_entry,
     fetch_match_history,
+    fetch_match_duration_samples,
+    match_duration_fingerprint,
     _resolve_name,
 )
 
@@ -243,6 +250,8 @@ __all__ = [
     'fetch_active_tournaments',
     'fetch_tournaments',
     'fetch_tournament',
+    'fetch_tournament_by_name',
+    'tournament_registry',
     'insert_tournament',
     'update_tournament',
     'mark_tournament_summary_sent',
@@ -264,6 +273,7 @@ __all__ = [
     '_sync_player_name_across_tournament',
     'update_player',
     'delete_player',
+    'bulk_import_tournament_players',
     'bulk_insert_players',
     'DEFAULT_GROUP_SCHEDULE_NOTE_PL',
     'DEFAULT_KNOCKOUT_SCHEDULE_NOTE_PL',
@@ -288,6 +298,8 @@ __all__ = [
     '_parse_schedule_reference_datetime',
     'find_suggested_schedule_match',
     'build_public_schedule_payload',
+    'fetch_public_schedule_document',
+    'invalidate_public_schedule_cache',
     '_coerce_schedule_entry',
     'upsert_tournament_schedule_entries',
     'update_tournament_schedule_entry',
@@ -377,5 +389,7 @@ __all__ = [
     'insert_match_history',
     'delete_latest_history_entry',
     'fetch_match_history',
+    'fetch_match_duration_samples',
+    'match_duration_fingerprint',
     '_resolve_name',
 ]
@@ -2,15 +2,19 @@
 import json
 import re
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Generator, List, Optional
+from flask import g as flask_g, has_request_context
 from werkzeug.security import generate_password_hash
 
 from ..config import settings, logger
+from ..services.compute_pool import run_cpu_bound
 
-from .connection import db_conn
+from .connection import bracket_version, db_conn
 
 def _bracket_row_match_priority(row: sqlite3.Row, player_name: str) -> int:
     """Rank player matches: full-name exact wins over surname-only fallback."""
@@ -72,6 +76,141 @@ def _find_bracket_groups_for_player(cursor: sqlite3.Cursor, tournament_id: int,
 
     return matched_group_ids, best_priority
 
+class _BracketContextIndex:
+    """Everything ``detect_bracket_context`` needs for one tournament, in memory.
+
+    - explicit (non-group) phases of schedule rows and knockout slots, newest
+      row first, keyed by the unordered exact player pair, plus the rows
+      themselves for the ``LIKE '%surname'`` fallback;
+    - group ids per normalized exact name candidate and per surname, so a
+      player's groups and match priority are two dictionary lookups.
+    """
+
+    def __init__(self, schedule_rows, knockout_rows, member_rows) -> None:
+        self._phase_rows = {"tournament_schedule": [], "bracket_knockout": []}
+        self._phase_by_pair: Dict[str, Dict[tuple, str]] = {"tournament_schedule": {}, "bracket_knockout": {}}
+        for table_name, rows in (("tournament_schedule", schedule_rows), ("bracket_knockout", knockout_rows)):
+            for row in rows:
+                phase = row["phase"]
+                if phase is None or not phase.strip(" ") or phase == "Grupowa":
+                    continue
+                if row["player1_name"] is None or row["player2_name"] is None:
+                    continue
+                pair = tuple(sorted((row["player1_name"], row["player2_name"])))
+                self._phase_by_pair[table_name].setdefault(pair, phase)
+                self._phase_rows[table_name].append((row["player1_name"], row["player2_name"], phase))
+
+        self._groups_by_name: Dict[str, set] = {}
+        self._groups_by_surname: Dict[str, set] = {}
+        for row in member_rows:
+            group_id = int(row["group_id"])
+            first_name = (row["player_first_name"] or "").strip()
+            last_name = (row["player_last_name"] or "").strip()
+            for candidate in {
+                _normalize_player_name(row["bracket_player_name"]),
+                _normalize_player_name(row["player_full_name"]),
+                _normalize_player_name(f"{first_name} {last_name}"),
+                _normalize_player_name(last_name),
+            } - {""}:
+                self._groups_by_name.setdefault(candidate, set()).add(group_id)
+            for candidate in {
+                _player_surname(row["bracket_player_name"]),
+                _player_surname(row["player_full_name"]),
+                _player_surname(last_name),
+            } - {""}:
+                self._groups_by_surname.setdefault(candidate, set()).add(group_id)
+
+    def explicit_phase(self, table_name: str, p1: str, p2: str) -> Optional[str]:
+        phase = self._phase_by_pair[table_name].get(tuple(sorted((p1, p2))))
+        if phase:
+            return phase
+        p1_surname = p1.split()[-1] if p1 else ""
+        p2_surname = p2.split()[-1] if p2 else ""
+        if not p1_surname or not p2_surname:
+            return None
+        first = _like_suffix_pattern(p1_surname)
+        second = _like_suffix_pattern(p2_surname)
+        for name1, name2, phase in self._phase_rows[table_name]:
+            if (first.fullmatch(name1) and second.fullmatch(name2)) or (
+                second.fullmatch(name1) and first.fullmatch(name2)
+            ):
+                return phase
+        return None
+
+    def player_groups(self, player_name: str) -> tuple[set[int], int]:
+        """Same answer as ``_find_bracket_groups_for_player``: exact names first, surname second."""
+        normalized = _normalize_player_name(player_name)
+        if not normalized:
+            return set(), 0
+        if normalized in self._groups_by_name:
+            return set(self._groups_by_name[normalized]), 2
+        surname = _player_surname(player_name)
+        if surname and surname in self._groups_by_surname:
+            return set(self._groups_by_surname[surname]), 1
+        return set(), 0
+
+
+class _BracketContextCache:
+    """``_BracketContextIndex`` per tournament, rebuilt when its bracket version moves.
+
+    The version (see ``bracket_version``) is bumped by triggers on group,
+    group member, knockout and schedule phase/player writes, so validating
+    the index is one primary-key read however the bracket was changed.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+
+    def index(self, cursor: sqlite3.Cursor, tournament_id: int) -> _BracketContextIndex:
+        key = (settings.database_path, int(tournament_id))
+        version = bracket_version(cursor, int(tournament_id))
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        index = self._build(cursor, int(tournament_id))
+        with self._lock:
+            self._entries[key] = (version, index)
+        return index
+
+    def invalidate(self, tournament_id: Optional[int] = None) -> None:
+        with self._lock:
+            if tournament_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == int(tournament_id)]:
+                del self._entries[key]
+
+    @staticmethod
+    def _build(cursor: sqlite3.Cursor, tournament_id: int) -> _BracketContextIndex:
+        rows = {}
+        for table_name in ("tournament_schedule", "bracket_knockout"):
+            cursor.execute(
+                f"SELECT phase, player1_name, player2_name FROM {table_name} "
+                "WHERE tournament_id = ? ORDER BY id DESC",
+                (tournament_id,),
+            )
+            rows[table_name] = cursor.fetchall()
+        cursor.execute(
+            """
+            SELECT DISTINCT bgp.group_id, bg.name,
+                   bgp.player_name AS bracket_player_name,
+                   p.name AS player_full_name,
+                   p.first_name AS player_first_name,
+                   p.last_name AS player_last_name
+            FROM bracket_group_players bgp
+            JOIN bracket_groups bg ON bg.id = bgp.group_id
+            LEFT JOIN players p ON p.id = bgp.player_id
+            WHERE bg.tournament_id = ?
+            """,
+            (tournament_id,),
+        )
+        return _BracketContextIndex(rows["tournament_schedule"], rows["bracket_knockout"], cursor.fetchall())
+
+
+_bracket_context_cache = _BracketContextCache()
+
 def detect_bracket_context(player1_name: str, player2_name: str, tournament_id: int) -> Dict[str, Any]:
     """Detect bracket group/phase for a match based on player names.
     
@@ -82,84 +221,37 @@ def detect_bracket_context(player1_name: str, player2_name: str, tournament_id:
     """
     try:
         with db_conn() as conn:
-            cursor = conn.cursor()
-            p1 = (player1_name or "").strip()
-            p2 = (player2_name or "").strip()
-            p1_surname = p1.split()[-1] if p1 else ""
-            p2_surname = p2.split()[-1] if p2 else ""
+            index = _bracket_context_cache.index(conn.cursor(), tournament_id)
+        p1 = (player1_name or "").strip()
+        p2 = (player2_name or "").strip()
 
-            def _find_explicit_phase(table_name: str) -> Optional[str]:
-                cursor.execute(
-                    f"""
-                    SELECT phase
-                    FROM {table_name}
-                    WHERE tournament_id = ?
-                      AND phase IS NOT NULL
-                      AND TRIM(phase) != ''
-                      AND phase != 'Grupowa'
-                      AND ((player1_name = ? AND player2_name = ?)
-                        OR (player1_name = ? AND player2_name = ?))
-                    ORDER BY id DESC
-                    LIMIT 1
-                    """,
-                    (tournament_id, p1, p2, p2, p1),
-                )
-                row = cursor.fetchone()
-                if row:
-                    return row["phase"]
-                if not p1_surname or not p2_surname:
-                    return None
-                cursor.execute(
-                    f"""
-                    SELECT phase
-                    FROM {table_name}
-                    WHERE tournament_id = ?
-                      AND phase IS NOT NULL
-                      AND TRIM(phase) != ''
-                      AND phase != 'Grupowa'
-                      AND ((player1_name LIKE ? AND player2_name LIKE ?)
-                        OR (player1_name LIKE ? AND player2_name LIKE ?))
-                    ORDER BY id DESC
-                    LIMIT 1
-                    """,
-                    (
-                        tournament_id,
-                        f"%{p1_surname}",
-                        f"%{p2_surname}",
-                        f"%{p2_surname}",
-                        f"%{p1_surname}",
-                    ),
-                )
-                row = cursor.fetchone()
-                return row["phase"] if row else None
-
-            scheduled_phase = _find_explicit_phase("tournament_schedule")
-            if scheduled_phase:
-                return {"group_id": None, "phase": scheduled_phase, "warning": None}
+        scheduled_phase = index.explicit_phase("tournament_schedule", p1, p2)
+        if scheduled_phase:
+            return {"group_id": None, "phase": scheduled_phase, "warning": None}
 
-            # Prefer explicit knockout slots over shared group membership so
-            # same-group finals are not misclassified as group matches.
-            knockout_phase = _find_explicit_phase("bracket_knockout")
-            if knockout_phase:
-                return {"group_id": None, "phase": knockout_phase, "warning": None}
+        # Prefer explicit knockout slots over shared group membership so
+        # same-group finals are not misclassified as group matches.
+        knockout_phase = index.explicit_phase("bracket_knockout", p1, p2)
+        if knockout_phase:
+            return {"group_id": None, "phase": knockout_phase, "warning": None}
 
-            p1_gids, p1_priority = _find_bracket_groups_for_player(cursor, tournament_id, player1_name)
-            p2_gids, p2_priority = _find_bracket_groups_for_player(cursor, tournament_id, player2_name)
+        p1_gids, p1_priority = index.player_groups(player1_name)
+        p2_gids, p2_priority = index.player_groups(player2_name)
 
-            if not p1_gids or not p2_gids:
-                return {"group_id": None, "phase": None, "warning": "no_bracket"}
+        if not p1_gids or not p2_gids:
+            return {"group_id": None, "phase": None, "warning": "no_bracket"}
 
-            common = p1_gids & p2_gids
+        common = p1_gids & p2_gids
 
-            if common:
-                gid = min(common)
-                return {"group_id": gid, "phase": "Grupowa", "warning": None}
+        if common:
+            gid = min(common)
+            return {"group_id": gid, "phase": "Grupowa", "warning": None}
 
-            surname_only_ambiguous = (p1_priority == 1 and len(p1_gids) > 1) or (p2_priority == 1 and len(p2_gids) > 1)
-            if surname_only_ambiguous:
-                return {"group_id": None, "phase": None, "warning": "no_bracket"}
+        surname_only_ambiguous = (p1_priority == 1 and len(p1_gids) > 1) or (p2_priority == 1 and len(p2_gids) > 1)
+        if surname_only_ambiguous:
+            return {"group_id": None, "phase": None, "warning": "no_bracket"}
 
-            return {"group_id": None, "phase": "Pucharowa", "warning": "different_groups"}
+        return {"group_id": None, "phase": "Pucharowa", "warning": "different_groups"}
 
     except Exception as e:
         logger.error("detect_bracket_context_error", error=str(e))
@@ -871,7 +963,7 @@ def maybe_generate_knockout_from_completed_groups(tournament_id: int) -> Dict[st
 
     bracket = get_full_bracket(tournament_id)
     groups_data = bracket.get("groups", [])
-    generated = _compute_knockout_slots_from_bracket(groups_data)
+    generated = run_cpu_bound(_compute_knockout_slots_from_bracket, groups_data)
     if generated.get("error"):
         return generated
 
@@ -1011,29 +1103,57 @@ def save_bracket_groups(tournament_id: int, groups: List[Dict]) -> bool:
         logger.error("save_bracket_groups_error", error=str(e))
         return False
 
+def _load_bracket_groups(cursor: sqlite3.Cursor, tournament_id: int) -> List[Dict]:
+    """Groups of a tournament with their members, from one JOIN.
+
+    Memoized per request under the tournament's bracket version, so the
+    office dashboard and planning views that ask several times in one request
+    pay one primary-key read after the first call. Callers get copies.
+    """
+    version = bracket_version(cursor, tournament_id)
+    memo = None
+    if has_request_context():
+        memo = flask_g.setdefault("_bracket_groups_memo", {})
+        cached = memo.get((settings.database_path, tournament_id))
+        if cached is not None and cached[0] == version:
+            return [{**group, "players": [dict(player) for player in group["players"]]} for group in cached[1]]
+
+    cursor.execute(
+        """
+        SELECT bg.id, bg.name, bg.tournament_category_id,
+               bgp.id AS member_id, bgp.player_id, bgp.player_name
+        FROM bracket_groups bg
+        LEFT JOIN bracket_group_players bgp ON bgp.group_id = bg.id
+        WHERE bg.tournament_id = ?
+        ORDER BY bg.order_num, bg.id, bgp.id
+        """,
+        (tournament_id,),
+    )
+    groups: List[Dict] = []
+    by_id: Dict[int, Dict] = {}
+    for row in cursor.fetchall():
+        group = by_id.get(row["id"])
+        if group is None:
+            group = by_id[row["id"]] = {
+                "id": row["id"],
+                "name": row["name"],
+                "tournament_category_id": row["tournament_category_id"],
+                "players": [],
+            }
+            groups.append(group)
+        if row["member_id"] is not None:
+            group["players"].append({"player_id": row["player_id"], "name": row["player_name"]})
+
+    if memo is not None:
+        memo[(settings.database_path, tournament_id)] = (version, groups)
+        return [{**group, "players": [dict(player) for player in group["players"]]} for group in groups]
+    return groups
+
 def fetch_bracket_groups(tournament_id: int) -> List[Dict]:
     """Get all bracket groups with players for a tournament."""
     try:
         with db_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT id, name, order_num, tournament_category_id FROM bracket_groups WHERE tournament_id = ? ORDER BY order_num",
-                (tournament_id,),
-            )
-            groups = []
-            for g in cursor.fetchall():
-                cursor.execute(
-                    "SELECT player_id, player_name FROM bracket_group_players WHERE group_id = ?",
-                    (g["id"],),
-                )
-                players = [{"player_id": r["player_id"], "name": r["player_name"]} for r in cursor.fetchall()]
-                groups.append({
-                    "id": g["id"],
-                    "name": g["name"],
-                    "tournament_category_id": g["tournament_category_id"],
-                    "players": players,
-                })
-            return groups
+            return _load_bracket_groups(conn.cursor(), tournament_id)
     except Exception as e:
         logger.error("fetch_bracket_groups_error", error=str(e))
         return []
@@ -1277,6 +1397,18 @@ def _compute_standings(player_names: List[str], matches) -> tuple:
     standings.sort(key=lambda x: (x["wins"], x["set_diff"], x["game_diff"]), reverse=True)
     return standings, match_results
 
+def _compute_groups_standings(group_inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Standings for every group from plain group and match rows (process-pool safe)."""
+    groups_data = []
+    for group in group_inputs:
+        standings, match_results = _compute_standings(group["player_names"], group["matches"])
+        groups_data.append({
+            "name": group["name"],
+            "standings": standings,
+            "matches": match_results,
+        })
+    return groups_data
+
 def save_bracket_knockout(tournament_id: int, slots: List[Dict]) -> bool:
     """Save knockout bracket slots."""
     try:
@@ -1315,6 +1447,40 @@ def fetch_bracket_knockout(tournament_id: int) -> List[Dict]:
         logger.error("fetch_bracket_knockout_error", error=str(e))
         return []
 
+_KNOCKOUT_MATCH_COLUMNS = (
+    "player1_name, player2_name, player1_sets, player2_sets, sets_history, "
+    "winner_name, finish_reason, result_note"
+)
+
+
+def _knockout_result_from_row(row, p1: str, p2: str) -> Dict:
+    """Slot result for players ``p1``/``p2`` from a finished match row (either orientation)."""
+    p1_surname = p1.strip().split()[-1].lower() if p1.strip() else ""
+    match_p1_surname = row["player1_name"].strip().split()[-1].lower() if row["player1_name"] else ""
+    flipped = match_p1_surname != p1_surname
+
+    sh = json.loads(row["sets_history"]) if row["sets_history"] else []
+    sh = [s for s in sh if not _is_empty_set(s)]
+    score_parts = [_format_set_score(s, flipped) for s in sh]
+    sets_detail = [_build_set_detail(s, flipped) for s in sh]
+
+    match_winner = row["winner_name"] or (row["player1_name"] if row["player1_sets"] > row["player2_sets"] else row["player2_name"])
+    winner_surname = match_winner.strip().split()[-1].lower() if match_winner else ""
+    if winner_surname == p1.strip().split()[-1].lower():
+        winner = p1
+    elif winner_surname == p2.strip().split()[-1].lower():
+        winner = p2
+    else:
+        winner = match_winner
+    return {
+        "winner": winner,
+        "score": "  ".join(score_parts),
+        "sets": sets_detail,
+        "finish_reason": row["finish_reason"],
+        "result_note": row["result_note"],
+    }
+
+
 def _detect_knockout_result(
     cursor,
     p1: str,
@@ -1338,8 +1504,7 @@ def _detect_knockout_result(
         phase_clause = "AND phase = ?" if match_phase else ""
         phase_params = [match_phase] if match_phase else []
         cursor.execute(f"""
-                        SELECT player1_name, player2_name, player1_sets, player2_sets, sets_history,
-                                     winner_name, finish_reason, result_note
+            SELECT {_KNOCKOUT_MATCH_COLUMNS}
             FROM matches
             WHERE status = 'finished'
                             AND COALESCE(finish_reason, 'normal') != 'test'
@@ -1353,8 +1518,7 @@ def _detect_knockout_result(
         if row:
             return row
         cursor.execute(f"""
-                        SELECT player1_name, player2_name, player1_sets, player2_sets, sets_history,
-                                     winner_name, finish_reason, result_note
+            SELECT {_KNOCKOUT_MATCH_COLUMNS}
             FROM matches
             WHERE status = 'finished'
                             AND COALESCE(finish_reason, 'normal') != 'test'
@@ -1375,31 +1539,78 @@ def _detect_knockout_result(
 
     if not row:
         return None
+    return _knockout_result_from_row(row, p1, p2)
 
-    p1_surname = p1.strip().split()[-1].lower() if p1.strip() else ""
-    match_p1_surname = row["player1_name"].strip().split()[-1].lower() if row["player1_name"] else ""
-    flipped = match_p1_surname != p1_surname
 
-    sh = json.loads(row["sets_history"]) if row["sets_history"] else []
-    sh = [s for s in sh if not _is_empty_set(s)]
-    score_parts = [_format_set_score(s, flipped) for s in sh]
-    sets_detail = [_build_set_detail(s, flipped) for s in sh]
+@lru_cache(maxsize=1024)
+def _like_suffix_pattern(value: str) -> "re.Pattern[str]":
+    """Python equivalent of SQLite ``LIKE '%<value>'`` (ASCII-only case folding)."""
+    body = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in value
+    )
+    return re.compile(f"(?s:.*{body})", re.IGNORECASE | re.ASCII)
+
+
+class _KnockoutResultIndex:
+    """Finished matches of a tournament, resolved per knockout slot without SQL.
+
+    Mirrors ``_detect_knockout_result``: per phase, an exact unordered
+    player pair first, then the surname ``LIKE '%surname'`` fallback, then
+    the same two steps in the "Pucharowa" phase; the newest match wins.
+    """
+
+    def __init__(self, rows: List[sqlite3.Row]) -> None:
+        # rows arrive newest first, so the first row kept per key is the one LIMIT 1 returned.
+        self._by_pair: Dict[tuple, sqlite3.Row] = {}
+        self._by_phase: Dict[Optional[str], List[sqlite3.Row]] = {None: []}
+        for row in rows:
+            if row["player1_name"] is None or row["player2_name"] is None:
+                continue
+            pair = tuple(sorted((row["player1_name"], row["player2_name"])))
+            for phase in (row["phase"] or None, None):
+                self._by_pair.setdefault((phase, pair), row)
+                if phase is not None:
+                    self._by_phase.setdefault(phase, []).append(row)
+            self._by_phase[None].append(row)
+
+    @classmethod
+    def load(cls, cursor, tournament_id: int, start_date: str, end_date: str) -> "_KnockoutResultIndex":
+        cursor.execute(f"""
+            SELECT {_KNOCKOUT_MATCH_COLUMNS}, phase
+            FROM matches
+            WHERE status = 'finished'
+              AND COALESCE(finish_reason, 'normal') != 'test'
+              AND tournament_id = ?
+              AND created_at >= ? AND created_at <= ?
+            ORDER BY created_at DESC, id DESC
+        """, (tournament_id, start_date, end_date + "T23:59:59"))
+        return cls(cursor.fetchall())
+
+    def _find(self, p1: str, p2: str, phase: Optional[str]) -> Optional[sqlite3.Row]:
+        row = self._by_pair.get((phase or None, tuple(sorted((p1, p2)))))
+        if row is not None:
+            return row
+        first = _like_suffix_pattern(p1.strip().split()[-1] if p1.strip() else p1)
+        second = _like_suffix_pattern(p2.strip().split()[-1] if p2.strip() else p2)
+        for row in self._by_phase.get(phase or None, ()):
+            name1, name2 = row["player1_name"], row["player2_name"]
+            if (first.fullmatch(name1) and second.fullmatch(name2)) or (
+                second.fullmatch(name1) and first.fullmatch(name2)
+            ):
+                return row
+        return None
+
+    def resolve(self, p1: str, p2: str, phase: Optional[str] = None) -> Optional[Dict]:
+        if not p1 or not p2:
+            return None
+        row = self._find(p1, p2, phase)
+        if row is None and phase and phase != "Pucharowa":
+            row = self._find(p1, p2, "Pucharowa")
+        if row is None:
+            return None
+        return _knockout_result_from_row(row, p1, p2)
 
-    match_winner = row["winner_name"] or (row["player1_name"] if row["player1_sets"] > row["player2_sets"] else row["player2_name"])
-    winner_surname = match_winner.strip().split()[-1].lower() if match_winner else ""
-    if winner_surname == p1.strip().split()[-1].lower():
-        winner = p1
-    elif winner_surname == p2.strip().split()[-1].lower():
-        winner = p2
-    else:
-        winner = match_winner
-    return {
-        "winner": winner,
-        "score": "  ".join(score_parts),
-        "sets": sets_detail,
-        "finish_reason": row["finish_reason"],
-        "result_note": row["result_note"],
-    }
 
 def get_full_bracket(tournament_id: int) -> Dict:
     """Get complete bracket data for a tournament."""
@@ -1417,26 +1628,15 @@ def get_full_bracket(tournament_id: int) -> Dict:
             end_date = t["end_date"]
 
             # Groups + standings
-            cursor.execute(
-                "SELECT id, name FROM bracket_groups WHERE tournament_id = ? ORDER BY order_num",
-                (tournament_id,)
-            )
-            group_rows = cursor.fetchall()
-
-            groups_data = []
-            for g in group_rows:
-                cursor.execute(
-                    "SELECT player_name FROM bracket_group_players WHERE group_id = ?",
-                    (g["id"],)
-                )
-                player_names = [r["player_name"] for r in cursor.fetchall()]
-                matches = _find_group_matches(cursor, player_names, start_date, end_date, tournament_id)
-                standings, match_results = _compute_standings(player_names, matches)
-                groups_data.append({
-                    "name": g["name"],
-                    "standings": standings,
-                    "matches": match_results,
+            group_inputs = []
+            for group in _load_bracket_groups(cursor, tournament_id):
+                player_names = [player["name"] for player in group["players"]]
+                group_inputs.append({
+                    "name": group["name"],
+                    "player_names": player_names,
+                    "matches": _find_group_matches(cursor, player_names, start_date, end_date, tournament_id),
                 })
+            groups_data = run_cpu_bound(_compute_groups_standings, group_inputs)
 
             # Knockout
             cursor.execute(
@@ -1445,6 +1645,7 @@ def get_full_bracket(tournament_id: int) -> Dict:
                 (tournament_id,)
             )
             knockout_rows = cursor.fetchall()
+            results = _KnockoutResultIndex.load(cursor, tournament_id, start_date, end_date) if knockout_rows else None
 
             knockout = {}
             for r in knockout_rows:
@@ -1461,9 +1662,7 @@ def get_full_bracket(tournament_id: int) -> Dict:
                 }
                 # Auto-detect result from match data (always, to populate sets)
                 if slot["player1"] and slot["player2"]:
-                    result = _detect_knockout_result(
-                        cursor, slot["player1"], slot["player2"], start_date, end_date, tournament_id, phase
-                    )
+                    result = results.resolve(slot["player1"], slot["player2"], phase)
                     if result:
                         if not slot["winner"]:
                             slot["winner"] = result["winner"]
@@ -1490,7 +1689,7 @@ def generate_knockout_from_standings(tournament_id: int) -> Dict:
     """Auto-generate knockout bracket from completed group standings."""
     try:
         bracket = get_full_bracket(tournament_id)
-        generated = _compute_knockout_slots_from_bracket(bracket.get("groups", []))
+        generated = run_cpu_bound(_compute_knockout_slots_from_bracket, bracket.get("groups", []))
         if generated.get("error"):
             return generated
         slots = generated.get("knockout", [])
@@ -9,6 +9,8 @@ from typing import Any, Dict, Generator, List, Optional
 from werkzeug.security import generate_password_hash
 
 from ..config import settings, logger
+from ..services.name_keys import fold_name
+from ..services.query_budget import InstrumentedConnection
 
 def _default_simulation_office_password_hash(is_simulation: bool, office_password_hash: str) -> str:
     if is_simulation and not (office_password_hash or '').strip():
@@ -21,7 +23,7 @@ def db_conn() -> Generator[sqlite3.Connection, None, None]:
     db_path = Path(settings.database_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     
-    connection = sqlite3.connect(str(db_path), check_same_thread=False)
+    connection = sqlite3.connect(str(db_path), check_same_thread=False, factory=InstrumentedConnection)
     connection.row_factory = sqlite3.Row
     connection.execute("PRAGMA foreign_keys = ON")
     try:
@@ -429,6 +431,12 @@ def init_db() -> None:
             if column_name not in schedule_cols:
                 cursor.execute(f"ALTER TABLE tournament_schedule ADD COLUMN {column_name} {ddl}")
                 logger.info("database_migration", action=f"added_{column_name}_to_tournament_schedule")
+        if 'pair_key' not in schedule_cols:
+            cursor.execute("ALTER TABLE tournament_schedule ADD COLUMN pair_key TEXT")
+            logger.info("database_migration", action="added_pair_key_to_tournament_schedule")
+        _ensure_schedule_pair_keys(cursor)
+        _ensure_schedule_versions(cursor)
+        _ensure_cache_versions(cursor)
         
         # Migration: Add location column to tournaments
         cursor.execute("PRAGMA table_info(tournaments)")
@@ -515,10 +523,35 @@ def init_db() -> None:
             cursor.execute("ALTER TABLE players ADD COLUMN global_player_id INTEGER REFERENCES global_players(id) ON DELETE SET NULL")
             logger.info("database_migration", action="added_global_player_id_to_players")
 
+        _ensure_global_player_name_keys(cursor)
+
         conn.commit()
     
     logger.info("database_initialized", db_path=settings.database_path)
 
+def _ensure_global_player_name_keys(cursor: sqlite3.Cursor) -> None:
+    """Add, backfill and index the folded name keys of ``global_players`` (see ``fold_name``)."""
+    cursor.execute("PRAGMA table_info(global_players)")
+    columns = [row[1] for row in cursor.fetchall()]
+    for column in ("first_name_key", "last_name_key"):
+        if column not in columns:
+            cursor.execute(f"ALTER TABLE global_players ADD COLUMN {column} TEXT")
+            logger.info("database_migration", action=f"added_{column}_to_global_players")
+    cursor.execute(
+        "SELECT id, first_name, last_name FROM global_players "
+        "WHERE first_name_key IS NULL OR last_name_key IS NULL"
+    )
+    backfill = [(fold_name(row["first_name"]), fold_name(row["last_name"]), row["id"]) for row in cursor.fetchall()]
+    if backfill:
+        cursor.executemany(
+            "UPDATE global_players SET first_name_key = ?, last_name_key = ? WHERE id = ?", backfill
+        )
+        logger.info("database_migration", action="backfilled_global_player_name_keys", rows=len(backfill))
+    cursor.execute("DROP INDEX IF EXISTS idx_global_players_name_key")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_global_players_name_keys ON global_players(last_name_key, first_name_key)"
+    )
+
 def fetch_app_settings(keys: List[str]) -> Dict[str, Any]:
     """Fetch app settings from database."""
     try:
@@ -564,5 +597,332 @@ def upsert_app_settings(settings_dict: Dict[str, str]) -> None:
     except Exception as e:
         logger.error("upsert_app_settings_error", error=str(e))
 
+# (phase, sorted player names) of a schedule row as one comparable text value.
+SCHEDULE_PAIR_KEY_SEPARATOR = "\x1f"
+
+
+def _schedule_pair_key_sql(alias: str) -> str:
+    p1 = f"trim(COALESCE({alias}.player1_name, ''))"
+    p2 = f"trim(COALESCE({alias}.player2_name, ''))"
+    return f"trim(COALESCE({alias}.phase, '')) || char(31) || min({p1}, {p2}) || char(31) || max({p1}, {p2})"
+
+
+def schedule_pair_key(phase: Any, player1_name: Any, player2_name: Any) -> Optional[str]:
+    """Python twin of the ``tournament_schedule.pair_key`` expression (None without two players)."""
+    first, second = sorted((str(player1_name or "").strip(" "), str(player2_name or "").strip(" ")))
+    if not first or not second:
+        return None
+    return SCHEDULE_PAIR_KEY_SEPARATOR.join((str(phase or "").strip(" "), first, second))
+
+
+def _ensure_schedule_pair_keys(cursor: sqlite3.Cursor) -> None:
+    """Backfill ``pair_key`` and install the unique index plus the triggers that maintain it.
+
+    Only one row per (tournament, phase, pair) carries the key: legacy duplicates keep
+    NULL, and the oldest of them inherits the key when the keyed row is deleted.
+    """
+    cursor.execute(
+        """
+        SELECT id, tournament_id, phase, player1_name, player2_name, pair_key
+        FROM tournament_schedule
+        ORDER BY id
+        """
+    )
+    rows = cursor.fetchall()
+    taken = {(row["tournament_id"], row["pair_key"]) for row in rows if row["pair_key"] is not None}
+    backfill = []
+    for row in rows:
+        if row["pair_key"] is not None:
+            continue
+        key = schedule_pair_key(row["phase"], row["player1_name"], row["player2_name"])
+        if key is None or (row["tournament_id"], key) in taken:
+            continue
+        taken.add((row["tournament_id"], key))
+        backfill.append((key, row["id"]))
+    if backfill:
+        cursor.executemany("UPDATE tournament_schedule SET pair_key = ? WHERE id = ?", backfill)
+        logger.info("database_migration", action="backfilled_tournament_schedule_pair_key", rows=len(backfill))
+
+    cursor.execute(
+        """
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_tournament_schedule_pair_key
+        ON tournament_schedule(tournament_id, pair_key) WHERE pair_key IS NOT NULL
+        """
+    )
+    new_key = _schedule_pair_key_sql("NEW")
+    has_players = (
+        "trim(COALESCE(NEW.player1_name, '')) != '' AND trim(COALESCE(NEW.player2_name, '')) != ''"
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tournament_schedule_pair_key_insert
+        AFTER INSERT ON tournament_schedule
+        WHEN NEW.pair_key IS NULL AND {has_players}
+        BEGIN
+            UPDATE tournament_schedule SET pair_key = {new_key}
+            WHERE id = NEW.id AND NOT EXISTS (
+                SELECT 1 FROM tournament_schedule
+                WHERE tournament_id = NEW.tournament_id AND pair_key = {new_key}
+            );
+        END
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tournament_schedule_pair_key_update
+        AFTER UPDATE OF phase, player1_name, player2_name ON tournament_schedule
+        BEGIN
+            UPDATE tournament_schedule
+            SET pair_key = CASE
+                WHEN {has_players} AND NOT EXISTS (
+                    SELECT 1 FROM tournament_schedule
+                    WHERE tournament_id = NEW.tournament_id AND pair_key = {new_key} AND id != NEW.id
+                ) THEN {new_key}
+                ELSE NULL
+            END
+            WHERE id = NEW.id;
+        END
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_tournament_schedule_pair_key_delete
+        AFTER DELETE ON tournament_schedule
+        WHEN OLD.pair_key IS NOT NULL
+        BEGIN
+            UPDATE tournament_schedule SET pair_key = OLD.pair_key
+            WHERE id = (
+                SELECT ts.id FROM tournament_schedule ts
+                WHERE ts.tournament_id = OLD.tournament_id AND ts.pair_key IS NULL
+                  AND {_schedule_pair_key_sql("ts")} = OLD.pair_key
+                ORDER BY ts.id
+                LIMIT 1
+            );
+        END
+        """
+    )
+
+
+def _install_trigger(cursor: sqlite3.Cursor, name: str, definition: str) -> None:
+    """Create trigger ``name``, replacing an existing one whose definition differs.
+
+    ``CREATE TRIGGER IF NOT EXISTS`` would keep the old body on databases created
+    before a trigger changed; SQLite stores the statement text, so compare it.
+    """
+    sql = f"CREATE TRIGGER {name}\n{definition.strip()}"
+    cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?", (name,))
+    row = cursor.fetchone()
+    if row is not None and row[0] == sql:
+        return
+    if row is not None:
+        cursor.execute(f"DROP TRIGGER {name}")
+        logger.info("database_migration", action=f"replaced_trigger_{name}")
+    cursor.execute(sql)
+
+
+def _changed(*columns: str) -> str:
+    """Trigger condition: any of ``columns`` differs between OLD and NEW."""
+    return " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+
+
+def _ensure_schedule_versions(cursor: sqlite3.Cursor) -> None:
+    """Install per-tournament schedule version counters, bumped by triggers.
+
+    Every write to ``tournament_schedule`` (raw SQL or ORM, from any worker
+    process) increments its tournament's version, and court renames bump
+    tournament 0, so in-memory schedule indexes can validate themselves with
+    one primary-key read. ``result_version`` moves when a match's result
+    columns change, which is what the public schedule shows of linked matches.
+    ``bracket_version`` moves when group membership, knockout slots or the
+    phase/players of a schedule row change (the bracket context index); its
+    update triggers compare OLD and NEW, so rewriting a row unchanged keeps it.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tournament_schedule_versions (
+            tournament_id INTEGER PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            result_version INTEGER NOT NULL DEFAULT 0,
+            bracket_version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    cursor.execute("PRAGMA table_info(tournament_schedule_versions)")
+    version_columns = [row[1] for row in cursor.fetchall()]
+    for column in ("result_version", "bracket_version"):
+        if column not in version_columns:
+            cursor.execute(
+                f"ALTER TABLE tournament_schedule_versions ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0"
+            )
+            logger.info("database_migration", action=f"added_{column}_to_tournament_schedule_versions")
+    bump = (
+        "INSERT INTO tournament_schedule_versions (tournament_id, {column}) VALUES ({tid}, 1) "
+        "ON CONFLICT(tournament_id) DO UPDATE SET {column} = {column} + 1;"
+    )
+    result_columns = "status, winner_name, result_note, finish_reason, player1_sets, player2_sets, sets_history"
+    group_of = "(SELECT tournament_id FROM bracket_groups WHERE id = {row}.group_id)"
+    pair_columns = ("tournament_id", "phase", "player1_name", "player2_name")
+    group_columns = ("tournament_id", "name", "order_num", "tournament_category_id")
+    member_columns = ("group_id", "player_id", "player_name")
+
+    def changed_update(table: str, columns: tuple, when: str = "") -> str:
+        condition = _changed(*columns)
+        condition = f"{when} AND ({condition})" if when else condition
+        return f"AFTER UPDATE OF {', '.join(columns)} ON {table} WHEN {condition}"
+
+    for name, event, column, tid in (
+        ("insert", "AFTER INSERT ON tournament_schedule", "version", "NEW.tournament_id"),
+        ("update", "AFTER UPDATE ON tournament_schedule", "version", "NEW.tournament_id"),
+        ("delete", "AFTER DELETE ON tournament_schedule", "version", "OLD.tournament_id"),
+        ("courts", "AFTER UPDATE OF name, display_order ON courts", "version", "0"),
+        (
+            "match_result",
+            f"AFTER UPDATE OF {result_columns} ON matches WHEN NEW.tournament_id IS NOT NULL",
+            "result_version",
+            "NEW.tournament_id",
+        ),
+        (
+            "match_delete",
+            "AFTER DELETE ON matches WHEN OLD.tournament_id IS NOT NULL",
+            "result_version",
+            "OLD.tournament_id",
+        ),
+        ("bracket_schedule_insert", "AFTER INSERT ON tournament_schedule", "bracket_version", "NEW.tournament_id"),
+        (
+            "bracket_schedule_update",
+            changed_update("tournament_schedule", pair_columns),
+            "bracket_version",
+            "NEW.tournament_id",
+        ),
+        ("bracket_schedule_delete", "AFTER DELETE ON tournament_schedule", "bracket_version", "OLD.tournament_id"),
+        ("bracket_knockout_insert", "AFTER INSERT ON bracket_knockout", "bracket_version", "NEW.tournament_id"),
+        (
+            "bracket_knockout_update",
+            changed_update("bracket_knockout", pair_columns),
+            "bracket_version",
+            "NEW.tournament_id",
+        ),
+        ("bracket_knockout_delete", "AFTER DELETE ON bracket_knockout", "bracket_version", "OLD.tournament_id"),
+        ("bracket_groups_insert", "AFTER INSERT ON bracket_groups", "bracket_version", "NEW.tournament_id"),
+        (
+            "bracket_groups_update",
+            changed_update("bracket_groups", group_columns),
+            "bracket_version",
+            "NEW.tournament_id",
+        ),
+        ("bracket_groups_delete", "AFTER DELETE ON bracket_groups", "bracket_version", "OLD.tournament_id"),
+        (
+            "bracket_members_insert",
+            f"AFTER INSERT ON bracket_group_players WHEN {group_of.format(row='NEW')} IS NOT NULL",
+            "bracket_version",
+            group_of.format(row="NEW"),
+        ),
+        (
+            "bracket_members_update",
+            changed_update("bracket_group_players", member_columns, f"{group_of.format(row='NEW')} IS NOT NULL"),
+            "bracket_version",
+            group_of.format(row="NEW"),
+        ),
+        (
+            "bracket_members_delete",
+            f"AFTER DELETE ON bracket_group_players WHEN {group_of.format(row='OLD')} IS NOT NULL",
+            "bracket_version",
+            group_of.format(row="OLD"),
+        ),
+        (
+            "bracket_player_rename",
+            changed_update("players", ("name", "first_name", "last_name")),
+            "bracket_version",
+            "NEW.tournament_id",
+        ),
+    ):
+        _install_trigger(
+            cursor,
+            f"trg_tournament_schedule_version_{name}",
+            f"""
+            {event}
+            BEGIN
+                {bump.format(column=column, tid=tid)}
+            END
+            """,
+        )
+
+
+def _ensure_cache_versions(cursor: sqlite3.Cursor) -> None:
+    """Install named version counters for in-process read caches, bumped by triggers.
+
+    ``tournaments`` moves on any write to ``tournaments`` and whenever a court
+    joins or leaves a tournament (``court_count`` is part of the cached rows).
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS cache_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        """
+    )
+    bump = (
+        "INSERT INTO cache_versions (name, version) VALUES ('{name}', 1) "
+        "ON CONFLICT(name) DO UPDATE SET version = version + 1;"
+    )
+    for trigger, event, name in (
+        ("tournaments_insert", "AFTER INSERT ON tournaments", "tournaments"),
+        ("tournaments_update", "AFTER UPDATE ON tournaments", "tournaments"),
+        ("tournaments_delete", "AFTER DELETE ON tournaments", "tournaments"),
+        ("courts_insert", "AFTER INSERT ON courts", "tournaments"),
+        ("courts_move", "AFTER UPDATE OF tournament_id ON courts", "tournaments"),
+        ("courts_delete", "AFTER DELETE ON courts", "tournaments"),
+    ):
+        cursor.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_cache_version_{trigger}
+            {event}
+            BEGIN
+                {bump.format(name=name)}
+            END
+            """
+        )
+
+
+def cache_version(cursor: sqlite3.Cursor, name: str) -> int:
+    """Current value of the ``cache_versions`` counter ``name``; see ``_ensure_cache_versions``."""
+    cursor.execute("SELECT version FROM cache_versions WHERE name = ?", (name,))
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
+def schedule_versions(cursor: sqlite3.Cursor, tournament_id: int) -> tuple[int, int]:
+    """``(schedule version, court version)`` for ``tournament_id``; see ``_ensure_schedule_versions``."""
+    cursor.execute(
+        "SELECT tournament_id, version FROM tournament_schedule_versions WHERE tournament_id IN (?, 0)",
+        (tournament_id,),
+    )
+    versions = {row[0]: row[1] for row in cursor.fetchall()}
+    return versions.get(tournament_id, 0), versions.get(0, 0)
+
+
+def schedule_result_versions(cursor: sqlite3.Cursor, tournament_id: int) -> tuple[int, int, int, int]:
+    """``(schedule version, court version, match-result version, bracket version)`` for ``tournament_id``."""
+    cursor.execute(
+        "SELECT tournament_id, version, result_version, bracket_version FROM tournament_schedule_versions "
+        "WHERE tournament_id IN (?, 0)",
+        (tournament_id,),
+    )
+    rows = {row[0]: (row[1], row[2], row[3]) for row in cursor.fetchall()}
+    version, result_version, bracket = rows.get(tournament_id, (0, 0, 0))
+    return version, rows.get(0, (0, 0, 0))[0], result_version, bracket
+
+
+def bracket_version(cursor: sqlite3.Cursor, tournament_id: int) -> int:
+    """Bracket-context version of ``tournament_id``; see ``_ensure_schedule_versions``."""
+    cursor.execute(
+        "SELECT bracket_version FROM tournament_schedule_versions WHERE tournament_id = ?",
+        (tournament_id,),
+    )
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
+
+
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
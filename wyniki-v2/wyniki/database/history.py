@@ -68,6 +68,46 @@ def insert_match_history(entry: Dict[str, Any]) -> None:
     except Exception as e:
         logger.error("insert_match_history_error", error=str(e), entry=entry)
 
+def fetch_match_duration_samples(tournament_id: Optional[int] = None) -> List[tuple]:
+    """Return ``(category, phase, duration_seconds)`` for normally finished matches.
+
+    ``match_statistics.match_duration_ms`` fills in when the history row has no
+    duration. Without ``tournament_id`` every tournament's history is returned.
+    """
+    where = "WHERE COALESCE(mh.finish_reason, 'normal') = 'normal'"
+    params: tuple = ()
+    if tournament_id is not None:
+        where += " AND mh.tournament_id = ?"
+        params = (tournament_id,)
+    with db_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT mh.category, mh.phase,
+                   CASE WHEN mh.duration_seconds > 0 THEN mh.duration_seconds
+                        ELSE COALESCE(ms.match_duration_ms, 0) / 1000 END AS duration
+            FROM match_history mh
+            LEFT JOIN match_statistics ms ON ms.match_id = mh.match_id
+            {where}
+        """, params)
+        return [(row["category"], row["phase"], row["duration"]) for row in cursor.fetchall()]
+
+
+def match_duration_fingerprint(tournament_id: Optional[int] = None) -> tuple:
+    """Cheap summary of the history rows; it changes whenever a match is recorded or re-recorded."""
+    where = "WHERE tournament_id = ?" if tournament_id is not None else ""
+    params = (tournament_id,) if tournament_id is not None else ()
+    with db_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT COUNT(*) AS total, MAX(id) AS last_id, MAX(ended_ts) AS last_ended,
+                   SUM(duration_seconds) AS seconds
+            FROM match_history
+            {where}
+        """, params)
+        row = cursor.fetchone()
+        return (row["total"], row["last_id"], row["last_ended"], row["seconds"])
+
+
 def delete_latest_history_entry() -> Optional[Dict]:
     """Delete the most recent history entry."""
     try:
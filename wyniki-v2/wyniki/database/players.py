@@ -9,6 +9,7 @@ from typing import Any, Dict, Generator, List, Optional
 from werkzeug.security import generate_password_hash
 
 from ..config import settings, logger
+from ..services.name_keys import fold_name
 
 from .connection import db_conn
 
@@ -108,11 +109,11 @@ def _ensure_global_player(cursor: sqlite3.Cursor, first_name: str, last_name: st
     cursor.execute(
         """
         SELECT id FROM global_players
-        WHERE LOWER(TRIM(first_name)) = LOWER(TRIM(?))
-          AND LOWER(TRIM(last_name)) = LOWER(TRIM(?))
+        WHERE last_name_key = ? AND first_name_key = ?
+        ORDER BY id
         LIMIT 1
         """,
-        (first_name, last_name),
+        (fold_name(last_name), fold_name(first_name)),
     )
     row = cursor.fetchone()
     if row:
@@ -131,10 +132,13 @@ def _ensure_global_player(cursor: sqlite3.Cursor, first_name: str, last_name: st
 
     cursor.execute(
         """
-        INSERT INTO global_players (first_name, last_name, gender, country, category)
-        VALUES (?, ?, ?, ?, ?)
+        INSERT INTO global_players (first_name, last_name, gender, country, category, first_name_key, last_name_key)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
-        (first_name, last_name, (gender or "").strip(), (country or "").strip(), (category or "").strip()),
+        (
+            first_name, last_name, (gender or "").strip(), (country or "").strip(), (category or "").strip(),
+            fold_name(first_name), fold_name(last_name),
+        ),
     )
     return cursor.lastrowid
 
@@ -274,48 +278,225 @@ def delete_player(player_id: int, tournament_id: Optional[int] = None) -> bool:
         logger.error("delete_player_error", error=str(e), player_id=player_id)
         return False
 
+# Rows per set-based lookup, well under SQLite's bound-parameter limit.
+_BULK_LOOKUP_CHUNK = 500
+
+_GLOBAL_FILL_FIELDS = ("gender", "country", "category")
+
+
+def _split_import_name(player: Dict) -> tuple[str, str, str]:
+    p_name = player.get("name", "")
+    fn = player.get("first_name", "")
+    ln = player.get("last_name", "")
+    # Split name if first/last not provided
+    if not fn and not ln and p_name:
+        parts = p_name.strip().rsplit(' ', 1)
+        if len(parts) == 2:
+            fn, ln = parts[0], parts[1]
+        else:
+            fn, ln = '', p_name.strip()
+    if not p_name:
+        p_name = f"{fn} {ln}".strip()
+    return p_name, fn, ln
+
+
+def _lookup_global_players(cursor: sqlite3.Cursor, keys: set) -> Dict[tuple, Dict]:
+    """Existing global players by ``(first, last)`` name key, oldest first per key.
+
+    One query per chunk of last names, served by ``idx_global_players_name_keys``.
+    """
+    found: Dict[tuple, Dict] = {}
+    last_names = sorted({last for _first, last in keys})
+    for offset in range(0, len(last_names), _BULK_LOOKUP_CHUNK):
+        chunk = last_names[offset:offset + _BULK_LOOKUP_CHUNK]
+        cursor.execute(
+            f"""
+            SELECT id, first_name_key AS first_key, last_name_key AS last_key,
+                   gender, country, category
+            FROM global_players
+            WHERE last_name_key IN ({", ".join("?" for _ in chunk)})
+            ORDER BY id
+            """,
+            chunk,
+        )
+        for row in cursor.fetchall():
+            key = (row["first_key"], row["last_key"])
+            if key in keys:
+                found.setdefault(key, dict(row))
+    return found
+
+
+def bulk_import_tournament_players(
+    tournament_id: int,
+    players_data: List[Dict],
+    *,
+    skip_existing: bool = False,
+    fill_from_global: bool = False,
+) -> Dict[str, Any]:
+    """Insert many tournament players in one transaction with set-based global-player resolution.
+
+    Names are split and keyed with ``fold_name`` first; existing global players are then found
+    with one query per chunk, the missing ones created with one
+    ``executemany`` (blank gender/country/category of matched ones filled
+    from the import, first non-empty value wins), and the tournament entries
+    inserted with one more. ``skip_existing`` leaves out people already
+    entered in the tournament (or earlier in the same import);
+    ``fill_from_global`` takes missing entry fields from the global player.
+
+    Returns counts plus one report per input row: ``status`` ("added" or
+    "skipped"), ``global`` ("matched", "created" or None) and ``global_player_id``.
+    """
+    rows = []
+    for index, player in enumerate(players_data):
+        p_name, fn, ln = _split_import_name(player)
+        rows.append({
+            "index": index,
+            "name": p_name,
+            "first_name": fn,
+            "last_name": ln,
+            "category": player.get("category", ""),
+            "country": player.get("country", ""),
+            "gender": player.get("gender", ""),
+            "key": (fold_name(fn), fold_name(ln)) if (fn or "").strip() or (ln or "").strip() else None,
+        })
+
+    with db_conn() as conn:
+        cursor = conn.cursor()
+        links_global = _tournament_links_global_players(cursor, tournament_id)
+        global_rows: Dict[tuple, Dict] = {}
+        if links_global:
+            keys = {row["key"] for row in rows if row["key"] is not None}
+            global_rows = _lookup_global_players(cursor, keys)
+            fills: Dict[tuple, Dict] = {}
+            new_globals: Dict[tuple, Dict] = {}
+            for row in rows:
+                key = row["key"]
+                if key is None:
+                    continue
+                values = {field: (row[field] or "").strip() for field in _GLOBAL_FILL_FIELDS}
+                if key in global_rows:
+                    row["global"] = "matched"
+                    current = fills.setdefault(key, {
+                        field: global_rows[key][field] or "" for field in _GLOBAL_FILL_FIELDS
+                    })
+                elif key in new_globals:
+                    row["global"] = "matched"
+                    current = new_globals[key]
+                else:
+                    row["global"] = "created"
+                    new_globals[key] = {
+                        "first_name": (row["first_name"] or "").strip(),
+                        "last_name": (row["last_name"] or "").strip(),
+                        **values,
+                    }
+                    continue
+                for field, value in values.items():
+                    if not current[field].strip(" "):
+                        current[field] = value
+
+            updates = [
+                (*(fill[field] for field in _GLOBAL_FILL_FIELDS), global_rows[key]["id"])
+                for key, fill in fills.items()
+                if any(fill[field] != (global_rows[key][field] or "") for field in _GLOBAL_FILL_FIELDS)
+            ]
+            if updates:
+                cursor.executemany(
+                    "UPDATE global_players SET gender = ?, country = ?, category = ? WHERE id = ?", updates
+                )
+            for key, fill in fills.items():
+                global_rows[key].update(fill)
+            if new_globals:
+                cursor.executemany(
+                    """
+                    INSERT INTO global_players (first_name, last_name, gender, country, category,
+                                                first_name_key, last_name_key)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            item["first_name"], item["last_name"], item["gender"], item["country"], item["category"],
+                            *key,
+                        )
+                        for key, item in new_globals.items()
+                    ],
+                )
+                global_rows.update(_lookup_global_players(cursor, set(new_globals)))
+
+        entered_globals: set = set()
+        entered_names: set = set()
+        if skip_existing:
+            cursor.execute(
+                "SELECT global_player_id, first_name, last_name FROM players WHERE tournament_id = ?",
+                (tournament_id,),
+            )
+            for existing in cursor.fetchall():
+                if existing["global_player_id"] is not None:
+                    entered_globals.add(existing["global_player_id"])
+                entered_names.add((fold_name(existing["first_name"]), fold_name(existing["last_name"])))
+
+        inserts = []
+        for row in rows:
+            global_player = global_rows.get(row["key"]) if links_global and row["key"] is not None else None
+            row["global_player_id"] = global_player["id"] if global_player else None
+            row.setdefault("global", None)
+            if skip_existing:
+                if global_player is not None:
+                    if global_player["id"] in entered_globals:
+                        row["status"] = "skipped"
+                        continue
+                    entered_globals.add(global_player["id"])
+                elif not links_global:
+                    if row["key"] in entered_names:
+                        row["status"] = "skipped"
+                        continue
+                    entered_names.add(row["key"])
+            row["status"] = "added"
+            gender, category, country = row["gender"], row["category"], row["country"]
+            if fill_from_global and global_player is not None:
+                gender = gender or global_player["gender"] or ""
+                category = (category or "").strip() or global_player["category"] or ""
+                country = (country or "").strip() or global_player["country"] or ""
+            inserts.append((
+                tournament_id, row["name"], row["first_name"], row["last_name"],
+                category, country, gender, row["global_player_id"],
+            ))
+        if inserts:
+            cursor.executemany("""
+                INSERT INTO players (tournament_id, name, first_name, last_name, category, country, gender, global_player_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, inserts)
+        conn.commit()
+
+    report = [
+        {
+            "index": row["index"],
+            "name": row["name"],
+            "status": row["status"],
+            "global": row["global"],
+            "global_player_id": row["global_player_id"],
+        }
+        for row in rows
+    ]
+    result = {
+        "inserted": len(inserts),
+        "skipped": sum(1 for row in rows if row["status"] == "skipped"),
+        "matched_global": sum(1 for row in rows if row["global"] == "matched"),
+        "created_global": sum(1 for row in rows if row["global"] == "created"),
+        "rows": report,
+    }
+    logger.info(
+        "players_bulk_inserted",
+        count=result["inserted"],
+        skipped=result["skipped"],
+        created_global=result["created_global"],
+        tournament_id=tournament_id,
+    )
+    return result
+
 def bulk_insert_players(tournament_id: int, players_data: List[Dict]) -> int:
     """Bulk insert players. Returns count of inserted players."""
     try:
-        with db_conn() as conn:
-            cursor = conn.cursor()
-            count = 0
-            for player in players_data:
-                p_name = player.get("name", "")
-                fn = player.get("first_name", "")
-                ln = player.get("last_name", "")
-                # Split name if first/last not provided
-                if not fn and not ln and p_name:
-                    parts = p_name.strip().rsplit(' ', 1)
-                    if len(parts) == 2:
-                        fn, ln = parts[0], parts[1]
-                    else:
-                        fn, ln = '', p_name.strip()
-                if not p_name:
-                    p_name = f"{fn} {ln}".strip()
-                category = player.get("category", "")
-                country = player.get("country", "")
-                gender = player.get("gender", "")
-                global_player_id = None
-                if _tournament_links_global_players(cursor, tournament_id):
-                    global_player_id = _ensure_global_player(cursor, fn, ln, category, country, gender)
-                cursor.execute("""
-                    INSERT INTO players (tournament_id, name, first_name, last_name, category, country, gender, global_player_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    tournament_id,
-                    p_name,
-                    fn,
-                    ln,
-                    category,
-                    country,
-                    gender,
-                    global_player_id,
-                ))
-                count += 1
-            conn.commit()
-            logger.info("players_bulk_inserted", count=count, tournament_id=tournament_id)
-            return count
+        return bulk_import_tournament_players(tournament_id, players_data)["inserted"]
     except Exception as e:
         logger.error("bulk_insert_players_error", error=str(e))
         return 0
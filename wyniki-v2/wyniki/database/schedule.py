@@ -1,16 +1,20 @@
 """Database access layer submodule."""
+import hashlib
 import json
 import re
 import sqlite3
+import threading
+from bisect import bisect_left
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 from werkzeug.security import generate_password_hash
 
 from ..config import settings, logger
 
-from .connection import _utc_now, db_conn, fetch_app_settings, upsert_app_settings
+from .connection import _utc_now, db_conn, fetch_app_settings, schedule_pair_key, schedule_result_versions, schedule_versions, upsert_app_settings
+from .history import fetch_match_duration_samples, match_duration_fingerprint
 
 DEFAULT_GROUP_SCHEDULE_NOTE_PL = "Godzina orientacyjna zostanie podana przez biuro zawodow"
 
@@ -128,6 +132,24 @@ def _knockout_schedule_day_for_tournament(cursor: sqlite3.Cursor, tournament_id:
         return end
     return start or datetime.now(timezone.utc).date().isoformat()
 
+def _tournament_days(cursor: sqlite3.Cursor, tournament_id: int) -> List[str]:
+    """Every date from the tournament's start_date to its end_date, inclusive."""
+    cursor.execute("SELECT start_date, end_date FROM tournaments WHERE id = ?", (tournament_id,))
+    row = cursor.fetchone()
+    start_text = str(row["start_date"] or "") if row else ""
+    end_text = str(row["end_date"] or "") if row else ""
+    try:
+        start = date.fromisoformat(start_text or _schedule_day_for_tournament(cursor, tournament_id))
+        end = date.fromisoformat(end_text) if end_text else start
+    except ValueError:
+        return [_schedule_day_for_tournament(cursor, tournament_id)]
+    days = []
+    current = start
+    while current <= end and len(days) < 31:
+        days.append(current.isoformat())
+        current += timedelta(days=1)
+    return days or [start.isoformat()]
+
 def _autoschedule_phases_include_knockout(phases: Optional[List[str]]) -> bool:
     if not phases:
         return True
@@ -170,8 +192,12 @@ def _schedule_entry_priority(row: sqlite3.Row | Dict[str, Any]) -> tuple[int, in
         -row_id,
     )
 
-def _prune_duplicate_schedule_entries(cursor: sqlite3.Cursor, tournament_id: int) -> int:
-    """Drop redundant unassigned rows when another row exists for the same pair and phase."""
+def _prune_duplicate_schedule_entries(cursor: sqlite3.Cursor, tournament_id: int) -> List[int]:
+    """Drop redundant unassigned rows when another row exists for the same pair and phase.
+
+    Phases and names compare case-insensitively, unlike the ``pair_key`` index,
+    and legacy rows without a key are covered too. Returns the deleted ids.
+    """
     cursor.execute(
         """
         SELECT id, phase, player1_name, player2_name, court_id, scheduled_time,
@@ -194,7 +220,7 @@ def _prune_duplicate_schedule_entries(cursor: sqlite3.Cursor, tournament_id: int
         key = (str(row["phase"] or "").strip().casefold(), tuple(players))
         grouped.setdefault(key, []).append(row)
 
-    deleted = 0
+    deleted: List[int] = []
     for entries in grouped.values():
         if len(entries) <= 1:
             continue
@@ -213,7 +239,8 @@ def _prune_duplicate_schedule_entries(cursor: sqlite3.Cursor, tournament_id: int
                 "DELETE FROM tournament_schedule WHERE id = ? AND tournament_id = ?",
                 (entry["id"], tournament_id),
             )
-            deleted += int(cursor.rowcount or 0)
+            if cursor.rowcount:
+                deleted.append(int(entry["id"]))
     return deleted
 
 def _format_score_text(sets_history_raw: Any) -> str:
@@ -285,6 +312,22 @@ def _schedule_row_payload(row: sqlite3.Row | Dict[str, Any], *, public: bool = F
         payload["notes_internal"] = data.get("notes_internal") or ""
     return payload
 
+_SCHEDULE_ROW_SELECT = """
+    SELECT ts.*, c.name AS court_name, COALESCE(c.display_order, 9999) AS court_display_order,
+           m.status AS match_status, m.winner_name AS match_winner_name,
+           m.result_note AS match_result_note, m.finish_reason AS match_finish_reason,
+           m.player1_sets AS match_player1_sets, m.player2_sets AS match_player2_sets,
+           m.sets_history AS match_sets_history
+    FROM tournament_schedule ts
+    LEFT JOIN courts c ON c.kort_id = ts.court_id
+    LEFT JOIN matches m ON m.id = ts.match_id
+"""
+
+_SCHEDULE_ROW_ORDER = """
+    ORDER BY ts.day_date, COALESCE(NULLIF(ts.scheduled_time, ''), '99:99'),
+             COALESCE(c.display_order, 9999), ts.sort_order, ts.id
+"""
+
 def fetch_tournament_schedule(tournament_id: int, *, public_only: bool = False) -> List[Dict[str, Any]]:
     """Return flat tournament schedule entries sorted by day, time, court and order."""
     try:
@@ -292,19 +335,7 @@ def fetch_tournament_schedule(tournament_id: int, *, public_only: bool = False)
             cursor = conn.cursor()
             status_clause = "AND ts.status != 'draft'" if public_only else ""
             cursor.execute(
-                f"""
-                SELECT ts.*, c.name AS court_name, COALESCE(c.display_order, 9999) AS court_display_order,
-                       m.status AS match_status, m.winner_name AS match_winner_name,
-                       m.result_note AS match_result_note, m.finish_reason AS match_finish_reason,
-                       m.player1_sets AS match_player1_sets, m.player2_sets AS match_player2_sets,
-                       m.sets_history AS match_sets_history
-                FROM tournament_schedule ts
-                LEFT JOIN courts c ON c.kort_id = ts.court_id
-                LEFT JOIN matches m ON m.id = ts.match_id
-                WHERE ts.tournament_id = ? {status_clause}
-                ORDER BY ts.day_date, COALESCE(NULLIF(ts.scheduled_time, ''), '99:99'),
-                         COALESCE(c.display_order, 9999), ts.sort_order, ts.id
-                """,
+                f"{_SCHEDULE_ROW_SELECT} WHERE ts.tournament_id = ? {status_clause} {_SCHEDULE_ROW_ORDER}",
                 (tournament_id,),
             )
             return [_schedule_row_payload(row, public=public_only) for row in cursor.fetchall()]
@@ -321,57 +352,97 @@ def _parse_schedule_reference_datetime(value: Optional[str] = None) -> datetime:
             pass
     return datetime.now().replace(tzinfo=None)
 
+class _UpcomingScheduleIndex:
+    """Unlinked, playable schedule entries per court, sorted by start datetime.
+
+    One tournament's index is rebuilt from a single query whenever its schedule
+    version (see ``schedule_versions``) moves; between writes a lookup is one
+    version read plus a bisect.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+
+    def court(self, cursor: sqlite3.Cursor, tournament_id: int, court_id: str) -> tuple:
+        key = (settings.database_path, tournament_id)
+        version = schedule_versions(cursor, tournament_id)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, self._build(cursor, tournament_id))
+            with self._lock:
+                self._entries[key] = cached
+        return cached[1].get(str(court_id), ((), ()))
+
+    @staticmethod
+    def _build(cursor: sqlite3.Cursor, tournament_id: int) -> Dict[str, tuple]:
+        cursor.execute(
+            """
+            SELECT ts.*, c.name AS court_name, COALESCE(c.display_order, 9999) AS court_display_order
+            FROM tournament_schedule ts
+            LEFT JOIN courts c ON c.kort_id = ts.court_id
+            WHERE ts.tournament_id = ?
+              AND COALESCE(ts.court_id, '') != ''
+              AND (ts.match_id IS NULL OR ts.match_id = '')
+              AND COALESCE(ts.status, 'planned') != 'completed'
+              AND COALESCE(ts.day_date, '') != ''
+              AND COALESCE(ts.scheduled_time, '') != ''
+              AND COALESCE(ts.player1_name, '') != ''
+              AND COALESCE(ts.player2_name, '') != ''
+            """,
+            (tournament_id,),
+        )
+        by_court: Dict[str, list] = {}
+        for row in cursor.fetchall():
+            entry = _schedule_row_payload(row, public=False)
+            try:
+                scheduled_at = datetime.fromisoformat(f"{entry['day_date']}T{entry['scheduled_time']}:00")
+            except ValueError:
+                continue
+            by_court.setdefault(str(row["court_id"]), []).append(
+                (scheduled_at, entry.get("sort_order") or 0, entry.get("id") or 0, entry)
+            )
+        index = {}
+        for court_id, items in by_court.items():
+            items.sort(key=lambda item: item[:3])
+            index[court_id] = (tuple(item[0] for item in items), tuple(item[3] for item in items))
+        return index
+
+
+_upcoming_schedule_index = _UpcomingScheduleIndex()
+
 def find_suggested_schedule_match(
     tournament_id: int,
     court_id: str,
     *,
     reference_time: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
-    """Return the nearest unlinked schedule entry for a court and reference time."""
+    """Return the nearest unlinked schedule entry for a court and reference time.
+
+    Ties on distance go to the upcoming entry, then the lower sort order and id.
+    """
     if not tournament_id or not court_id:
         return None
     reference = _parse_schedule_reference_datetime(reference_time)
     try:
         with db_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT ts.*, c.name AS court_name, COALESCE(c.display_order, 9999) AS court_display_order
-                FROM tournament_schedule ts
-                LEFT JOIN courts c ON c.kort_id = ts.court_id
-                WHERE ts.tournament_id = ?
-                  AND ts.court_id = ?
-                  AND (ts.match_id IS NULL OR ts.match_id = '')
-                  AND COALESCE(ts.status, 'planned') != 'completed'
-                  AND COALESCE(ts.day_date, '') != ''
-                  AND COALESCE(ts.scheduled_time, '') != ''
-                  AND COALESCE(ts.player1_name, '') != ''
-                  AND COALESCE(ts.player2_name, '') != ''
-                """,
-                (tournament_id, court_id),
-            )
-            candidates = []
-            for row in cursor.fetchall():
-                entry = _schedule_row_payload(row, public=False)
-                try:
-                    scheduled_at = datetime.fromisoformat(f"{entry['day_date']}T{entry['scheduled_time']}:00")
-                except ValueError:
-                    continue
-                diff_seconds = abs((scheduled_at - reference).total_seconds())
-                future_first = 0 if scheduled_at >= reference else 1
-                candidates.append((diff_seconds, future_first, entry.get("sort_order") or 0, entry.get("id") or 0, entry))
-            if not candidates:
-                return None
-            candidates.sort(key=lambda item: (item[0], item[1], item[2], item[3]))
-            return candidates[0][4]
+            times, entries = _upcoming_schedule_index.court(conn.cursor(), tournament_id, court_id)
     except Exception as e:
         logger.error("find_suggested_schedule_match_error", error=str(e), tournament_id=tournament_id, court_id=court_id)
         return None
-
-def build_public_schedule_payload(tournament_id: int) -> Dict[str, Any]:
-    """Return schedule grouped by day and category for the public UI."""
-    tournament = fetch_tournament(tournament_id) or {}
-    entries = fetch_tournament_schedule(tournament_id, public_only=True)
+    if not times:
+        return None
+    position = bisect_left(times, reference)
+    best = position if position < len(times) else None
+    if position > 0:
+        # First entry of the latest start before the reference (entries are in sort order within a start).
+        earlier = bisect_left(times, times[position - 1])
+        if best is None or reference - times[earlier] < times[best] - reference:
+            best = earlier
+    return dict(entries[best])
+
+def _group_public_schedule_days(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     days: Dict[str, Dict[str, Any]] = {}
     for entry in entries:
         day_date = entry.get("day_date") or ""
@@ -412,16 +483,113 @@ def build_public_schedule_payload(tournament_id: int) -> Dict[str, Any]:
             }
         )
     grouped_days.sort(key=lambda item: item["date"])
+    return grouped_days
+
+def _public_schedule_etag(payload: Dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(body, digest_size=12).hexdigest()
+
+_MISSING_DAY = ("missing",)
+
+class _PublicScheduleCache:
+    """Grouped public schedule documents per tournament.
+
+    A tournament's documents are rebuilt from one query when its schedule,
+    court, match-result or bracket version moves (see
+    ``schedule_result_versions``), or when an office/admin write drops them
+    through ``invalidate``. With ``sync_entries`` the group and knockout
+    schedule rows are brought up to date before such a rebuild, so a warm
+    read costs only the version lookup. Each build keeps the
+    whole-tournament document plus one per day, every one with the digest
+    of its content as ETag, so a day keeps its ETag while other days change.
+    Cached documents are shared: do not mutate them.
+    """
 
-    return {
-        "tournament": {
-            "id": tournament.get("id") or tournament_id,
-            "name": tournament.get("name") or "",
-            "start_date": tournament.get("start_date") or "",
-            "end_date": tournament.get("end_date") or "",
-        },
-        "days": grouped_days,
-    }
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[tuple, tuple] = {}
+
+    def document(
+        self,
+        tournament_id: int,
+        day: Optional[str] = None,
+        *,
+        sync_entries: bool = False,
+    ) -> Tuple[str, Dict[str, Any]]:
+        tournament_id = int(tournament_id)
+        key = (settings.database_path, tournament_id)
+        versions = self._versions(tournament_id)
+        with self._lock:
+            cached = self._entries.get(key)
+        if cached is None or cached[0] != versions or (sync_entries and not cached[1]):
+            if sync_entries:
+                ensure_group_schedule_entries(tournament_id)
+                ensure_knockout_schedule_entries(tournament_id)
+                versions = self._versions(tournament_id)
+            cached = (versions, sync_entries, self._build(tournament_id))
+            with self._lock:
+                self._entries[key] = cached
+        documents = cached[2]
+        if not day:
+            return documents[None]
+        return documents.get(str(day)) or documents[_MISSING_DAY]
+
+    def invalidate(self, tournament_id: Optional[int] = None) -> None:
+        with self._lock:
+            if tournament_id is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == int(tournament_id)]:
+                del self._entries[key]
+
+    @staticmethod
+    def _versions(tournament_id: int) -> tuple:
+        with db_conn() as conn:
+            return schedule_result_versions(conn.cursor(), tournament_id)
+
+    @staticmethod
+    def _build(tournament_id: int) -> Dict[Any, Tuple[str, Dict[str, Any]]]:
+        tournament = fetch_tournament(tournament_id) or {}
+        grouped_days = _group_public_schedule_days(fetch_tournament_schedule(tournament_id, public_only=True))
+        header = {
+            "tournament": {
+                "id": tournament.get("id") or tournament_id,
+                "name": tournament.get("name") or "",
+                "start_date": tournament.get("start_date") or "",
+                "end_date": tournament.get("end_date") or "",
+            },
+            "day_dates": [day["date"] for day in grouped_days],
+        }
+        documents: Dict[Any, Tuple[str, Dict[str, Any]]] = {}
+        for day_key, days in [(None, grouped_days), (_MISSING_DAY, [])] + [(day["date"], [day]) for day in grouped_days]:
+            payload = {**header, "days": days}
+            documents[day_key] = (_public_schedule_etag(payload), payload)
+        return documents
+
+
+_public_schedule_cache = _PublicScheduleCache()
+
+def fetch_public_schedule_document(
+    tournament_id: int,
+    day: Optional[str] = None,
+    *,
+    sync_entries: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
+    """Return ``(etag, payload)`` of the public schedule, whole or for one ``day``.
+
+    ``sync_entries`` runs the group/knockout schedule sync first, but only
+    when the versions moved since the cached build. The payload is the
+    cached document itself and must not be modified.
+    """
+    return _public_schedule_cache.document(tournament_id, day, sync_entries=sync_entries)
+
+def invalidate_public_schedule_cache(tournament_id: Optional[int] = None) -> None:
+    """Drop cached public schedule documents (all tournaments when ``tournament_id`` is None)."""
+    _public_schedule_cache.invalidate(tournament_id)
+
+def build_public_schedule_payload(tournament_id: int, day: Optional[str] = None) -> Dict[str, Any]:
+    """Return schedule grouped by day and category for the public UI."""
+    return fetch_public_schedule_document(tournament_id, day)[1]
 
 def _coerce_schedule_entry(tournament_id: int, data: Dict[str, Any], default_order: int = 0) -> Dict[str, Any]:
     return {
@@ -445,89 +613,95 @@ def _coerce_schedule_entry(tournament_id: int, data: Dict[str, Any], default_ord
         "notes_internal": str(data.get("notes_internal") or "").strip(),
     }
 
-def upsert_tournament_schedule_entries(tournament_id: int, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Create or update schedule entries and return the refreshed schedule."""
+_SCHEDULE_UPSERT_COLUMNS = (
+    "day_date", "scheduled_time", "court_id", "court_label", "category_name", "bracket_group_id",
+    "group_name", "phase", "player1_name", "player2_name", "status", "source_type", "source_ref_id",
+    "match_id", "sort_order", "notes_public", "notes_internal",
+)
+
+# Rows addressed by id are overwritten as sent; only real changes bump updated_at.
+_SCHEDULE_UPDATE_BY_ID_SQL = f"""
+    UPDATE tournament_schedule
+    SET {", ".join(f"{column} = ?" for column in _SCHEDULE_UPSERT_COLUMNS)}, updated_at = ?
+    WHERE id = ? AND tournament_id = ?
+      AND ({", ".join(_SCHEDULE_UPSERT_COLUMNS)}) IS NOT ({", ".join("?" for _ in _SCHEDULE_UPSERT_COLUMNS)})
+"""
+
+# New rows land on the (tournament, phase, pair) key; an existing row for the pair keeps
+# its group and match links unless the payload carries new ones.
+_SCHEDULE_MERGED_VALUES = {
+    "bracket_group_id": "COALESCE(excluded.bracket_group_id, bracket_group_id)",
+    "group_name": "CASE WHEN COALESCE(excluded.group_name, '') != '' THEN excluded.group_name ELSE group_name END",
+    "match_id": "COALESCE(excluded.match_id, match_id)",
+}
+_SCHEDULE_UPSERT_BY_PAIR_SQL = f"""
+    INSERT INTO tournament_schedule (
+        tournament_id, {", ".join(_SCHEDULE_UPSERT_COLUMNS)}, pair_key, created_at, updated_at
+    ) VALUES (?, {", ".join("?" for _ in _SCHEDULE_UPSERT_COLUMNS)}, ?, ?, ?)
+    ON CONFLICT (tournament_id, pair_key) WHERE pair_key IS NOT NULL DO UPDATE SET
+        {", ".join(f"{column} = {_SCHEDULE_MERGED_VALUES.get(column, f'excluded.{column}')}" for column in _SCHEDULE_UPSERT_COLUMNS)},
+        updated_at = excluded.updated_at
+    WHERE ({", ".join(_SCHEDULE_UPSERT_COLUMNS)})
+        IS NOT ({", ".join(_SCHEDULE_MERGED_VALUES.get(column, f"excluded.{column}") for column in _SCHEDULE_UPSERT_COLUMNS)})
+"""
+
+def upsert_tournament_schedule_entries(
+    tournament_id: int,
+    entries: List[Dict[str, Any]],
+    *,
+    changed_only: bool = False,
+) -> List[Dict[str, Any]]:
+    """Create or update schedule entries in two batched statements.
+
+    Entries with an ``id`` update that row; the rest upsert on the row's unique
+    (tournament, phase, player pair) key. Duplicates the key cannot see (other
+    letter case, legacy rows) are pruned afterwards. Returns the refreshed
+    schedule, or with ``changed_only`` just the rows this call inserted or
+    modified plus ``{"id": ..., "removed": True}`` for each pruned row.
+    """
     if not entries:
-        return fetch_tournament_schedule(tournament_id)
+        return [] if changed_only else fetch_tournament_schedule(tournament_id)
     with db_conn() as conn:
         cursor = conn.cursor()
         default_day = _schedule_day_for_tournament(cursor, tournament_id)
         now = _utc_now()
+        by_id: List[tuple] = []
+        by_pair: List[tuple] = []
+        touched_ids: set[int] = set()
+        touched_keys: set[str] = set()
         for index, raw_entry in enumerate(entries):
             entry = _coerce_schedule_entry(tournament_id, raw_entry, default_order=index)
             if not entry["day_date"]:
                 entry["day_date"] = default_day
             if not entry["player1_name"] or not entry["player2_name"]:
                 raise ValueError("Two player names are required for schedule entry")
+            values = tuple(entry[column] for column in _SCHEDULE_UPSERT_COLUMNS)
             schedule_id = raw_entry.get("id")
-            values = (
-                entry["day_date"], entry["scheduled_time"], entry["court_id"], entry["court_label"],
-                entry["category_name"], entry["bracket_group_id"], entry["group_name"], entry["phase"],
-                entry["player1_name"], entry["player2_name"], entry["status"], entry["source_type"],
-                entry["source_ref_id"], entry["match_id"], entry["sort_order"], entry["notes_public"],
-                entry["notes_internal"], now,
-            )
             if schedule_id:
-                cursor.execute(
-                    """
-                    UPDATE tournament_schedule
-                    SET day_date = ?, scheduled_time = ?, court_id = ?, court_label = ?, category_name = ?,
-                        bracket_group_id = ?, group_name = ?, phase = ?, player1_name = ?, player2_name = ?,
-                        status = ?, source_type = ?, source_ref_id = ?, match_id = ?, sort_order = ?,
-                        notes_public = ?, notes_internal = ?, updated_at = ?
-                    WHERE id = ? AND tournament_id = ?
-                    """,
-                    (*values, schedule_id, tournament_id),
-                )
+                touched_ids.add(int(schedule_id))
+                by_id.append((*values, now, int(schedule_id), tournament_id, *values))
             else:
-                pair_clause, pair_params = _schedule_pair_clause(entry["player1_name"], entry["player2_name"])
-                cursor.execute(
-                    f"""
-                    SELECT id FROM tournament_schedule
-                    WHERE tournament_id = ? AND phase = ? AND {pair_clause}
-                    ORDER BY id
-                    LIMIT 1
-                    """,
-                    (tournament_id, entry["phase"], *pair_params),
-                )
-                existing = cursor.fetchone()
-                if existing:
-                    schedule_id = int(existing["id"])
-                    cursor.execute(
-                        """
-                        UPDATE tournament_schedule
-                        SET day_date = ?, scheduled_time = ?, court_id = ?, court_label = ?, category_name = ?,
-                            bracket_group_id = COALESCE(?, bracket_group_id), group_name = CASE
-                                WHEN COALESCE(?, '') != '' THEN ? ELSE group_name END,
-                            phase = ?, player1_name = ?, player2_name = ?,
-                            status = ?, source_type = ?, source_ref_id = ?, match_id = COALESCE(?, match_id),
-                            sort_order = ?, notes_public = ?, notes_internal = ?, updated_at = ?
-                        WHERE id = ? AND tournament_id = ?
-                        """,
-                        (
-                            entry["day_date"], entry["scheduled_time"], entry["court_id"], entry["court_label"],
-                            entry["category_name"], entry["bracket_group_id"], entry["group_name"], entry["group_name"],
-                            entry["phase"], entry["player1_name"], entry["player2_name"], entry["status"],
-                            entry["source_type"], entry["source_ref_id"], entry["match_id"], entry["sort_order"],
-                            entry["notes_public"], entry["notes_internal"], now, schedule_id, tournament_id,
-                        ),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        INSERT INTO tournament_schedule (
-                            tournament_id, day_date, scheduled_time, court_id, court_label, category_name,
-                            bracket_group_id, group_name, phase, player1_name, player2_name, status, source_type,
-                            source_ref_id, match_id, sort_order, notes_public, notes_internal, created_at, updated_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (tournament_id, *values[:-1], now, now),
-                    )
+                pair_key = schedule_pair_key(entry["phase"], entry["player1_name"], entry["player2_name"])
+                touched_keys.add(pair_key)
+                by_pair.append((tournament_id, *values, pair_key, now, now))
+        if by_id:
+            cursor.executemany(_SCHEDULE_UPDATE_BY_ID_SQL, by_id)
+        if by_pair:
+            cursor.executemany(_SCHEDULE_UPSERT_BY_PAIR_SQL, by_pair)
+        removed = _prune_duplicate_schedule_entries(cursor, tournament_id)
         conn.commit()
-        cursor = conn.cursor()
-        _prune_duplicate_schedule_entries(cursor, tournament_id)
-        conn.commit()
-    return fetch_tournament_schedule(tournament_id)
+        if not changed_only:
+            return fetch_tournament_schedule(tournament_id)
+        cursor.execute(
+            f"{_SCHEDULE_ROW_SELECT} WHERE ts.tournament_id = ? AND ts.updated_at = ? {_SCHEDULE_ROW_ORDER}",
+            (tournament_id, now),
+        )
+        changed = [
+            _schedule_row_payload(row)
+            for row in cursor.fetchall()
+            if int(row["id"]) in touched_ids or row["pair_key"] in touched_keys
+        ]
+        return changed + [{"id": schedule_id, "removed": True} for schedule_id in removed]
 
 def update_tournament_schedule_entry(tournament_id: int, schedule_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Patch one schedule entry."""
@@ -719,29 +893,23 @@ def ensure_knockout_schedule_entries(
                             or (existing["court_id"] or "").strip()
                             or (existing["court_label"] or "").strip()
                         ) else "draft"
+                    values = (
+                        category_name or phase_label,
+                        phase_label,
+                        player1_name,
+                        player2_name,
+                        corrected_status or existing["status"],
+                    )
+                    # Public schedule reads call this whenever the versions move; rewriting
+                    # unchanged rows would move them again and defeat the cached document.
                     cursor.execute(
                         """
                         UPDATE tournament_schedule
-                        SET category_name = ?, phase = ?, player1_name = ?, player2_name = ?,
-                            status = CASE
-                                WHEN ? IS NOT NULL THEN ?
-                                WHEN ? = 'completed' THEN 'completed'
-                                ELSE status
-                            END,
-                            updated_at = ?
+                        SET category_name = ?, phase = ?, player1_name = ?, player2_name = ?, status = ?, updated_at = ?
                         WHERE id = ?
+                          AND (category_name, phase, player1_name, player2_name, status) IS NOT (?, ?, ?, ?, ?)
                         """,
-                        (
-                            category_name or phase_label,
-                            phase_label,
-                            player1_name,
-                            player2_name,
-                            corrected_status,
-                            corrected_status,
-                            status,
-                            now,
-                            existing["id"],
-                        ),
+                        (*values, now, existing["id"], *values),
                     )
                     continue
                 cursor.execute(
@@ -896,17 +1064,51 @@ def get_autoscheduler_config(tournament_id: int) -> Dict[str, Any]:
             pass
     if not config.get("b1_court_ids") and config.get("b1_court_id"):
         config["b1_court_ids"] = [str(config["b1_court_id"])]
+    config.pop("estimated_minutes", None)
+    if config.get("duration_source") in ("p50", "p80"):
+        estimated = _estimated_slot_minutes(tournament_id, config)
+        if estimated:
+            config["estimated_minutes"] = estimated
     return config
 
+def _estimated_slot_minutes(tournament_id: int, config: Dict[str, Any]) -> Dict[str, int]:
+    """Slot minutes learned from finished matches, this tournament's history over everyone's."""
+    from ..services import duration_estimator
+
+    try:
+        global_estimates = duration_estimator.duration_cache.get(
+            None, match_duration_fingerprint(), lambda: duration_estimator.build_estimates(fetch_match_duration_samples())
+        )
+        own_estimates = duration_estimator.duration_cache.get(
+            tournament_id,
+            match_duration_fingerprint(tournament_id),
+            lambda: duration_estimator.build_estimates(fetch_match_duration_samples(tournament_id)),
+        )
+        turnover = config.get("turnover_minutes")
+        turnover = duration_estimator.DEFAULT_TURNOVER_MINUTES if turnover is None else int(turnover)
+    except (sqlite3.Error, ValueError, TypeError) as exc:
+        logger.warning("duration_estimates_failed", tournament_id=tournament_id, error=str(exc))
+        return {}
+    return duration_estimator.estimated_slot_minutes(
+        duration_estimator.merge_estimates(own_estimates, global_estimates),
+        which=config["duration_source"],
+        turnover_minutes=max(0, turnover),
+    )
+
 def save_autoscheduler_config(tournament_id: int, config: Dict[str, Any]) -> Dict[str, Any]:
     """Persist the auto-scheduler config for a tournament."""
     from ..services import auto_scheduler
 
     current = get_autoscheduler_config(tournament_id)
-    allowed = {"start_time", "b1_court_id", "b1_court_ids", "category_courts", "slot_minutes", "rest_slots"}
+    allowed = {
+        "start_time", "end_time", "day_windows", "b1_court_id", "b1_court_ids",
+        "category_courts", "slot_minutes", "rest_slots", "duration_source", "turnover_minutes",
+    }
     for key in allowed:
         if key in config and config[key] not in (None, ""):
             current[key] = config[key]
+    if not isinstance(current.get("day_windows"), dict):
+        current.pop("day_windows", None)
     if isinstance(current.get("b1_court_ids"), list):
         ids = [str(court_id).strip() for court_id in current["b1_court_ids"] if str(court_id or "").strip()]
         if ids:
@@ -914,8 +1116,11 @@ def save_autoscheduler_config(tournament_id: int, config: Dict[str, Any]) -> Dic
         else:
             current["b1_court_ids"] = []
             current["b1_court_id"] = ""
+    if current.get("duration_source") not in ("fixed", "p50", "p80"):
+        current.pop("duration_source", None)
+    current.pop("estimated_minutes", None)
     upsert_app_settings({_autoscheduler_settings_key(tournament_id): json.dumps(current)})
-    return current
+    return get_autoscheduler_config(tournament_id)
 
 def _schedule_entry_match_dict(entry: Dict[str, Any]) -> Dict[str, Any]:
     return {
@@ -939,13 +1144,21 @@ def generate_autoschedule_proposal(
     b1_court_ids: Optional[List[str]] = None,
     day_date: Optional[str] = None,
     phases: Optional[List[str]] = None,
+    optimize: bool = False,
+    optimize_seed: int = 0,
+    optimize_budget_ms: Optional[int] = None,
+    multi_day: bool = False,
 ) -> Dict[str, Any]:
     """Build a (non-persisted) auto-placement proposal for the tournament schedule.
 
     Returns {config, placements, courts} where each placement carries the schedule entry
-    plus the proposed court_id/day_date/scheduled_time.
+    plus the proposed court_id/day_date/scheduled_time. With ``optimize`` the greedy
+    placements are improved by local search and {optimization} carries its stats.
+    With ``multi_day`` the whole tournament window is planned in one pass (``day_date``
+    and ``optimize`` are ignored) and {days} carries per-day capacity stats.
     """
-    from ..services import auto_scheduler
+    from ..services import auto_scheduler, schedule_optimizer
+    from ..services.compute_pool import run_cpu_bound
 
     ensure_group_schedule_entries(tournament_id)
 
@@ -970,6 +1183,9 @@ def generate_autoschedule_proposal(
         cursor = conn.cursor()
         default_day = _schedule_day_for_tournament(cursor, tournament_id)
         knockout_day = _knockout_schedule_day_for_tournament(cursor, tournament_id)
+        tournament_days = _tournament_days(cursor, tournament_id) if multi_day else []
+    if multi_day:
+        day_date = None
     target_day = day_date or config.get("day_date") or default_day
 
     if _autoschedule_phases_include_knockout(phases):
@@ -1007,7 +1223,38 @@ def generate_autoschedule_proposal(
         entries = [entry for entry in entries if _phase_match(entry)]
 
     matches = [_schedule_entry_match_dict(entry) for entry in entries]
-    placements = auto_scheduler.place_matches(matches, config, target_day)
+    optimization = None
+    day_stats = None
+    if multi_day:
+        plan = auto_scheduler.plan_tournament_days(matches, config, tournament_days)
+        placements = plan["placements"]
+        day_stats = plan["days"]
+    else:
+        placements = auto_scheduler.place_matches(matches, config, target_day)
+    if optimize and placements and not multi_day:
+        budget_seconds = float(settings.autoschedule_optimize_seconds)
+        if optimize_budget_ms is not None:
+            budget_seconds = min(budget_seconds, max(0, int(optimize_budget_ms)) / 1000.0)
+        optimized = run_cpu_bound(
+            schedule_optimizer.optimize_placements,
+            placements,
+            config,
+            int(optimize_seed),
+            budget_seconds,
+            int(settings.autoschedule_optimize_iterations),
+            timeout=budget_seconds + float(settings.compute_pool_timeout_seconds),
+        )
+        placements = optimized["placements"]
+        optimization = optimized["stats"]
+        logger.info(
+            "autoschedule_optimized",
+            tournament_id=tournament_id,
+            iterations=optimization["iterations"],
+            stopped_by=optimization["stopped_by"],
+            elapsed_ms=optimization["elapsed_ms"],
+            cost_before=optimization["before"]["cost"],
+            cost_after=optimization["after"]["cost"],
+        )
 
     entry_by_id = {int(entry["id"]): entry for entry in entries if entry.get("id")}
     result_placements = []
@@ -1027,11 +1274,18 @@ def generate_autoschedule_proposal(
                 "player2_name": entry.get("player2_name") if entry else match.get("player2_name"),
             }
         )
-    return {
+        if placement.get("reason"):
+            result_placements[-1]["reason"] = placement["reason"]
+    proposal = {
         "config": config,
         "courts": fetch_courts_for_tournament(tournament_id),
         "placements": result_placements,
     }
+    if optimization is not None:
+        proposal["optimization"] = optimization
+    if day_stats is not None:
+        proposal["days"] = day_stats
+    return proposal
 
 def apply_autoschedule_placements(
     tournament_id: int, placements: List[Dict[str, Any]]
@@ -1091,8 +1345,8 @@ def move_schedule_entry_with_cascade(
     """Move one entry to a court/time and re-cascade times on the affected courts.
 
     Moves the entry onto the target court (optionally at a requested time), then recomputes
-    sequential start times for every entry on both the source and target courts for that day,
-    using the configured slot lengths.
+    sequential start times on both the source and target courts for that day, using the
+    configured slot lengths. Only rows whose court, day or time changed are written back.
     """
     from ..services import auto_scheduler
 
@@ -1103,67 +1357,44 @@ def move_schedule_entry_with_cascade(
         return schedule
 
     source_court = str(moved.get("court_id") or "")
+    source_day = str(moved.get("day_date") or "")
     target_court = str(court_id or source_court)
-    target_day = str(day_date or moved.get("day_date") or "")
+    target_day = str(day_date or source_day)
     courts = {str(c.get("kort_id")): c for c in fetch_courts_for_tournament(tournament_id)}
 
-    # Apply the move in-memory first.
-    moved["court_id"] = target_court
-    moved["court_label"] = courts.get(target_court, {}).get("name") or target_court
-    if day_date:
-        moved["day_date"] = target_day
-    if scheduled_time:
-        moved["scheduled_time"] = str(scheduled_time)
-
-    def _court_entries(court, day):
-        items = [
-            e
-            for e in schedule
-            if str(e.get("court_id") or "") == court and str(e.get("day_date") or "") == day
-        ]
-        items.sort(key=lambda e: (str(e.get("scheduled_time") or "99:99"), int(e.get("sort_order") or 0), int(e.get("id") or 0)))
-        return items
-
-    updates: List[Dict[str, Any]] = []
-
-    # Target court: pin the moved match at its drop time, cascade only the matches after it
-    # (matches earlier on the court keep their times). This matches the "shift by slot" mental model.
-    target_entries = _court_entries(target_court, target_day)
-    if scheduled_time:
-        pivot_index = next(
-            (i for i, e in enumerate(target_entries) if int(e["id"]) == int(schedule_id)), 0
-        )
-        cursor = str(moved.get("scheduled_time") or "")
-        for entry in target_entries[pivot_index:]:
-            band = auto_scheduler.normalize_band(entry.get("category_name") or entry.get("group_name"))
-            entry["scheduled_time"] = cursor
-            cursor = auto_scheduler.add_minutes(
-                cursor,
-                auto_scheduler._slot_minutes_for_court(target_court, config, band),
-            )
-        updates.extend(target_entries)
-    else:
-        updates.extend(auto_scheduler.recompute_court_times(target_entries, config))
+    # Only the days touched by the move matter; the engine re-times just the entries
+    # after the drop point on the target court and closes the gap on the source court.
+    engine = auto_scheduler.ScheduleEngine(config)
+    engine.load(e for e in schedule if str(e.get("day_date") or "") in {source_day, target_day})
+    changed = engine.move(
+        int(schedule_id),
+        target_court,
+        scheduled_time=str(scheduled_time) if scheduled_time else None,
+        day_date=target_day,
+    )
 
-    # Source court (if different): close the gap left behind by cascading from its start.
-    source_day = str(moved.get("day_date") or target_day)
-    if source_court and (source_court, source_day) != (target_court, target_day):
-        updates.extend(auto_scheduler.recompute_court_times(_court_entries(source_court, source_day), config))
+    # Unchanged draft entries on the affected courts are still promoted to planned.
+    updates: Dict[int, Dict[str, Any]] = {int(entry["id"]): entry for entry in changed}
+    for court, day in {(target_court, target_day), (source_court, source_day)}:
+        if not court:
+            continue
+        for entry in engine.court_entries(court, day):
+            if str(entry.get("status") or "") == "draft":
+                updates.setdefault(int(entry["id"]), entry)
 
     now = _utc_now()
     try:
         with db_conn() as conn:
-            cursor = conn.cursor()
-            for entry in updates:
-                cursor.execute(
-                    """
-                    UPDATE tournament_schedule
-                    SET court_id = ?, court_label = ?, day_date = ?, scheduled_time = ?,
-                        status = CASE WHEN status IN ('in_progress','completed') THEN status
-                                      WHEN status = 'draft' THEN 'planned' ELSE status END,
-                        updated_at = ?
-                    WHERE id = ? AND tournament_id = ?
-                    """,
+            conn.executemany(
+                """
+                UPDATE tournament_schedule
+                SET court_id = ?, court_label = ?, day_date = ?, scheduled_time = ?,
+                    status = CASE WHEN status IN ('in_progress','completed') THEN status
+                                  WHEN status = 'draft' THEN 'planned' ELSE status END,
+                    updated_at = ?
+                WHERE id = ? AND tournament_id = ?
+                """,
+                [
                     (
                         str(entry.get("court_id") or ""),
                         courts.get(str(entry.get("court_id") or ""), {}).get("name") or str(entry.get("court_id") or ""),
@@ -1172,8 +1403,10 @@ def move_schedule_entry_with_cascade(
                         now,
                         int(entry["id"]),
                         tournament_id,
-                    ),
-                )
+                    )
+                    for entry in updates.values()
+                ],
+            )
             conn.commit()
     except Exception as e:
         logger.error("move_schedule_cascade_error", error=str(e), tournament_id=tournament_id, schedule_id=schedule_id)
@@ -2,28 +2,124 @@
 import json
 import re
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Generator, List, Optional
+from typing import Any, Dict, Generator, List, Optional, Tuple
 from werkzeug.security import generate_password_hash
 
 from ..config import settings, logger
 
-from .connection import _default_simulation_office_password_hash, db_conn, fetch_app_settings, upsert_app_settings
+from .connection import (
+    _default_simulation_office_password_hash,
+    cache_version,
+    db_conn,
+    fetch_app_settings,
+    upsert_app_settings,
+)
+
+_TOURNAMENT_ROW_SELECT = """
+    SELECT
+        t.id,
+        t.name,
+        t.start_date,
+        t.end_date,
+        t.active,
+        t.location,
+        t.city,
+        t.country,
+        t.logo_path,
+        t.report_email,
+        t.summary_sent_at,
+        COALESCE(t.is_public, 1) AS is_public,
+        COALESCE(t.stats_enabled, 1) AS stats_enabled,
+        COALESCE(t.is_simulation, 0) AS is_simulation,
+        COALESCE(t.access_key, '') AS access_key,
+        CASE WHEN COALESCE(t.office_password_hash, '') != '' THEN 1 ELSE 0 END AS has_office_password,
+        t.created_at,
+        COUNT(c.kort_id) AS court_count
+    FROM tournaments t
+    LEFT JOIN courts c ON c.tournament_id = t.id
+    GROUP BY t.id, t.name, t.start_date, t.end_date, t.active, t.location, t.city, t.country,
+             t.logo_path, t.report_email, t.summary_sent_at, t.is_public, t.stats_enabled,
+             t.is_simulation, t.access_key, t.office_password_hash, t.created_at
+    ORDER BY t.id
+"""
+
+class TournamentRegistry:
+    """In-process read model of the ``tournaments`` table.
+
+    All rows (with court counts, active/public flags and access keys) are
+    loaded by one query and served from memory until the ``tournaments``
+    cache version moves. Triggers bump it for every writer, including the ORM
+    and other worker processes; the write helpers in this module also drop
+    the cache directly. A lookup costs one primary-key read of the version.
+    Callers always get copies of the rows.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._state: Optional[Tuple[Any, ...]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def _rows(self) -> Tuple[Dict[int, Dict], List[Dict], Dict[str, Dict]]:
+        with db_conn() as conn:
+            cursor = conn.cursor()
+            version = cache_version(cursor, "tournaments")
+            key = (settings.database_path, version)
+            with self._lock:
+                state = self._state
+                if state is not None and state[0] == key:
+                    self.hits += 1
+                    return state[1:]
+            cursor.execute(_TOURNAMENT_ROW_SELECT)
+            by_id = {int(row["id"]): dict(row) for row in cursor.fetchall()}
+        by_start = sorted(by_id.values(), key=lambda row: str(row.get("start_date") or ""), reverse=True)
+        by_name: Dict[str, Dict] = {}
+        for row in by_id.values():
+            by_name.setdefault(str(row.get("name") or ""), row)
+        with self._lock:
+            self._state = (key, by_id, by_start, by_name)
+            self.misses += 1
+        return by_id, by_start, by_name
+
+    def tournaments(self, public_only: bool = False) -> List[Dict]:
+        _by_id, by_start, _by_name = self._rows()
+        return [dict(row) for row in by_start if not public_only or row["is_public"] == 1]
+
+    def tournament(self, tournament_id: int) -> Optional[Dict]:
+        row = self._rows()[0].get(int(tournament_id))
+        return dict(row) if row else None
+
+    def by_name(self, name: str) -> Optional[Dict]:
+        row = self._rows()[2].get(str(name or ""))
+        return dict(row) if row else None
+
+    def active(self, public_only: bool = False) -> Optional[Dict]:
+        """Lowest-id active tournament, as ``SELECT ... WHERE active = 1 LIMIT 1`` used to return."""
+        for row in self._rows()[0].values():
+            if row.get("active") == 1 and (not public_only or row["is_public"] == 1):
+                return dict(row)
+        return None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._state = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+tournament_registry = TournamentRegistry()
 
 def get_active_tournament_id(public_only: bool = False) -> Optional[int]:
     """Get the ID of the currently active tournament."""
     try:
-        with db_conn() as conn:
-            cursor = conn.cursor()
-            query = "SELECT id FROM tournaments WHERE active = 1"
-            if public_only:
-                query += " AND COALESCE(is_public, 1) = 1"
-            query += " LIMIT 1"
-            cursor.execute(query)
-            row = cursor.fetchone()
-            return row["id"] if row else None
+        tournament = tournament_registry.active(public_only=public_only)
+        return tournament["id"] if tournament else None
     except Exception as e:
         logger.error("get_active_tournament_id_error", error=str(e))
         return None
@@ -31,15 +127,8 @@ def get_active_tournament_id(public_only: bool = False) -> Optional[int]:
 def get_active_tournament_name(public_only: bool = False) -> Optional[str]:
     """Get the name of the currently active tournament."""
     try:
-        with db_conn() as conn:
-            cursor = conn.cursor()
-            query = "SELECT name FROM tournaments WHERE active = 1"
-            if public_only:
-                query += " AND COALESCE(is_public, 1) = 1"
-            query += " LIMIT 1"
-            cursor.execute(query)
-            row = cursor.fetchone()
-            return row["name"] if row else None
+        tournament = tournament_registry.active(public_only=public_only)
+        return tournament["name"] if tournament else None
     except Exception as e:
         logger.error("get_active_tournament_name_error", error=str(e))
         return None
@@ -55,39 +144,7 @@ def fetch_active_tournaments(public_only: bool = False) -> List[Dict]:
 def fetch_tournaments(public_only: bool = False) -> List[Dict]:
     """Fetch all tournaments."""
     try:
-        with db_conn() as conn:
-            cursor = conn.cursor()
-            where_clause = "WHERE COALESCE(t.is_public, 1) = 1" if public_only else ""
-            cursor.execute("""
-                SELECT
-                    t.id,
-                    t.name,
-                    t.start_date,
-                    t.end_date,
-                    t.active,
-                    t.location,
-                    t.city,
-                    t.country,
-                    t.logo_path,
-                    t.report_email,
-                    t.summary_sent_at,
-                    COALESCE(t.is_public, 1) AS is_public,
-                    COALESCE(t.stats_enabled, 1) AS stats_enabled,
-                    COALESCE(t.is_simulation, 0) AS is_simulation,
-                    COALESCE(t.access_key, '') AS access_key,
-                    CASE WHEN COALESCE(t.office_password_hash, '') != '' THEN 1 ELSE 0 END AS has_office_password,
-                    t.created_at,
-                    COUNT(c.kort_id) AS court_count
-                FROM tournaments t
-                LEFT JOIN courts c ON c.tournament_id = t.id
-                {where_clause}
-                GROUP BY t.id, t.name, t.start_date, t.end_date, t.active, t.location, t.city, t.country,
-                         t.logo_path, t.report_email, t.summary_sent_at, t.is_public, t.stats_enabled,
-                         t.is_simulation, t.access_key, t.office_password_hash, t.created_at
-                ORDER BY start_date DESC
-            """.format(where_clause=where_clause))
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return tournament_registry.tournaments(public_only=public_only)
     except Exception as e:
         logger.error("fetch_tournaments_error", error=str(e))
         return []
@@ -95,41 +152,19 @@ def fetch_tournaments(public_only: bool = False) -> List[Dict]:
 def fetch_tournament(tournament_id: int) -> Optional[Dict]:
     """Fetch a single tournament by ID."""
     try:
-        with db_conn() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    t.id,
-                    t.name,
-                    t.start_date,
-                    t.end_date,
-                    t.active,
-                    t.location,
-                    t.city,
-                    t.country,
-                    t.logo_path,
-                    t.report_email,
-                    t.summary_sent_at,
-                    COALESCE(t.is_public, 1) AS is_public,
-                    COALESCE(t.stats_enabled, 1) AS stats_enabled,
-                    COALESCE(t.is_simulation, 0) AS is_simulation,
-                    COALESCE(t.access_key, '') AS access_key,
-                    CASE WHEN COALESCE(t.office_password_hash, '') != '' THEN 1 ELSE 0 END AS has_office_password,
-                    t.created_at,
-                    COUNT(c.kort_id) AS court_count
-                FROM tournaments t
-                LEFT JOIN courts c ON c.tournament_id = t.id
-                WHERE t.id = ?
-                GROUP BY t.id, t.name, t.start_date, t.end_date, t.active, t.location, t.city, t.country,
-                        t.logo_path, t.report_email, t.summary_sent_at, t.is_public, t.stats_enabled,
-                        t.is_simulation, t.access_key, t.office_password_hash, t.created_at
-            """, (tournament_id,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        return tournament_registry.tournament(tournament_id)
     except Exception as e:
         logger.error("fetch_tournament_error", error=str(e), tournament_id=tournament_id)
         return None
 
+def fetch_tournament_by_name(name: str) -> Optional[Dict]:
+    """Fetch the first tournament (lowest id) with exactly this name."""
+    try:
+        return tournament_registry.by_name(name)
+    except Exception as e:
+        logger.error("fetch_tournament_by_name_error", error=str(e), name=name)
+        return None
+
 def insert_tournament(
     name: str,
     start_date: str,
@@ -177,6 +212,7 @@ def insert_tournament(
                 office_password_hash,
             ))
             conn.commit()
+            tournament_registry.invalidate()
             logger.info("tournament_inserted", id=cursor.lastrowid, name=name)
             return cursor.lastrowid
     except Exception as e:
@@ -232,6 +268,7 @@ def update_tournament(
                 tournament_id,
             ))
             conn.commit()
+            tournament_registry.invalidate()
             logger.info("tournament_updated", id=tournament_id)
             return True
     except Exception as e:
@@ -251,6 +288,7 @@ def mark_tournament_summary_sent(tournament_id: int, sent_at: Optional[str] = No
                 (value, tournament_id),
             )
             conn.commit()
+            tournament_registry.invalidate()
         logger.info("tournament_summary_marked", tournament_id=tournament_id, sent_at=value)
         return True
     except Exception as e:
@@ -291,6 +329,7 @@ def delete_tournament(tournament_id: int) -> bool:
             cursor.execute("DELETE FROM courts WHERE tournament_id = ?", (tournament_id,))
             cursor.execute("DELETE FROM tournaments WHERE id = ?", (tournament_id,))
             conn.commit()
+            tournament_registry.invalidate()
             logger.info("tournament_deleted", id=tournament_id)
             return cursor.rowcount > 0
     except Exception as e:
@@ -304,6 +343,7 @@ def set_active_tournament(tournament_id: int) -> bool:
             cursor = conn.cursor()
             cursor.execute("UPDATE tournaments SET active = 1 WHERE id = ?", (tournament_id,))
             conn.commit()
+            tournament_registry.invalidate()
             logger.info("active_tournament_set", id=tournament_id)
             return True
     except Exception as e:
@@ -320,6 +360,7 @@ def set_tournament_active_state(tournament_id: int, active: bool) -> bool:
                 (1 if active else 0, tournament_id),
             )
             conn.commit()
+            tournament_registry.invalidate()
             logger.info("tournament_active_state_set", id=tournament_id, active=active)
             return cursor.rowcount > 0
     except Exception as e:
@@ -1,6 +1,9 @@
 """SQLAlchemy models for database."""
 from datetime import datetime, date, timezone
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+
+from .services.name_keys import fold_name
 
 db = SQLAlchemy()
 
@@ -12,10 +15,14 @@ def utc_now_iso() -> str:
 class GlobalPlayer(db.Model):
     """Universal player — one record per real person, across all tournaments."""
     __tablename__ = 'global_players'
+    __table_args__ = (db.Index('idx_global_players_name_keys', 'last_name_key', 'first_name_key'),)
 
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(100), nullable=False, default='')
     last_name = db.Column(db.String(100), nullable=False, default='')
+    # fold_name() of the names, kept in step on every ORM flush
+    first_name_key = db.Column(db.String(100), nullable=True)
+    last_name_key = db.Column(db.String(100), nullable=True)
     gender = db.Column(db.String(1), nullable=True, default='')
     birth_date = db.Column(db.String(10), nullable=True)  # YYYY-MM-DD
     country = db.Column(db.String(10), nullable=True, default='')
@@ -63,6 +70,13 @@ class GlobalPlayer(db.Model):
         }
 
 
+@event.listens_for(GlobalPlayer, 'before_insert')
+@event.listens_for(GlobalPlayer, 'before_update')
+def _refresh_global_player_name_keys(_mapper, _connection, target: GlobalPlayer) -> None:
+    target.first_name_key = fold_name(target.first_name)
+    target.last_name_key = fold_name(target.last_name)
+
+
 class Tournament(db.Model):
     """Tournament model."""
     __tablename__ = 'tournaments'
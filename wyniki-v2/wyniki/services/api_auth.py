@@ -18,6 +18,7 @@ from flask import jsonify, request
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 
 from ..config import logger, settings
+from .client_ip import request_client_ip
 
 OFFICE_STREAM_COOKIE_PREFIX = "office_stream_"
 _OFFICE_SESSION_MAX_AGE_SECONDS = 60 * 60 * 24
@@ -93,7 +94,7 @@ def require_court_access(kort_id: str | None):
             method=request.method,
             kort_id=normalized,
             app_code=request.headers.get("X-TennisReferee-App-Code"),
-            client_ip=request.headers.get("CF-Connecting-IP") or request.remote_addr,
+            client_ip=request_client_ip(),
         )
         return None
     return jsonify({"error": "Court authorization required"}), 401
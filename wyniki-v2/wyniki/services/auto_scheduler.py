@@ -3,15 +3,27 @@
 B1 matches are pinned to configured B1 courts only. All other matches are load-balanced
 across the remaining courts to shorten the overall day (makespan), while respecting phase
 order, player rest gaps, and no overlapping appearances for the same player.
+
+Placement runs on a :class:`ScheduleEngine`: the config is compiled once into a
+table of slot lengths, and every booked match is kept in per-player interval
+indexes, so checking a candidate slot costs a binary search per player instead
+of a scan over everything already scheduled.
 """
 from __future__ import annotations
 
+import json
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+import threading
+from bisect import bisect_left, insort
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 DEFAULT_SLOT_MINUTES = 60
 B1_SLOT_MINUTES = 75
 DEFAULT_START_TIME = "09:30"
+DEFAULT_END_TIME = "20:00"
+_LAST_MINUTE = 23 * 60 + 59
 
 # Highest band gets the lowest court number in default config (court1=B4 ... court4=B1).
 _BAND_COURT_ORDER = ["B4", "B3", "B2", "B1"]
@@ -19,7 +31,12 @@ _BAND_COURT_ORDER = ["B4", "B3", "B2", "B1"]
 
 def normalize_band(category_name: Optional[str]) -> str:
     """Extract the B-band (B1..B4) from a category/group label."""
-    match = re.search(r"B\s*([1-4])", str(category_name or "").upper())
+    return _band_from_label(str(category_name or ""))
+
+
+@lru_cache(maxsize=1024)
+def _band_from_label(label: str) -> str:
+    match = re.search(r"B\s*([1-4])", label.upper())
     return f"B{match.group(1)}" if match else ""
 
 
@@ -34,6 +51,12 @@ def add_minutes(time_str: str, minutes: int) -> str:
     return f"{total // 60:02d}:{total % 60:02d}"
 
 
+def minutes_to_time(minutes: int) -> str:
+    """Format minutes since midnight as HH:MM (clamped like :func:`add_minutes`)."""
+    total = max(0, min(int(minutes), _LAST_MINUTE))
+    return f"{total // 60:02d}:{total % 60:02d}"
+
+
 def time_to_minutes(time_str: str) -> int:
     try:
         hours, mins = (int(part) for part in str(time_str).split(":", 1))
@@ -145,7 +168,7 @@ def _players(match: Dict[str, Any]) -> Set[str]:
 
 def order_with_rest(matches: List[Dict[str, Any]], rest_slots: int = 1) -> List[Dict[str, Any]]:
     """Order matches to maximise rest between a player's matches on the same court."""
-    remaining = list(matches)
+    remaining = [(match, tuple(_players(match))) for match in matches]
     ordered: List[Dict[str, Any]] = []
     last_pos: Dict[str, int] = {}
     never = -(10 ** 6)
@@ -153,8 +176,7 @@ def order_with_rest(matches: List[Dict[str, Any]], rest_slots: int = 1) -> List[
     while remaining:
         best_index = 0
         best_key = None
-        for index, match in enumerate(remaining):
-            players = _players(match)
+        for index, (_match, players) in enumerate(remaining):
             if players:
                 gap = min(position - last_pos.get(player, never) for player in players)
             else:
@@ -163,9 +185,9 @@ def order_with_rest(matches: List[Dict[str, Any]], rest_slots: int = 1) -> List[
             if best_key is None or key > best_key:
                 best_key = key
                 best_index = index
-        match = remaining.pop(best_index)
+        match, players = remaining.pop(best_index)
         ordered.append(match)
-        for player in _players(match):
+        for player in players:
             last_pos[player] = position
         position += 1
     return ordered
@@ -199,56 +221,323 @@ def _b1_court_for_match(
     return b1_courts[index]
 
 
-def _slot_minutes_for_court(court_id: str, config: Dict[str, Any], band: str = "") -> int:
-    if is_b1_court(court_id, config):
-        return slot_minutes_for("B1", config)
-    return slot_minutes_for(band, config)
-
-
 def _rest_gap_minutes(config: Dict[str, Any], rest_slots: int) -> int:
     return max(0, rest_slots) * slot_minutes_for("", config)
 
 
-def _placement_window(placement: Dict[str, Any], config: Dict[str, Any]) -> Tuple[int, int]:
-    start = time_to_minutes(str(placement.get("scheduled_time") or DEFAULT_START_TIME))
-    band = normalize_band(
-        placement.get("match", {}).get("category_name")
-        or placement.get("match", {}).get("group_name")
-        or placement.get("category_name")
-        or placement.get("group_name")
-    )
-    court_id = str(placement.get("court_id") or "")
-    duration = _slot_minutes_for_court(court_id, config, band)
-    return start, start + duration
+def _match_band(match: Dict[str, Any]) -> str:
+    return normalize_band(match.get("category_name") or match.get("group_name"))
 
 
-def _slot_available_for_player(
-    match: Dict[str, Any],
-    court_id: str,
-    start_time: str,
-    config: Dict[str, Any],
-    scheduled: List[Dict[str, Any]],
-    rest_slots: int,
-) -> bool:
-    band = normalize_band(match.get("category_name") or match.get("group_name"))
-    start, end = _placement_window(
-        {"scheduled_time": start_time, "court_id": court_id, "match": match},
-        config,
-    )
-    rest_gap = _rest_gap_minutes(config, rest_slots)
-    players = _players(match)
-    for placement in scheduled:
-        other_players = _players(placement["match"])
-        if not players & other_players:
-            continue
-        other_start, other_end = _placement_window(placement, config)
-        if start < other_end and end > other_start:
-            return False
-        if other_end <= start and (start - other_end) < rest_gap:
-            return False
-        if end <= other_start and (other_start - end) < rest_gap:
-            return False
-    return True
+@lru_cache(maxsize=1024)
+def _phase_kind_from_label(label: str) -> str:
+    return "group" if _phase_rank(label) == 0 else "knockout"
+
+
+def phase_kind(phase: Optional[str]) -> str:
+    """``"group"`` or ``"knockout"``, the phase granularity of duration estimates."""
+    return _phase_kind_from_label(str(phase or ""))
+
+
+def _match_slot(match: Dict[str, Any]) -> str:
+    """Slot key for duration lookups: the band plus the phase kind (``"B2:knockout"``)."""
+    return f"{_match_band(match)}:{phase_kind(match.get('phase'))}"
+
+
+class CompiledSchedulerConfig:
+    """Slot lengths and rest gap of one scheduler config, resolved up front.
+
+    ``config["estimated_minutes"]`` (see ``duration_estimator``) overrides the
+    fixed ``slot_minutes``, most specific key first: ``"B2:knockout"``, ``"B2"``,
+    then an explicitly configured band slot, then ``"default:knockout"`` and
+    ``"default"``. B1 never falls back to estimates learned from other bands.
+    """
+
+    __slots__ = ("b1_courts", "rest_gap", "_slots")
+
+    def __init__(self, config: Dict[str, Any], rest_slots: int) -> None:
+        self.b1_courts = frozenset(normalize_b1_court_ids(config))
+        self.rest_gap = _rest_gap_minutes(config, rest_slots)
+        estimated = {key: int(value) for key, value in (config.get("estimated_minutes") or {}).items()}
+        explicit = config.get("slot_minutes") or {}
+        self._slots: Dict[str, int] = {}
+        for band in ("", *_BAND_COURT_ORDER):
+            for kind in ("group", "knockout"):
+                candidates = [estimated.get(f"{band}:{kind}"), estimated.get(band)] if band else []
+                if band == "B1" or band in explicit:
+                    candidates.append(slot_minutes_for(band, config))
+                candidates += [estimated.get(f"default:{kind}"), estimated.get("default")]
+                self._slots[f"{band}:{kind}"] = next(
+                    (minutes for minutes in candidates if minutes), slot_minutes_for(band, config)
+                )
+
+    def duration(self, court_id: Optional[str], slot: str) -> int:
+        """Minutes for a match with slot key ``slot`` (see ``_match_slot``) on ``court_id``."""
+        band, _, kind = slot.partition(":")
+        if court_id and str(court_id).strip() in self.b1_courts:
+            band = "B1"
+        minutes = self._slots.get(f"{band}:{kind or 'group'}")
+        return self._slots[f":{kind or 'group'}"] if minutes is None else minutes
+
+
+_compiled_configs: "OrderedDict[str, CompiledSchedulerConfig]" = OrderedDict()
+_compiled_lock = threading.Lock()
+
+
+def compile_config(config: Dict[str, Any], rest_slots: Optional[int] = None) -> CompiledSchedulerConfig:
+    """Return the compiled form of ``config``, reusing it while the config is unchanged."""
+    slots = int(config.get("rest_slots") or 1) if rest_slots is None else int(rest_slots)
+    key = json.dumps([config, slots], sort_keys=True, default=str)
+    with _compiled_lock:
+        compiled = _compiled_configs.get(key)
+        if compiled is not None:
+            _compiled_configs.move_to_end(key)
+            return compiled
+    compiled = CompiledSchedulerConfig(config, slots)
+    with _compiled_lock:
+        _compiled_configs[key] = compiled
+        while len(_compiled_configs) > 32:
+            _compiled_configs.popitem(last=False)
+    return compiled
+
+
+class PlayerIntervalIndex:
+    """Booked ``[start, end)`` intervals per player, sorted by start minute.
+
+    Any interval that can clash with ``[start, end)`` starts less than one
+    longest-slot before it, so a lookup is a bisect plus a short forward walk.
+    """
+
+    def __init__(self) -> None:
+        self._intervals: Dict[Any, List[Tuple[int, int, int]]] = {}
+        self._longest = 0
+
+    def add(self, players: Iterable[Any], start: int, end: int, token: int) -> None:
+        self._longest = max(self._longest, end - start)
+        for player in players:
+            insort(self._intervals.setdefault(player, []), (start, end, token))
+
+    def remove(self, players: Iterable[Any], start: int, end: int, token: int) -> None:
+        for player in players:
+            intervals = self._intervals.get(player)
+            if not intervals:
+                continue
+            index = bisect_left(intervals, (start, end, token))
+            if index < len(intervals) and intervals[index] == (start, end, token):
+                intervals.pop(index)
+
+    def conflicts(
+        self,
+        players: Iterable[Any],
+        start: int,
+        end: int,
+        rest_gap: int = 0,
+        ignore: Optional[int] = None,
+    ) -> List[int]:
+        """Tokens of bookings that overlap ``[start, end)`` or sit closer than ``rest_gap``."""
+        found: List[int] = []
+        for player in players:
+            intervals = self._intervals.get(player)
+            if not intervals:
+                continue
+            index = bisect_left(intervals, (start - rest_gap - self._longest,))
+            limit = end + rest_gap
+            while index < len(intervals) and intervals[index][0] < limit:
+                other_start, other_end, token = intervals[index]
+                if other_end > start - rest_gap and token != ignore and token not in found:
+                    found.append(token)
+                index += 1
+        return found
+
+    def is_free(self, players: Iterable[Any], start: int, end: int, rest_gap: int = 0) -> bool:
+        return not self.conflicts(players, start, end, rest_gap)
+
+    def span(self, player: Any) -> Optional[Tuple[int, int]]:
+        """First start and last end booked for ``player``."""
+        intervals = self._intervals.get(player)
+        if not intervals:
+            return None
+        last_end = intervals[0][1]
+        for _start, end, _token in intervals:
+            if end > last_end:
+                last_end = end
+        return intervals[0][0], last_end
+
+
+class _Booking:
+    __slots__ = ("token", "entry", "court_id", "day_date", "slot", "players", "start", "end")
+
+    def __init__(self, token, entry, court_id, day_date, slot, players, start, end):
+        self.token = token
+        self.entry = entry
+        self.court_id = court_id
+        self.day_date = day_date
+        self.slot = slot
+        self.players = players
+        self.start = start
+        self.end = end
+
+
+class ScheduleEngine:
+    """Mutable court timelines plus per-player interval indexes for one schedule.
+
+    ``book`` / ``is_available`` drive initial placement; ``load`` + ``move``
+    re-place a single match and re-time only the court entries that follow it.
+    """
+
+    def __init__(self, config: Dict[str, Any], rest_slots: Optional[int] = None) -> None:
+        self.config = config
+        self.model = compile_config(config, rest_slots)
+        self.index = PlayerIntervalIndex()
+        self._bookings: Dict[int, _Booking] = {}
+        self._by_entry_id: Dict[int, int] = {}
+        self._timelines: Dict[Tuple[str, str], List[int]] = {}
+        self._next_token = 0
+
+    @staticmethod
+    def _player_keys(day_date: str, match: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
+        return tuple((day_date, player) for player in sorted(_players(match)))
+
+    def duration(self, court_id: Optional[str], slot: str) -> int:
+        return self.model.duration(court_id, slot)
+
+    def is_available(self, match: Dict[str, Any], court_id: str, start: int, day_date: str = "") -> bool:
+        end = start + self.duration(court_id, _match_slot(match))
+        return self.index.is_free(self._player_keys(day_date, match), start, end, self.model.rest_gap)
+
+    def earliest_free_start(self, match: Dict[str, Any], court_id: str, start: int, day_date: str = "") -> int:
+        """First minute at or after ``start`` when every player of ``match`` is free and rested."""
+        keys = self._player_keys(day_date, match)
+        length = self.duration(court_id, _match_slot(match))
+        rest_gap = self.model.rest_gap
+        while True:
+            tokens = self.index.conflicts(keys, start, start + length, rest_gap)
+            if not tokens:
+                return start
+            start = max(self._bookings[token].end for token in tokens) + rest_gap
+
+    def book(self, match: Dict[str, Any], court_id: str, start: int, day_date: str = "") -> int:
+        slot = _match_slot(match)
+        end = start + self.duration(court_id, slot)
+        token = self._next_token
+        self._next_token += 1
+        booking = _Booking(token, match, str(court_id or ""), str(day_date or ""), slot,
+                           self._player_keys(str(day_date or ""), match), start, end)
+        self._bookings[token] = booking
+        self.index.add(booking.players, start, end, token)
+        if match.get("id") is not None:
+            self._by_entry_id[int(match["id"])] = token
+        return token
+
+    def _retime(self, booking: _Booking, start: int) -> None:
+        self.index.remove(booking.players, booking.start, booking.end, booking.token)
+        booking.start = start
+        booking.end = start + self.duration(booking.court_id, booking.slot)
+        self.index.add(booking.players, booking.start, booking.end, booking.token)
+
+    def _timeline_sort_key(self, token: int) -> Tuple[str, int, int]:
+        entry = self._bookings[token].entry
+        return (
+            str(entry.get("scheduled_time") or "99:99"),
+            int(entry.get("sort_order") or 0),
+            int(entry.get("id") or 0),
+        )
+
+    def load(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """Index existing schedule entries (flat rows with court/day/time)."""
+        for entry in entries:
+            court_id = str(entry.get("court_id") or "")
+            day_date = str(entry.get("day_date") or "")
+            start = time_to_minutes(str(entry.get("scheduled_time") or DEFAULT_START_TIME))
+            token = self.book(entry, court_id, start, day_date)
+            if court_id:
+                self._timelines.setdefault((court_id, day_date), []).append(token)
+        for tokens in self._timelines.values():
+            tokens.sort(key=self._timeline_sort_key)
+
+    def _cascade(self, tokens: List[int], from_index: int, cursor: int, changed: Dict[int, Dict[str, Any]]) -> None:
+        for token in tokens[from_index:]:
+            booking = self._bookings[token]
+            entry = booking.entry
+            time_str = minutes_to_time(cursor)
+            if str(entry.get("scheduled_time") or "") != time_str or booking.start != cursor:
+                entry["scheduled_time"] = time_str
+                self._retime(booking, cursor)
+                changed[token] = entry
+            cursor = min(cursor + booking.end - booking.start, _LAST_MINUTE)
+
+    def _restart_court(self, tokens: List[int], changed: Dict[int, Dict[str, Any]]) -> None:
+        if not tokens:
+            return
+        first = self._bookings[tokens[0]].entry
+        start = str(first.get("scheduled_time") or "").strip() or str(self.config.get("start_time") or DEFAULT_START_TIME)
+        self._cascade(tokens, 0, time_to_minutes(start), changed)
+
+    def move(
+        self,
+        entry_id: int,
+        court_id: str,
+        scheduled_time: Optional[str] = None,
+        day_date: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Move one loaded entry and return only the entries whose placement changed.
+
+        With ``scheduled_time`` the moved match is pinned there and only the
+        matches after it on the target court shift; otherwise the target court is
+        re-timed from its first match. The source court closes the gap behind it.
+        """
+        token = self._by_entry_id.get(int(entry_id))
+        if token is None:
+            return []
+        booking = self._bookings[token]
+        entry = booking.entry
+        source_key = (booking.court_id, booking.day_date)
+        target_court = str(court_id or booking.court_id)
+        target_day = str(day_date or booking.day_date)
+
+        source_tokens = self._timelines.get(source_key, [])
+        if token in source_tokens:
+            source_tokens.remove(token)
+
+        self.index.remove(booking.players, booking.start, booking.end, token)
+        if target_day != booking.day_date:
+            booking.players = self._player_keys(target_day, entry)
+        booking.court_id = target_court
+        booking.day_date = target_day
+        entry["court_id"] = target_court
+        entry["day_date"] = target_day
+        if scheduled_time:
+            entry["scheduled_time"] = str(scheduled_time)
+        booking.start = time_to_minutes(str(entry.get("scheduled_time") or DEFAULT_START_TIME))
+        booking.end = booking.start + self.duration(target_court, booking.slot)
+        self.index.add(booking.players, booking.start, booking.end, token)
+
+        changed: Dict[int, Dict[str, Any]] = {token: entry}
+        target_key = (target_court, target_day)
+        target_tokens = self._timelines.setdefault(target_key, [])
+        insort(target_tokens, token, key=self._timeline_sort_key)
+        if scheduled_time:
+            pivot = target_tokens.index(token)
+            self._cascade(target_tokens, pivot, booking.start, changed)
+        else:
+            self._restart_court(target_tokens, changed)
+
+        if source_key[0] and source_key != target_key:
+            self._restart_court(source_tokens, changed)
+        return list(changed.values())
+
+    def court_entries(self, court_id: str, day_date: str) -> List[Dict[str, Any]]:
+        tokens = self._timelines.get((str(court_id or ""), str(day_date or "")), [])
+        return [self._bookings[token].entry for token in tokens]
+
+    def conflicts_for(self, entry_id: int) -> List[Dict[str, Any]]:
+        """Entries that clash with ``entry_id`` (overlap or too little rest)."""
+        token = self._by_entry_id.get(int(entry_id))
+        if token is None:
+            return []
+        booking = self._bookings[token]
+        tokens = self.index.conflicts(booking.players, booking.start, booking.end, self.model.rest_gap, ignore=token)
+        return [self._bookings[other].entry for other in tokens]
 
 
 def _order_matches_for_scheduling(matches: List[Dict[str, Any]], rest_slots: int) -> List[Dict[str, Any]]:
@@ -272,22 +561,25 @@ def _place_on_court(
     day_date: str,
     start_time: str,
     rest_slots: int,
+    engine: Optional[ScheduleEngine] = None,
 ) -> List[Dict[str, Any]]:
+    engine = engine or ScheduleEngine(config, rest_slots)
     ordered = _order_matches_for_scheduling(court_matches, rest_slots)
     placements: List[Dict[str, Any]] = []
-    cursor = start_time
+    cursor = time_to_minutes(start_time)
     for match in ordered:
-        band = normalize_band(match.get("category_name") or match.get("group_name"))
+        band = _match_band(match)
         placements.append(
             {
                 "match": match,
                 "court_id": court_id,
                 "day_date": day_date,
-                "scheduled_time": cursor,
+                "scheduled_time": minutes_to_time(cursor),
                 "band": band,
             }
         )
-        cursor = add_minutes(cursor, _slot_minutes_for_court(court_id, config, band))
+        engine.book(match, court_id, cursor, day_date)
+        cursor = min(cursor + engine.duration(court_id, _match_slot(match)), _LAST_MINUTE)
     return placements
 
 
@@ -298,6 +590,7 @@ def _place_load_balanced(
     day_date: str,
     start_time: str,
     rest_slots: int,
+    engine: Optional[ScheduleEngine] = None,
 ) -> List[Dict[str, Any]]:
     if not flex_courts:
         return [
@@ -306,43 +599,42 @@ def _place_load_balanced(
                 "court_id": None,
                 "day_date": day_date,
                 "scheduled_time": "",
-                "band": normalize_band(match.get("category_name") or match.get("group_name")),
+                "band": _match_band(match),
             }
             for match in matches
         ]
 
+    engine = engine or ScheduleEngine(config, rest_slots)
     ordered = _order_matches_for_scheduling(matches, rest_slots)
-    court_next_time = {court_id: start_time for court_id in flex_courts}
-    scheduled: List[Dict[str, Any]] = []
+    start = time_to_minutes(start_time)
+    court_next_time = {court_id: start for court_id in flex_courts}
     placements: List[Dict[str, Any]] = []
 
     for match in ordered:
-        band = normalize_band(match.get("category_name") or match.get("group_name"))
-        candidates = sorted(flex_courts, key=lambda court_id: time_to_minutes(court_next_time[court_id]))
+        band = _match_band(match)
+        candidates = sorted(flex_courts, key=court_next_time.__getitem__)
         chosen_court = None
-        chosen_start = None
         for court_id in candidates:
-            proposed_start = court_next_time[court_id]
-            if _slot_available_for_player(match, court_id, proposed_start, config, scheduled, rest_slots):
+            if engine.is_available(match, court_id, court_next_time[court_id], day_date):
                 chosen_court = court_id
-                chosen_start = proposed_start
                 break
         if not chosen_court:
             chosen_court = candidates[0]
-            chosen_start = court_next_time[chosen_court]
+        chosen_start = court_next_time[chosen_court]
 
-        placement = {
-            "match": match,
-            "court_id": chosen_court,
-            "day_date": day_date,
-            "scheduled_time": chosen_start,
-            "band": band,
-        }
-        placements.append(placement)
-        scheduled.append(placement)
-        court_next_time[chosen_court] = add_minutes(
-            chosen_start,
-            _slot_minutes_for_court(chosen_court, config, band),
+        placements.append(
+            {
+                "match": match,
+                "court_id": chosen_court,
+                "day_date": day_date,
+                "scheduled_time": minutes_to_time(chosen_start),
+                "band": band,
+            }
+        )
+        engine.book(match, chosen_court, chosen_start, day_date)
+        court_next_time[chosen_court] = min(
+            chosen_start + engine.duration(chosen_court, _match_slot(match)),
+            _LAST_MINUTE,
         )
 
     return placements
@@ -375,6 +667,7 @@ def place_matches(
             unplaced.append(match)
 
     placements: List[Dict[str, Any]] = []
+    engine = ScheduleEngine(config, rest_slots)
 
     if b1_matches:
         by_b1_court: Dict[str, List[Dict[str, Any]]] = {}
@@ -386,9 +679,13 @@ def place_matches(
                 continue
             by_b1_court.setdefault(court_id, []).append(match)
         for court_id, court_matches in by_b1_court.items():
-            placements.extend(_place_on_court(court_matches, court_id, config, day_date, start_time, rest_slots))
+            placements.extend(
+                _place_on_court(court_matches, court_id, config, day_date, start_time, rest_slots, engine)
+            )
 
-    placements.extend(_place_load_balanced(flex_matches, flex_courts, config, day_date, start_time, rest_slots))
+    placements.extend(
+        _place_load_balanced(flex_matches, flex_courts, config, day_date, start_time, rest_slots, engine)
+    )
 
     for match in unplaced:
         placements.append(
@@ -403,6 +700,132 @@ def place_matches(
     return placements
 
 
+def day_window(config: Dict[str, Any], day_date: str) -> Tuple[int, int]:
+    """Court hours ``(start, end)`` in minutes for one day.
+
+    ``config["day_windows"]`` maps ``YYYY-MM-DD`` to ``{"start_time", "end_time"}``;
+    missing values fall back to the tournament-wide ``start_time`` / ``end_time``.
+    """
+    window = (config.get("day_windows") or {}).get(str(day_date)) or {}
+    start = str(window.get("start_time") or config.get("start_time") or DEFAULT_START_TIME)
+    end = str(window.get("end_time") or config.get("end_time") or DEFAULT_END_TIME)
+    return time_to_minutes(start), time_to_minutes(end)
+
+
+def _dependency_key(match: Dict[str, Any]) -> str:
+    return str(match.get("category_name") or match.get("group_name") or "").strip().casefold()
+
+
+# Phase rank -> dependency tier. A match waits for every match of its category in
+# a lower tier: 5th/7th place (3A v 3B) only needs the groups, while the final
+# and the 3rd-place match both need the semifinals.
+_DEPENDENCY_TIERS = {0: 0, 1: 1, 2: 2, 3: 1, 4: 3, 5: 3, 6: 3}
+
+
+def plan_tournament_days(
+    matches: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    days: List[str],
+) -> Dict[str, Any]:
+    """Place matches over several days in one pass, honouring daily court windows.
+
+    Matches go in phase order. Each one takes the court and day where it can
+    finish earliest: after the court's previous match, after its players' rest,
+    and after every match of its category it depends on (a knockout round waits
+    for its groups and for the previous round, possibly into the next day).
+    When a day's window is full the match spills to the next day; what does not
+    fit before the last day closes is returned unplaced.
+
+    Returns ``{"placements": [...], "days": [...]}`` with ``place_matches``-shaped
+    placements (unplaced ones carry ``reason``) and capacity stats per day.
+    """
+    rest_slots = int(config.get("rest_slots") or 1)
+    engine = ScheduleEngine(config, rest_slots)
+    b1_courts = normalize_b1_court_ids(config)
+    flex_courts = _ordered_flex_court_ids(config)
+    windows = [day_window(config, day) for day in days]
+    cursors = [dict.fromkeys([*b1_courts, *flex_courts], start) for start, _end in windows]
+    booked = [0] * len(days)
+    counts = [0] * len(days)
+    finish = [start for start, _end in windows]
+
+    # Latest (day index, end minute) per category and dependency tier; None once
+    # a match of that tier could not be placed, which blocks every later tier.
+    phase_ends: Dict[str, Dict[int, Optional[Tuple[int, int]]]] = {}
+    placements: List[Dict[str, Any]] = []
+
+    for match in _order_matches_for_scheduling(matches, rest_slots):
+        band = _match_band(match)
+        slot = _match_slot(match)
+        tier = _DEPENDENCY_TIERS[_phase_rank(match.get("phase"))]
+        ends = phase_ends.setdefault(_dependency_key(match), {})
+        earlier = [end for phase_tier, end in ends.items() if phase_tier < tier]
+        courts = b1_courts if band == "B1" and b1_courts else flex_courts
+        chosen: Optional[Tuple[int, int, int, str]] = None
+        reason = "no_court" if not courts else "capacity"
+        if any(end is None for end in earlier):
+            courts, reason = [], "dependency"
+        ready = max((end for end in earlier if end is not None), default=(0, 0))
+
+        for day_index in range(ready[0], len(days)) if courts else ():
+            window_start, window_end = windows[day_index]
+            for order, court_id in enumerate(courts):
+                start = max(cursors[day_index][court_id], ready[1] if day_index == ready[0] else window_start)
+                start = engine.earliest_free_start(match, court_id, start, days[day_index])
+                end = start + engine.duration(court_id, slot)
+                if end <= window_end and (chosen is None or (end, order) < (chosen[2], chosen[3])):
+                    chosen = (day_index, start, end, order)
+            if chosen is not None:
+                break
+
+        if chosen is None:
+            ends[tier] = None
+            placements.append({
+                "match": match,
+                "court_id": None,
+                "day_date": "",
+                "scheduled_time": "",
+                "band": band,
+                "reason": reason,
+            })
+            continue
+
+        day_index, start, end, order = chosen
+        court_id = courts[order]
+        engine.book(match, court_id, start, days[day_index])
+        cursors[day_index][court_id] = end
+        booked[day_index] += end - start
+        counts[day_index] += 1
+        finish[day_index] = max(finish[day_index], end)
+        if ends.get(tier, (0, 0)) is not None:
+            ends[tier] = max(ends.get(tier, (0, 0)), (day_index, end))
+        placements.append({
+            "match": match,
+            "court_id": court_id,
+            "day_date": days[day_index],
+            "scheduled_time": minutes_to_time(start),
+            "band": band,
+        })
+
+    court_count = len(b1_courts) + len(flex_courts)
+    day_stats = []
+    for day_index, day in enumerate(days):
+        window_start, window_end = windows[day_index]
+        capacity = max(0, window_end - window_start) * court_count
+        day_stats.append({
+            "day_date": day,
+            "start_time": minutes_to_time(window_start),
+            "end_time": minutes_to_time(window_end),
+            "courts": court_count,
+            "matches": counts[day_index],
+            "capacity_minutes": capacity,
+            "booked_minutes": booked[day_index],
+            "utilization": round(booked[day_index] / capacity, 3) if capacity else 0.0,
+            "finish_time": minutes_to_time(finish[day_index]) if counts[day_index] else "",
+        })
+    return {"placements": placements, "days": day_stats}
+
+
 def recompute_court_times(
     ordered_entries: List[Dict[str, Any]],
     config: Dict[str, Any],
@@ -416,14 +839,16 @@ def recompute_court_times(
         or str(ordered_entries[0].get("scheduled_time") or "").strip()
         or str(config.get("start_time") or DEFAULT_START_TIME)
     )
+    compiled = compile_config(config)
     result: List[Dict[str, Any]] = []
     court_id = str(ordered_entries[0].get("court_id") or "").strip()
-    for entry in ordered_entries:
-        band = normalize_band(entry.get("category_name") or entry.get("group_name"))
+    minutes = time_to_minutes(cursor)
+    for index, entry in enumerate(ordered_entries):
         updated = dict(entry)
-        updated["scheduled_time"] = cursor
+        # The first entry keeps the start exactly as given; later ones are HH:MM.
+        updated["scheduled_time"] = cursor if index == 0 else minutes_to_time(minutes)
         result.append(updated)
-        cursor = add_minutes(cursor, _slot_minutes_for_court(court_id, config, band))
+        minutes = min(minutes + compiled.duration(court_id, _match_slot(entry)), _LAST_MINUTE)
     return result
 
 
@@ -0,0 +1,24 @@
+"""Hit/miss counters of the in-process read caches for the Prometheus registry."""
+from __future__ import annotations
+
+from prometheus_client.core import CounterMetricFamily
+
+
+class CacheStatsCollector:
+    """Expose ``hits`` / ``misses`` of named caches at scrape time.
+
+    ``caches`` maps a label to any object with integer ``hits`` and
+    ``misses`` attributes (``tournament_registry``, ``duration_cache``).
+    """
+
+    def __init__(self, caches: dict) -> None:
+        self._caches = caches
+
+    def collect(self):
+        hits = CounterMetricFamily("wyniki_cache_hits", "Reads served from an in-process cache", labels=["cache"])
+        misses = CounterMetricFamily("wyniki_cache_misses", "Reads that rebuilt an in-process cache", labels=["cache"])
+        for name, cache in sorted(self._caches.items()):
+            hits.add_metric([name], int(cache.hits))
+            misses.add_metric([name], int(cache.misses))
+        yield hits
+        yield misses
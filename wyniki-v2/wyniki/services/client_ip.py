@@ -0,0 +1,52 @@
+"""Client address of the current request, as vouched for by our own proxies.
+
+Public traffic arrives through Cloudflare → cloudflared → Traefik, so the TCP
+peer Flask sees is a proxy on a private network for every visitor; keying the
+SSE per-IP cap or umpire audit records on it would lump everyone together.
+Forwarding headers are believed only when that peer lies in
+``trusted_proxy_networks``: the client is then ``CF-Connecting-IP`` (written
+by Cloudflare's edge, which replaces whatever the visitor sent) or, failing
+that, the nearest ``X-Forwarded-For`` entry that is not one of our proxies.
+A peer outside those networks is the client itself and its headers are
+ignored, so they cannot be used to dodge the cap or forge an audit address.
+"""
+from __future__ import annotations
+
+import ipaddress
+from functools import lru_cache
+from typing import Tuple, Union
+
+from flask import request
+
+from ..config import settings
+
+_Network = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+@lru_cache(maxsize=8)
+def _networks(spec: str) -> Tuple[_Network, ...]:
+    return tuple(ipaddress.ip_network(part.strip(), strict=False) for part in spec.split(",") if part.strip())
+
+
+def _is_trusted_proxy(address: str) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in _networks(settings.trusted_proxy_networks))
+
+
+def request_client_ip() -> str:
+    peer = request.remote_addr or ""
+    if not _is_trusted_proxy(peer):
+        return peer or "unknown"
+
+    cloudflare = (request.headers.get("CF-Connecting-IP") or "").strip()
+    if cloudflare:
+        return cloudflare
+
+    hops = [hop.strip() for hop in request.headers.get("X-Forwarded-For", "").split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
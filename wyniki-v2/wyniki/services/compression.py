@@ -0,0 +1,216 @@
+"""Negotiated gzip/deflate compression for SSE streams and large JSON payloads."""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from flask import Response, current_app, request, stream_with_context
+
+from ..config import logger
+from .client_ip import request_client_ip
+from .sse_registry import sse_registry
+
+# Encodings we can produce, in server preference order.
+SUPPORTED_ENCODINGS = ("gzip", "deflate")
+# Bodies below this size are cheaper to send as-is than to compress.
+MIN_COMPRESS_BYTES = 1024
+# Level 6 is zlib's default; SSE frames are tiny so a lower level keeps CPU flat.
+JSON_COMPRESS_LEVEL = 6
+STREAM_COMPRESS_LEVEL = 5
+
+_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+    best: Optional[str] = None
+    best_quality = 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def compress_bytes(data: bytes, encoding: str, level: int = JSON_COMPRESS_LEVEL) -> bytes:
+    """Compress a complete body with the given content-coding."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+    return compressor.compress(data) + compressor.flush(zlib.Z_FINISH)
+
+
+class StreamCompressor:
+    """Per-connection deflate context that flushes each SSE frame on its own.
+
+    Keeping one context per connection lets later events reuse the dictionary
+    built from earlier ones (court_update payloads repeat almost every key),
+    while ``Z_SYNC_FLUSH`` guarantees every frame reaches the client immediately.
+    """
+
+    def __init__(self, encoding: str, level: int = STREAM_COMPRESS_LEVEL) -> None:
+        self.encoding = encoding
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, _WBITS[encoding])
+
+    def compress_event(self, chunk: str | bytes) -> bytes:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+def compress_event_stream(chunks: Iterable[str | bytes], encoding: str) -> Iterator[bytes]:
+    """Wrap an SSE generator so every yielded frame is compressed and flushed."""
+    compressor = StreamCompressor(encoding)
+    iterator = iter(chunks)
+    try:
+        for chunk in iterator:
+            yield compressor.compress_event(chunk)
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def _sse_rejection(reason: str) -> Response:
+    """Tell a rejected EventSource to come back later instead of failing hard.
+
+    A 200 stream that only carries ``retry:`` makes browsers reconnect after the
+    hinted delay; an error status would stop EventSource for good.
+    """
+    retry_ms = sse_registry.retry_ms()
+    payload = json.dumps({"reason": reason, "retry_ms": retry_ms})
+    response = Response(
+        f"retry: {retry_ms}\nevent: busy\ndata: {payload}\n\n",
+        mimetype="text/event-stream",
+    )
+    response.headers["Retry-After"] = str(max(1, retry_ms // 1000))
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def sse_response(generate: Callable[[], Iterable[str]], headers: Optional[dict[str, str]] = None) -> Response:
+    """Build an admitted SSE response, compressing the stream when negotiated.
+
+    ``X-Accel-Buffering: no`` is always kept so proxies forward each flushed frame
+    instead of waiting for a full compression block.
+    """
+    endpoint = request.endpoint or request.path
+    lease, reason = sse_registry.try_acquire(endpoint, request_client_ip())
+    if lease is None:
+        logger.warning("sse_connection_rejected", endpoint=endpoint, reason=reason)
+        return _sse_rejection(reason)
+
+    response_headers = {"X-Accel-Buffering": "no"}
+    response_headers.update(headers or {})
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+    body: Iterable[Any] = stream_with_context(generate())
+    if encoding:
+        body = compress_event_stream(body, encoding)
+        response_headers["Content-Encoding"] = encoding
+    response_headers["Vary"] = "Accept-Encoding"
+    response = Response(body, mimetype="text/event-stream", headers=response_headers)
+    response.call_on_close(lease.release)
+    return response
+
+
+class PrecompressedCache:
+    """Keep the compressed variants of the latest body for each cache key.
+
+    The version of a body is the digest of its serialized JSON, so identical
+    payloads are compressed once no matter how many clients request them.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self._entries: "OrderedDict[str, tuple[str, dict[str, bytes]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cache_key: str, body: bytes, encoding: str) -> bytes:
+        version = hashlib.blake2b(body, digest_size=16).hexdigest()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry and entry[0] == version and encoding in entry[1]:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1][encoding]
+        compressed = compress_bytes(body, encoding)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if not entry or entry[0] != version:
+                entry = (version, {})
+                self._entries[cache_key] = entry
+            entry[1][encoding] = compressed
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+            self.misses += 1
+        return compressed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+precompressed_cache = PrecompressedCache()
+
+
+def _compressed_json(payload: Any, cache_key: str, status: int) -> Response:
+    body = (current_app.json.dumps(payload) + "\n").encode("utf-8")
+    encoding = negotiate_encoding(request.headers.get("Accept-Encoding"))
+    response = Response(mimetype="application/json", status=status)
+    if encoding and len(body) >= MIN_COMPRESS_BYTES:
+        response.set_data(precompressed_cache.get(cache_key, body, encoding))
+        response.headers["Content-Encoding"] = encoding
+    else:
+        response.set_data(body)
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+def compressed_json_no_cache(payload: Any, cache_key: str, status: int = 200) -> Response:
+    """Non-cacheable JSON response, compressed once per distinct body per cache key."""
+    response = _compressed_json(payload, cache_key, status)
+    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
+    response.headers["Pragma"] = "no-cache"
+    response.headers["Expires"] = "0"
+    return response
+
+
+def compressed_json_revalidated(payload: Any, cache_key: str, etag: str) -> Response:
+    """JSON response clients must revalidate; 304 without a body when ``etag`` matches.
+
+    The ETag is weak because the same document is sent in several content-codings.
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = _compressed_json(payload, cache_key, 200)
+    response.set_etag(etag, weak=True)
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = "no-cache, must-revalidate"
+    return response
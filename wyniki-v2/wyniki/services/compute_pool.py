@@ -0,0 +1,189 @@
+"""Process pool for pure-Python bracket and standings computation.
+
+Standings, knockout seeding and full bracket assembly are CPU-bound loops.
+Under gevent they block every greenlet in the worker (SSE streams included)
+for as long as they run. This service submits such work to a small
+``ProcessPoolExecutor`` with plain, picklable inputs (group rows and match
+rows), waits cooperatively, and falls back to running the function inline
+when the pool is disabled, broken or too slow.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from prometheus_client.core import CounterMetricFamily
+
+from ..config import logger, settings
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor
+    workers = int(settings.compute_pool_workers)
+    if workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            # "spawn" keeps gevent's monkey-patched state out of the children.
+            _executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _threading_patched() -> bool:
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched("threading")
+
+
+def _wait_for_future(future: Future, timeout: float) -> Any:
+    """Wait for a pool result without blocking the gevent hub.
+
+    The executor's manager may be a native thread (when concurrent.futures was
+    imported before monkey-patching), and it cannot wake a gevent waiter via the
+    future's condition. A loop ``async`` watcher is the thread-safe way to do it.
+    """
+    if not _threading_patched():
+        return future.result(timeout=timeout)
+
+    from gevent import get_hub
+    from gevent.event import Event
+
+    done = Event()
+    watcher = get_hub().loop.async_()
+    watcher.start(done.set)
+    closed = []
+
+    def _notify(_future: Future) -> None:
+        if closed:
+            return
+        try:
+            watcher.send()
+        except Exception:
+            pass
+
+    future.add_done_callback(_notify)
+    try:
+        if not done.wait(timeout) and not future.done():
+            raise FutureTimeoutError()
+    finally:
+        closed.append(True)
+        watcher.stop()
+        watcher.close()
+    return future.result(timeout=0)
+
+
+def _reset_executor(executor: ProcessPoolExecutor) -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_compute_pool(wait: bool = False) -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ComputePoolStats:
+    """Counters for offloaded work, exported to the app's Prometheus registry."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._offloaded: dict[str, list[float]] = {}
+        self._fallbacks: dict[tuple[str, str], int] = {}
+
+    def record_offloaded(self, task: str, seconds: float) -> None:
+        with self._lock:
+            entry = self._offloaded.setdefault(task, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def record_fallback(self, task: str, reason: str) -> None:
+        with self._lock:
+            self._fallbacks[(task, reason)] = self._fallbacks.get((task, reason), 0) + 1
+
+    def offloaded(self) -> dict[str, tuple[int, float]]:
+        with self._lock:
+            return {task: (int(count), seconds) for task, (count, seconds) in self._offloaded.items()}
+
+    def fallbacks(self) -> dict[tuple[str, str], int]:
+        with self._lock:
+            return dict(self._fallbacks)
+
+    def collect(self):
+        offloaded = self.offloaded()
+        seconds = CounterMetricFamily(
+            "wyniki_compute_offloaded_seconds",
+            "Wall time spent in the compute process pool instead of the event loop",
+            labels=["task"],
+        )
+        tasks = CounterMetricFamily("wyniki_compute_offloaded_tasks", "Tasks completed in the compute pool", labels=["task"])
+        for task, (count, total) in sorted(offloaded.items()):
+            seconds.add_metric([task], total)
+            tasks.add_metric([task], count)
+        yield seconds
+        yield tasks
+
+        fallbacks = CounterMetricFamily(
+            "wyniki_compute_inline_fallbacks",
+            "Compute tasks that ran inline on the event loop",
+            labels=["task", "reason"],
+        )
+        for (task, reason), count in sorted(self.fallbacks().items()):
+            fallbacks.add_metric([task, reason], count)
+        yield fallbacks
+
+
+compute_stats = ComputePoolStats()
+
+
+def run_cpu_bound(func: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+    """Run ``func(*args)`` in the process pool, or inline when that is not possible.
+
+    ``func`` must be a module-level function and ``args`` plain picklable data.
+    The result is identical either way; only where the CPU time is spent changes.
+    """
+    task = getattr(func, "__name__", "task")
+    executor = _get_executor()
+    if executor is None:
+        compute_stats.record_fallback(task, "disabled")
+        return func(*args)
+
+    wait = float(settings.compute_pool_timeout_seconds if timeout is None else timeout)
+    started = time.perf_counter()
+    try:
+        future = executor.submit(func, *args)
+        result = _wait_for_future(future, wait)
+    except FutureTimeoutError:
+        future.cancel()
+        logger.warning("compute_pool_timeout", task=task, timeout_seconds=wait)
+        compute_stats.record_fallback(task, "timeout")
+        return func(*args)
+    except BrokenProcessPool as exc:
+        logger.error("compute_pool_broken", task=task, error=str(exc))
+        _reset_executor(executor)
+        compute_stats.record_fallback(task, "broken")
+        return func(*args)
+    except Exception as exc:
+        logger.error("compute_pool_error", task=task, error=str(exc))
+        compute_stats.record_fallback(task, "error")
+        return func(*args)
+    compute_stats.record_offloaded(task, time.perf_counter() - started)
+    return result
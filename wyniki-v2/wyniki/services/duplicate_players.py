@@ -0,0 +1,236 @@
+"""Likely duplicate global players, found by blocking plus pairwise similarity.
+
+Comparing every pair of global players is quadratic, so each player is put
+into two blocks: one for the first four letters of the folded surname and
+one for a phonetic code of the surname (``Kowalski`` and ``Kowalsky`` share
+one). Pairs are scored only inside a block. A pair conflicts, and is never
+suggested, when both first initials are known and differ, both genders are
+known and differ, or both birth years are known and more than a year apart.
+
+Scores combine Jaro-Winkler similarity of surnames and first names. Pairs
+at or above the threshold join clusters best-first (union-find), but two
+clusters are only joined when no members conflict, so an entry without a
+first name cannot chain "Jan" and "Piotr" together. Each cluster gets a
+merge suggestion. The suggested target is the entry with the
+most tournaments, then the one with a first name, then the oldest id.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from itertools import combinations, product
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .name_keys import fold_name
+
+DEFAULT_THRESHOLD = 0.9
+_PREFIX_LENGTH = 4
+_LARGE_BLOCK = 250
+_WINDOW = 12
+# Surname spelling variants that sound alike (after accent folding).
+_PHONETIC_RULES = (
+    ("sch", "s"), ("sz", "s"), ("cz", "c"), ("ch", "h"), ("ck", "k"), ("ph", "f"),
+    ("rz", "z"), ("w", "v"), ("y", "i"), ("q", "k"), ("x", "ks"),
+)
+_NOT_LETTERS = re.compile(r"[^a-z]")
+
+
+def phonetic_key(surname: str) -> str:
+    """Coarse sound-alike code of a folded surname: first letter plus consonant skeleton."""
+    text = _NOT_LETTERS.sub("", fold_name(surname))
+    if not text:
+        return ""
+    for pattern, replacement in _PHONETIC_RULES:
+        text = text.replace(pattern, replacement)
+    skeleton = [text[0]]
+    for char in text[1:]:
+        if char in "aeiouh" or char == skeleton[-1]:
+            continue
+        skeleton.append(char)
+    return "".join(skeleton)
+
+
+@lru_cache(maxsize=65536)
+def jaro_winkler(first: str, second: str) -> float:
+    if first == second:
+        return 1.0
+    if not first or not second:
+        return 0.0
+    window = max(0, max(len(first), len(second)) // 2 - 1)
+    second_matched = [False] * len(second)
+    first_chars = []
+    for index, char in enumerate(first):
+        end = min(len(second), index + window + 1)
+        other = second.find(char, max(0, index - window), end)
+        while other != -1 and second_matched[other]:
+            other = second.find(char, other + 1, end)
+        if other != -1:
+            second_matched[other] = True
+            first_chars.append(char)
+    matches = len(first_chars)
+    if not matches:
+        return 0.0
+    second_chars = [char for char, matched in zip(second, second_matched) if matched]
+    transpositions = sum(a != b for a, b in zip(first_chars, second_chars)) / 2
+    jaro = (matches / len(first) + matches / len(second) + (matches - transpositions) / matches) / 3
+    prefix = 0
+    for a, b in zip(first[:4], second[:4]):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+def _birth_year(value: Any) -> Optional[int]:
+    text = str(value or "")[:4]
+    return int(text) if text.isdigit() else None
+
+
+class _Candidate:
+    __slots__ = ("id", "first", "last", "initial", "gender", "year")
+
+    def __init__(self, player: Dict[str, Any]) -> None:
+        self.id = int(player["id"])
+        self.first = player.get("first_name_key") or fold_name(player.get("first_name"))
+        self.last = player.get("last_name_key") or fold_name(player.get("last_name"))
+        self.initial = self.first[:1]
+        self.gender = str(player.get("gender") or "").strip().upper()[:1]
+        self.year = _birth_year(player.get("birth_date"))
+
+
+def _conflict(first: _Candidate, second: _Candidate) -> bool:
+    return bool(
+        (first.initial and second.initial and first.initial != second.initial)
+        or (first.gender and second.gender and first.gender != second.gender)
+        or (first.year is not None and second.year is not None and abs(first.year - second.year) > 1)
+    )
+
+
+def pair_score(first: _Candidate, second: _Candidate) -> float:
+    if _conflict(first, second):
+        return 0.0
+    surname = jaro_winkler(first.last, second.last)
+    if not first.first or not second.first:
+        # Missing first name: surname decides, slightly discounted.
+        return surname * 0.95
+    return 0.6 * surname + 0.4 * jaro_winkler(first.first, second.first)
+
+
+def _blocks(candidates: Iterable[_Candidate]) -> Iterable[List[_Candidate]]:
+    blocks: Dict[Tuple[str, str], List[_Candidate]] = {}
+    for candidate in candidates:
+        if not candidate.last:
+            continue
+        blocks.setdefault(("prefix", candidate.last[:_PREFIX_LENGTH]), []).append(candidate)
+        code = phonetic_key(candidate.last)
+        if code:
+            blocks.setdefault(("sound", code), []).append(candidate)
+    return (block for block in blocks.values() if len(block) > 1)
+
+
+def _compatible(first: Tuple[str, Optional[int]], second: Tuple[str, Optional[int]]) -> bool:
+    (first_initial, first_year), (second_initial, second_year) = first, second
+    if first_initial and second_initial and first_initial != second_initial:
+        return False
+    return first_year is None or second_year is None or abs(first_year - second_year) <= 1
+
+
+def _candidate_pairs(block: List[_Candidate]) -> Iterable[Tuple[_Candidate, _Candidate]]:
+    """Pairs of a block that can match: sub-blocks by (first initial, birth year).
+
+    An unknown initial or year acts as a wildcard, so nothing that could
+    score is skipped. Blocks over ``_LARGE_BLOCK`` entries (a very common
+    surname) fall back to a sorted neighbourhood: each entry is compared
+    with the next ``_WINDOW`` entries in surname order.
+    """
+    if len(block) > _LARGE_BLOCK:
+        ordered = sorted(block, key=lambda candidate: (candidate.last, candidate.first, candidate.id))
+        for index, candidate in enumerate(ordered):
+            for other in ordered[index + 1:index + 1 + _WINDOW]:
+                yield candidate, other
+        return
+    buckets: Dict[Tuple[str, Optional[int]], List[_Candidate]] = {}
+    for candidate in block:
+        buckets.setdefault((candidate.initial, candidate.year), []).append(candidate)
+    keys = list(buckets)
+    for index, key in enumerate(keys):
+        yield from combinations(buckets[key], 2)
+        for other in keys[index + 1:]:
+            if _compatible(key, other):
+                yield from product(buckets[key], buckets[other])
+
+
+def find_duplicate_clusters(
+    players: Iterable[Dict[str, Any]],
+    tournament_counts: Optional[Dict[int, int]] = None,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Dict[str, Any]]:
+    """Clusters of likely duplicates among ``players`` (dicts with id, names, gender, birth_date).
+
+    Returns ``[{"player_ids", "score", "pairs", "suggested_merge"}]``, most
+    certain clusters first. ``score`` is the lowest pair score that joined the
+    cluster.
+    """
+    counts = tournament_counts or {}
+    by_id = {candidate.id: candidate for candidate in map(_Candidate, players)}
+    scored: Dict[Tuple[int, int], float] = {}
+    for block in _blocks(by_id.values()):
+        for first, second in _candidate_pairs(block):
+            pair = (first.id, second.id) if first.id < second.id else (second.id, first.id)
+            if pair in scored:
+                continue
+            scored[pair] = pair_score(first, second)
+
+    parent: Dict[int, int] = {}
+    members_of: Dict[int, List[int]] = {}
+
+    def _root(node: int) -> int:
+        while parent.get(node, node) != node:
+            parent[node] = parent.get(parent[node], parent[node])
+            node = parent[node]
+        return node
+
+    candidates = sorted(
+        ((pair, score) for pair, score in scored.items() if score >= threshold),
+        key=lambda item: (-item[1], item[0]),
+    )
+    accepted: Dict[Tuple[int, int], float] = {}
+    for (first_id, second_id), score in candidates:
+        first_root, second_root = _root(first_id), _root(second_id)
+        if first_root != second_root:
+            first_members = members_of.get(first_root, [first_root])
+            second_members = members_of.get(second_root, [second_root])
+            if any(_conflict(by_id[a], by_id[b]) for a in first_members for b in second_members):
+                continue
+            parent[first_root] = second_root
+            members_of[second_root] = second_members + first_members
+            members_of.pop(first_root, None)
+        accepted[(first_id, second_id)] = score
+
+    clusters: Dict[int, List[int]] = {}
+    for player_id in sorted({player_id for pair in accepted for player_id in pair}):
+        clusters.setdefault(_root(player_id), []).append(player_id)
+    cluster_pairs: Dict[int, List[Dict[str, Any]]] = {}
+    for (first_id, second_id), score in accepted.items():
+        cluster_pairs.setdefault(_root(first_id), []).append(
+            {"ids": [first_id, second_id], "score": round(score, 3)}
+        )
+
+    result = []
+    for root, member_ids in clusters.items():
+        pairs = sorted(cluster_pairs[root], key=lambda item: (-item["score"], item["ids"]))
+        target = min(
+            member_ids,
+            key=lambda player_id: (-counts.get(player_id, 0), not by_id[player_id].first, player_id),
+        )
+        result.append({
+            "player_ids": member_ids,
+            "score": min(item["score"] for item in pairs),
+            "pairs": pairs,
+            "suggested_merge": {
+                "target_id": target,
+                "source_ids": [player_id for player_id in member_ids if player_id != target],
+            },
+        })
+    result.sort(key=lambda cluster: (-cluster["score"], cluster["player_ids"]))
+    return result
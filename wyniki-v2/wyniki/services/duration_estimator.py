@@ -0,0 +1,142 @@
+"""Slot-length estimates learned from recorded match durations.
+
+``match_history.duration_seconds`` (with ``match_statistics.match_duration_ms`` as
+a fallback when it is zero) already holds how long finished matches took. This
+service turns those samples into p50/p80 durations per band, per phase kind
+(group / knockout) and per band and phase kind together, and maps them onto the
+slot keys the auto-scheduler understands::
+
+    {"B2": 55, "B2:knockout": 70, "B1": 80, "default": 60, ...}
+
+Estimates are cached per tournament behind a fingerprint of its history rows,
+so a finished match (however it was recorded) triggers a rebuild on the next
+read and nothing is recomputed otherwise.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .auto_scheduler import _BAND_COURT_ORDER, normalize_band, phase_kind
+
+PERCENTILES = ("p50", "p80")
+MIN_SAMPLES = 5
+DEFAULT_TURNOVER_MINUTES = 5
+SLOT_ROUNDING_MINUTES = 5
+# Walkovers, aborted uploads and forgotten "end match" taps are not durations.
+MIN_DURATION_SECONDS = 10 * 60
+MAX_DURATION_SECONDS = 5 * 60 * 60
+
+
+def percentile(ordered: list, fraction: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def build_estimates(samples: Iterable[Tuple[Optional[str], Optional[str], int]]) -> Dict[str, Dict[str, Any]]:
+    """Percentiles of ``(category, phase, duration_seconds)`` samples per slot key.
+
+    Keys are ``""`` (all matches), a phase kind (``"group"`` / ``"knockout"``),
+    a band (``"B2"``) and a band with phase kind (``"B2:knockout"``).
+    """
+    buckets: Dict[str, list] = {}
+    for category, phase, seconds in samples:
+        seconds = int(seconds or 0)
+        if not MIN_DURATION_SECONDS <= seconds <= MAX_DURATION_SECONDS:
+            continue
+        band = normalize_band(category)
+        kind = phase_kind(phase)
+        keys = ["", kind]
+        if band:
+            keys += [band, f"{band}:{kind}"]
+        for key in keys:
+            buckets.setdefault(key, []).append(seconds)
+
+    estimates: Dict[str, Dict[str, Any]] = {}
+    for key, values in buckets.items():
+        values.sort()
+        estimates[key] = {
+            "samples": len(values),
+            "p50": round(percentile(values, 0.5)),
+            "p80": round(percentile(values, 0.8)),
+        }
+    return estimates
+
+
+def _slot_minutes(seconds: float, turnover_minutes: int) -> int:
+    minutes = seconds / 60.0 + turnover_minutes
+    return int(math.ceil(minutes / SLOT_ROUNDING_MINUTES) * SLOT_ROUNDING_MINUTES)
+
+
+def estimated_slot_minutes(
+    estimates: Dict[str, Dict[str, Any]],
+    which: str = "p80",
+    turnover_minutes: int = DEFAULT_TURNOVER_MINUTES,
+    min_samples: int = MIN_SAMPLES,
+) -> Dict[str, int]:
+    """Scheduler slot keys -> minutes, for keys backed by at least ``min_samples``.
+
+    Slot lengths are the chosen percentile plus court turnover, rounded up to
+    five minutes. Keys without enough history are left out so the scheduler
+    falls back to the next coarser estimate and finally to the fixed config.
+    """
+    if which not in PERCENTILES:
+        raise ValueError(f"unknown percentile {which!r}")
+    slots: Dict[str, int] = {}
+    for key, stats in estimates.items():
+        if stats["samples"] < min_samples:
+            continue
+        if key == "":
+            slots["default"] = _slot_minutes(stats[which], turnover_minutes)
+        elif key in ("group", "knockout"):
+            slots[f"default:{key}"] = _slot_minutes(stats[which], turnover_minutes)
+        elif key.split(":", 1)[0] in _BAND_COURT_ORDER:
+            slots[key] = _slot_minutes(stats[which], turnover_minutes)
+    return slots
+
+
+def merge_estimates(primary: Dict[str, Dict[str, Any]], fallback: Dict[str, Dict[str, Any]], min_samples: int = MIN_SAMPLES) -> Dict[str, Dict[str, Any]]:
+    """Per key, keep the tournament's own estimate when it has enough samples."""
+    merged = dict(fallback)
+    for key, stats in primary.items():
+        if stats["samples"] >= min_samples or key not in merged:
+            merged[key] = stats
+    return merged
+
+
+class DurationEstimateCache:
+    """Per-tournament estimates, rebuilt when the history fingerprint changes."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: Dict[Any, Tuple[Any, Dict[str, Dict[str, Any]]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any, fingerprint: Any, build) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self.hits += 1
+                return cached[1]
+        estimates = build()
+        with self._lock:
+            self._entries[key] = (fingerprint, estimates)
+            self.misses += 1
+        return estimates
+
+    def invalidate(self, key: Any = None) -> None:
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+duration_cache = DurationEstimateCache()
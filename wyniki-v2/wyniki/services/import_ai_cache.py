@@ -0,0 +1,95 @@
+"""Disk cache and per-tournament concurrency cap for AI-assisted import parsing.
+
+Each request to the import model is keyed by a SHA-256 of everything that
+shapes its answer (model, prompt). The parsed answer is stored as one JSON
+file in the data volume (next to the database unless
+``import_players_ai_cache_dir`` says otherwise). Re-uploading the same list
+then costs no remote calls. Entries older than
+``import_players_ai_cache_ttl_days`` count as misses and are overwritten.
+
+Large lists are split into chunks that are requested in parallel. A
+per-tournament semaphore caps how many calls one tournament has in flight,
+across concurrent previews, at ``import_players_ai_concurrency``.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ..config import logger, settings
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_slots: Dict[int, Tuple[int, threading.BoundedSemaphore]] = {}
+_slots_lock = threading.Lock()
+
+
+def content_key(*parts: Any) -> str:
+    """Stable hash of the request parts (strings, or JSON-serializable values)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        text = part if isinstance(part, str) else json.dumps(part, sort_keys=True, ensure_ascii=False)
+        digest.update(text.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _cache_dir() -> Path:
+    configured = str(settings.import_players_ai_cache_dir or "").strip()
+    return Path(configured) if configured else Path(settings.database_path).parent / "ai-import-cache"
+
+
+def cache_get(key: str) -> Optional[Any]:
+    path = _cache_dir() / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > int(settings.import_players_ai_cache_ttl_days) * 86400:
+            return None
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def cache_put(key: str, value: Any) -> None:
+    directory = _cache_dir()
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename: concurrent readers never see a half-written entry.
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{key[:8]}-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(value, handle, ensure_ascii=False)
+        os.replace(tmp_name, directory / f"{key}.json")
+    except OSError as exc:
+        logger.warning("import_ai_cache_write_failed", error=str(exc))
+
+
+def _tournament_slots(tournament_id: Optional[int]) -> threading.BoundedSemaphore:
+    limit = max(1, int(settings.import_players_ai_concurrency))
+    with _slots_lock:
+        entry = _slots.get(int(tournament_id or 0))
+        if entry is None or entry[0] != limit:
+            entry = _slots[int(tournament_id or 0)] = (limit, threading.BoundedSemaphore(limit))
+        return entry[1]
+
+
+def map_limited(tournament_id: Optional[int], fn: Callable[[T], R], items: List[T]) -> List[R]:
+    """``[fn(item) for item in items]``, in parallel, within the tournament's call cap."""
+    slots = _tournament_slots(tournament_id)
+
+    def _call(item: T) -> R:
+        with slots:
+            return fn(item)
+
+    if len(items) <= 1:
+        return [_call(item) for item in items]
+    workers = min(len(items), max(1, int(settings.import_players_ai_concurrency)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import-ai") as pool:
+        return list(pool.map(_call, items))
@@ -0,0 +1,39 @@
+"""Accent-insensitive name keys for matching the same person across imports.
+
+``fold_name`` removes diacritics (including letters Unicode does not
+decompose, such as ``ł``, ``ø`` and ``ß``), case-folds, and collapses
+whitespace. ``"  Łukasz  Żółć "`` and ``"LUKASZ zolc"`` get the same key.
+The ``global_players.first_name_key`` / ``last_name_key`` columns store
+these keys and are indexed, so registry lookups don't compute anything per
+row in SQL.
+"""
+from __future__ import annotations
+
+import unicodedata
+from functools import lru_cache
+from typing import Any
+
+_UNDECOMPOSABLE = str.maketrans({
+    "ł": "l", "Ł": "L",
+    "ø": "o", "Ø": "O",
+    "đ": "d", "Đ": "D",
+    "ð": "d", "Ð": "D",
+    "ħ": "h", "Ħ": "H",
+    "ı": "i",
+    "ß": "ss", "ẞ": "SS",
+    "æ": "ae", "Æ": "AE",
+    "œ": "oe", "Œ": "OE",
+    "þ": "th", "Þ": "TH",
+})
+
+
+@lru_cache(maxsize=16384)
+def _fold(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text.translate(_UNDECOMPOSABLE))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def fold_name(value: Any) -> str:
+    """Matching key of a first or last name ("" for blank)."""
+    return _fold(str(value or ""))
@@ -46,7 +46,14 @@ office_event_broker = OfficeEventBroker()
 
 
 def emit_office_invalidation(tournament_id: int, scopes: list[str] | None = None) -> None:
-    """Notify office sessions that tournament-derived data changed."""
+    """Notify office sessions that tournament-derived data changed.
+
+    The same writes make the tournament's cached public schedule stale, so it
+    is dropped here as well.
+    """
+    from ..database import invalidate_public_schedule_cache
+
+    invalidate_public_schedule_cache(int(tournament_id))
     office_event_broker.broadcast(
         int(tournament_id),
         {
@@ -55,3 +62,20 @@ def emit_office_invalidation(tournament_id: int, scopes: list[str] | None = None
             "timestamp": datetime.now(timezone.utc).isoformat(),
         },
     )
+
+
+def emit_office_event(tournament_id: int, event: str, data: dict[str, Any]) -> None:
+    """Send a named, informational event (e.g. import progress) to office sessions.
+
+    Unlike :func:`emit_office_invalidation` this does not ask clients to
+    refresh; streams forward it under its own SSE event name.
+    """
+    office_event_broker.broadcast(
+        int(tournament_id),
+        {
+            "tournament_id": int(tournament_id),
+            "event": event,
+            **data,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+    )
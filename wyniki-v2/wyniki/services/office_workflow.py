@@ -27,6 +27,7 @@ from ..database import (
     _is_knockout_placeholder_name,
 )
 from ..db_models import Match, MatchHistory, TournamentSchedule, db, utc_now_iso
+from .schedule_conflicts import schedule_conflicts
 
 
 class OfficeWorkflowError(ValueError):
@@ -712,6 +713,7 @@ def _build_office_dashboard(tournament_id: int) -> Dict[str, Any]:
         },
         "matches": office_matches[:300],
         "schedule": schedule,
+        "schedule_conflicts": schedule_conflicts.conflicts(tournament_id),
         "courts": fetch_courts_for_tournament(tournament_id),
         "quick_info": get_tournament_quick_info(tournament_id),
     }
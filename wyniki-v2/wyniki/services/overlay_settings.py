@@ -6,16 +6,32 @@ Also stores tournament branding (logo + name) and court label settings.
 
 Settings are persisted to the SQLite database (app_settings table)
 so they survive container restarts.
+
+The logo is not kept inline: uploaded data-URLs are written once to
+``overlay-assets/<sha256>.<ext>`` in the data volume and the settings keep
+only the asset URL. Every write bumps ``version`` and re-serializes the
+document snapshot once, so polls are answered from that snapshot and its
+ETag (mostly with 304) instead of deep-copying the settings each time.
+
+Writers also publish an ``overlay_settings`` event on the public SSE
+stream: the new version plus the overlays that changed (``overlays``) or
+were removed (``removed``). Overlays apply it directly when it directly
+follows the version they hold, and refetch otherwise.
 """
 from __future__ import annotations
 
+import base64
+import binascii
 import copy
+import hashlib
 import json
 import threading
-from typing import Any, Dict
+from pathlib import Path
+from typing import Any, Dict, Tuple
 
-from ..config import logger
+from ..config import logger, settings
 from ..database import fetch_app_settings, upsert_app_settings
+from .event_broker import event_broker
 
 # ---------- thread-safety ----------
 _OVERLAY_LOCK = threading.Lock()
@@ -24,6 +40,16 @@ _OVERLAY_LOCK = threading.Lock()
 _DB_KEY = "overlay_settings"
 _STATS_TOGGLE_OVERLAY_IDS = ("1", "2", "3", "4")
 
+# ---------- content-addressed assets ----------
+ASSET_URL_PREFIX = "/api/overlay/assets/"
+_ASSET_EXTENSIONS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "image/svg+xml": "svg",
+}
+
 
 # ---------- element builders ----------
 
@@ -170,10 +196,56 @@ _DEFAULT_SETTINGS: Dict[str, Any] = {
 # ---------- live state (cache) ----------
 _overlay_settings: Dict[str, Any] = {}
 _loaded_from_db: bool = False
+_document: Tuple[str, Dict[str, Any]] = ("", {})
+
+
+def asset_dir() -> Path:
+    return Path(settings.database_path).parent / "overlay-assets"
 
 
-def _save_to_db() -> None:
+def store_logo_asset(value: Any) -> Any:
+    """Turn a ``data:image/...;base64,`` logo into a stored asset and return its URL.
+
+    Anything else (an existing URL, ``None``) is returned unchanged. The file
+    name is the SHA-256 of the image bytes, so uploading the same logo again
+    reuses the file and the URL never needs revalidating.
+    """
+    if not isinstance(value, str) or not value.startswith("data:"):
+        return value
+    header, _, encoded = value.partition(",")
+    mime = header[len("data:"):].split(";", 1)[0].strip().lower()
+    extension = _ASSET_EXTENSIONS.get(mime)
+    if extension is None or ";base64" not in header:
+        raise ValueError("Logo must be a base64 PNG, JPEG, GIF, WebP or SVG data-URL")
+    try:
+        content = base64.b64decode(encoded, validate=True)
+    except (binascii.Error, ValueError) as exc:
+        raise ValueError("Logo data-URL is not valid base64") from exc
+
+    name = f"{hashlib.sha256(content).hexdigest()}.{extension}"
+    target = asset_dir() / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = target.with_suffix(".tmp")
+        partial.write_bytes(content)
+        partial.replace(target)
+        logger.info("overlay_asset_stored", name=name, bytes=len(content))
+    return ASSET_URL_PREFIX + name
+
+
+def _refresh_document() -> None:
+    """Snapshot the settings for readers and derive their ETag. Must be called under _OVERLAY_LOCK."""
+    global _document
+    snapshot = copy.deepcopy(_overlay_settings)
+    digest = hashlib.sha256(json.dumps(snapshot, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+    _document = (f"overlay-{snapshot.get('version') or 0}-{digest[:16]}", snapshot)
+
+
+def _save_to_db(bump: bool = True) -> None:
     """Persist current settings to the database. Must be called under _OVERLAY_LOCK."""
+    if bump:
+        _overlay_settings["version"] = int(_overlay_settings.get("version") or 0) + 1
+    _refresh_document()
     try:
         upsert_app_settings({_DB_KEY: json.dumps(_overlay_settings, ensure_ascii=False)})
     except Exception as e:
@@ -191,6 +263,12 @@ def _load_from_db() -> None:
         if raw:
             _overlay_settings = json.loads(raw)
             logger.info("overlay_settings_loaded_from_db")
+            logo = _overlay_settings.get("tournament_logo")
+            if isinstance(logo, str) and logo.startswith("data:"):
+                # Older installs kept the logo inline in the JSON blob.
+                _overlay_settings["tournament_logo"] = store_logo_asset(logo)
+                _save_to_db()
+                logger.info("overlay_logo_moved_to_asset", url=_overlay_settings["tournament_logo"])
         else:
             _overlay_settings = copy.deepcopy(_DEFAULT_SETTINGS)
             _save_to_db()
@@ -198,6 +276,7 @@ def _load_from_db() -> None:
     except Exception as e:
         logger.error("overlay_settings_load_error", error=str(e))
         _overlay_settings = copy.deepcopy(_DEFAULT_SETTINGS)
+    _refresh_document()
     _loaded_from_db = True
 
 
@@ -214,21 +293,61 @@ def get_overlay_settings() -> Dict[str, Any]:
         return copy.deepcopy(_overlay_settings)
 
 
+def _settings_event(changed: list[str] | None = None, removed: list[str] | None = None,
+                    branding: bool = False) -> Dict[str, Any]:
+    """SSE payload for the current version. Must be called under _OVERLAY_LOCK."""
+    etag, snapshot = _document
+    event: Dict[str, Any] = {"type": "overlay_settings", "version": snapshot.get("version"), "etag": etag}
+    if changed is not None or removed is not None or branding:
+        overlays = snapshot.get("overlays") or {}
+        event["overlays"] = {oid: overlays[oid] for oid in changed or [] if oid in overlays}
+        event["removed"] = list(removed or [])
+        if branding:
+            event["tournament_logo"] = snapshot.get("tournament_logo")
+            event["tournament_name"] = snapshot.get("tournament_name", "")
+    return event
+
+
+def overlay_settings_version_event() -> Dict[str, Any]:
+    """Version-only ``overlay_settings`` event, sent when a stream connects."""
+    with _OVERLAY_LOCK:
+        _ensure_defaults()
+        return _settings_event()
+
+
+def get_overlay_settings_document() -> Tuple[str, Dict[str, Any]]:
+    """Return ``(etag, settings)``: a snapshot taken once per write. Callers must not mutate it."""
+    with _OVERLAY_LOCK:
+        _ensure_defaults()
+        return _document
+
+
 def update_overlay_settings(new: Dict[str, Any]) -> Dict[str, Any]:
-    """Merge *new* into current settings, persist, and return updated copy."""
+    """Merge *new* into current settings, persist, and return updated copy.
+
+    A data-URL ``tournament_logo`` is stored as an asset first (see
+    :func:`store_logo_asset`); an invalid one raises ``ValueError``.
+    """
     global _overlay_settings
+    logo = store_logo_asset(new.get("tournament_logo")) if "tournament_logo" in new else None
+    changed: list[str] = []
     with _OVERLAY_LOCK:
         _ensure_defaults()
-        for key in ("tournament_logo", "tournament_name"):
-            if key in new:
-                _overlay_settings[key] = new[key]
+        if "tournament_logo" in new:
+            _overlay_settings["tournament_logo"] = logo
+        if "tournament_name" in new:
+            _overlay_settings["tournament_name"] = new["tournament_name"]
         if "overlays" in new and isinstance(new["overlays"], dict):
             for oid, odata in new["overlays"].items():
                 if isinstance(odata, dict):
                     _overlay_settings.setdefault("overlays", {})[oid] = odata
+                    changed.append(str(oid))
         _save_to_db()
         logger.info("overlay_settings_updated")
-        return copy.deepcopy(_overlay_settings)
+        event = _settings_event(changed, branding="tournament_logo" in new or "tournament_name" in new)
+        updated = copy.deepcopy(_overlay_settings)
+    event_broker.broadcast(event)
+    return updated
 
 
 def set_overlay_stats_visibility(active: bool, mode: Any = None) -> Dict[str, Any]:
@@ -271,12 +390,15 @@ def set_overlay_stats_visibility(active: bool, mode: Any = None) -> Dict[str, An
             overlay_ids=touched_overlay_ids,
             mode=normalized_mode,
         )
-        return {
+        event = _settings_event(touched_overlay_ids)
+        result = {
             "active": bool(active),
             "overlay_ids": touched_overlay_ids,
             "mode": normalized_mode,
             "settings": copy.deepcopy(_overlay_settings),
         }
+    event_broker.broadcast(event)
+    return result
 
 
 def delete_overlay(overlay_id: str) -> bool:
@@ -285,9 +407,11 @@ def delete_overlay(overlay_id: str) -> bool:
     with _OVERLAY_LOCK:
         _ensure_defaults()
         overlays = _overlay_settings.get("overlays", {})
-        if overlay_id in overlays:
-            del overlays[overlay_id]
-            _save_to_db()
-            logger.info("overlay_deleted", overlay_id=overlay_id)
-            return True
-        return False
+        if overlay_id not in overlays:
+            return False
+        del overlays[overlay_id]
+        _save_to_db()
+        logger.info("overlay_deleted", overlay_id=overlay_id)
+        event = _settings_event(removed=[str(overlay_id)])
+    event_broker.broadcast(event)
+    return True
@@ -0,0 +1,329 @@
+"""Streaming player import jobs for uploaded CSV, XLSX and text files.
+
+Uploads are copied to disk in fixed-size pieces and processed by a
+background job, so the request returns at once and large federation exports
+don't hit the proxy timeout. The job reads rows lazily
+(:func:`iter_upload_rows`), passes each one through the route's
+``normalize`` callable, and hands ``player_import_chunk_size`` valid rows at
+a time to ``write`` (the bulk import path). Per-row outcomes are appended
+to a CSV result file rather than kept in memory, so memory stays flat
+whatever the file size.
+
+After each chunk, office SSE listeners get a ``player_import`` event with
+the job's counters. When the job ends, the usual invalidation tells them to
+refresh players and groups.
+"""
+from __future__ import annotations
+
+import csv
+import shutil
+import tempfile
+import threading
+import time
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from uuid import uuid4
+
+from flask import url_for
+
+from ..config import logger, settings
+from .name_keys import fold_name
+from .office_event_broker import emit_office_event, emit_office_invalidation
+
+_COPY_BUFFER = 64 * 1024
+_SNIFF_BYTES = 64 * 1024
+_RESULT_COLUMNS = ("line", "name", "status", "global", "global_player_id", "message")
+_POSITIONAL_COLUMNS = ("name", "category", "country", "gender")
+_HEADER_ALIASES = {
+    "name": "name", "player": "name", "zawodnik": "name", "zawodniczka": "name",
+    "imie i nazwisko": "name", "full name": "name",
+    "first name": "first_name", "firstname": "first_name", "imie": "first_name",
+    "last name": "last_name", "lastname": "last_name", "surname": "last_name",
+    "nazwisko": "last_name",
+    "category": "category", "kategoria": "category", "kat": "category",
+    "country": "country", "kraj": "country", "panstwo": "country", "nationality": "country",
+    "gender": "gender", "sex": "gender", "plec": "gender",
+}
+
+RowNormalizer = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+ChunkWriter = Callable[[List[Dict[str, Any]]], Dict[str, Any]]
+
+
+class ImportFormatError(ValueError):
+    """The uploaded file cannot be read as CSV, XLSX or text."""
+
+
+def _import_dir() -> Path:
+    path = Path(settings.player_import_dir or Path(tempfile.gettempdir()) / "wyniki-imports")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def save_upload(stream, filename: str = "") -> Path:
+    """Copy an uploaded file to the import directory without reading it whole."""
+    suffix = Path(filename or "").suffix.lower()[:8]
+    with tempfile.NamedTemporaryFile("wb", dir=_import_dir(), prefix="upload-", suffix=suffix, delete=False) as out:
+        shutil.copyfileobj(stream, out, _COPY_BUFFER)
+        return Path(out.name)
+
+
+def _is_xlsx(path: Path, filename: str) -> bool:
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        return True
+    with open(path, "rb") as handle:
+        return handle.read(4) == b"PK\x03\x04"
+
+
+def _text_encoding(path: Path) -> str:
+    with open(path, "rb") as handle:
+        sample = handle.read(_SNIFF_BYTES)
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # A multi-byte character cut at the sample boundary is still UTF-8.
+        if exc.start < len(sample) - 3:
+            return "cp1250"
+    return "utf-8-sig"
+
+
+def _header_mapping(cells: Iterable[Any]) -> Optional[List[Optional[str]]]:
+    mapping = [_HEADER_ALIASES.get(fold_name(cell).replace("_", " ")) for cell in cells]
+    if any(field in {"name", "first_name", "last_name"} for field in mapping):
+        return mapping
+    return None
+
+
+def _structured_rows(rows: Iterator[tuple[int, List[Any]]]) -> Iterator[Dict[str, Any]]:
+    """Map cell rows to player fields using a recognised header row, or fixed positions."""
+    first = next(rows, None)
+    if first is None:
+        return
+    mapping = _header_mapping(first[1])
+    if mapping is None:
+        mapping = list(_POSITIONAL_COLUMNS)
+        rows = chain([first], rows)
+    for line_number, cells in rows:
+        row = {"line_number": line_number}
+        for field, value in zip(mapping, cells):
+            if field and value is not None and str(value).strip():
+                row[field] = str(value).strip()
+        if len(row) > 1:
+            yield row
+
+
+def _csv_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    encoding = _text_encoding(path)
+    with open(path, newline="", encoding=encoding, errors="replace") as handle:
+        sample = handle.read(4096)
+        handle.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.reader(handle, dialect)
+        yield from _structured_rows((reader.line_num, cells) for cells in reader)
+
+
+def _xlsx_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:
+        raise ImportFormatError("XLSX import needs openpyxl installed; upload a CSV export instead") from exc
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        yield from _structured_rows(
+            (line_number, list(cells))
+            for line_number, cells in enumerate(sheet.iter_rows(values_only=True), start=1)
+        )
+    finally:
+        workbook.close()
+
+
+def _text_rows(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding=_text_encoding(path), errors="replace") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if line.strip():
+                yield {"line_number": line_number, "raw_line": line.rstrip("\r\n")}
+
+
+def iter_upload_rows(path: Path, filename: str = "") -> Iterator[Dict[str, Any]]:
+    """Rows of an uploaded file, read lazily.
+
+    CSV and XLSX rows become dicts of player fields (``name``,
+    ``first_name``, ``last_name``, ``category``, ``country``, ``gender``),
+    from a header row when one is recognised and from fixed positions
+    otherwise. Other files are read as text: one ``raw_line`` per line.
+    Every row carries its ``line_number``.
+    """
+    path = Path(path)
+    if _is_xlsx(path, filename):
+        return _xlsx_rows(path)
+    if filename.lower().endswith((".csv", ".tsv")):
+        return _csv_rows(path)
+    return _text_rows(path)
+
+
+class PlayerImportJob:
+    """State of one background import; counters only, per-row results go to ``result_path``."""
+
+    def __init__(self, tournament_id: int, filename: str) -> None:
+        self.id = uuid4().hex
+        self.tournament_id = int(tournament_id)
+        self.filename = filename
+        self.status = "queued"
+        self.error = ""
+        self.processed = 0
+        self.inserted = 0
+        self.skipped = 0
+        self.invalid = 0
+        self.matched_global = 0
+        self.created_global = 0
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result_path = _import_dir() / f"result-{self.id}.csv"
+        self._done = threading.Event()
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "tournament_id": self.tournament_id,
+            "filename": self.filename,
+            "status": self.status,
+            "error": self.error,
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "skipped": self.skipped,
+            "invalid": self.invalid,
+            "matched_global": self.matched_global,
+            "created_global": self.created_global,
+        }
+
+    def _write_chunk(self, chunk: List[Dict[str, Any]], write: ChunkWriter, results) -> None:
+        outcome = write(chunk)
+        self.inserted += int(outcome.get("inserted", 0))
+        self.skipped += int(outcome.get("skipped", 0))
+        self.matched_global += int(outcome.get("matched_global", 0))
+        self.created_global += int(outcome.get("created_global", 0))
+        for row in outcome.get("rows", []):
+            source = chunk[row["index"]]
+            results.writerow([
+                source.get("line_number", ""), row.get("name", ""), row.get("status", ""),
+                row.get("global") or "", row.get("global_player_id") or "", source.get("message", ""),
+            ])
+
+    def run(self, rows: Iterable[Dict[str, Any]], normalize: RowNormalizer, write: ChunkWriter) -> None:
+        chunk_size = max(1, int(settings.player_import_chunk_size))
+        self.status = "running"
+        try:
+            with open(self.result_path, "w", newline="", encoding="utf-8") as handle:
+                results = csv.writer(handle)
+                results.writerow(_RESULT_COLUMNS)
+                chunk: List[Dict[str, Any]] = []
+                for row in rows:
+                    try:
+                        player = normalize(row)
+                    except ValueError as exc:
+                        self.invalid += 1
+                        self.processed += 1
+                        results.writerow([row.get("line_number", ""), row.get("name", ""), "invalid", "", "", str(exc)])
+                        continue
+                    if player is None:
+                        continue
+                    player.setdefault("line_number", row.get("line_number", ""))
+                    chunk.append(player)
+                    if len(chunk) >= chunk_size:
+                        self._write_chunk(chunk, write, results)
+                        self.processed += len(chunk)
+                        chunk = []
+                        self._publish()
+                        time.sleep(0)
+                if chunk:
+                    self._write_chunk(chunk, write, results)
+                    self.processed += len(chunk)
+            self.status = "done"
+        except Exception as exc:
+            self.status = "failed"
+            self.error = str(exc) if isinstance(exc, ImportFormatError) else "Import failed"
+            logger.error("player_import_failed", job_id=self.id, tournament_id=self.tournament_id, error=str(exc))
+        finally:
+            self.finished_at = time.time()
+            self._done.set()
+            self._publish()
+            if self.inserted:
+                emit_office_invalidation(self.tournament_id, ["players", "groups", "dashboard"])
+        logger.info("player_import_finished", **self.to_dict())
+
+    def _publish(self) -> None:
+        emit_office_event(self.tournament_id, "player_import", {"job": self.to_dict()})
+
+
+class PlayerImportJobs:
+    """Running and recently finished import jobs of this process."""
+
+    def __init__(self) -> None:
+        self._jobs: Dict[str, PlayerImportJob] = {}
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        tournament_id: int,
+        source_path: Path,
+        filename: str,
+        normalize: RowNormalizer,
+        write: ChunkWriter,
+    ) -> PlayerImportJob:
+        """Start importing ``source_path`` in the background; the file is removed when done."""
+        self._prune()
+        job = PlayerImportJob(tournament_id, filename)
+        with self._lock:
+            self._jobs[job.id] = job
+
+        def _run() -> None:
+            try:
+                job.run(iter_upload_rows(source_path, filename), normalize, write)
+            finally:
+                Path(source_path).unlink(missing_ok=True)
+
+        threading.Thread(target=_run, name=f"player-import-{job.id[:8]}", daemon=True).start()
+        return job
+
+    def get(self, tournament_id: int, job_id: str) -> Optional[PlayerImportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None or job.tournament_id != int(tournament_id):
+            return None
+        return job
+
+    def _prune(self) -> None:
+        cutoff = time.time() - int(settings.player_import_result_ttl_seconds)
+        with self._lock:
+            expired = [job for job in self._jobs.values() if job.finished_at and job.finished_at < cutoff]
+            for job in expired:
+                self._jobs.pop(job.id, None)
+        for job in expired:
+            job.result_path.unlink(missing_ok=True)
+
+
+player_import_jobs = PlayerImportJobs()
+
+
+def player_import_job_payload(job: PlayerImportJob) -> Dict[str, Any]:
+    """Job state plus the admin URLs for polling it and downloading per-row results."""
+    return {
+        "job": job.to_dict(),
+        "status_url": url_for(
+            "admin_tournaments.get_player_import_job", tournament_id=job.tournament_id, job_id=job.id,
+        ),
+        "result_url": url_for(
+            "admin_tournaments.download_player_import_result", tournament_id=job.tournament_id, job_id=job.id,
+        ),
+    }
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..db_models import GlobalPlayer, Player, Tournament
+from .name_keys import fold_name
 
 
 def split_player_name(name: str = "", first_name: str = "", last_name: str = "") -> tuple[str, str, str]:
@@ -66,9 +66,9 @@ def find_or_create_global_player(
         return None
 
     global_player = session.query(GlobalPlayer).filter(
-        func.lower(func.trim(GlobalPlayer.first_name)) == first_name.lower(),
-        func.lower(func.trim(GlobalPlayer.last_name)) == last_name.lower(),
-    ).first()
+        GlobalPlayer.last_name_key == fold_name(last_name),
+        GlobalPlayer.first_name_key == fold_name(first_name),
+    ).order_by(GlobalPlayer.id).first()
 
     if global_player:
         if not (global_player.gender or "").strip() and gender:
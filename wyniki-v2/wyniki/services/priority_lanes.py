@@ -0,0 +1,160 @@
+"""Request lanes: keep umpire writes responsive while heavy public reads run.
+
+Every request is classified into one of three lanes:
+
+- ``fast``: umpire ingestion (``/api/matches*``, ``/api/match-events``). These
+  stay on the event loop and get SSE admission headroom (see ``sse_registry``).
+- ``cpu``: read endpoints marked with :func:`cpu_lane`. Their view body runs in
+  a bounded native threadpool, so long pure-Python loops no longer block the
+  gevent hub and every other greenlet on the worker.
+- ``default``: everything else, handled inline as before.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+from flask import copy_current_request_context, current_app, g, request
+from prometheus_client.core import GaugeMetricFamily, HistogramMetricFamily
+
+from ..config import settings
+from .sse_registry import is_priority_path
+
+LANE_FAST = "fast"
+LANE_CPU = "cpu"
+LANE_DEFAULT = "default"
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float("inf"))
+
+_pool = None
+_pool_lock = threading.Lock()
+_in_worker = threading.local()
+
+
+def _cpu_pool():
+    """Lazily create the bounded threadpool; ``None`` disables offloading."""
+    global _pool
+    workers = int(settings.cpu_lane_workers)
+    if workers <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            from gevent.threadpool import ThreadPool
+
+            _pool = ThreadPool(workers)
+        return _pool
+
+
+def cpu_lane(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Run a CPU-heavy read view in the bounded threadpool.
+
+    The caller's greenlet waits cooperatively while the view runs in a native
+    thread with the same app and request context. When all workers are busy
+    new requests queue in the pool instead of piling onto the event loop.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        pool = _cpu_pool()
+        if pool is None or getattr(_in_worker, "active", False):
+            return view(*args, **kwargs)
+
+        @copy_current_request_context
+        def run():
+            _in_worker.active = True
+            try:
+                return view(*args, **kwargs)
+            finally:
+                _in_worker.active = False
+
+        return pool.spawn(run).get()
+
+    wrapper.request_lane = LANE_CPU
+    return wrapper
+
+
+def classify_request(path: str, view: Optional[Callable[..., Any]] = None) -> str:
+    if is_priority_path(path):
+        return LANE_FAST
+    if view is not None and getattr(view, "request_lane", None) == LANE_CPU:
+        return LANE_CPU
+    return LANE_DEFAULT
+
+
+def request_lane() -> str:
+    """Lane of the current request, resolved from its path and view function."""
+    view = current_app.view_functions.get(request.endpoint or "")
+    return classify_request(request.path, view)
+
+
+class LaneStats:
+    """Per-lane in-flight counts and latency histograms, exported to Prometheus."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[str, int] = {}
+        self._buckets: dict[str, list[int]] = {}
+        self._sums: dict[str, float] = {}
+
+    def started(self, lane: str) -> None:
+        with self._lock:
+            self._inflight[lane] = self._inflight.get(lane, 0) + 1
+
+    def finished(self, lane: str) -> None:
+        with self._lock:
+            self._inflight[lane] = max(0, self._inflight.get(lane, 0) - 1)
+
+    def observe(self, lane: str, seconds: float) -> None:
+        with self._lock:
+            buckets = self._buckets.setdefault(lane, [0] * len(_LATENCY_BUCKETS))
+            for index, bound in enumerate(_LATENCY_BUCKETS):
+                if seconds <= bound:
+                    buckets[index] += 1
+            self._sums[lane] = self._sums.get(lane, 0.0) + seconds
+
+    def collect(self):
+        with self._lock:
+            inflight = dict(self._inflight)
+            buckets = {lane: list(values) for lane, values in self._buckets.items()}
+            sums = dict(self._sums)
+
+        gauge = GaugeMetricFamily("wyniki_lane_inflight_requests", "In-flight requests per lane", labels=["lane"])
+        for lane, count in sorted(inflight.items()):
+            gauge.add_metric([lane], count)
+        yield gauge
+
+        histogram = HistogramMetricFamily(
+            "wyniki_lane_request_seconds",
+            "Request latency per lane, including threadpool queueing",
+            labels=["lane"],
+        )
+        for lane, values in sorted(buckets.items()):
+            histogram.add_metric(
+                [lane],
+                [(str(bound) if bound != float("inf") else "+Inf", count) for bound, count in zip(_LATENCY_BUCKETS, values)],
+                sums[lane],
+            )
+        yield histogram
+
+
+lane_stats = LaneStats()
+
+
+def begin_request_lane() -> None:
+    lane = request_lane()
+    g.request_lane = lane
+    g.request_lane_started = time.perf_counter()
+    lane_stats.started(lane)
+
+
+def end_request_lane() -> Optional[str]:
+    lane = g.pop("request_lane", None)
+    started = g.pop("request_lane_started", None)
+    if lane is None:
+        return None
+    lane_stats.finished(lane)
+    if started is not None:
+        lane_stats.observe(lane, time.perf_counter() - started)
+    return lane
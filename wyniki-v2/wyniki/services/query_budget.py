@@ -0,0 +1,294 @@
+"""Per-request SQL statement counts and time, with a budget and N+1 hints.
+
+Both database paths feed the same counters: ``db_conn`` connections are
+``InstrumentedConnection`` objects, and SQLAlchemy engines report through
+cursor-execute events (:func:`instrument_sqlalchemy`). Counts live on the
+WSGI environ, so a view moved into the ``cpu`` lane threadpool still adds
+to its own request.
+
+At the end of a request the totals go into per-endpoint Prometheus
+histograms. A request over ``query_budget_statements`` /
+``query_budget_seconds`` logs ``query_budget_exceeded``; one statement
+repeated ``query_repeat_threshold`` times (a query inside a loop) logs
+``query_repeat_suspected`` even within budget.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from flask import has_request_context, request
+from prometheus_client.core import HistogramMetricFamily
+
+from ..config import logger, settings
+
+_ENVIRON_KEY = "wyniki.query_stats"
+_STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 250, 500, float("inf"))
+_SECONDS_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, float("inf"))
+
+
+class QueryStats:
+    """Statements and SQL time of one request (or one :func:`capture_queries` block)."""
+
+    __slots__ = ("statements", "seconds", "_repeats")
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.seconds = 0.0
+        self._repeats: Dict[str, int] = {}
+
+    def record(self, sql: str, seconds: float) -> None:
+        self.statements += 1
+        self.seconds += seconds
+        self._repeats[sql] = self._repeats.get(sql, 0) + 1
+
+    def add_time(self, seconds: float) -> None:
+        self.seconds += seconds
+
+    def most_repeated(self) -> Tuple[str, int]:
+        """The statement text issued most often, whitespace-collapsed, and its count."""
+        if not self._repeats:
+            return "", 0
+        sql, count = max(self._repeats.items(), key=lambda item: item[1])
+        return " ".join(sql.split())[:200], count
+
+    def count(self, fragment: str) -> int:
+        """Statements whose text contains ``fragment`` (case-insensitive)."""
+        fragment = fragment.lower()
+        return sum(count for sql, count in self._repeats.items() if fragment in sql.lower())
+
+
+_captures: List[QueryStats] = []
+_captures_lock = threading.Lock()
+
+
+def _request_stats() -> Optional[QueryStats]:
+    if not has_request_context():
+        return None
+    stats = request.environ.get(_ENVIRON_KEY)
+    if stats is None:
+        stats = request.environ[_ENVIRON_KEY] = QueryStats()
+    return stats
+
+
+def record_query(sql: str, seconds: float) -> None:
+    stats = _request_stats()
+    if stats is not None:
+        stats.record(sql, seconds)
+    if _captures:
+        with _captures_lock:
+            for capture in _captures:
+                capture.record(sql, seconds)
+
+
+def _record_fetch(seconds: float) -> None:
+    stats = _request_stats()
+    if stats is not None:
+        stats.add_time(seconds)
+    if _captures:
+        with _captures_lock:
+            for capture in _captures:
+                capture.add_time(seconds)
+
+
+@contextmanager
+def capture_queries() -> Iterator[QueryStats]:
+    """Count every statement issued inside the block, in or out of a request."""
+    stats = QueryStats()
+    with _captures_lock:
+        _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        with _captures_lock:
+            _captures.remove(stats)
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """``sqlite3.Cursor`` that reports each statement and its step time."""
+
+    def execute(self, sql, parameters=()):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record_query(sql, time.perf_counter() - started)
+
+    def executemany(self, sql, seq_of_parameters):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record_query(sql, time.perf_counter() - started)
+
+    def executescript(self, sql_script):
+        started = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            record_query(sql_script, time.perf_counter() - started)
+
+    # SQLite produces rows lazily, so fetching is part of the statement's cost.
+    def fetchone(self):
+        started = time.perf_counter()
+        try:
+            return super().fetchone()
+        finally:
+            _record_fetch(time.perf_counter() - started)
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        try:
+            return super().fetchmany(self.arraysize if size is None else size)
+        finally:
+            _record_fetch(time.perf_counter() - started)
+
+    def fetchall(self):
+        started = time.perf_counter()
+        try:
+            return super().fetchall()
+        finally:
+            _record_fetch(time.perf_counter() - started)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """``sqlite3.Connection`` whose cursors, and execute shortcuts, are instrumented."""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+
+# The start time rides on the statement's execution context rather than on the
+# pooled connection, so a statement that raises cannot leave a stale entry behind.
+_STARTED_ATTR = "_wyniki_query_started"
+
+
+def _elapsed(context) -> float:
+    started = getattr(context, _STARTED_ATTR, None)
+    return time.perf_counter() - started if started is not None else 0.0
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    if context is not None:
+        setattr(context, _STARTED_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(_conn, _cursor, statement, _parameters, context, _executemany):
+    record_query(statement, _elapsed(context))
+
+
+def _handle_error(exception_context) -> None:
+    # after_cursor_execute does not fire for a failing statement; count it here,
+    # as InstrumentedCursor does for raw connections.
+    context = exception_context.execution_context
+    if exception_context.statement is not None and hasattr(context, _STARTED_ATTR):
+        record_query(exception_context.statement, _elapsed(context))
+
+
+def instrument_sqlalchemy() -> None:
+    """Report statements of every SQLAlchemy engine (idempotent)."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
+
+
+class QueryBudgetStats:
+    """Per-endpoint histograms of statements and SQL seconds per request."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._statements: Dict[str, List[int]] = {}
+        self._seconds: Dict[str, List[int]] = {}
+        self._sums: Dict[str, List[float]] = {}
+
+    def observe(self, endpoint: str, statements: int, seconds: float) -> None:
+        with self._lock:
+            counts = self._statements.setdefault(endpoint, [0] * len(_STATEMENT_BUCKETS))
+            for index, bound in enumerate(_STATEMENT_BUCKETS):
+                if statements <= bound:
+                    counts[index] += 1
+            timings = self._seconds.setdefault(endpoint, [0] * len(_SECONDS_BUCKETS))
+            for index, bound in enumerate(_SECONDS_BUCKETS):
+                if seconds <= bound:
+                    timings[index] += 1
+            sums = self._sums.setdefault(endpoint, [0.0, 0.0])
+            sums[0] += statements
+            sums[1] += seconds
+
+    @staticmethod
+    def _family(name: str, documentation: str, buckets, values, sums, which: int) -> HistogramMetricFamily:
+        family = HistogramMetricFamily(name, documentation, labels=["endpoint"])
+        for endpoint, counts in sorted(values.items()):
+            family.add_metric(
+                [endpoint],
+                [(str(bound) if bound != float("inf") else "+Inf", count) for bound, count in zip(buckets, counts)],
+                sums[endpoint][which],
+            )
+        return family
+
+    def collect(self):
+        with self._lock:
+            statements = {endpoint: list(counts) for endpoint, counts in self._statements.items()}
+            seconds = {endpoint: list(counts) for endpoint, counts in self._seconds.items()}
+            sums = {endpoint: list(values) for endpoint, values in self._sums.items()}
+        yield self._family(
+            "wyniki_request_sql_statements", "SQL statements issued per request",
+            _STATEMENT_BUCKETS, statements, sums, 0,
+        )
+        yield self._family(
+            "wyniki_request_sql_seconds", "Time spent in SQL per request",
+            _SECONDS_BUCKETS, seconds, sums, 1,
+        )
+
+
+query_budget_stats = QueryBudgetStats()
+
+
+def finish_request_queries() -> Optional[QueryStats]:
+    """Observe the current request's totals and log budget overruns."""
+    stats = request.environ.pop(_ENVIRON_KEY, None)
+    if stats is None:
+        return None
+    endpoint = request.endpoint or "unmatched"
+    query_budget_stats.observe(endpoint, stats.statements, stats.seconds)
+
+    budget_statements = int(settings.query_budget_statements)
+    budget_seconds = float(settings.query_budget_seconds)
+    repeated_sql, repeated = stats.most_repeated()
+    over_budget = (budget_statements > 0 and stats.statements > budget_statements) or (
+        budget_seconds > 0 and stats.seconds > budget_seconds
+    )
+    details = {
+        "endpoint": endpoint,
+        "method": request.method,
+        "statements": stats.statements,
+        "sql_ms": round(stats.seconds * 1000, 1),
+        "repeated_sql": repeated_sql,
+        "repeated": repeated,
+    }
+    if over_budget:
+        logger.warning(
+            "query_budget_exceeded",
+            budget_statements=budget_statements,
+            budget_ms=round(budget_seconds * 1000, 1),
+            **details,
+        )
+    elif 0 < int(settings.query_repeat_threshold) <= repeated:
+        logger.warning("query_repeat_suspected", **details)
+    return stats
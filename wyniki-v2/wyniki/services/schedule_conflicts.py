@@ -0,0 +1,280 @@
+"""Player conflicts in a tournament's saved schedule, kept as a live index.
+
+A conflict is two schedule entries of the same day that share a player and
+either overlap on the clock or leave less than the scheduler's rest gap
+between them. The auto-scheduler avoids both when it places matches, but
+manual edits, drags on the office board and late knockout fills can still
+introduce them.
+
+``ScheduleConflictIndex`` keeps every placed entry in a per-player
+``PlayerIntervalIndex`` (sorted intervals per ``(day, player)``), so adding,
+moving or removing one entry, and validating a hypothetical move, is a bisect
+and a short walk rather than a pass over the whole schedule. The registry
+keeps one index per tournament in step with ``tournament_schedule`` through
+the schedule version counters: after a write only the rows whose placement
+changed are re-indexed.
+"""
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..config import logger, settings
+from .auto_scheduler import PlayerIntervalIndex, _match_slot, compile_config, minutes_to_time, time_to_minutes
+
+# Fields of a schedule row that decide whether and where it is indexed.
+_SIGNATURE_FIELDS = (
+    "day_date", "scheduled_time", "court_id", "status",
+    "player1_name", "player2_name", "category_name", "group_name", "phase",
+)
+
+
+def _entry_signature(entry: Dict[str, Any]) -> tuple:
+    return tuple(str(entry.get(field) or "") for field in _SIGNATURE_FIELDS)
+
+
+class _Placement:
+    __slots__ = ("entry", "day_date", "players", "start", "end")
+
+    def __init__(self, entry, day_date, players, start, end):
+        self.entry = entry
+        self.day_date = day_date
+        self.players = players
+        self.start = start
+        self.end = end
+
+
+class ScheduleConflictIndex:
+    """Overlap and rest-gap conflicts between placed entries of one schedule.
+
+    Only entries with a day, a time and a court take part; completed entries
+    and knockout placeholder names ("Zwycięzca PF1", "1A") are ignored.
+    """
+
+    def __init__(self, config: Dict[str, Any], is_placeholder=None) -> None:
+        self.model = compile_config(config)
+        self._is_placeholder = is_placeholder or (lambda name: not str(name or "").strip())
+        self.index = PlayerIntervalIndex()
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._signatures: Dict[int, tuple] = {}
+        self._placed: Dict[int, _Placement] = {}
+        self._pairs: Dict[frozenset, str] = {}
+        self._partners: Dict[int, Set[int]] = {}
+
+    def _players(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """Normalized player key -> display name, placeholders left out."""
+        players = {}
+        for field in ("player1_name", "player2_name"):
+            name = str(entry.get(field) or "").strip()
+            if name and not self._is_placeholder(name):
+                players[name.lower()] = name
+        return players
+
+    def _placement(self, entry: Dict[str, Any]) -> Optional[_Placement]:
+        day_date = str(entry.get("day_date") or "")
+        scheduled_time = str(entry.get("scheduled_time") or "")
+        court_id = str(entry.get("court_id") or "")
+        if not (day_date and scheduled_time and court_id):
+            return None
+        if str(entry.get("status") or "") == "completed":
+            return None
+        players = self._players(entry)
+        if not players:
+            return None
+        start = time_to_minutes(scheduled_time)
+        end = start + self.model.duration(court_id, _match_slot(entry))
+        keys = tuple((day_date, player) for player in sorted(players))
+        return _Placement(entry, day_date, keys, start, end)
+
+    def _kind(self, first: _Placement, second: _Placement) -> str:
+        return "overlap" if first.start < second.end and second.start < first.end else "rest"
+
+    def _conflicts_for(self, entry_id: int, placement: _Placement) -> List[int]:
+        return self.index.conflicts(
+            placement.players, placement.start, placement.end, self.model.rest_gap, ignore=entry_id
+        )
+
+    def upsert(self, entry: Dict[str, Any]) -> None:
+        """Add or re-place one schedule entry and recompute only its conflicts."""
+        entry_id = int(entry["id"])
+        self.remove(entry_id)
+        self._rows[entry_id] = entry
+        self._signatures[entry_id] = _entry_signature(entry)
+        placement = self._placement(entry)
+        if placement is None:
+            return
+        for other_id in self._conflicts_for(entry_id, placement):
+            self._pairs[frozenset((entry_id, other_id))] = self._kind(placement, self._placed[other_id])
+            self._partners.setdefault(entry_id, set()).add(other_id)
+            self._partners.setdefault(other_id, set()).add(entry_id)
+        self.index.add(placement.players, placement.start, placement.end, entry_id)
+        self._placed[entry_id] = placement
+
+    def remove(self, entry_id: int) -> None:
+        entry_id = int(entry_id)
+        self._rows.pop(entry_id, None)
+        self._signatures.pop(entry_id, None)
+        placement = self._placed.pop(entry_id, None)
+        if placement is not None:
+            self.index.remove(placement.players, placement.start, placement.end, entry_id)
+        for other_id in self._partners.pop(entry_id, set()):
+            self._pairs.pop(frozenset((entry_id, other_id)), None)
+            partners = self._partners.get(other_id)
+            if partners is not None:
+                partners.discard(entry_id)
+                if not partners:
+                    del self._partners[other_id]
+
+    def apply(self, entries: List[Dict[str, Any]]) -> bool:
+        """Bring the index in line with ``entries``; True when the conflict set changed."""
+        before = self.signature()
+        current = {int(entry["id"]): entry for entry in entries if entry.get("id")}
+        for entry_id in [entry_id for entry_id in self._rows if entry_id not in current]:
+            self.remove(entry_id)
+        for entry_id, entry in current.items():
+            if self._signatures.get(entry_id) != _entry_signature(entry):
+                self.upsert(entry)
+            else:
+                self._rows[entry_id] = entry
+        return self.signature() != before
+
+    def signature(self) -> frozenset:
+        return frozenset(self._pairs.items())
+
+    def _payload(self, kind: str, first: _Placement, second: _Placement) -> Dict[str, Any]:
+        if (second.start, int(second.entry["id"])) < (first.start, int(first.entry["id"])):
+            first, second = second, first
+        shared = set(first.players) & set(second.players)
+        names = self._players(first.entry)
+        return {
+            "kind": kind,
+            "day_date": first.day_date,
+            "players": sorted(names[player] for _day, player in shared),
+            "entry_ids": [int(first.entry["id"]), int(second.entry["id"])],
+            "entries": [
+                {
+                    "id": int(placement.entry["id"]),
+                    "court_id": str(placement.entry.get("court_id") or ""),
+                    "scheduled_time": minutes_to_time(placement.start),
+                    "end_time": minutes_to_time(placement.end),
+                    "player1_name": placement.entry.get("player1_name"),
+                    "player2_name": placement.entry.get("player2_name"),
+                    "category_name": placement.entry.get("category_name"),
+                }
+                for placement in (first, second)
+            ],
+        }
+
+    def conflicts(self) -> List[Dict[str, Any]]:
+        """Current conflicts, ordered by day and start of the earlier entry."""
+        payloads = []
+        for pair, kind in self._pairs.items():
+            first_id, second_id = pair
+            payloads.append(self._payload(kind, self._placed[first_id], self._placed[second_id]))
+        payloads.sort(key=lambda item: (item["day_date"], item["entries"][0]["scheduled_time"], item["entry_ids"]))
+        return payloads
+
+    def check(
+        self,
+        entry_id: int,
+        *,
+        court_id: Optional[str] = None,
+        day_date: Optional[str] = None,
+        scheduled_time: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Conflicts ``entry_id`` would have at a new court/day/time; nothing is changed."""
+        entry_id = int(entry_id)
+        current = self._rows.get(entry_id)
+        if current is None:
+            raise KeyError(entry_id)
+        moved = dict(current)
+        if court_id is not None:
+            moved["court_id"] = court_id
+        if day_date is not None:
+            moved["day_date"] = day_date
+        if scheduled_time is not None:
+            moved["scheduled_time"] = scheduled_time
+        placement = self._placement(moved)
+        if placement is None:
+            return []
+        return [
+            self._payload(self._kind(placement, self._placed[other_id]), placement, self._placed[other_id])
+            for other_id in self._conflicts_for(entry_id, placement)
+        ]
+
+
+class ScheduleConflictRegistry:
+    """One ``ScheduleConflictIndex`` per tournament, synced on access.
+
+    A sync reads the schedule version counters; only when they moved is the
+    schedule re-read and diffed into the index. A changed scheduler config
+    (slot lengths, rest slots) rebuilds the index from scratch.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._indexes: Dict[tuple, Tuple[Any, str, ScheduleConflictIndex]] = {}
+        self._announced: Dict[tuple, frozenset] = {}
+
+    def _sync(self, tournament_id: int) -> ScheduleConflictIndex:
+        from ..database import (
+            _is_knockout_placeholder_name,
+            db_conn,
+            fetch_tournament_schedule,
+            get_autoscheduler_config,
+        )
+        from ..database.connection import schedule_versions
+
+        key = (settings.database_path, int(tournament_id))
+        with db_conn() as conn:
+            versions = schedule_versions(conn.cursor(), int(tournament_id))
+        config = get_autoscheduler_config(int(tournament_id))
+        config_key = json.dumps(config, sort_keys=True, default=str)
+        with self._lock:
+            cached = self._indexes.get(key)
+            if cached is not None and cached[0] == versions and cached[1] == config_key:
+                return cached[2]
+            if cached is None or cached[1] != config_key:
+                index = ScheduleConflictIndex(config, _is_knockout_placeholder_name)
+            else:
+                index = cached[2]
+            index.apply(fetch_tournament_schedule(int(tournament_id)))
+            self._indexes[key] = (versions, config_key, index)
+            return index
+
+    def conflicts(self, tournament_id: int) -> List[Dict[str, Any]]:
+        index = self._sync(tournament_id)
+        with self._lock:
+            return index.conflicts()
+
+    def check(self, tournament_id: int, entry_id: int, **move: Optional[str]) -> List[Dict[str, Any]]:
+        index = self._sync(tournament_id)
+        with self._lock:
+            return index.check(entry_id, **move)
+
+    def refresh(self, tournament_id: int) -> bool:
+        """Sync after a write; True when the conflict set differs from the last refresh.
+
+        Comparing against the last refresh rather than the last sync keeps the
+        answer right when the write's own response already synced the index.
+        """
+        key = (settings.database_path, int(tournament_id))
+        try:
+            index = self._sync(tournament_id)
+        except Exception as exc:
+            logger.error("schedule_conflicts_refresh_failed", error=str(exc), tournament_id=tournament_id)
+            return False
+        with self._lock:
+            signature = index.signature()
+            changed = signature != self._announced.get(key, frozenset())
+            self._announced[key] = signature
+        return changed
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._indexes.clear()
+            self._announced.clear()
+
+
+schedule_conflicts = ScheduleConflictRegistry()
@@ -0,0 +1,453 @@
+"""Local-search improvement of greedy auto-scheduler placements.
+
+``auto_scheduler.place_matches`` is a first-fit pass over courts sorted by their
+next free time. This module takes its placements as the starting point and runs
+simulated annealing over the per-court match sequences with two operators:
+*move* (take a match off a court and insert it at another position, possibly on
+another court of the same pool) and *swap* (exchange two matches). Courts stay
+gap-free, so the sequences alone determine every start time. B1 matches stay on
+B1 courts and all other matches on flex courts, exactly as the greedy pass
+placed them.
+
+The cost is a weighted sum of the makespan (and any overrun past 23:59), player
+clashes (overlapping or with less rest than configured), phase-order violations
+inside a category, idle minutes on B1 courts, player idle time and a small
+court-balance term. A step only re-times the tail of the courts it touches and
+only re-scores the matches and players in that tail.
+
+The walk is driven by ``random.Random(seed)`` and cools by iteration count
+alone, so the same seed and input always take the same path. The iteration
+budget is sized from the day (a step costs roughly one court's length of
+re-timing), which keeps the run well inside the wall-clock budget; the clock
+only stops the walk early, and ``stats["stopped_by"] == "time"`` marks such a
+result as not reproducible.
+"""
+from __future__ import annotations
+
+import math
+import random
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .auto_scheduler import (
+    DEFAULT_START_TIME,
+    PlayerIntervalIndex,
+    _LAST_MINUTE,
+    _match_slot,
+    _ordered_flex_court_ids,
+    _phase_rank,
+    _players,
+    compile_config,
+    minutes_to_time,
+    normalize_b1_court_ids,
+    time_to_minutes,
+)
+
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "makespan": 1.0,
+    "overlap": 2000.0,
+    "rest": 150.0,
+    "phase": 500.0,
+    "b1_idle": 0.25,
+    "player_idle": 0.05,
+    # Per minute past 23:59, which a schedule entry cannot express.
+    "overtime": 50.0,
+    # Squared court lengths: gives the search a slope while several courts tie
+    # for the latest finish and the makespan itself cannot move yet.
+    "balance": 0.002,
+}
+DEFAULT_MAX_ITERATIONS = 20000
+# Annealing temperature in cost units (~minutes of makespan), cooled geometrically.
+_START_TEMPERATURE = 60.0
+_END_TEMPERATURE = 0.5
+# Iteration budget per match-per-court: about 0.6 s of search on a dev laptop
+# whatever the size of the day, leaving headroom under the default 2 s budget.
+_ITERATION_WORK = 60000
+
+
+class _Layout:
+    """Court sequences for one day with running cost terms."""
+
+    def __init__(self, placements: List[Dict[str, Any]], config: Dict[str, Any], weights: Dict[str, float]) -> None:
+        model = compile_config(config)
+        self.weights = weights
+        self.rest_gap = model.rest_gap
+        self.court_start = time_to_minutes(str(config.get("start_time") or DEFAULT_START_TIME))
+        self.index = PlayerIntervalIndex()
+        self.b1_courts: Set[str] = set(model.b1_courts)
+
+        self.positions: List[int] = []
+        self.players: List[Tuple[str, ...]] = []
+        self.category: List[str] = []
+        self.rank: List[int] = []
+        self.duration: List[int] = []
+        self.court_of: List[str] = []
+        self.start: List[int] = []
+        self.end: List[int] = []
+        self.seq: Dict[str, List[int]] = {}
+        self.court_end: Dict[str, int] = {}
+        self.pool_courts: Dict[str, List[str]] = {"b1": [], "flex": []}
+        self.pool_matches: Dict[str, List[int]] = {"b1": [], "flex": []}
+        self.balance_total = 0
+        # Every configured court is a target, including ones greedy left empty.
+        for court_id in [*normalize_b1_court_ids(config), *_ordered_flex_court_ids(config)]:
+            self._add_court(court_id)
+
+        seeded = sorted(
+            (
+                (time_to_minutes(str(placement["scheduled_time"])), position)
+                for position, placement in enumerate(placements)
+                if placement.get("court_id") and placement.get("scheduled_time")
+            )
+        )
+        for _minutes, position in seeded:
+            placement = placements[position]
+            match = placement.get("match") or {}
+            court_id = str(placement["court_id"])
+            match_id = len(self.positions)
+            self.positions.append(position)
+            self.players.append(tuple(sorted(_players(match))))
+            self.category.append(
+                str(match.get("category_name") or match.get("group_name") or "").strip().casefold()
+            )
+            self.rank.append(_phase_rank(match.get("phase")))
+            self.duration.append(model.duration(court_id, _match_slot(match)))
+            self.court_of.append(court_id)
+            # Sentinel so the first retime books every match in the index.
+            self.start.append(-1)
+            self.end.append(-1)
+            self._add_court(court_id)
+            self.seq[court_id].append(match_id)
+            self.pool_matches[self._pool(court_id)].append(match_id)
+
+        self.members: Dict[str, List[int]] = {}
+        self.busy: Dict[str, int] = {}
+        for match_id, category in enumerate(self.category):
+            self.members.setdefault(category, []).append(match_id)
+            for player in self.players[match_id]:
+                self.busy[player] = self.busy.get(player, 0) + self.duration[match_id]
+        # Phase ranks never change, so members are kept in phase order once and
+        # categories with a single phase (most group days) are never re-scored.
+        for members in self.members.values():
+            members.sort(key=self.rank.__getitem__)
+        self.phased: Set[str] = {
+            category
+            for category, members in self.members.items()
+            if self.rank[members[0]] != self.rank[members[-1]]
+        }
+
+        for match_id in range(len(self.positions)):
+            self.index.add(self.players[match_id], -1, -1, match_id)
+        for court_id in self.seq:
+            self.retime(court_id, 0)
+        self.clash_total = self.clash_cost(range(len(self.positions)))
+        self.phase_cost = {category: self._phase_violations(category) for category in self.phased}
+        self.idle = {player: self._player_idle(player) for player in self.busy}
+
+    def _pool(self, court_id: str) -> str:
+        return "b1" if court_id in self.b1_courts else "flex"
+
+    def _add_court(self, court_id: str) -> None:
+        if court_id not in self.seq:
+            self.seq[court_id] = []
+            self.pool_courts[self._pool(court_id)].append(court_id)
+
+    # -- timing -------------------------------------------------------------
+
+    def retime(self, court_id: str, from_pos: int) -> None:
+        seq = self.seq[court_id]
+        cursor = self.end[seq[from_pos - 1]] if from_pos > 0 else self.court_start
+        for match_id in seq[from_pos:]:
+            if self.start[match_id] != cursor or self.court_of[match_id] != court_id:
+                self.index.remove(self.players[match_id], self.start[match_id], self.end[match_id], match_id)
+                self.start[match_id] = cursor
+                self.end[match_id] = cursor + self.duration[match_id]
+                self.court_of[match_id] = court_id
+                self.index.add(self.players[match_id], self.start[match_id], self.end[match_id], match_id)
+            cursor = self.end[match_id]
+        previous = self.court_end.get(court_id, self.court_start) - self.court_start
+        self.balance_total += (cursor - self.court_start) ** 2 - previous ** 2
+        self.court_end[court_id] = cursor
+
+    # -- cost terms -----------------------------------------------------------
+
+    def clash_cost(self, match_ids: Iterable[int]) -> float:
+        """Clash penalty of every pair with at least one match in ``match_ids`` (each pair once)."""
+        scope = set(match_ids)
+        total = 0.0
+        for match_id in scope:
+            start, end = self.start[match_id], self.end[match_id]
+            for other in self.index.conflicts(self.players[match_id], start, end, self.rest_gap, ignore=match_id):
+                if other in scope and other < match_id:
+                    continue
+                overlaps = start < self.end[other] and end > self.start[other]
+                total += self.weights["overlap"] if overlaps else self.weights["rest"]
+        return total
+
+    def _phase_violations(self, category: str) -> int:
+        """Matches that start before an earlier-phase match of the same category ends."""
+        rank, start, end = self.rank, self.start, self.end
+        violations = 0
+        earlier_end = rank_end = -1
+        current_rank = None
+        for match_id in self.members[category]:
+            if rank[match_id] != current_rank:
+                if rank_end > earlier_end:
+                    earlier_end = rank_end
+                current_rank = rank[match_id]
+            if start[match_id] < earlier_end:
+                violations += 1
+            if end[match_id] > rank_end:
+                rank_end = end[match_id]
+        return violations
+
+    def _player_idle(self, player: str) -> int:
+        span = self.index.span(player)
+        if span is None:
+            return 0
+        return max(0, span[1] - span[0] - self.busy[player])
+
+    def makespan(self) -> int:
+        return max(self.court_end.values(), default=self.court_start) - self.court_start
+
+    def b1_idle(self) -> int:
+        ends = [self.court_end[court_id] for court_id in self.pool_courts["b1"]]
+        if len(ends) < 2:
+            return 0
+        latest = max(ends)
+        return sum(latest - end for end in ends)
+
+    def global_cost(self) -> float:
+        weights = self.weights
+        return (
+            weights["makespan"] * self.makespan()
+            + weights["overtime"] * max(0, self.court_start + self.makespan() - _LAST_MINUTE)
+            + weights["b1_idle"] * self.b1_idle()
+            + weights["balance"] * self.balance_total
+        )
+
+    def cost(self) -> float:
+        weights = self.weights
+        return (
+            self.global_cost()
+            + self.clash_total
+            + weights["phase"] * sum(self.phase_cost.values())
+            + weights["player_idle"] * sum(self.idle.values())
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        clashes = 0
+        for match_id in range(len(self.positions)):
+            clashes += sum(
+                1
+                for other in self.index.conflicts(
+                    self.players[match_id], self.start[match_id], self.end[match_id], self.rest_gap, ignore=match_id
+                )
+                if other > match_id
+            )
+        return {
+            "finish_time": minutes_to_time(self.court_start + self.makespan()),
+            "makespan_minutes": self.makespan(),
+            "player_clashes": clashes,
+            "phase_violations": sum(self.phase_cost.values()),
+            "b1_idle_minutes": self.b1_idle(),
+            "player_idle_minutes": sum(self.idle.values()),
+            "cost": round(self.cost(), 2),
+        }
+
+    # -- moves ------------------------------------------------------------------
+
+    def _position(self, match_id: int) -> Tuple[str, int]:
+        court_id = self.court_of[match_id]
+        return court_id, self.seq[court_id].index(match_id)
+
+    def apply_move(self, match_id: int, court_id: str, position: int) -> List[Tuple[str, int]]:
+        source, source_pos = self._position(match_id)
+        self.seq[source].pop(source_pos)
+        self.seq[court_id].insert(position, match_id)
+        if source == court_id:
+            return [(court_id, min(source_pos, position))]
+        return [(source, source_pos), (court_id, position)]
+
+    def apply_swap(self, first: int, second: int) -> List[Tuple[str, int]]:
+        first_court, first_pos = self._position(first)
+        second_court, second_pos = self._position(second)
+        self.seq[first_court][first_pos] = second
+        self.seq[second_court][second_pos] = first
+        if first_court == second_court:
+            return [(first_court, min(first_pos, second_pos))]
+        return [(first_court, first_pos), (second_court, second_pos)]
+
+    def tail(self, touched: List[Tuple[str, int]]) -> Set[int]:
+        scope: Set[int] = set()
+        for court_id, position in touched:
+            scope.update(self.seq[court_id][position:])
+        return scope
+
+    def snapshot(self) -> Dict[str, List[int]]:
+        return {court_id: list(seq) for court_id, seq in self.seq.items()}
+
+    def restore(self, sequences: Dict[str, List[int]]) -> None:
+        self.seq = {court_id: list(seq) for court_id, seq in sequences.items()}
+        for court_id in self.seq:
+            self.retime(court_id, 0)
+        self.clash_total = self.clash_cost(range(len(self.positions)))
+        self.phase_cost = {category: self._phase_violations(category) for category in self.phased}
+        self.idle = {player: self._player_idle(player) for player in self.busy}
+
+
+def _neighbour(layout: _Layout, rng: random.Random) -> Optional[Tuple[str, Tuple[Any, ...], Set[int]]]:
+    """Pick a random move or swap; return (operator, arguments, affected matches)."""
+    pools = [pool for pool, matches in layout.pool_matches.items() if len(matches) > 1]
+    if not pools:
+        return None
+    pool = rng.choice(pools)
+    courts = layout.pool_courts[pool]
+    roll = rng.random()
+    if roll < 0.2:
+        # Shorten the day: the last match of the court that finishes last goes
+        # to the court that finishes first, so only that court's tail moves.
+        critical = max(courts, key=lambda court_id: (layout.court_end[court_id], court_id))
+        target = min(courts, key=lambda court_id: (layout.court_end[court_id], court_id))
+        if critical == target or not layout.seq[critical]:
+            return None
+        match_id = layout.seq[critical][-1]
+        position = len(layout.seq[target]) - int(rng.random() ** 2 * (len(layout.seq[target]) + 1))
+        position = max(0, position)
+        scope = layout.tail([(target, position)])
+        scope.add(match_id)
+        return "move", (match_id, target, position), scope
+    if roll < 0.6:
+        match_id = rng.choice(layout.pool_matches[pool])
+        source, source_pos = layout._position(match_id)
+        target = rng.choice(courts)
+        position = rng.randrange(len(layout.seq[target]) + (0 if target == source else 1))
+        if target == source:
+            if position == source_pos:
+                return None
+            scope = layout.tail([(source, min(source_pos, position))])
+        else:
+            scope = layout.tail([(source, source_pos), (target, position)])
+        scope.add(match_id)
+        return "move", (match_id, target, position), scope
+
+    first, second = rng.sample(layout.pool_matches[pool], 2)
+    return "swap", (first, second), layout.tail([layout._position(first), layout._position(second)])
+
+
+def _iteration_limit(layout: _Layout, max_iterations: int) -> int:
+    """Iterations for this day: fewer on long courts, where every step re-times more."""
+    matches_per_court = -(-len(layout.positions) // max(1, len(layout.seq)))
+    return max(1, min(int(max_iterations), _ITERATION_WORK // max(1, matches_per_court)))
+
+
+def optimize_placements(
+    placements: List[Dict[str, Any]],
+    config: Dict[str, Any],
+    seed: int = 0,
+    time_budget_seconds: float = 2.0,
+    max_iterations: int = DEFAULT_MAX_ITERATIONS,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Improve greedy ``placements`` (as returned by ``place_matches``) for one day.
+
+    Returns ``{"placements": [...], "stats": {...}}``; placements keep their input
+    order and shape, with new ``court_id`` / ``scheduled_time`` values. Unplaced
+    entries are passed through untouched. ``max_iterations`` is an upper bound;
+    the run uses the size-based limit reported as ``stats["max_iterations"]``.
+    """
+    started = time.perf_counter()
+    layout = _Layout(placements, config, {**DEFAULT_WEIGHTS, **(weights or {})})
+    before = layout.metrics()
+    rng = random.Random(seed)
+    current = best_cost = layout.cost()
+    best = layout.snapshot()
+    iterations = accepted = 0
+    budget = max(0.0, float(time_budget_seconds))
+    max_iterations = _iteration_limit(layout, max_iterations)
+    ratio = _END_TEMPERATURE / _START_TEMPERATURE
+    stopped_by = "iterations"
+    weights = layout.weights
+
+    while iterations < max_iterations:
+        # The clock may only stop the walk; letting it steer the temperature
+        # would make accept/reject depend on machine load.
+        if iterations % 256 == 0 and time.perf_counter() - started >= budget:
+            stopped_by = "time"
+            break
+        iterations += 1
+        temperature = _START_TEMPERATURE * ratio ** (iterations / max_iterations)
+        neighbour = _neighbour(layout, rng)
+        if neighbour is None:
+            continue
+        operator, args, scope = neighbour
+
+        global_before = layout.global_cost()
+        clash_before = layout.clash_cost(scope)
+        categories = {layout.category[match_id] for match_id in scope} & layout.phased
+        phase_before = sum(layout.phase_cost[category] for category in categories)
+        players = {player for match_id in scope for player in layout.players[match_id]}
+        idle_before = sum(layout.idle[player] for player in players)
+
+        if operator == "move":
+            match_id, target, position = args
+            source, source_pos = layout._position(match_id)
+            touched = layout.apply_move(match_id, target, position)
+        else:
+            touched = layout.apply_swap(*args)
+        for court_id, position in touched:
+            layout.retime(court_id, position)
+
+        clash_after = layout.clash_cost(scope)
+        phase_after = {category: layout._phase_violations(category) for category in categories}
+        idle_after = {player: layout._player_idle(player) for player in players}
+        delta = (
+            layout.global_cost() - global_before
+            + clash_after - clash_before
+            + weights["phase"] * (sum(phase_after.values()) - phase_before)
+            + weights["player_idle"] * (sum(idle_after.values()) - idle_before)
+        )
+
+        if delta <= 0 or rng.random() < math.exp(-delta / temperature):
+            accepted += 1
+            layout.clash_total += clash_after - clash_before
+            layout.phase_cost.update(phase_after)
+            layout.idle.update(idle_after)
+            current += delta
+            if current < best_cost - 1e-9:
+                best_cost = current
+                best = layout.snapshot()
+            continue
+
+        if operator == "move":
+            undone = layout.apply_move(match_id, source, source_pos)
+        else:
+            undone = layout.apply_swap(*args)
+        for court_id, position in undone:
+            layout.retime(court_id, position)
+
+    layout.restore(best)
+    after = layout.metrics()
+
+    result = [dict(placement) for placement in placements]
+    for match_id, position in enumerate(layout.positions):
+        result[position]["court_id"] = layout.court_of[match_id]
+        result[position]["scheduled_time"] = minutes_to_time(layout.start[match_id])
+    return {
+        "placements": result,
+        "stats": {
+            "seed": seed,
+            "iterations": iterations,
+            "max_iterations": max_iterations,
+            "stopped_by": stopped_by,
+            "accepted": accepted,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "before": before,
+            "after": after,
+        },
+    }
+
+
+def placement_metrics(placements: List[Dict[str, Any]], config: Dict[str, Any]) -> Dict[str, Any]:
+    """Score a placement list with the optimizer's cost terms (no changes made)."""
+    return _Layout(placements, config, dict(DEFAULT_WEIGHTS)).metrics()
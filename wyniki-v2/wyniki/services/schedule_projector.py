@@ -0,0 +1,206 @@
+"""Live ETA projection for the rest of today's schedule on each court.
+
+When a match overruns, every later entry on that court starts late, but the
+planned ``tournament_schedule`` times stay as the office left them. The
+projector watches live court state in ``COURTS`` (who is playing, since when)
+and re-projects the remaining entries of each court from the moment the court
+is expected to be free. Results are published as ``schedule_eta`` events on the
+public SSE stream; nothing is written to the database.
+
+Durations come from the tournament's auto-scheduler config, so learned slot
+lengths (``duration_source``) apply here as well.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import logger, settings
+from ..utils import parse_iso_datetime
+from .auto_scheduler import _match_slot, compile_config
+from .court_manager import COURTS, STATE_LOCK
+from .event_broker import event_broker
+
+# How often live court state is checked for a started or finished match; a full
+# re-projection also runs every ``schedule_eta_interval_seconds``.
+_WATCH_SECONDS = 5.0
+_CLOSED_STATUSES = {"completed", "in_progress"}
+
+
+def _local_naive(value: Optional[str]) -> Optional[datetime]:
+    """Court timestamps are UTC ISO strings; schedule times are local wall clock."""
+    if not value:
+        return None
+    try:
+        parsed = parse_iso_datetime(str(value))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _hhmm(moment: datetime) -> str:
+    return moment.strftime("%H:%M")
+
+
+def _live_court(state: Dict[str, Any]) -> Dict[str, Any]:
+    """The fields of a court state the projection depends on."""
+    match_time = state.get("match_time") or {}
+    meta = state.get("history_meta") or {}
+    return {
+        "tournament_id": state.get("tournament_id"),
+        "active": bool((state.get("match_status") or {}).get("active")),
+        "started_ts": match_time.get("started_ts"),
+        "category": meta.get("category"),
+        "phase": meta.get("phase"),
+    }
+
+
+def live_courts_snapshot() -> Dict[str, Dict[str, Any]]:
+    with STATE_LOCK:
+        return {str(kort_id): _live_court(state) for kort_id, state in COURTS.items()}
+
+
+def project_tournament_etas(
+    entries: Iterable[Dict[str, Any]],
+    live_courts: Dict[str, Dict[str, Any]],
+    config: Dict[str, Any],
+    now: datetime,
+    *,
+    overrun_minutes: int = 10,
+) -> Dict[str, Any]:
+    """Projected start times for today's remaining schedule entries, per court.
+
+    A court with a live match is free at ``start + slot``, but never sooner
+    than ``overrun_minutes`` from ``now`` (a match running late still has to
+    be finished). An idle court is free now. Remaining entries then follow in
+    planned order, each starting no earlier than its planned time.
+
+    Returns ``{"day_date", "courts": {court_id: {"free_at", "delay_minutes"}},
+    "entries": {schedule_id: "HH:MM"}}``, where ``entries`` only lists entries
+    whose projected start differs from the planned one.
+    """
+    compiled = compile_config(config)
+    today = now.date().isoformat()
+    by_court: Dict[str, List[tuple]] = {}
+    for entry in entries:
+        if str(entry.get("day_date") or "") != today or entry.get("match_id"):
+            continue
+        if str(entry.get("status") or "") in _CLOSED_STATUSES:
+            continue
+        court_id = str(entry.get("court_id") or "")
+        try:
+            planned = datetime.fromisoformat(f"{today}T{entry.get('scheduled_time')}")
+        except ValueError:
+            continue
+        if court_id:
+            by_court.setdefault(court_id, []).append((planned, int(entry.get("sort_order") or 0), entry))
+
+    courts: Dict[str, Dict[str, Any]] = {}
+    etas: Dict[str, str] = {}
+    for court_id, remaining in by_court.items():
+        remaining.sort(key=lambda item: (item[0], item[1], int(item[2].get("id") or 0)))
+        free_at = now
+        live = live_courts.get(court_id) or {}
+        started = _local_naive(live.get("started_ts")) if live.get("active") else None
+        if started is not None:
+            slot = {"category_name": live.get("category"), "phase": live.get("phase")}
+            free_at = max(
+                started + timedelta(minutes=compiled.duration(court_id, _match_slot(slot))),
+                now + timedelta(minutes=overrun_minutes),
+            )
+
+        cursor = free_at
+        first_delay = 0
+        for index, (planned, _order, entry) in enumerate(remaining):
+            projected = max(planned, cursor)
+            if index == 0:
+                first_delay = int((projected - planned).total_seconds() // 60)
+            if _hhmm(projected) != _hhmm(planned):
+                etas[str(entry.get("id"))] = _hhmm(projected)
+            cursor = projected + timedelta(minutes=compiled.duration(court_id, _match_slot(entry)))
+        courts[court_id] = {"free_at": _hhmm(free_at), "delay_minutes": max(0, first_delay)}
+    return {"day_date": today, "courts": courts, "entries": etas}
+
+
+class ScheduleProjector:
+    """Background loop that re-projects ETAs and publishes changes over SSE.
+
+    The loop starts with the first public stream listener and skips all work
+    while nobody listens. It re-projects when a court starts or finishes a
+    match and otherwise every ``schedule_eta_interval_seconds``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._latest: Dict[int, Dict[str, Any]] = {}
+        self._signature: Optional[tuple] = None
+        self._last_run = 0.0
+
+    def ensure_started(self) -> None:
+        if float(settings.schedule_eta_interval_seconds) <= 0:
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._loop, name="schedule-projector", daemon=True)
+            self._thread.start()
+
+    def latest(self) -> List[Dict[str, Any]]:
+        """Last published projection per tournament (sent to new stream clients)."""
+        with self._lock:
+            return list(self._latest.values())
+
+    def _loop(self) -> None:
+        while True:
+            time.sleep(_WATCH_SECONDS)
+            if not event_broker.listeners:
+                continue
+            live = live_courts_snapshot()
+            signature = tuple(sorted(
+                (court_id, court["active"], court["started_ts"]) for court_id, court in live.items()
+            ))
+            interval = float(settings.schedule_eta_interval_seconds)
+            if signature == self._signature and time.monotonic() - self._last_run < interval:
+                continue
+            self._signature = signature
+            self._last_run = time.monotonic()
+            try:
+                self.run_once(live)
+            except Exception as exc:
+                logger.error("schedule_projection_failed", error=str(exc))
+
+    def run_once(self, live: Optional[Dict[str, Dict[str, Any]]] = None, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """Project every public tournament with live courts; broadcast what changed."""
+        from ..database import fetch_tournament, fetch_tournament_schedule, get_autoscheduler_config
+
+        live = live_courts_snapshot() if live is None else live
+        now = now or datetime.now().replace(second=0, microsecond=0)
+        tournament_ids = sorted({int(court["tournament_id"]) for court in live.values() if court.get("tournament_id")})
+        published = []
+        for tournament_id in tournament_ids:
+            tournament = fetch_tournament(tournament_id) or {}
+            if int(tournament.get("is_public") or 0) != 1:
+                continue
+            projection = project_tournament_etas(
+                fetch_tournament_schedule(tournament_id, public_only=True),
+                live,
+                get_autoscheduler_config(tournament_id),
+                now,
+                overrun_minutes=int(settings.schedule_eta_overrun_minutes),
+            )
+            payload = {"type": "schedule_eta", "tournament_id": tournament_id, **projection}
+            with self._lock:
+                if self._latest.get(tournament_id) == payload:
+                    continue
+                self._latest[tournament_id] = payload
+            event_broker.broadcast(payload)
+            published.append(payload)
+        return published
+
+
+schedule_projector = ScheduleProjector()
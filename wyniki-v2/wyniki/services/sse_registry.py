@@ -0,0 +1,133 @@
+"""Admission control for long-lived SSE connections.
+
+Every EventSource holds a greenlet and a file descriptor for as long as the page
+stays open, and they share the worker with the umpire API. The registry caps
+open streams globally and per client IP, and keeps headroom for in-flight
+umpire requests (``/api/matches*`` and ``/api/match-events``) so a burst of
+embeds can never starve score submission.
+"""
+from __future__ import annotations
+
+import random
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
+
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from ..config import settings
+
+PRIORITY_PATH_PREFIXES = ("/api/matches", "/api/match-events")
+
+
+def is_priority_path(path: str) -> bool:
+    return any(path.startswith(prefix) for prefix in PRIORITY_PATH_PREFIXES)
+
+
+@dataclass
+class SSELease:
+    """One admitted stream; release it exactly once when the response closes."""
+
+    registry: "SSEConnectionRegistry"
+    endpoint: str
+    client_ip: str
+    released: bool = field(default=False)
+
+    def release(self) -> None:
+        self.registry.release(self)
+
+
+class SSEConnectionRegistry:
+    """Count open SSE streams per endpoint and per IP, and decide admission."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_endpoint: dict[str, int] = defaultdict(int)
+        self._by_ip: dict[str, int] = defaultdict(int)
+        self._rejected: dict[tuple[str, str], int] = defaultdict(int)
+        self._total = 0
+        self._priority_inflight = 0
+
+    def try_acquire(self, endpoint: str, client_ip: str) -> tuple[Optional[SSELease], str]:
+        """Admit a stream or return ``(None, reason)`` when a cap is reached."""
+        with self._lock:
+            reserved = max(int(settings.sse_priority_reserve), self._priority_inflight)
+            if self._total + reserved >= int(settings.sse_max_connections):
+                reason = "capacity"
+            elif self._by_ip[client_ip] >= int(settings.sse_max_connections_per_ip):
+                reason = "per_ip"
+            else:
+                self._total += 1
+                self._by_endpoint[endpoint] += 1
+                self._by_ip[client_ip] += 1
+                return SSELease(self, endpoint, client_ip), ""
+            self._rejected[(endpoint, reason)] += 1
+            if not self._by_ip[client_ip]:
+                self._by_ip.pop(client_ip, None)
+            return None, reason
+
+    def release(self, lease: SSELease) -> None:
+        with self._lock:
+            if lease.released:
+                return
+            lease.released = True
+            self._total -= 1
+            self._by_endpoint[lease.endpoint] -= 1
+            self._by_ip[lease.client_ip] -= 1
+            if self._by_ip[lease.client_ip] <= 0:
+                self._by_ip.pop(lease.client_ip, None)
+
+    def priority_started(self) -> None:
+        with self._lock:
+            self._priority_inflight += 1
+
+    def priority_finished(self) -> None:
+        with self._lock:
+            self._priority_inflight = max(0, self._priority_inflight - 1)
+
+    def open_streams(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._by_endpoint)
+
+    def rejected(self) -> dict[tuple[str, str], int]:
+        with self._lock:
+            return dict(self._rejected)
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def retry_ms(self) -> int:
+        """Jittered reconnect delay so rejected clients do not return in lockstep."""
+        base = int(settings.sse_retry_ms)
+        return base + random.randint(0, max(1, base // 2))
+
+
+class SSERegistryCollector:
+    """Expose registry counts to the app's Prometheus registry at scrape time."""
+
+    def __init__(self, registry: SSEConnectionRegistry) -> None:
+        self._registry = registry
+
+    def collect(self):
+        open_streams = GaugeMetricFamily(
+            "wyniki_sse_open_streams",
+            "Open SSE streams per endpoint",
+            labels=["endpoint"],
+        )
+        for endpoint, count in sorted(self._registry.open_streams().items()):
+            open_streams.add_metric([endpoint], count)
+        yield open_streams
+
+        rejected = CounterMetricFamily(
+            "wyniki_sse_rejected",
+            "SSE connections rejected by admission control",
+            labels=["endpoint", "reason"],
+        )
+        for (endpoint, reason), count in sorted(self._registry.rejected().items()):
+            rejected.add_metric([endpoint, reason], count)
+        yield rejected
+
+
+sse_registry = SSEConnectionRegistry()